@@ -118,6 +118,23 @@ class Hasher(object):
                     constant_hasher_map))
         return hasher.digest()
 
+    @staticmethod
+    def module_structure_signature(obj):
+        """Returns the signature for the structure of a module: what it is,
+        which functions are set and with which types, and its port specs,
+        but not the values of the parameters.
+
+        """
+        functions = [(f.name, [(p.pos, p.identifier, p.type,
+                                p.namespace or '')
+                               for p in f.params])
+                     for f in obj.functions]
+        port_specs = sorted((ps.name, ps.type, ps.sigstring, ps.depth)
+                            for ps in obj.port_specs.itervalues())
+        return sha_hash(repr((obj.id, obj.package, obj.name,
+                              obj.namespace or '', obj.version or '',
+                              functions, port_specs))).digest()
+
     @staticmethod
     def subpipeline_signature(module_sig, upstream_sigs):
         """Returns the signature for a subpipeline, given the signatures for
@@ -0,0 +1,322 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+
+"""Eviction policies for the persistent pipeline of the cached interpreter.
+
+A policy keeps one entry per cached module, keyed by the module's
+subpipeline signature, and decides which entries should go when the cache
+grows beyond its budget. The policy never removes anything itself: the
+interpreter asks for victims and removes them (and their downstream
+modules) from the persistent pipeline, reporting back what was removed.
+
+"""
+
+import sys
+
+##############################################################################
+
+class CacheEntry(object):
+    """Bookkeeping for a single module in the persistent pipeline."""
+
+    def __init__(self, key, module_id, size=0):
+        self.key = key
+        self.module_id = module_id
+        self.size = size
+        self.count = 0
+        self.last_access = 0
+
+    def __repr__(self):
+        return ("CacheEntry(key=%r, module_id=%r, size=%r, count=%r)" %
+                (self.key, self.module_id, self.size, self.count))
+
+
+class CachePolicy(object):
+    """CachePolicy is the base class for cache eviction policies.
+
+    max_entries is the maximum number of cached modules, and max_memory
+    the maximum estimated size in bytes of their outputs; None or 0 means
+    no limit. The base class never selects victims, it only keeps the
+    hit, miss and eviction counters.
+
+    """
+
+    name = 'unbounded'
+
+    def __init__(self, max_entries=None, max_memory=None):
+        self.max_entries = max_entries or None
+        self.max_memory = max_memory or None
+        self._entries = {}
+        self._tick = 0
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def is_bounded(self):
+        return self.max_entries is not None or self.max_memory is not None
+
+    def _access(self, entry):
+        self._tick += 1
+        entry.count += 1
+        entry.last_access = self._tick
+
+    def add(self, key, module_id, size=0):
+        """add(key, module_id, size) -> None
+        Records a cache miss: a module was added to the persistent
+        pipeline.
+
+        """
+        self.misses += 1
+        if key in self._entries:
+            self.discard(key)
+        entry = self._entries[key] = CacheEntry(key, module_id, size)
+        self.memory += size
+        self._access(entry)
+
+    def touch(self, key):
+        """touch(key) -> None
+        Records a cache hit: a module of the persistent pipeline was
+        reused.
+
+        """
+        self.hits += 1
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._access(entry)
+
+    def update_size(self, key, size):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.memory += size - entry.size
+            entry.size = size
+
+    def discard(self, key, evicted=False):
+        """discard(key, evicted=False) -> None
+        Forgets about an entry, because the module was removed from the
+        persistent pipeline. evicted tells whether it was removed to
+        satisfy this policy.
+
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.memory -= entry.size
+            if evicted:
+                self.evictions += 1
+
+    def clear(self):
+        """clear() -> None
+        Forgets about all entries, but keeps the counters.
+
+        """
+        self._entries = {}
+        self.memory = 0
+
+    def over_budget(self):
+        if (self.max_entries is not None and
+                len(self._entries) > self.max_entries):
+            return True
+        if self.max_memory is not None and self.memory > self.max_memory:
+            return True
+        return False
+
+    def rank(self, entry):
+        """rank(entry) -> comparable
+        Entries with the lowest rank are evicted first.
+
+        """
+        raise NotImplementedError
+
+    def select_victim(self, protected=frozenset()):
+        """select_victim(protected: set of module ids) -> CacheEntry or None
+        Returns the entry that should be evicted next, or None if the
+        cache is within budget or every candidate is protected.
+
+        """
+        if not self.is_bounded() or not self.over_budget():
+            return None
+        candidates = [entry for entry in self._entries.itervalues()
+                      if entry.module_id not in protected]
+        if not candidates:
+            return None
+        return min(candidates, key=self.rank)
+
+    def statistics(self):
+        """statistics() -> dict
+        Returns the counters of this policy.
+
+        """
+        return {'policy': self.name,
+                'entries': len(self._entries),
+                'memory': self.memory,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions}
+
+
+class LRUCachePolicy(CachePolicy):
+    """Evicts the least recently used modules first."""
+
+    name = 'lru'
+
+    def rank(self, entry):
+        return entry.last_access
+
+
+class LFUCachePolicy(CachePolicy):
+    """Evicts the least frequently used modules first, breaking ties by
+    recency.
+
+    """
+
+    name = 'lfu'
+
+    def rank(self, entry):
+        return (entry.count, entry.last_access)
+
+_policies = {'lru': LRUCachePolicy,
+             'lfu': LFUCachePolicy}
+
+def create_cache_policy(name='lru', max_entries=None, max_memory=None):
+    """create_cache_policy(name: str, max_entries: int, max_memory: int)
+      -> CachePolicy
+    Builds a policy from its name. If neither limit is set, the returned
+    policy never evicts anything.
+
+    """
+    if not max_entries and not max_memory:
+        return CachePolicy()
+    try:
+        klass = _policies[name.lower()]
+    except KeyError:
+        raise ValueError("Unknown cache policy %r" % name)
+    return klass(max_entries, max_memory)
+
+def create_cache_policy_from_configuration(configuration=None):
+    """create_cache_policy_from_configuration(configuration) -> CachePolicy
+    Builds a policy from the cachePolicy, cacheMaxEntries and
+    cacheMaxMemory (in MB) configuration settings.
+
+    """
+    if configuration is None:
+        from vistrails.core.configuration import get_vistrails_configuration
+        configuration = get_vistrails_configuration()
+    if configuration is None:
+        return CachePolicy()
+    name = getattr(configuration, 'cachePolicy', None) or 'lru'
+    max_entries = getattr(configuration, 'cacheMaxEntries', None)
+    max_memory = getattr(configuration, 'cacheMaxMemory', None)
+    if max_memory:
+        max_memory = max_memory * 1024 * 1024
+    return create_cache_policy(name, max_entries, max_memory)
+
+def estimate_size(obj):
+    """estimate_size(obj: Module) -> int
+    Estimates the memory used by the outputs of a module, in bytes.
+
+    This is a shallow estimate: arrays report their buffer size, other
+    values what sys.getsizeof() returns.
+
+    """
+    size = 0
+    for name, value in obj.outputPorts.iteritems():
+        if name == 'self' or value is obj:
+            continue
+        nbytes = getattr(value, 'nbytes', None)
+        if isinstance(nbytes, (int, long)):
+            size += nbytes
+        else:
+            try:
+                size += sys.getsizeof(value)
+            except TypeError:
+                pass
+    return size
+
+##############################################################################
+
+import unittest
+
+class TestCachePolicy(unittest.TestCase):
+    def test_unbounded(self):
+        policy = create_cache_policy('lru')
+        self.assertFalse(policy.is_bounded())
+        for i in xrange(10):
+            policy.add('sig%d' % i, i)
+        self.assertIsNone(policy.select_victim())
+        self.assertEqual(policy.misses, 10)
+
+    def test_lru(self):
+        policy = create_cache_policy('lru', max_entries=2)
+        policy.add('a', 1)
+        policy.add('b', 2)
+        policy.touch('a')
+        self.assertIsNone(policy.select_victim())
+        policy.add('c', 3)
+        self.assertEqual(policy.select_victim().module_id, 2)
+        self.assertEqual(policy.select_victim(set([2])).module_id, 1)
+        policy.discard('b', evicted=True)
+        self.assertIsNone(policy.select_victim())
+        self.assertEqual(policy.statistics()['evictions'], 1)
+        self.assertEqual(policy.hits, 1)
+        self.assertEqual(policy.misses, 3)
+
+    def test_lfu(self):
+        policy = create_cache_policy('lfu', max_entries=2)
+        policy.add('a', 1)
+        policy.touch('a')
+        policy.add('b', 2)
+        policy.add('c', 3)
+        # b and c were used once, b less recently
+        self.assertEqual(policy.select_victim().module_id, 2)
+
+    def test_memory(self):
+        policy = create_cache_policy('lru', max_memory=100)
+        policy.add('a', 1, 60)
+        policy.add('b', 2)
+        self.assertIsNone(policy.select_victim())
+        policy.update_size('b', 60)
+        self.assertEqual(policy.memory, 120)
+        self.assertEqual(policy.select_victim().module_id, 1)
+        policy.discard('a', evicted=True)
+        self.assertEqual(policy.memory, 60)
+        self.assertIsNone(policy.select_victim())
+
+    def test_unknown(self):
+        self.assertRaises(ValueError, create_cache_policy, 'fifo', 2)
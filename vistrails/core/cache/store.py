@@ -0,0 +1,315 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+
+"""On-disk store for module outputs, indexed by subpipeline signature.
+
+Subpipeline signatures are stable across processes, so the outputs of a
+module can be reused by a later VisTrails session as long as its
+signature, and the version of its package, are the same (see
+:py:func:`result_key`). Only modules that opt in through
+``ModuleSettings(persistent_cache=True)`` are stored. Output values that
+are VisTrails modules are saved through their
+:py:class:`~vistrails.core.modules.vistrails_module.Serializable`
+interface, other values are pickled.
+
+"""
+
+import cPickle as pickle
+import hashlib
+import os
+import tempfile
+import time
+
+from vistrails.core import debug
+
+##############################################################################
+
+STORE_VERSION = 1
+
+def result_key(signature, descriptor):
+    """result_key(signature: str, descriptor: ModuleDescriptor) -> str
+    Returns the key of the outputs of a module in the store, from its
+    subpipeline signature and the identifier and version of its package,
+    so that a new version of a package doesn't reuse old results.
+
+    """
+    hasher = hashlib.sha1()
+    for value in (signature, descriptor.identifier,
+                  descriptor.package_version or ''):
+        hasher.update('%d:%s' % (len(value), value))
+    return hasher.hexdigest()
+
+class StoreEntry(object):
+    def __init__(self, abs_name, size, time):
+        self.abs_name = abs_name
+        self.size = size
+        self.time = time
+
+
+class ResultStore(object):
+    """ResultStore keeps module outputs in a directory, one file per key
+    (see result_key()). max_size is the size budget in bytes (None means no limit);
+    the least recently used files are removed when it is exceeded.
+
+    """
+
+    suffix = '.vtresult'
+
+    def __init__(self, directory, max_size=None):
+        self.directory = directory
+        self.max_size = max_size or None
+        self.hits = 0
+        self.misses = 0
+        self.elements = {}
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.init_cache()
+
+    def init_cache(self):
+        self.elements = {}
+        for f in os.listdir(self.directory):
+            if not f.endswith(self.suffix):
+                continue
+            fname = os.path.join(self.directory, f)
+            statinfo = os.stat(fname)
+            self.elements[f[:-len(self.suffix)]] = StoreEntry(
+                    fname, statinfo.st_size, statinfo.st_mtime)
+
+    def size(self):
+        return sum(entry.size for entry in self.elements.itervalues())
+
+    def get_filename(self, signature):
+        return os.path.join(self.directory, signature + self.suffix)
+
+    def has(self, signature):
+        return signature in self.elements
+
+    def load(self, signature):
+        """load(signature: str) -> dict or None
+        Returns the outputs stored for this signature, or None.
+
+        """
+        entry = self.elements.get(signature)
+        if entry is None:
+            self.misses += 1
+            return None
+        try:
+            with open(entry.abs_name, 'rb') as fp:
+                data = pickle.load(fp)
+            if data.get('version') != STORE_VERSION:
+                raise ValueError("unsupported version %r" %
+                                 data.get('version'))
+            outputs = dict((name, self._decode(value))
+                           for name, value in data['outputs'].iteritems())
+        except Exception, e:
+            debug.warning("Could not load cached result %s" % signature, e)
+            self.remove(signature)
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry.time = time.time()
+        try:
+            os.utime(entry.abs_name, None)
+        except OSError:
+            pass
+        return outputs
+
+    def save(self, signature, outputs):
+        """save(signature: str, outputs: dict) -> bool
+        Stores the outputs for this signature. Returns False if they can't
+        be serialized, in which case nothing is stored.
+
+        """
+        try:
+            data = {'version': STORE_VERSION,
+                    'outputs': dict((name, self._encode(value))
+                                    for name, value in outputs.iteritems())}
+            serialized = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        except Exception, e:
+            debug.debug("Not storing result %s: %s" % (signature, e))
+            return False
+        if self.max_size is not None and len(serialized) > self.max_size:
+            return False
+        fname = self.get_filename(signature)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(serialized)
+            if os.path.exists(fname):
+                os.unlink(fname)
+            os.rename(tmp_name, fname)
+        except (IOError, OSError), e:
+            debug.warning("Could not store result %s" % signature, e)
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            return False
+        self.elements[signature] = StoreEntry(fname, len(serialized),
+                                              time.time())
+        self.remove_lru()
+        return True
+
+    def remove(self, signature):
+        entry = self.elements.pop(signature, None)
+        if entry is not None:
+            try:
+                os.unlink(entry.abs_name)
+            except OSError, e:
+                debug.warning("Could not remove file %s" % entry.abs_name, e)
+
+    def remove_lru(self):
+        """remove_lru() -> None
+        Removes the least recently used entries until the store is within
+        its size budget.
+
+        """
+        if self.max_size is None:
+            return
+        size = self.size()
+        if size <= self.max_size:
+            return
+        elements = sorted(self.elements.iteritems(),
+                          key=lambda (sig, entry): entry.time)
+        for signature, entry in elements:
+            if size <= self.max_size:
+                break
+            size -= entry.size
+            self.remove(signature)
+
+    def clear(self):
+        for signature in self.elements.keys():
+            self.remove(signature)
+
+    @staticmethod
+    def _encode(value):
+        from vistrails.core.modules.module_registry import get_module_registry
+        from vistrails.core.modules.vistrails_module import Module
+        if isinstance(value, Module):
+            reg = get_module_registry()
+            sigstring = reg.get_descriptor(type(value)).sigstring
+            return ('module', sigstring, value.serialize())
+        return ('value', value)
+
+    @staticmethod
+    def _decode(value):
+        from vistrails.core.modules.module_registry import get_module_registry
+        from vistrails.core.modules.utils import parse_descriptor_string
+        if value[0] == 'module':
+            reg = get_module_registry()
+            d_tuple = parse_descriptor_string(value[1])
+            module_klass = reg.get_descriptor_by_name(*d_tuple).module
+            return module_klass().deserialize(value[2])
+        return value[1]
+
+def create_result_store_from_configuration(configuration=None):
+    """create_result_store_from_configuration(configuration)
+      -> ResultStore or None
+    Builds the store from the persistentCache, persistentCacheDir and
+    persistentCacheSize (in MB) configuration settings. Returns None if
+    the store is disabled.
+
+    """
+    from vistrails.core.system import get_vistrails_directory
+    if configuration is None:
+        from vistrails.core.configuration import get_vistrails_configuration
+        configuration = get_vistrails_configuration()
+    if configuration is None or not configuration.check('persistentCache'):
+        return None
+    directory = get_vistrails_directory('persistentCacheDir', configuration)
+    if directory is None:
+        return None
+    max_size = getattr(configuration, 'persistentCacheSize', None)
+    if max_size:
+        max_size = max_size * 1024 * 1024
+    try:
+        return ResultStore(directory, max_size)
+    except OSError, e:
+        debug.warning("Could not open result store in %s" % directory, e)
+        return None
+
+##############################################################################
+
+import shutil
+import unittest
+
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='vt_results_')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_roundtrip(self):
+        store = ResultStore(self.directory)
+        self.assertIsNone(store.load('abc'))
+        self.assertTrue(store.save('abc', {'value': [1, 2.5, 'x']}))
+        self.assertTrue(store.has('abc'))
+        self.assertEqual(store.load('abc'), {'value': [1, 2.5, 'x']})
+        # a new store on the same directory sees the entry
+        store = ResultStore(self.directory)
+        self.assertEqual(store.load('abc'), {'value': [1, 2.5, 'x']})
+        self.assertEqual((store.hits, store.misses), (1, 0))
+
+    def test_unpicklable(self):
+        store = ResultStore(self.directory)
+        self.assertFalse(store.save('abc', {'value': lambda: None}))
+        self.assertFalse(store.has('abc'))
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_eviction(self):
+        store = ResultStore(self.directory)
+        for i in xrange(3):
+            store.save('sig%d' % i, {'value': 'x' * 1000})
+            store.elements['sig%d' % i].time = i
+        store.max_size = 2500
+        store.load('sig0')
+        store.save('sig3', {'value': 'x' * 1000})
+        self.assertEqual(sorted(store.elements), ['sig0', 'sig3'])
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         ['sig0.vtresult', 'sig3.vtresult'])
+
+    def test_key(self):
+        class Descriptor(object):
+            def __init__(self, identifier, package_version):
+                self.identifier = identifier
+                self.package_version = package_version
+        key = result_key('abc', Descriptor('org.example', '1.0'))
+        self.assertEqual(key, result_key('abc',
+                                         Descriptor('org.example', '1.0')))
+        self.assertNotEqual(key, result_key('abd',
+                                            Descriptor('org.example', '1.0')))
+        self.assertNotEqual(key, result_key('abc',
+                                            Descriptor('org.example', '1.1')))
+        self.assertNotEqual(key, result_key('abc',
+                                            Descriptor('org.other', '1.0')))
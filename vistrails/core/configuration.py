@@ -60,6 +60,9 @@ autoConnect: Automatically connect dragged in modules
 autoSave: Automatically save backup vistrails every two minutes
 batch: Run in batch mode instead of interactive mode
 cache: Cache previous results so they may be used in future computations
+cacheMaxEntries: Maximum number of cached modules (0 for no limit)
+cacheMaxMemory: Maximum estimated size of cached results (MB, 0 for no limit)
+cachePolicy: Which cached modules to evict first (lru or lfu)
 dataDir: Default data directory
 db: The name for the database to load the vistrail from
 dbDefault: Save vistrails in a database by default
@@ -71,6 +74,10 @@ enablePackagesSilently: Automatically enable packages when needed
 errorLog: Write errors to a log file
 execute: Execute any specified workflows
 executionLog: Track execution provenance when running workflows
+executionLogLoopSampling: Log one iteration out of N for looping modules
+executionLogStream: Write execution provenance to disk as executions finish
+executionProfile: Write a per-module execution profile to this file
+executionThreads: Number of threads used to run independent modules
 fileDir: Default vistrail directory
 fixedSpreadsheetCells: Draw spreadsheet cells at a fixed size
 handlerDontAsk: Do not ask about extension handling at startup
@@ -82,6 +89,8 @@ jobAutorun: Run jobs automatically when they finish
 jobCheckInterval: How often to check for jobs (in seconds)
 jobList: List running workflows
 jobInfo: List jobs in running workflow
+jobs: Number of processes for parameter explorations
+lazyActionLoading: Read the changes of large vistrail files only when needed
 logDir: Log files directory
 maxRecentVistrails: Number of recent vistrails
 maximizeWindows: VisTrails windows should be maximized
@@ -91,7 +100,12 @@ multithread: Server will start a thread for each request
 packageDir: System packages directory
 parameterExploration: Run parameter exploration instead of workflow
 parameters: List of parameters to use when running workflow
+persistentCache: Store results of modules that allow it on disk
+persistentCacheDir: Directory of the on-disk result store
+persistentCacheSize: Size of the on-disk result store (MB)
 port: The port for the database to load the vistrail from
+registryCache: Reuse the modules registered by packages in previous sessions
+registryCacheDir: Directory of the registry snapshots
 repositoryHTTPURL: Remote package repository URL
 repositoryLocalPath: Local package repository directory
 rootDirectory: Directory that contains the VisTrails source code
@@ -153,6 +167,23 @@ cache: Boolean
 
     Cache previous results so they may be used in future computations.
 
+cacheMaxEntries: Integer
+
+    The maximum number of modules kept in the execution cache. When
+    the cache grows beyond that, modules are evicted according to
+    cachePolicy, along with the modules downstream of them. 0 means no
+    limit.
+
+cacheMaxMemory: Integer
+
+    The maximum estimated size (in MB) of the results kept in the
+    execution cache. 0 means no limit.
+
+cachePolicy: String
+
+    Which modules get evicted first from the execution cache when it is
+    full: 'lru' (least recently used) or 'lfu' (least frequently used).
+
 dataDir: Path
 
     The location that VisTrails uses as a default directory for data.
@@ -201,6 +232,35 @@ executionLog: Boolean
 
     Track execution provenance when running workflows.
 
+executionLogLoopSampling: Integer
+
+    Only record one iteration out of N in the execution log when a
+    module loops over a list, to bound the size of the log. Iterations
+    that fail or get suspended are always recorded, and the total
+    number of iterations is added as an annotation on the looping
+    module. 1 (the default) records every iteration, 0 records none
+    but failures.
+
+executionLogStream: Boolean
+
+    Append each workflow execution to the log file as soon as it
+    finishes, instead of keeping the whole execution log in memory
+    until the vistrail is saved.
+
+executionProfile: Path
+
+    Profile the modules of every workflow execution and write the
+    result to this file in the Chrome trace format (for
+    chrome://tracing). A table summarizing the time spent in each
+    module is written next to it, with a '.txt' extension.
+
+executionThreads: Integer
+
+    The number of worker threads used to update independent branches
+    of a workflow concurrently. Only modules that declare themselves
+    thread-safe run on the worker threads. 1 means that modules are
+    updated one at a time.
+
 fileDir: Path
 
     The location that VisTrails uses as a default directory for
@@ -247,6 +307,20 @@ jobInfo: Boolean
 
     List jobs in running workflow
 
+jobs: Integer
+
+    Number of processes to use when running a parameter exploration
+    from the command-line. With more than one, the pipelines are
+    executed without the spreadsheet.
+
+lazyActionLoading: Boolean
+
+    When opening a vistrail from a .vt or .xml file, only read the
+    version tree and read the changes that make up each version when
+    they are first needed. This makes opening large vistrails faster
+    and uses less memory. The file must not be modified by another
+    program while the vistrail is open.
+
 logDir: Path
 
     The path that indicates where log files should be stored.
@@ -313,6 +387,21 @@ parameters: String
 
     List of parameters to use when running workflow.
 
+persistentCache: Boolean
+
+    Save the results of modules that allow it (through the
+    persistent_cache module setting) to an on-disk store, so that
+    later sessions can reuse them instead of recomputing.
+
+persistentCacheDir: Path
+
+    The directory of the on-disk result store.
+
+persistentCacheSize: Integer
+
+    The size (in MB) of the on-disk result store. Least recently used
+    results are removed when it grows beyond that.
+
 port: Integer
 
     The port for the database to load the vistrail from.
@@ -325,6 +414,19 @@ recentVistrailList: String
 
     Storage for recent vistrails. Users should not edit.
 
+registryCache: Boolean
+
+    After initializing a package, store the modules and ports it
+    registered in a snapshot file. When not running the GUI, packages
+    with an up-to-date snapshot are registered from it and their code is
+    only imported when one of their modules is used, which makes
+    starting VisTrails faster. The VTK package also keeps the ports it
+    generates from the VTK classes there.
+
+registryCacheDir: Path
+
+    The directory of the registry snapshots.
+
 repositoryHTTPURL: URL
 
     URL used to locate packages available to be installed.
@@ -615,6 +717,9 @@ base_config = {
      ConfigField("parameters", None, str, ConfigType.COMMAND_LINE),
      ConfigField("parameterExploration", False, bool,
                  ConfigType.COMMAND_LINE_FLAG),
+     ConfigField("jobs", 1, int, ConfigType.COMMAND_LINE, flag='-j'),
+     ConfigField("executionProfile", None, ConfigPath,
+                 ConfigType.COMMAND_LINE),
      ConfigField('showWindow', True, bool, ConfigType.COMMAND_LINE_FLAG),
      ConfigField("withVersionTree", False, bool, ConfigType.COMMAND_LINE_FLAG),
      ConfigField("withWorkflow", False, bool, ConfigType.COMMAND_LINE_FLAG),
@@ -637,8 +742,22 @@ base_config = {
     [ConfigField('autoSave', True, bool, ConfigType.ON_OFF),
      ConfigField('dbDefault', False, bool, ConfigType.ON_OFF),
      ConfigField('cache', True, bool, ConfigType.ON_OFF),
+     ConfigField('cacheMaxEntries', 0, int),
+     ConfigField('cacheMaxMemory', 0, int),
+     ConfigField('persistentCache', False, bool, ConfigType.ON_OFF),
+     ConfigField('persistentCacheSize', 1024, int),
+     ConfigField('registryCache', False, bool, ConfigType.ON_OFF),
+     ConfigField('cachePolicy', "lru", str, widget_type="combo",
+                 widget_options={"allowed_values": ["lru", "lfu"],
+                                 "label": "Cache eviction policy",
+                                 "remap": {"lru": "Least Recently Used",
+                                           "lfu": "Least Frequently Used"}}),
      ConfigField('stopOnError', True, bool, ConfigType.ON_OFF),
      ConfigField('executionLog', True, bool, ConfigType.ON_OFF),
+     ConfigField('executionLogLoopSampling', 1, int),
+     ConfigField('executionLogStream', False, bool, ConfigType.ON_OFF),
+     ConfigField('executionThreads', 1, int),
+     ConfigField('lazyActionLoading', False, bool, ConfigType.ON_OFF),
      ConfigField('errorLog', True, bool, ConfigType.ON_OFF),
      ConfigField('defaultFileType', system.vistrails_default_file_type(), str,
                  widget_type="combo",
@@ -713,6 +832,8 @@ base_config = {
      ConfigField('userPackageDir', "userpackages", ConfigPath),
      ConfigField('fileDir', None, ConfigPath),
      ConfigField('logDir', "logs", ConfigPath),
+     ConfigField('persistentCacheDir', "results", ConfigPath),
+     ConfigField('registryCacheDir', "registry", ConfigPath),
      ConfigField('temporaryDir', None,  ConfigPath)],
     "Advanced":
     [ConfigField('singleInstance', True, bool, ConfigType.ON_OFF),
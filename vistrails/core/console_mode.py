@@ -274,15 +274,22 @@ def run(w_list, parameters='', output_dir=None, update_vistrail=True,
     return all_errors
 
 def run_parameter_exploration(locator, pe_id, extra_info = {},
-                              reason="Console Mode Parameter Exploration Execution"):
+                              reason="Console Mode Parameter Exploration Execution",
+                              jobs=None):
     """run_parameter_exploration(w_list: (locator, version),
                                  pe_id: str/int,
-                                 reason: str) -> (pe_id, [error msg])
+                                 reason: str,
+                                 jobs: int) -> (pe_id, [error msg])
     Run parameter exploration in w, and returns an interpreter result object.
     version can be a tag name or a version id.
+
+    If jobs is greater than 1, or if the GUI is not running, the exploration
+    is run without the spreadsheet, on jobs processes.
     
     """
-    if is_running_gui():
+    if jobs is None:
+        jobs = getattr(get_vistrails_configuration(), 'jobs', 1)
+    if is_running_gui() and jobs <= 1:
         from vistrails.gui.vistrail_controller import VistrailController as \
              GUIVistrailController
         try:
@@ -301,10 +308,70 @@ def run_parameter_exploration(locator, pe_id, extra_info = {},
             import traceback
             return (locator, pe_id,
                     debug.format_exception(e), traceback.format_exc())
+    else:
+        try:
+            errors = execute_parameter_exploration(locator, pe_id, jobs,
+                                                   extra_info, reason)
+        except Exception, e:
+            import traceback
+            return (locator, pe_id,
+                    debug.format_exception(e), traceback.format_exc())
+        if errors:
+            return (locator, pe_id, "%d module(s) failed" % len(errors),
+                    '\n'.join(errors))
+
+def execute_parameter_exploration(locator, pe_id, jobs=1, extra_info=None,
+                                  reason="Console Mode Parameter Exploration "
+                                         "Execution"):
+    """execute_parameter_exploration(locator, pe_id: str/int, jobs: int,
+                                     extra_info: dict, reason: str) -> [str]
+    Run parameter exploration pe_id without a GUI, on jobs processes.
+    Returns the list of error messages.
+
+    """
+    from vistrails.core.param_explore import ExplorationExecutor
+
+    (v, abstractions , thumbnails, mashups)  = load_vistrail(locator)
+    controller = VistrailController(v, locator, abstractions, thumbnails,
+                                    mashups, auto_save=False)
+    try:
+        pe_id = int(pe_id)
+        pe = controller.vistrail.get_paramexp(pe_id)
+    except ValueError:
+        pe = controller.vistrail.get_named_paramexp(pe_id)
+    controller.change_selected_version(pe.action_id)
+    actions, pre_actions, vistrail_vars = \
+            pe.collectParameterActions(controller.current_pipeline)
+
+    kwargs = {'locator': locator,
+              'current_version': controller.current_version,
+              'reason': reason,
+              'extra_info': extra_info or {}}
+    if controller.get_vistrail_variables():
+        # remove vars used in pe
+        vars = dict((var.uuid, var)
+                    for var in controller.get_vistrail_variables()
+                    if var.uuid not in vistrail_vars)
+        kwargs['vistrail_variables'] = lambda x: vars.get(x, None)
+
+    log = None
+    if controller.logging_on():
+        log = controller.log
+    executor = ExplorationExecutor(controller.current_pipeline, actions,
+                                   pre_actions, jobs)
+    results = executor.execute(log, **kwargs)
+
+    errors = []
+    for i, result in enumerate(results):
+        for module_id, error in sorted(result.iteritems()):
+            errors.append("pipeline %d, module %s: %s" % (i, module_id,
+                                                          error))
+    return errors
 
 def run_parameter_explorations(w_list, extra_info = {},
-                       reason="Console Mode Parameter Exploration Execution"):
-    """run(w_list: list of (locator, pe_id), reason: str) -> boolean
+                       reason="Console Mode Parameter Exploration Execution",
+                       jobs=None):
+    """run(w_list: list of (locator, pe_id), reason: str, jobs: int) -> boolean
     For each workflow in w_list, run parameter exploration pe_id
     version can be a tag name or a version id.
     Returns list of errors (empty list if there are no errors)
@@ -312,7 +379,7 @@ def run_parameter_explorations(w_list, extra_info = {},
     all_errors = []
     for locator, pe_id in w_list:
         result = run_parameter_exploration(locator, pe_id, reason=reason,
-                                           extra_info=extra_info)
+                                           extra_info=extra_info, jobs=jobs)
         if result:
             all_errors.append(result)
     return all_errors
@@ -34,6 +34,7 @@
 ###############################################################################
 from vistrails.core.vistrail.action import Action
 from vistrails.core.log.log import Log
+from vistrails.core.log.workflow_exec import WorkflowExec
 from vistrails.core.vistrail.operation import AddOp, ChangeOp, DeleteOp
 from vistrails.db.services.io import SaveBundle
 import vistrails.db.services.io
@@ -111,6 +112,15 @@ def open_log(fname, was_appended=False):
     return log
 
 
+def open_workflow_exec(fname, index):
+    workflow_exec = \
+        vistrails.db.services.io.open_workflow_exec_from_xml(fname, index)
+    WorkflowExec.convert(workflow_exec)
+    return workflow_exec
+
+def append_workflow_exec(workflow_exec, fname):
+    vistrails.db.services.io.append_workflow_exec_to_xml(workflow_exec, fname)
+
 def merge_logs(new_log, log_fname):
     log = vistrails.db.services.io.merge_logs(new_log, log_fname)
     Log.convert(log)
@@ -44,7 +44,8 @@ from vistrails.core.thumbnails import ThumbnailCache
 from vistrails.core import debug
 from vistrails.db.services.locator import XMLFileLocator as _XMLFileLocator, \
     DBLocator as _DBLocator, ZIPFileLocator as _ZIPFileLocator, \
-    BaseLocator as _BaseLocator, UntitledLocator as _UntitledLocator
+    BaseLocator as _BaseLocator, UntitledLocator as _UntitledLocator, \
+    BinaryFileLocator as _BinaryFileLocator
 from vistrails.db.services.io import SaveBundle, test_db_connection
 from vistrails.db import VistrailsDBException
 from vistrails.db.domain import DBWorkflow
@@ -57,6 +58,8 @@ class BaseLocator(_BaseLocator):
             locator.__class__ = XMLFileLocator
         elif locator.__class__ == _ZIPFileLocator:
             locator.__class__ = ZIPFileLocator
+        elif locator.__class__ == _BinaryFileLocator:
+            locator.__class__ = BinaryFileLocator
         elif locator.__class__ == _DBLocator:
             DBLocator.convert(locator)
         elif locator.__class__ == _UntitledLocator:
@@ -107,6 +110,16 @@ class CoreLocator(object):
                      OpmGraph.vtType: OpmGraph}
         return klass_map[vt_type]
 
+def lazy_action_loading(klass):
+    """lazy_action_loading(klass) -> bool
+
+    Whether the actions of a vistrail file should be read on demand.
+
+    """
+    from vistrails.core.vistrail.vistrail import Vistrail
+    return (klass.vtType == Vistrail.vtType and
+            get_vistrails_configuration().check('lazyActionLoading'))
+
 class UntitledLocator(_UntitledLocator, CoreLocator):
     def load(self, klass=None):
         from vistrails.core.vistrail.vistrail import Vistrail
@@ -126,7 +139,8 @@ class XMLFileLocator(_XMLFileLocator, CoreLocator):
         from vistrails.core.vistrail.vistrail import Vistrail
         if klass is None:
             klass = Vistrail
-        obj = _XMLFileLocator.load(self, klass.vtType)
+        obj = _XMLFileLocator.load(self, klass.vtType,
+                                   lazy_action_loading(klass))
         klass.convert(obj)
         obj.locator = self
         return obj
@@ -433,7 +447,8 @@ class DBLocator(_DBLocator, CoreLocator):
     def __eq__(self, other):
         if type(other) != type(self):
             return False
-        return (self._host == other._host and
+        return (self._backend == other._backend and
+                self._host == other._host and
                 self._port == other._port and
                 self._db == other._db and
                 self._user == other._user and
@@ -470,6 +485,73 @@ class DBLocator(_DBLocator, CoreLocator):
         locator.__list = ExtConnectionList.getInstance(
                                                    default_connections_file())
 
+class BinaryFileLocator(_BinaryFileLocator, CoreLocator):
+
+    def __init__(self, filename, **kwargs):
+        _BinaryFileLocator.__init__(self, filename, **kwargs)
+
+    def load(self, klass=None):
+        from vistrails.core.vistrail.vistrail import Vistrail
+        if klass is None:
+            klass = Vistrail
+        obj = _BinaryFileLocator.load(self, klass.vtType)
+        klass.convert(obj)
+        obj.locator = self
+        return obj
+
+    def save(self, obj):
+        is_bundle = False
+        if type(obj) == type(SaveBundle(None)):
+            is_bundle = True
+            save_bundle = obj
+            obj = save_bundle.get_primary_obj()
+        klass = obj.__class__
+        obj = _BinaryFileLocator.save(self, obj, False)
+        klass.convert(obj)
+        obj.locator = self
+        if is_bundle:
+            return SaveBundle(save_bundle.bundle_type, obj)
+        return obj
+
+    def save_as(self, obj, version=None):
+        is_bundle = False
+        if type(obj) == type(SaveBundle(None)):
+            is_bundle = True
+            save_bundle = obj
+            obj = save_bundle.get_primary_obj()
+        klass = obj.__class__
+        obj = _BinaryFileLocator.save(self, obj, True, version)
+        klass.convert(obj)
+        obj.locator = self
+        if is_bundle:
+            return SaveBundle(save_bundle.bundle_type, obj)
+        return obj
+
+    ##########################################################################
+
+    def __eq__(self, other):
+        if not isinstance(other, BinaryFileLocator):
+            return False
+        return self._name == other._name
+
+    ##########################################################################
+
+    @staticmethod
+    def prompt_autosave(parent_widget):
+        import vistrails.gui.extras.core.db.locator as db_gui
+        return db_gui.get_autosave_prompt(parent_widget)
+
+    @staticmethod
+    def load_from_gui(parent_widget, obj_type):
+        import vistrails.gui.extras.core.db.locator as db_gui
+        return db_gui.get_load_file_locator_from_gui(parent_widget, obj_type)
+
+    @staticmethod
+    def save_from_gui(parent_widget, obj_type, locator=None):
+        import vistrails.gui.extras.core.db.locator as db_gui
+        return db_gui.get_save_file_locator_from_gui(parent_widget, obj_type,
+                                                         locator)
+
 class ZIPFileLocator(_ZIPFileLocator, CoreLocator):
 
     def __init__(self, filename, **kwargs):
@@ -479,7 +561,8 @@ class ZIPFileLocator(_ZIPFileLocator, CoreLocator):
         from vistrails.core.vistrail.vistrail import Vistrail
         if klass is None:
             klass = Vistrail
-        save_bundle = _ZIPFileLocator.load(self, klass.vtType)
+        save_bundle = _ZIPFileLocator.load(self, klass.vtType,
+                                           lazy_action_loading(klass))
         for obj in save_bundle.get_db_objs():
             klass = self.get_convert_klass(obj.vtType)
             klass.convert(obj)
@@ -534,6 +617,8 @@ class FileLocator(CoreLocator):
         if filename:
             if filename.endswith('.vt'):
                 return ZIPFileLocator(filename, **kwargs)
+            elif filename.endswith('.vtb'):
+                return BinaryFileLocator(filename, **kwargs)
             elif filename.endswith('.vtl'):
                 return FileLocator.from_link_file(filename)
             else:
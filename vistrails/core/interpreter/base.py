@@ -189,6 +189,7 @@ class BaseInterpreter(object):
                 info = pipeline.aliases[alias]
                 param = pipeline.db_get_object(info[0],info[1])
                 param.strValue = str(aliases[alias])
+                pipeline.invalidate_signatures([info[4]])
             except KeyError:
                 pass
                     
@@ -203,12 +204,19 @@ class BaseInterpreter(object):
         
         """
         if customParams:
+            changed = set()
             for (vttype, oId, strval) in customParams:
                 try:
                     param = pipeline.db_get_object(vttype,oId)
                     param.strValue = str(strval)
+                    changed.add(id(param))
                 except Exception, e:
                     debug.debug("Problem when updating params", e)
+            if changed:
+                pipeline.invalidate_signatures(
+                        [m.id for m in pipeline.module_list
+                         if any(id(p) in changed
+                                for f in m.functions for p in f.params)])
 
     def resolve_variables(self, vistrail_variables, pipeline):
         for m in pipeline.module_list:
@@ -220,6 +228,7 @@ class BaseInterpreter(object):
                 for func in m.functions:
                     if func.name == 'value':
                         func.params[0].strValue = strValue
+                pipeline.invalidate_signatures([m.id])
 
     def set_done_summon_hook(self, hook):
         """ set_done_summon_hook(hook: function(pipeline, objects)) -> None
@@ -34,15 +34,23 @@
 ###############################################################################
 
 import base64
+from collections import OrderedDict
 import copy
 import gc
 import cPickle as pickle
 
+from vistrails.core.cache.policy import \
+    create_cache_policy_from_configuration, estimate_size
+from vistrails.core.cache.store import \
+    create_result_store_from_configuration, result_key
 from vistrails.core.common import InstanceObject, VistrailsInternalError
+from vistrails.core.configuration import get_vistrails_configuration
 from vistrails.core.data_structures.bijectivedict import Bidict
 from vistrails.core import debug
 import vistrails.core.interpreter.base
 from vistrails.core.interpreter.base import AbortExecution
+from vistrails.core.interpreter.scheduler import CallQueue, \
+    SynchronizedLogController, update_parallel
 import vistrails.core.interpreter.utils
 from vistrails.core.log.controller import DummyLogController
 from vistrails.core.modules.basic_modules import identifier as basic_pkg, \
@@ -56,6 +64,39 @@ import vistrails.core.system
 import vistrails.core.vistrail.pipeline
 
 
+###############################################################################
+
+class ValidationPlan(object):
+    """What validating a pipeline computed, for reuse by pipelines with the
+    same structure.
+
+    Pipelines with the same structure_signature() only differ by their
+    parameter values, which don't change the result of validation: the
+    specs of the connections and the list depths can be copied over
+    instead of being looked up in the registry again.
+    """
+    def __init__(self, pipeline):
+        self.modules = dict((module.id, (module.list_depth,
+                                         list(module.iterated_ports)))
+                            for module in pipeline.module_list)
+        self.connections = dict((conn.id, (conn.source.spec,
+                                           conn.destination.spec))
+                                for conn in pipeline.connection_list)
+
+    def apply(self, pipeline):
+        for module in pipeline.module_list:
+            module.is_valid = True
+            for function in module.functions:
+                function.is_valid = True
+            module.list_depth, iterated_ports = self.modules[module.id]
+            module.iterated_ports = list(iterated_ports)
+        for conn in pipeline.connection_list:
+            conn.source.spec, conn.destination.spec = \
+                self.connections[conn.id]
+            conn.source.is_valid = conn.source.spec.is_valid
+            conn.destination.is_valid = conn.destination.spec.is_valid
+        pipeline.is_valid = True
+
 ###############################################################################
 
 class ViewUpdatingLogController(object):
@@ -208,8 +249,12 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         self._file_pool = FilePool()
         self._persistent_pipeline = vistrails.core.vistrail.pipeline.Pipeline()
         self._objects = {}
+        self._cache_policy = create_cache_policy_from_configuration()
+        self._execute_depth = 0
+        self._result_store = create_result_store_from_configuration()
         self.filePool = self._file_pool
         self._streams = []
+        self.clear_plans()
 
     def clear(self):
         self._file_pool.cleanup()
@@ -217,15 +262,68 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         for obj in self._objects.itervalues():
             obj.clear()
         self._objects = {}
+        self._cache_policy.clear()
+
+    def set_cache_policy(self, policy):
+        """set_cache_policy(policy: CachePolicy) -> None
+
+        Replaces the eviction policy of the persistent pipeline. The
+        modules currently cached are registered with the new policy, which
+        is enforced right away.
+        """
+        self._cache_policy = policy
+        for i in sorted(self._objects):
+            module = self._persistent_pipeline.modules[i]
+            policy.add(module._signature, i, estimate_size(self._objects[i]))
+        policy.hits = policy.misses = 0
+        self.enforce_cache_policy()
+
+    def set_result_store(self, store):
+        """set_result_store(store: ResultStore) -> None
+
+        Replaces the on-disk result store, None disabling it. The modules
+        currently cached are unaffected.
+        """
+        self._result_store = store
+
+    def get_cache_statistics(self):
+        """get_cache_statistics() -> dict
+
+        Returns the hit, miss and eviction counters of the cache, along
+        with its current number of entries and estimated memory. If the
+        on-disk result store is enabled, its hits and misses are included.
+        """
+        stats = self._cache_policy.statistics()
+        if self._result_store is not None:
+            stats['store_hits'] = self._result_store.hits
+            stats['store_misses'] = self._result_store.misses
+        return stats
+
+    def enforce_cache_policy(self, protected=frozenset()):
+        """enforce_cache_policy(protected: set of persistent module ids)
+
+        Evicts modules from the persistent pipeline until the cache is
+        within the budget of its policy. Evicting a module also evicts the
+        modules downstream of it, since their signatures depend on it.
+        Modules in protected are never selected as victims.
+        """
+        policy = self._cache_policy
+        while True:
+            victim = policy.select_victim(protected)
+            if victim is None:
+                break
+            self.clean_modules([victim.module_id], evicted=True)
 
     def __del__(self):
         self.clear()
 
-    def clean_modules(self, modules_to_clean):
-        """clean_modules(modules_to_clean: list of persistent module ids)
+    def clean_modules(self, modules_to_clean, evicted=False):
+        """clean_modules(modules_to_clean: list of persistent module ids,
+                         evicted: bool)
 
         Removes modules from the persistent pipeline, and the modules that
-        depend on them."""
+        depend on them. evicted indicates that they are removed by the
+        cache policy, and is only used for statistics."""
         if not modules_to_clean:
             return
         g = self._persistent_pipeline.graph
@@ -233,6 +331,9 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
                             set(self._persistent_pipeline.modules.iterkeys()))
         dependencies = g.vertices_topological_sort(modules_to_clean)
         for v in dependencies:
+            self._cache_policy.discard(
+                    self._persistent_pipeline.modules[v]._signature,
+                    evicted)
             self._persistent_pipeline.delete_module(v)
             del self._objects[v]
 
@@ -257,6 +358,63 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
                    for mod in self._persistent_pipeline.module_list
                    if mod.module_descriptor.identifier == identifier]
         self.clean_modules(modules)
+        # the plans reference the descriptors of the package
+        self.clear_plans()
+
+    # Number of pipeline structures whose validation is remembered
+    MAX_VALIDATION_PLANS = 32
+
+    def clear_plans(self):
+        """clear_plans() -> None
+
+        Forgets the validation results and function plans, that are
+        reused by pipelines with the same structure.
+        """
+        self._validation_plans = OrderedDict()
+        self._function_plans = {}
+
+    def validate_pipeline(self, pipeline, controller=None):
+        """validate_pipeline(pipeline: Pipeline, controller) -> None
+
+        Validates the pipeline, or reuses the result of validating a
+        pipeline with the same structure.
+        """
+        key = pipeline.structure_signature()
+        plan = None
+        if key is not None:
+            plan = self._validation_plans.pop(key, None)
+        if plan is not None:
+            plan.apply(pipeline)
+        else:
+            if controller is not None:
+                # Controller is none for sub_modules
+                controller.validate(pipeline)
+            else:
+                pipeline.validate()
+            if key is None:
+                return
+            plan = ValidationPlan(pipeline)
+            if len(self._validation_plans) >= self.MAX_VALIDATION_PLANS:
+                self._validation_plans.popitem(last=False)
+        # most recently used last
+        self._validation_plans[key] = plan
+
+    def get_function_plan(self, function):
+        """get_function_plan(function: ModuleFunction) -> (PortSpec, list)
+
+        Returns the spec of the output port and the descriptors of the
+        parameters of a function, which only depend on the parameter types.
+        """
+        key = tuple((p.identifier, p.type, p.namespace)
+                    for p in function.params)
+        try:
+            return self._function_plans[key]
+        except KeyError:
+            reg = get_module_registry()
+            descriptors = [reg.get_descriptor_by_name(*k) for k in key]
+            plan = self._function_plans[key] = (function.get_spec('output'),
+                                                descriptors)
+            return plan
 
     def make_connection(self, conn, src, dst):
         """make_connection(self, conn, src, dst)
@@ -299,6 +457,8 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         module_executed_hook = fetch('module_executed_hook', [])
         stop_on_error = fetch('stop_on_error', True)
         parent_exec = fetch('parent_exec', None)
+        threads = fetch('threads', None)
+        profiler = fetch('profiler', None)
 
         reg = get_module_registry()
 
@@ -312,10 +472,8 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
             descriptor = getter(basic_pkg, 'Null')
             return descriptor.module()
         
-        def create_constant(param, module):
+        def create_constant(param, module, desc):
             """Creates a Constant from a parameter spec"""
-            getter = reg.get_descriptor_by_name
-            desc = getter(param.identifier, param.type, param.namespace)
             constant = desc.module()
             constant.id = module.id
 #             if param.evaluatedStrValue:
@@ -334,11 +492,7 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         to_delete = []
         errors = {}
 
-        if controller is not None:
-            # Controller is none for sub_modules
-            controller.validate(pipeline)
-        else:
-            pipeline.validate()
+        self.validate_pipeline(pipeline, controller)
 
         self.resolve_aliases(pipeline, aliases)
         if vistrail_variables:
@@ -351,6 +505,14 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
          module_added_set,
          conn_added_set) = self.add_to_persistent_pipeline(pipeline)
 
+        # Register cache hits and misses with the policy
+        for i, persistent_id in tmp_to_persistent_module_map.iteritems():
+            sig = self._persistent_pipeline.modules[persistent_id]._signature
+            if i in module_added_set:
+                self._cache_policy.add(sig, persistent_id)
+            else:
+                self._cache_policy.touch(sig)
+
         # Create the new objects
         for i in module_added_set:
             persistent_id = tmp_to_persistent_module_map[i]
@@ -367,17 +529,40 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
                 if annotate_output:
                     obj.annotate_output = True
 
+            # Reuse outputs from the on-disk result store
+            if (self._result_store is not None and
+                    module.module_descriptor.persistent_cache):
+                outputs = self._result_store.load(
+                        result_key(module._signature,
+                                   module.module_descriptor))
+                if outputs is not None:
+                    for port, value in outputs.iteritems():
+                        obj.set_output(port, value)
+                    obj.upToDate = True
+                    obj.loaded_from_store = True
+
             for f in module.functions:
                 connector = None
+                try:
+                    spec, descriptors = self.get_function_plan(f)
+                except Exception, e:
+                    debug.unexpected_exception(e)
+                    errors[i] = ModuleError(
+                            module,
+                            "Uncaught exception creating Constants for "
+                            "function %s: %s" % (
+                            f.name,
+                            debug.format_exception(e)))
+                    to_delete.append(obj.id)
+                    continue
                 if len(f.params) == 0:
                     connector = ModuleConnector(create_null(), 'value',
-                                                f.get_spec('output'))
+                                                spec)
                 elif len(f.params) == 1:
                     p = f.params[0]
                     try:
-                        constant = create_constant(p, module)
-                        connector = ModuleConnector(constant, 'value',
-                                                    f.get_spec('output'))
+                        constant = create_constant(p, module, descriptors[0])
+                        connector = ModuleConnector(constant, 'value', spec)
                     except Exception, e:
                         debug.unexpected_exception(e)
                         err = ModuleError(
@@ -393,10 +578,11 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
                     tupleModule.length = len(f.params)
                     for (j,p) in enumerate(f.params):
                         try:
-                            constant = create_constant(p, module)
+                            constant = create_constant(p, module,
+                                                       descriptors[j])
                             constant.update()
                             connector = ModuleConnector(constant, 'value',
-                                                        f.get_spec('output'))
+                                                        spec)
                             tupleModule.set_input_port(j, connector)
                         except Exception, e:
                             debug.unexpected_exception(e)
@@ -408,8 +594,7 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
                                     debug.format_exception(e)))
                             errors[i] = err
                             to_delete.append(obj.id)
-                    connector = ModuleConnector(tupleModule, 'value',
-                                                f.get_spec('output'))
+                    connector = ModuleConnector(tupleModule, 'value', spec)
                 if connector:
                     obj.set_input_port(f.name, connector, is_method=True)
 
@@ -453,6 +638,8 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         clean_pipeline = fetch('clean_pipeline', False)
         stop_on_error = fetch('stop_on_error', True)
         parent_exec = fetch('parent_exec', None)
+        threads = fetch('threads', None)
+        profiler = fetch('profiler', None)
 
         if len(kwargs) > 0:
             raise VistrailsInternalError('Wrong parameters passed '
@@ -469,6 +656,20 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
                 ids=pipeline.modules.keys(),
                 module_executed_hook=module_executed_hook)
 
+        # Independent branches are updated in parallel if requested
+        if threads is None:
+            threads = getattr(get_vistrails_configuration(),
+                              'executionThreads', None) or 1
+        if profiler is not None:
+            module_logging = profiler.wrap(logging_obj, get_remapped_id)
+        else:
+            module_logging = logging_obj
+        if threads > 1:
+            # the view is updated from this thread, see update_parallel()
+            log_calls = CallQueue()
+            module_logging = SynchronizedLogController(module_logging,
+                                                       log_calls)
+
         # PARAMETER CHANGES SETUP
         parameter_changes = []
         def change_parameter(obj, name, value):
@@ -480,7 +681,7 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         # Update **all** modules in the current pipeline
         for i, obj in tmp_id_to_module_map.iteritems():
             obj.in_pipeline = True # set flag to indicate in pipeline
-            obj.logging = logging_obj
+            obj.logging = module_logging
             obj.change_parameter = make_change_parameter(obj)
             
             # Update object pipeline information
@@ -510,8 +711,19 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         self._streams.append(Generator.generators)
         Generator.generators = []
 
+        # Update the upstream modules first, running independent branches
+        # concurrently; the failures are then reported like errors from
+        # the sinks, without updating the failed sinks again
+        to_update = persistent_sinks
+        if threads > 1:
+            failed = update_parallel(persistent_sinks, threads,
+                                     stop_on_error, log_calls)
+            failed_ids = set(id(f.module) for f in failed)
+            to_update = failed + [obj for obj in persistent_sinks
+                                  if id(obj) not in failed_ids]
+
         # Update new sinks
-        for obj in persistent_sinks:
+        for obj in to_update:
             abort = False
             try:
                 obj.update()
@@ -625,6 +837,9 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         reset_computed = fetch('reset_computed', True)
         view = fetch('view', None)
 
+        if self._result_store is not None:
+            self.store_results(objs, errs, execs, suspended)
+
         self.clean_modules(to_delete)
 
         def dict2set(s):
@@ -639,6 +854,37 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
             for module in self._objects.itervalues():
                 module.computed = False
 
+    def store_results(self, objs, errs, execs, suspended):
+        """store_results(objs, errs, execs, suspended) -> None
+
+        Saves the outputs of the modules that were just computed to the
+        on-disk result store, if their module descriptor allows it. Modules
+        downstream of a non-cacheable module are never stored.
+        """
+        g = self._persistent_pipeline.graph
+        non_cacheable = [i for (i, obj) in self._objects.iteritems()
+                         if not obj.is_cacheable()]
+        if non_cacheable:
+            tainted = set(g.vertices_topological_sort(non_cacheable))
+        else:
+            tainted = set()
+        for i, obj in objs.iteritems():
+            if not execs.get(i) or errs.get(i) or suspended.get(i):
+                continue
+            if (obj.id in tainted or obj.loaded_from_store or
+                    obj.id not in self._persistent_pipeline.modules):
+                continue
+            module = self._persistent_pipeline.modules[obj.id]
+            if not module.module_descriptor.persistent_cache:
+                continue
+            key = result_key(module._signature, module.module_descriptor)
+            if self._result_store.has(key):
+                continue
+            outputs = dict((port, value)
+                           for (port, value) in obj.outputPorts.iteritems()
+                           if port != 'self')
+            self._result_store.save(key, outputs)
+
     def execute(self, pipeline, **kwargs):
         """execute(pipeline, **kwargs):
 
@@ -655,6 +901,8 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
           actions = fetch('actions', None)
           done_summon_hooks = fetch('done_summon_hooks', [])
           module_executed_hook = fetch('module_executed_hook', [])
+          threads = fetch('threads', None)
+          profiler = fetch('profiler', None)
 
         Executes a pipeline using caching. Caching works by reusing
         pipelines directly.  This means that there exists one global
@@ -698,10 +946,29 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         module_executed_hook = fetch('module_executed_hook', [])
         stop_on_error = fetch('stop_on_error', True)
         parent_exec = fetch('parent_exec', None)
+        threads = fetch('threads', None)
+        profiler = fetch('profiler', None)
 
         if len(kwargs) > 0:
             raise VistrailsInternalError('Wrong parameters passed '
                                          'to execute: %s' % kwargs)
+        self._execute_depth += 1
+        try:
+            return self._execute(pipeline, new_kwargs)
+        finally:
+            self._execute_depth -= 1
+
+    def _execute(self, pipeline, new_kwargs):
+        controller = new_kwargs['controller']
+        current_version = new_kwargs['current_version']
+        view = new_kwargs['view']
+        aliases = new_kwargs['aliases']
+        params = new_kwargs['params']
+        logger = new_kwargs['logger']
+        reason = new_kwargs['reason']
+        parent_exec = new_kwargs['parent_exec']
+        profiler = new_kwargs['profiler']
+
         self.clean_non_cacheable_modules()
 
 
@@ -724,7 +991,11 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         new_kwargs['logger'] = logger
         self.annotate_workflow_execution(logger, reason, aliases, params)
 
+        if profiler is not None:
+            setup_start = profiler.clock()
         res = self.setup_pipeline(pipeline, **new_kwargs)
+        if profiler is not None:
+            profiler.add_event('setup_pipeline', setup_start)
         modules_added = res[2]
         conns_added = res[3]
         to_delete = res[4]
@@ -737,6 +1008,18 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
                 view.set_module_error(i, error)
         self.finalize_pipeline(pipeline, *(res[:-1]), **new_kwargs)
 
+        # Update the size estimates and evict from the cache, unless we are
+        # inside of another execution that may still use the modules
+        persistent_ids = set()
+        for obj in res[1].itervalues():
+            if obj.id in self._objects:
+                persistent_ids.add(obj.id)
+                self._cache_policy.update_size(
+                        self._persistent_pipeline.modules[obj.id]._signature,
+                        estimate_size(obj))
+        if self._execute_depth == 1:
+            self.enforce_cache_policy(persistent_ids)
+
         result = InstanceObject(objects=res[1],
                               errors=res[2],
                               executed=res[3],
@@ -780,7 +1063,8 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         connection_id_map = Bidict()
         modules_added = set()
         connections_added = set()
-        pipeline.refresh_signatures()
+        # only the modules that changed since the last run get hashed again
+        pipeline.compute_signatures()
         # we must traverse vertices in topological sort order
         verts = pipeline.graph.vertices_topological_sort()
         for new_module_id in verts:
@@ -817,8 +1101,12 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
                 i = self._persistent_pipeline \
                         .connection_id_from_signature(new_sig)
                 connection_id_map[connection.id] = i
-        # update persistent signatures
-        self._persistent_pipeline.compute_signatures()
+        # update persistent signatures: the new entities have the same
+        # signatures as in the pipeline they come from
+        self._persistent_pipeline.copy_signatures(
+                pipeline,
+                dict((i, module_id_map[i]) for i in modules_added),
+                dict((i, connection_id_map[i]) for i in connections_added))
         return (module_id_map, connection_id_map,
                 modules_added, connections_added)
         
@@ -829,7 +1117,7 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         object_map = {}
         module_id_map = {}
         connection_id_map = {}
-        pipeline.refresh_signatures()
+        pipeline.compute_signatures()
         # we must traverse vertices in topological sort order
         verts = pipeline.graph.vertices_topological_sort()
         for module_id in verts:
@@ -928,6 +1216,157 @@ class TestCachedInterpreter(unittest.TestCase):
         finally:
             StandardOutput.compute = old_compute
 
+    def test_parallel(self):
+        """Test that a threaded execution runs every module."""
+        from vistrails.tests.utils import dummy_vistrail, select_tag
+
+        with dummy_vistrail() as controller:
+            n, p = select_tag(controller, 'float chain')
+            interpreter = CachedInterpreter()
+            result = interpreter.execute(p, locator=controller.vistrail,
+                                         current_version=n,
+                                         view=DummyView(), threads=4)
+            self.assertFalse(result.errors)
+            self.assertEqual(set(i for i, e in result.executed.iteritems()
+                                 if e),
+                             set(p.modules))
+            interpreter.clear()
+
+    def test_parallel_errors(self):
+        """Test that the modules that failed are only updated once."""
+        from vistrails.core.modules.basic_modules import StandardOutput
+        from vistrails.tests.utils import dummy_vistrail, select_tag
+
+        old_update = StandardOutput.update
+        calls = []
+        def compute(module):
+            raise ModuleError(module, "failed")
+        def update(module):
+            calls.append(module)
+            old_update(module)
+
+        with dummy_vistrail() as controller:
+            StandardOutput.compute = compute
+            StandardOutput.update = update
+            try:
+                n, p = select_tag(controller, 'float chain')
+                interpreter = CachedInterpreter()
+                result = interpreter.execute(p, locator=controller.vistrail,
+                                             current_version=n,
+                                             view=DummyView(), threads=2,
+                                             stop_on_error=False)
+                self.assertTrue(calls)
+                self.assertEqual(len(set(calls)), len(calls))
+                self.assertEqual(len(result.errors), len(calls))
+                interpreter.clear()
+            finally:
+                StandardOutput.update = old_update
+
+    def test_validation_plan(self):
+        """Test that pipelines differing by parameters share a plan."""
+        from vistrails.tests.utils import dummy_vistrail, select_tag
+
+        with dummy_vistrail() as controller:
+            v = controller.vistrail
+            n, p1 = select_tag(controller, 'int chain')
+            interpreter = CachedInterpreter()
+            result = interpreter.execute(p1, locator=v, current_version=n,
+                                         view=DummyView())
+            self.assertFalse(result.errors)
+            self.assertEqual(len(interpreter._validation_plans), 1)
+
+            p2 = copy.copy(p1)
+            module = [m for m in p2.module_list if m.functions][0]
+            param = module.functions[0].params[0]
+            param.strValue = param.strValue + '1'
+            p2.invalidate_signatures([module.id])
+            self.assertEqual(p1.structure_signature(),
+                             p2.structure_signature())
+            result = interpreter.execute(p2, locator=v, current_version=n,
+                                         view=DummyView())
+            self.assertFalse(result.errors)
+            self.assertEqual(len(interpreter._validation_plans), 1)
+            self.assertTrue(result.modules_added)
+            for conn in p2.connection_list:
+                self.assertIsNotNone(conn.source.spec)
+                self.assertIsNotNone(conn.destination.spec)
+            interpreter.clear()
+
+    def test_eviction(self):
+        """Test that the cache policy evicts unused modules."""
+        from vistrails.core.cache.policy import create_cache_policy
+        from vistrails.tests.utils import dummy_vistrail, select_tag
+
+        with dummy_vistrail() as controller:
+            interpreter = CachedInterpreter()
+            interpreter.set_cache_policy(create_cache_policy('lru',
+                                                             max_entries=1))
+            view = DummyView()
+            pipelines = []
+            for tag in ('int chain', 'float chain'):
+                n, p = select_tag(controller, tag)
+                pipelines.append(p)
+                interpreter.execute(p, locator=controller.vistrail,
+                                    current_version=n, view=view)
+            # modules of the last execution are kept, the others are gone
+            stats = interpreter.get_cache_statistics()
+            self.assertEqual(len(interpreter._objects),
+                             len(pipelines[1].modules))
+            self.assertEqual(stats['entries'], len(pipelines[1].modules))
+            self.assertGreater(stats['evictions'], 0)
+            self.assertEqual(stats['misses'],
+                             len(pipelines[0].modules) +
+                             len(pipelines[1].modules))
+            interpreter.clear()
+
+    def test_result_store(self):
+        """Test that stored results are reused by a new interpreter."""
+        import shutil
+        import tempfile
+        from vistrails.core.cache.store import ResultStore
+        from vistrails.core.modules.basic_modules import StandardOutput
+        from vistrails.tests.utils import dummy_vistrail, select_tag
+
+        directory = tempfile.mkdtemp(prefix='vt_results_')
+        descriptors = []
+
+        try:
+            with dummy_vistrail() as controller:
+                v = controller.vistrail
+                n, p = select_tag(controller, 'int chain')
+                for module in p.modules.itervalues():
+                    desc = module.module_descriptor
+                    if desc.module is not StandardOutput:
+                        descriptors.append(desc)
+                        desc.persistent_cache = True
+                stored = set(m.id for m in p.modules.itervalues()
+                             if m.module_descriptor.persistent_cache)
+
+                view = DummyView()
+                interpreter = CachedInterpreter()
+                interpreter._result_store = ResultStore(directory)
+                result = interpreter.execute(p, locator=v,
+                                             current_version=n, view=view)
+                self.assertEqual(set(i for i in stored
+                                     if result.executed[i]),
+                                 stored)
+                interpreter.clear()
+
+                interpreter = CachedInterpreter()
+                interpreter._result_store = ResultStore(directory)
+                result = interpreter.execute(p, locator=v,
+                                             current_version=n, view=view)
+                self.assertFalse(any(result.executed.get(i)
+                                     for i in stored))
+                self.assertTrue(any(result.objects[i].loaded_from_store
+                                    for i in stored))
+                self.assertGreater(
+                        interpreter.get_cache_statistics()['store_hits'], 0)
+                interpreter.clear()
+        finally:
+            for desc in descriptors:
+                desc.persistent_cache = False
+            shutil.rmtree(directory)
 
 if __name__ == '__main__':
     unittest.main()
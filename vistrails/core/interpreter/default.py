@@ -32,6 +32,8 @@
 ## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
 ##
 ###############################################################################
+from vistrails.core.cache.policy import create_cache_policy_from_configuration
+from vistrails.core.cache.store import create_result_store_from_configuration
 import vistrails.core.interpreter.cached
 import vistrails.core.interpreter.noncached
 
@@ -50,8 +52,21 @@ def set_cache_configuration(field, value):
     else:
         set_default_interpreter(noncached_interpreter)
 
+def set_cache_policy_configuration(field, value):
+    cached_interpreter.get().set_cache_policy(
+            create_cache_policy_from_configuration())
+
+def set_result_store_configuration(field, value):
+    cached_interpreter.get().set_result_store(
+            create_result_store_from_configuration())
+
 def connect_to_configuration(configuration):
     configuration.subscribe('cache', set_cache_configuration)
+    for field in ('cachePolicy', 'cacheMaxEntries', 'cacheMaxMemory'):
+        configuration.subscribe(field, set_cache_policy_configuration)
+    for field in ('persistentCache', 'persistentCacheDir',
+                  'persistentCacheSize'):
+        configuration.subscribe(field, set_result_store_configuration)
 
 def get_default_interpreter():
     """Returns an instance of the default interpreter class."""
@@ -80,3 +95,23 @@ class TestDefaultInterpreter(unittest.TestCase):
             set_default_interpreter(old_interpreter)
             self.assertEquals(type(get_default_interpreter()),
                               old_interpreter)
+
+    def test_result_store_configuration(self):
+        """The result store follows the configuration."""
+        import shutil
+        import tempfile
+        from vistrails.core.configuration import get_vistrails_configuration
+
+        conf = get_vistrails_configuration()
+        interpreter = cached_interpreter.get()
+        old = conf.persistentCache, conf.persistentCacheDir
+        directory = tempfile.mkdtemp(prefix='vt_results_')
+        try:
+            conf.persistentCacheDir = directory
+            conf.persistentCache = True
+            self.assertEqual(interpreter._result_store.directory, directory)
+            conf.persistentCache = False
+            self.assertIsNone(interpreter._result_store)
+        finally:
+            conf.persistentCache, conf.persistentCacheDir = old
+            shutil.rmtree(directory)
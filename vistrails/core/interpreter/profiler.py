@@ -0,0 +1,403 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah.
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice,
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright
+##    notice, this list of conditions and the following disclaimer in the
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its
+##    contributors may be used to endorse or promote products derived from
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+
+"""Per-module profiling of workflow executions.
+
+An ExecutionProfiler is passed to the interpreter with the 'profiler'
+keyword argument of execute(). It wraps the logging object that modules
+report to, and records for each module that gets updated:
+
+  - the wall-clock and CPU time spent in its compute phase,
+  - the time spent waiting for its upstream modules,
+  - whether its outputs came from the cache,
+  - the number of iterations when it loops over a list,
+  - the estimated size of its outputs.
+
+The records can be written as a Chrome trace (to be loaded in
+chrome://tracing or Perfetto) and as a text summary. When no profiler is
+given, nothing is wrapped and executions are not slowed down.
+
+The 'executionProfile' configuration setting (--executionProfile on the
+command line) profiles every execution of the session, writing the trace
+to the given file and the summary next to it.
+
+"""
+
+import json
+import os
+import threading
+import time
+
+from vistrails.core.cache.policy import estimate_size
+from vistrails.core.configuration import get_vistrails_configuration
+from vistrails.core.modules.module_registry import get_module_registry
+
+
+class ModuleProfile(object):
+    """The profile of one update of a module.
+
+    Times are in seconds; start is relative to the creation of the
+    profiler.
+
+    """
+
+    def __init__(self, module_id, name, start, thread):
+        self.module_id = module_id
+        self.name = name
+        self.start = start
+        self.thread = thread
+        self.wait = 0.0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.cached = False
+        self.error = None
+        self.iterations = 0
+        self.output_size = 0
+        self._compute_start = None
+        self._cpu_start = None
+
+
+class _ProfilingLoop(object):
+    """Wraps the Loop object of a ViewUpdatingLogController to count the
+    iterations of a module.
+
+    """
+
+    def __init__(self, loop, profile):
+        self._loop = loop
+        self._profile = profile
+
+    def begin_iteration(self, looped_obj, iteration):
+        if self._profile is not None:
+            self._profile.iterations += 1
+        self._loop.begin_iteration(looped_obj, iteration)
+
+    def __getattr__(self, name):
+        return getattr(self._loop, name)
+
+
+class ProfilingLogController(object):
+    """Wraps a ViewUpdatingLogController, recording the timings of the
+    modules in an ExecutionProfiler.
+
+    Module.update() calls begin_update(), then updates its upstream
+    modules, then calls begin_compute(), computes and calls end_update();
+    or calls update_cached() if its outputs were reused.
+
+    """
+
+    def __init__(self, logging_obj, profiler, remap_id):
+        self._logging_obj = logging_obj
+        self._profiler = profiler
+        self._remap_id = remap_id
+        # Modules being updated, by id(obj)
+        self._running = {}
+
+    def __getattr__(self, name):
+        return getattr(self._logging_obj, name)
+
+    def _module_name(self, obj):
+        try:
+            return get_module_registry().get_descriptor(obj.__class__).name
+        except Exception:
+            return obj.__class__.__name__
+
+    def _module_id(self, obj):
+        try:
+            return self._remap_id(obj.id)
+        except KeyError:
+            # modules inside a Group, logged by the recursive execution
+            return obj.id
+
+    def begin_update(self, obj):
+        now = self._profiler.clock()
+        self._running[id(obj)] = ModuleProfile(
+                self._module_id(obj), self._module_name(obj), now,
+                threading.current_thread().ident)
+        self._logging_obj.begin_update(obj)
+
+    def begin_compute(self, obj):
+        profile = self._running.get(id(obj))
+        if profile is None:
+            # loops call begin_compute() on their iteration modules
+            # directly, without begin_update()
+            profile = ModuleProfile(self._module_id(obj),
+                                    self._module_name(obj),
+                                    self._profiler.clock(),
+                                    threading.current_thread().ident)
+            self._running[id(obj)] = profile
+        profile._compute_start = self._profiler.clock()
+        profile.wait = profile._compute_start - profile.start
+        profile._cpu_start = time.clock()
+        self._logging_obj.begin_compute(obj)
+
+    def begin_loop_execution(self, obj, total_iterations=None):
+        loop = self._logging_obj.begin_loop_execution(obj, total_iterations)
+        return _ProfilingLoop(loop, self._running.get(id(obj)))
+
+    def update_cached(self, obj):
+        profile = self._running.pop(id(obj), None)
+        if profile is not None:
+            profile.cached = True
+            profile.wait = self._profiler.clock() - profile.start
+            self._profiler.add(profile)
+        self._logging_obj.update_cached(obj)
+
+    def end_update(self, obj, error=None, errorTrace=None,
+                   was_suspended=False):
+        profile = self._running.pop(id(obj), None)
+        if profile is not None:
+            if profile._compute_start is not None:
+                profile.wall = self._profiler.clock() - profile._compute_start
+                profile.cpu = time.clock() - profile._cpu_start
+            else:
+                profile.wait = self._profiler.clock() - profile.start
+            if was_suspended:
+                profile.error = 'suspended'
+            elif error is not None:
+                profile.error = getattr(error, 'msg', None) or str(error)
+            profile.output_size = estimate_size(obj)
+            self._profiler.add(profile)
+        self._logging_obj.end_update(obj, error, errorTrace, was_suspended)
+
+
+class ExecutionProfiler(object):
+    """Collects the profiles of the modules updated during executions.
+
+    """
+
+    # Columns of the summary, and what they can be sorted by
+    SORT_KEYS = ['wall', 'cpu', 'wait', 'calls', 'cached', 'iterations',
+                 'size', 'name']
+
+    def __init__(self):
+        self._origin = time.time()
+        self._lock = threading.Lock()
+        self.profiles = []
+        # (name, start, duration, thread) of other phases of the execution
+        self.events = []
+
+    def clock(self):
+        return time.time() - self._origin
+
+    def wrap(self, logging_obj, remap_id=lambda i: i):
+        """wrap(logging_obj, remap_id) -> ProfilingLogController
+        Returns a logging object recording the timings in this profiler.
+
+        """
+        return ProfilingLogController(logging_obj, self, remap_id)
+
+    def add(self, profile):
+        with self._lock:
+            self.profiles.append(profile)
+
+    def add_event(self, name, start, duration=None):
+        """add_event(name: str, start: float, duration: float) -> None
+        Records a phase of the execution that is not a module, started at
+        the given clock() value and lasting until now if duration is None.
+
+        """
+        if duration is None:
+            duration = self.clock() - start
+        with self._lock:
+            self.events.append((name, start, duration,
+                                threading.current_thread().ident))
+
+    def clear(self):
+        with self._lock:
+            self.profiles = []
+            self.events = []
+
+    def chrome_trace(self):
+        """chrome_trace() -> dict
+        Returns the profiles in the Chrome trace event format.
+
+        Each module update is a complete event spanning its upstream wait
+        and its compute phase; times are in microseconds.
+
+        """
+        pid = os.getpid()
+        events = []
+        for name, start, duration, thread in self.events:
+            events.append({'name': name, 'cat': 'interpreter', 'ph': 'X',
+                           'ts': start * 1e6, 'dur': duration * 1e6,
+                           'pid': pid, 'tid': thread})
+        for p in self.profiles:
+            args = {'module_id': p.module_id,
+                    'wait_ms': p.wait * 1e3,
+                    'cpu_ms': p.cpu * 1e3,
+                    'cached': p.cached,
+                    'output_bytes': p.output_size}
+            if p.iterations:
+                args['iterations'] = p.iterations
+            if p.error is not None:
+                args['error'] = p.error
+            events.append({'name': p.name,
+                           'cat': 'cached' if p.cached else 'module',
+                           'ph': 'X',
+                           'ts': (p.start + p.wait) * 1e6,
+                           'dur': p.wall * 1e6,
+                           'pid': pid, 'tid': p.thread,
+                           'args': args})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, filename):
+        with open(filename, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+
+    def summary(self, sort_by='wall'):
+        """summary(sort_by: str) -> str
+        Returns a table of the time spent in each module of the pipelines,
+        with the modules taking the most time first.
+
+        sort_by is one of SORT_KEYS.
+
+        """
+        if sort_by not in self.SORT_KEYS:
+            raise ValueError("Can't sort profile by %r" % sort_by)
+        rows = {}
+        for p in self.profiles:
+            key = (p.name, p.module_id)
+            try:
+                row = rows[key]
+            except KeyError:
+                row = rows[key] = dict(name='%s (%s)' % key,
+                                       calls=0, cached=0, wall=0.0, cpu=0.0,
+                                       wait=0.0, iterations=0, size=0)
+            row['calls'] += 1
+            row['cached'] += p.cached
+            row['wall'] += p.wall
+            row['cpu'] += p.cpu
+            row['wait'] += p.wait
+            row['iterations'] += p.iterations
+            row['size'] = max(row['size'], p.output_size)
+        rows = sorted(rows.itervalues(), key=lambda r: r[sort_by],
+                      reverse=sort_by != 'name')
+
+        lines = ['%-40s %6s %6s %10s %10s %10s %6s %12s' % (
+                 'module', 'calls', 'cached', 'wall (ms)', 'cpu (ms)',
+                 'wait (ms)', 'iters', 'output size')]
+        for r in rows:
+            lines.append('%-40s %6d %6d %10.2f %10.2f %10.2f %6d %12d' % (
+                         r['name'][:40], r['calls'], r['cached'],
+                         r['wall'] * 1e3, r['cpu'] * 1e3, r['wait'] * 1e3,
+                         r['iterations'], r['size']))
+        lines.append('total compute: %.2f ms wall, %.2f ms cpu' % (
+                     sum(r['wall'] for r in rows) * 1e3,
+                     sum(r['cpu'] for r in rows) * 1e3))
+        return '\n'.join(lines) + '\n'
+
+    def write_summary(self, filename, sort_by='wall'):
+        with open(filename, 'w') as f:
+            f.write(self.summary(sort_by))
+
+    def write(self, filename):
+        """write(filename: str) -> None
+        Writes the Chrome trace to filename, and the summary to
+        filename + '.txt'.
+
+        """
+        self.write_chrome_trace(filename)
+        self.write_summary(filename + '.txt')
+
+
+_configured_profiler = None
+
+def get_configured_profiler():
+    """get_configured_profiler() -> ExecutionProfiler or None
+    Returns the profiler of the session if the executionProfile setting
+    is set, None otherwise.
+
+    """
+    global _configured_profiler
+    if not get_vistrails_configuration().check('executionProfile'):
+        return None
+    if _configured_profiler is None:
+        _configured_profiler = ExecutionProfiler()
+    return _configured_profiler
+
+def write_configured_profile():
+    """write_configured_profile() -> None
+    Writes the profile of the session to the file given by the
+    executionProfile setting, if it is set.
+
+    """
+    configuration = get_vistrails_configuration()
+    if (configuration.check('executionProfile') and
+            _configured_profiler is not None):
+        _configured_profiler.write(configuration.executionProfile)
+
+##############################################################################
+
+import unittest
+
+
+class TestExecutionProfiler(unittest.TestCase):
+    def test_execute(self):
+        from vistrails.core.interpreter.cached import CachedInterpreter
+        from vistrails.core.utils import DummyView
+        from vistrails.tests.utils import dummy_vistrail, select_tag
+
+        with dummy_vistrail() as controller:
+            n, pipeline = select_tag(controller, 'int chain')
+            profiler = ExecutionProfiler()
+            interpreter = CachedInterpreter()
+            for i in xrange(2):
+                result = interpreter.execute(pipeline,
+                                             locator=controller.vistrail,
+                                             current_version=n,
+                                             view=DummyView(),
+                                             profiler=profiler)
+                self.assertFalse(result.errors)
+            interpreter.clear()
+
+        nb_modules = len(pipeline.modules)
+        self.assertEqual(len(profiler.profiles), 2 * nb_modules)
+        self.assertEqual(set(p.module_id for p in profiler.profiles),
+                         set(pipeline.modules))
+        # the second execution reuses the cached results, apart from the
+        # StandardOutput sink which is not cacheable
+        self.assertEqual(sum(p.cached for p in profiler.profiles[nb_modules:]),
+                         nb_modules - 1)
+        self.assertFalse(any(p.cached
+                             for p in profiler.profiles[:nb_modules]))
+
+        trace = profiler.chrome_trace()
+        events = [e for e in trace['traceEvents'] if e['cat'] != 'interpreter']
+        self.assertEqual(len(events), 2 * nb_modules)
+        json.dumps(trace)
+        summary = profiler.summary('cpu').splitlines()
+        self.assertEqual(len(summary), nb_modules + 2)
+        self.assertRaises(ValueError, profiler.summary, 'foo')
@@ -0,0 +1,478 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+
+"""Parallel update of independent branches of a pipeline.
+
+The regular execution model updates the sinks of a pipeline one at a
+time, each of them recursively updating its upstream modules
+depth-first. The scheduler in this module instead updates the modules
+upstream of the sinks in topological order, running the modules that are
+ready at the same time on a pool of threads.
+
+Only modules whose descriptor is marked thread-safe (through
+``ModuleSettings(thread_safe=True)``) and that are cacheable run on the
+worker threads; all the others are updated on the calling thread.
+
+Modules that override ``Module.update_upstream()`` (control flow
+modules such as If, Map or ExecuteInOrder, persistence modules) decide
+themselves which upstream modules to update, and when. They are barriers:
+their upstream modules are left to them, and they are updated on the
+calling thread while no other module is running.
+
+"""
+
+from collections import deque
+from multiprocessing.pool import ThreadPool
+import Queue
+import sys
+import threading
+
+from vistrails.core.interpreter.base import AbortExecution
+from vistrails.core.modules.module_registry import get_module_registry
+from vistrails.core.modules.vistrails_module import Module, \
+    ModuleSuspended, ModuleWasSuspended
+
+##############################################################################
+
+class CallQueue(object):
+    """Runs functions on the thread that created it on behalf of the
+    worker threads.
+
+    A worker thread calling call() waits until the creating thread runs
+    the function, from run_pending() or from update_parallel(), which
+    does it while it waits for the workers. Once close() has been
+    called, the functions are run directly, one at a time.
+
+    """
+
+    def __init__(self):
+        self.thread = threading.current_thread()
+        self.queue = Queue.Queue()
+        self._lock = threading.RLock()
+        self._closed = False
+
+    def call(self, func, *args, **kwargs):
+        """call(func: callable, *args, **kwargs) -> object
+        Calls func on the creating thread and returns its result, or
+        raises its exception.
+
+        """
+        if threading.current_thread() is self.thread:
+            return func(*args, **kwargs)
+        with self._lock:
+            if self._closed:
+                return func(*args, **kwargs)
+            call = PendingCall(func, args, kwargs)
+            self.queue.put(call)
+        return call.wait()
+
+    def run_pending(self):
+        """run_pending() -> None
+        Runs the functions that the worker threads are waiting on.
+
+        """
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except Queue.Empty:
+                return
+            item.run()
+
+    def close(self):
+        """close() -> None
+        Runs the pending functions, and the next ones directly on the
+        calling worker threads.
+
+        """
+        with self._lock:
+            self._closed = True
+            self.run_pending()
+
+
+class PendingCall(object):
+    """A function call that a worker thread waits on, see CallQueue.
+
+    """
+
+    def __init__(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.result = None
+        self.exc_info = None
+        self._done = threading.Event()
+
+    def run(self):
+        try:
+            self.result = self.func(*self.args, **self.kwargs)
+        except Exception:
+            self.exc_info = sys.exc_info()
+        self._done.set()
+
+    def wait(self):
+        self._done.wait()
+        if self.exc_info is not None:
+            raise self.exc_info[0], self.exc_info[1], self.exc_info[2]
+        return self.result
+
+
+class SynchronizedLogController(object):
+    """Wraps a ViewUpdatingLogController (or one of its Loop objects) so
+    that calls from worker threads are run on the thread that created the
+    CallQueue: the view it updates, and the progress shown, can only be
+    used from the GUI thread.
+
+    """
+
+    def __init__(self, logging_obj, calls=None):
+        self._logging_obj = logging_obj
+        if calls is None:
+            calls = CallQueue()
+        self._calls = calls
+
+    def __getattr__(self, name):
+        attr = getattr(self._logging_obj, name)
+        if not callable(attr):
+            return attr
+        def forwarded(*args, **kwargs):
+            result = self._calls.call(attr, *args, **kwargs)
+            if hasattr(result, 'begin_iteration'):
+                # a Loop object, which logs iterations
+                result = SynchronizedLogController(result, self._calls)
+            return result
+        return forwarded
+
+
+class FailedUpdate(object):
+    """Stands for a module whose update failed on a worker thread.
+
+    Its update() method raises the original exception again, so that the
+    interpreter can report it exactly as if it had been raised while
+    updating a sink.
+
+    """
+
+    def __init__(self, module, exc_info):
+        self.module = module
+        self.exc_info = exc_info
+
+    def update(self):
+        raise self.exc_info[0], self.exc_info[1], self.exc_info[2]
+
+
+def is_thread_safe(obj):
+    """is_thread_safe(obj: Module) -> bool
+    Tells whether a module object can be updated on a worker thread.
+
+    """
+    if getattr(obj, 'is_breakpoint', False):
+        return False
+    if getattr(obj, 'is_group', False):
+        return False
+    reg = get_module_registry()
+    try:
+        descriptor = reg.get_descriptor(obj.__class__)
+    except KeyError:
+        return False
+    return descriptor.thread_safe and obj.is_cacheable()
+
+
+def is_barrier(obj):
+    """is_barrier(obj: Module) -> bool
+    Tells whether a module object updates its upstream modules itself,
+    i.e. whether its class overrides Module.update_upstream().
+
+    """
+    method = getattr(type(obj), 'update_upstream', None)
+    return (method is not None and
+            getattr(method, 'im_func', None) is not
+                Module.update_upstream.im_func)
+
+
+def upstream_graph(sinks):
+    """upstream_graph(sinks: list of Module) -> (dict, dict)
+    Returns the objects upstream of the given sinks, as a dict from
+    id(obj) to obj, and the dependencies between them, as a dict from
+    id(obj) to the set of ids of its upstream objects.
+
+    The upstream objects of barriers (see is_barrier()) are not followed,
+    and barriers have no dependencies.
+
+    """
+    objects = {}
+    upstream = {}
+    stack = list(sinks)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in objects:
+            continue
+        objects[id(obj)] = obj
+        deps = set()
+        upstream[id(obj)] = deps
+        if is_barrier(obj):
+            continue
+        for connector_list in getattr(obj, 'inputPorts', {}).itervalues():
+            for connector in connector_list:
+                deps.add(id(connector.obj))
+                stack.append(connector.obj)
+    return objects, upstream
+
+
+def update_parallel(sinks, threads, stop_on_error=True, calls=None):
+    """update_parallel(sinks: list of Module, threads: int,
+                       stop_on_error: bool, calls: CallQueue)
+        -> list of FailedUpdate
+    Updates the modules upstream of the sinks (and the sinks themselves),
+    running independent branches concurrently on up to 'threads' worker
+    threads.
+
+    Barriers are updated on the calling thread, once the modules already
+    started are done, so that the upstream modules they update are not
+    running on worker threads at the same time.
+
+    Modules downstream of a failed or suspended module are not updated.
+    If stop_on_error is set, no new module is started after the first
+    error. The failures are returned in the order they happened, so that
+    the caller can report them.
+
+    If a CallQueue is given, the calls it receives from the worker
+    threads are run while waiting for them; it is closed on return.
+
+    """
+    objects, upstream = upstream_graph(sinks)
+    downstream = dict((i, []) for i in objects)
+    pending = {}
+    for i, deps in upstream.iteritems():
+        pending[i] = len(deps)
+        for dep in deps:
+            downstream[dep].append(i)
+    ready = deque(i for i, count in pending.iteritems() if count == 0)
+
+    if calls is None:
+        calls = CallQueue()
+    results = calls.queue
+    def run(obj):
+        try:
+            obj.update()
+        except Exception:
+            results.put((obj, sys.exc_info()))
+        else:
+            results.put((obj, None))
+
+    pool = ThreadPool(threads)
+    failed = []
+    stop = False
+    running = 0
+    barriers = deque()
+    try:
+        while True:
+            while ready and not stop:
+                obj = objects[ready.popleft()]
+                if is_barrier(obj):
+                    barriers.append(obj)
+                    continue
+                running += 1
+                if is_thread_safe(obj):
+                    pool.apply_async(run, (obj,))
+                else:
+                    run(obj)
+            if barriers and not running and not stop:
+                running += 1
+                run(barriers.popleft())
+            if not running:
+                break
+            item = results.get()
+            if isinstance(item, PendingCall):
+                item.run()
+                continue
+            obj, exc_info = item
+            running -= 1
+            if exc_info is not None:
+                failed.append(FailedUpdate(obj, exc_info))
+                if issubclass(exc_info[0], AbortExecution):
+                    stop = True
+                elif (stop_on_error and
+                        not issubclass(exc_info[0], (ModuleSuspended,
+                                                     ModuleWasSuspended))):
+                    stop = True
+                continue
+            for i in downstream[id(obj)]:
+                pending[i] -= 1
+                if pending[i] == 0:
+                    ready.append(i)
+    finally:
+        calls.close()
+        pool.close()
+        pool.join()
+    return failed
+
+##############################################################################
+
+import time
+import unittest
+
+class TestScheduler(unittest.TestCase):
+    class FakeConnector(object):
+        def __init__(self, obj):
+            self.obj = obj
+
+    class FakeModule(object):
+        is_breakpoint = False
+        is_group = False
+
+        def __init__(self, name, log, deps=(), error=None, delay=0.0):
+            self.name = name
+            self.log = log
+            self.error = error
+            self.delay = delay
+            self.inputPorts = {'in': [TestScheduler.FakeConnector(d)
+                                      for d in deps]}
+
+        def is_cacheable(self):
+            return True
+
+        def update(self):
+            time.sleep(self.delay)
+            if self.error is not None:
+                raise self.error
+            self.log.append(self.name)
+
+    def test_topological_order(self):
+        log = []
+        Mod = self.FakeModule
+        a = Mod('a', log)
+        b = Mod('b', log, [a])
+        c = Mod('c', log, [a])
+        d = Mod('d', log, [b, c])
+        self.assertEqual(update_parallel([d], 4), [])
+        self.assertEqual(log[0], 'a')
+        self.assertEqual(sorted(log[1:3]), ['b', 'c'])
+        self.assertEqual(log[3], 'd')
+
+    def test_error_stops_downstream(self):
+        log = []
+        Mod = self.FakeModule
+        error = ValueError("fail")
+        a = Mod('a', log, error=error)
+        b = Mod('b', log, [a])
+        c = Mod('c', log)
+        failed = update_parallel([b, c], 2, stop_on_error=False)
+        self.assertEqual(len(failed), 1)
+        self.assertIs(failed[0].module, a)
+        self.assertRaises(ValueError, failed[0].update)
+        self.assertEqual(log, ['c'])
+
+    def test_threads(self):
+        global is_thread_safe
+        log = []
+        Mod = self.FakeModule
+        events = [threading.Event(), threading.Event()]
+        # each branch waits for the other one to start
+        class Waiting(Mod):
+            def update(self):
+                events[self.index].set()
+                if events[1 - self.index].wait(5):
+                    self.log.append(self.name)
+        b = Waiting('b', log)
+        b.index = 0
+        c = Waiting('c', log)
+        c.index = 1
+        d = Mod('d', log, [b, c])
+        old_is_thread_safe = is_thread_safe
+        is_thread_safe = lambda obj: obj is not d
+        try:
+            self.assertEqual(update_parallel([d], 2), [])
+        finally:
+            is_thread_safe = old_is_thread_safe
+        self.assertEqual(sorted(log[:2]), ['b', 'c'])
+        self.assertEqual(log[2], 'd')
+
+    def test_barrier(self):
+        global is_thread_safe
+        log = []
+        Mod = self.FakeModule
+        class Barrier(Mod):
+            def update_upstream(self):
+                pass
+            def update(self):
+                # a barrier updates its upstream modules itself
+                for connector in self.inputPorts['in']:
+                    connector.obj.update()
+                self.log.append(self.name)
+        a = Mod('a', log)
+        b = Mod('b', log, delay=0.1)
+        c = Barrier('c', log, [a])
+        d = Mod('d', log, [b, c])
+        objects, upstream = upstream_graph([d])
+        self.assertNotIn(id(a), objects)
+        self.assertEqual(upstream[id(c)], set())
+        self.assertTrue(is_barrier(c))
+        self.assertFalse(is_barrier(d))
+        old_is_thread_safe = is_thread_safe
+        is_thread_safe = lambda obj: obj is b
+        try:
+            self.assertEqual(update_parallel([d], 2), [])
+        finally:
+            is_thread_safe = old_is_thread_safe
+        # c only starts once b is done
+        self.assertEqual(log, ['b', 'a', 'c', 'd'])
+
+    def test_log_calls_on_main_thread(self):
+        global is_thread_safe
+        threads = []
+        class Logger(object):
+            def log(self, name):
+                threads.append((name, threading.current_thread()))
+        calls = CallQueue()
+        logger = SynchronizedLogController(Logger(), calls)
+        log = []
+        Mod = self.FakeModule
+        class Logging(Mod):
+            def update(self):
+                logger.log(self.name)
+                Mod.update(self)
+        a = Logging('a', log)
+        b = Logging('b', log)
+        c = Logging('c', log, [a, b])
+        old_is_thread_safe = is_thread_safe
+        is_thread_safe = lambda obj: obj is not c
+        try:
+            self.assertEqual(update_parallel([c], 2, calls=calls), [])
+        finally:
+            is_thread_safe = old_is_thread_safe
+        self.assertEqual(sorted(name for name, _ in threads),
+                         ['a', 'b', 'c'])
+        main = threading.current_thread()
+        self.assertTrue(all(thread is main for _, thread in threads))
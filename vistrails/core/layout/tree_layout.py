@@ -52,6 +52,9 @@ The original paper is:
 
 """
 
+import random
+import unittest
+
 class TreeLW(object):
     """
     The input to the algorithm must be a tree
@@ -184,6 +187,12 @@ class NodeLW(object):
         self.thread = None
         self.change = 0
         self.shift = 0
+        self.midpoint = 0
+
+        # offset given to the childs in the
+        # second walk, kept by the incremental
+        # layout to skip the unchanged subtrees
+        self.offset = None
 
         # final center position
         self.x = 0
@@ -258,6 +267,11 @@ class TreeLayoutLW(object):
         self.ydistance = ydistance
         self.tree = tree
         self.vertical_alignment = vertical_alignment
+
+        # when not None, apportion() appends the
+        # (node, thread, mod, ancestor) values of the
+        # contour nodes it changes to this list
+        self.undoLog = None
         self.treeLayout()
 
     def treeLayout(self):
@@ -268,31 +282,36 @@ class TreeLayoutLW(object):
             
         r = self.tree.root()
         self.firstWalk(r)
+        self.placeNode(r)
         self.secondWalk(r, -r.prelim)
         self.setVerticalPositions()
 
     def setVerticalPositions(self):
 
         # set y position
-        maxNodeHeightPerLevel = self.tree.getMaxNodeHeightPerLevel()
+        info_level = self.getLevelPositions(
+            self.tree.getMaxNodeHeightPerLevel())
+            
+        #
+        for w in self.tree.nodes:
+            w.y = self.getVerticalPosition(w, info_level)
+
+    def getLevelPositions(self, maxNodeHeightPerLevel):
         info_level = []
         position_level = 0
-        for level in xrange(len(maxNodeHeightPerLevel)):
-            height_level = maxNodeHeightPerLevel[level]
+        for height_level in maxNodeHeightPerLevel:
             info_level.append((position_level,height_level))
             position_level += self.ydistance + height_level
-            
-        #
-        for w in self.tree.nodes:
-            level = w.level
-            position_level, height_level = info_level[level]
-            if self.vertical_alignment == TreeLayoutLW.TOP:
-                w.y = position_level + w.height/2.0
-            elif self.vertical_alignment == TreeLayoutLW.MIDDLE:
-                w.y = position_level + height_level/2.0
-            else: # bottom
-                w.y = position_level + height_level - w.height/2.0
-                
+        return info_level
+
+    def getVerticalPosition(self, w, info_level):
+        position_level, height_level = info_level[w.level]
+        if self.vertical_alignment == TreeLayoutLW.TOP:
+            return position_level + w.height/2.0
+        elif self.vertical_alignment == TreeLayoutLW.MIDDLE:
+            return position_level + height_level/2.0
+        else: # bottom
+            return position_level + height_level - w.height/2.0
         
     def gap(self, v1, v2):
 
@@ -300,29 +319,50 @@ class TreeLayoutLW(object):
 
 
     def firstWalk(self, v):
-        
-        if v.isLeaf():
-            v.prelim = 0
-            w = v.leftSibling()
-            if w != None:
-                v.prelim = w.prelim + self.gap(w,v)
+        for w in v.childs:
+            self.firstWalk(w)
+        if v.hasChild():
+            self.placeChilds(v)
 
-        else:
-            
-            defaultAncestor = v.leftChild()
-            for w in v.childs:
-                self.firstWalk(w)
-                defaultAncestor = self.apportion(w, defaultAncestor)
-            self.executeShifts(v)
-            
-            midpoint = (v.leftChild().prelim + v.rightChild().prelim) / 2.0
+    def placeChilds(self, v):
 
-            w = v.leftSibling()
-            if w != None:
-                v.prelim = w.prelim + self.gap(w,v)
-                v.mod = v.prelim - midpoint
-            else:
-                v.prelim = midpoint
+        """
+        Align the subtrees rooted at the childs of "v", whose
+        own childs are already aligned, from left to right.
+        This only changes the auxiliar variables of the
+        childs of "v" and of the contours of their subtrees.
+
+        """
+        defaultAncestor = v.leftChild()
+        for w in v.childs:
+            self.placeNode(w)
+            defaultAncestor = self.apportion(w, defaultAncestor)
+        self.executeShifts(v)
+
+        v.midpoint = (v.leftChild().prelim + v.rightChild().prelim) / 2.0
+
+    def placeNode(self, v):
+
+        """
+        Place "v" next to its left sibling, and
+        above the midpoint of its childs.
+
+        """
+        v.mod = 0
+        v.thread = None
+        v.ancestor = v
+        v.change = 0
+        v.shift = 0
+
+        w = v.leftSibling()
+        if w != None:
+            v.prelim = w.prelim + self.gap(w,v)
+            if v.hasChild():
+                v.mod = v.prelim - v.midpoint
+        elif v.hasChild():
+            v.prelim = v.midpoint
+        else:
+            v.prelim = 0
 
 
     def apportion(self,  v,  defaultAncestor):
@@ -365,6 +405,8 @@ class TreeLayoutLW(object):
                 vom = self.nextLeft(vom)
                 vop = self.nextRight(vop)
 
+                if self.undoLog is not None:
+                    self.undoLog.append((vop, vop.thread, vop.mod, vop.ancestor))
                 vop.ancestor = v
                 
                 shift = (vim.prelim + sim) - (vip.prelim + sip) + self.gap(vim,vip)
@@ -380,10 +422,14 @@ class TreeLayoutLW(object):
                 sop += vop.mod
 
             if self.nextRight(vim) != None and self.nextRight(vop) == None:            
+                if self.undoLog is not None:
+                    self.undoLog.append((vop, vop.thread, vop.mod, vop.ancestor))
                 vop.thread = self.nextRight(vim)
                 vop.mod += sim - sop
 
             if self.nextLeft(vip) != None and self.nextLeft(vom) == None:            
+                if self.undoLog is not None:
+                    self.undoLog.append((vom, vom.thread, vom.mod, vom.ancestor))
                 vom.thread = self.nextLeft(vip)
                 vom.mod += sip - som
                 defaultAncestor = v
@@ -431,6 +477,356 @@ class TreeLayoutLW(object):
         for w in v.childs:
             self.secondWalk(w, m + v.mod)
 
+class IncrementalTreeLayoutLW(TreeLayoutLW):
+
+    """
+    A TreeLayoutLW that keeps the auxiliar variables of the
+    algorithm so that the layout can be updated after the
+    tree is edited.
+
+    The tree is edited with addNode(), setChilds(), removeNode()
+    and setNodeSize(). update() then aligns again only the
+    subtrees that contain an edit, reusing the auxiliar
+    variables (and so the contours) of all the other subtrees,
+    and returns the nodes whose position or size changed.
+
+    The result is the same as laying out the edited tree from
+    scratch: the threads and modifiers that apportion() sets on
+    the contours of the subtrees are logged, so that they can be
+    restored before the parents of an edited subtree are aligned
+    again.
+
+    """
+
+    def __init__(self, tree, vertical_alignment=1, xdistance=10, ydistance=10):
+        # node -> (number of the alignment of its childs, undo log)
+        self.undoLogs = {}
+        self.walkCount = 0
+
+        # the edits since the last update
+        self.changedNodes = set()
+        self.removedNodes = set()
+        self.oldParents = {}
+
+        # level -> {height: number of nodes}, used to
+        # keep the positions of the levels up to date
+        self.levelHeights = []
+        self.levelPositions = []
+        TreeLayoutLW.__init__(self, tree, vertical_alignment, xdistance,
+                              ydistance)
+
+    def treeLayout(self):
+        self.undoLogs = {}
+        self.levelHeights = []
+        self.levelPositions = []
+        for v in self.tree.nodes:
+            v.mod = 0
+            v.thread = None
+            v.ancestor = v
+            v.offset = None
+            self.countNode(v, 1)
+        r = self.tree.root()
+        self.changedNodes = set(v for v in self.tree.nodes
+                                if v.parent is not None or v is r)
+        self.update()
+
+    def countNode(self, v, count):
+        while len(self.levelHeights) <= v.level:
+            self.levelHeights.append({})
+        heights = self.levelHeights[v.level]
+        count += heights.get(v.height, 0)
+        if count:
+            heights[v.height] = count
+        else:
+            del heights[v.height]
+
+    def addNode(self, width, height, object = None):
+        """ addNode(width: float, height: float, object) -> NodeLW
+        Adds a node to the tree. It has to be given a parent with
+        setChilds() before the next update.
+
+        """
+        v = self.tree.addNode(None, width, height, object)
+        v.ancestor = v
+        self.countNode(v, 1)
+        self.changedNodes.add(v)
+        return v
+
+    def detachNode(self, v):
+        parent = v.parent
+        if parent is not None:
+            parent.childs.remove(v)
+            for index in xrange(v.index, len(parent.childs)):
+                parent.childs[index].index = index
+            self.oldParents.setdefault(v, parent)
+            self.changedNodes.add(parent)
+            v.parent = None
+        self.changedNodes.add(v)
+
+    def setChilds(self, v, childs):
+        """ setChilds(v: NodeLW, childs: list of NodeLW) -> None
+        Changes the childs of a node, in order. The new childs are
+        taken from their previous parents, and the previous childs
+        have to be given another parent or be removed before the
+        next update.
+
+        """
+        kept = set(childs)
+        for w in v.childs:
+            if w not in kept:
+                self.oldParents.setdefault(w, v)
+                self.changedNodes.add(w)
+                w.parent = None
+        for w in childs:
+            if w.parent is not v:
+                self.detachNode(w)
+                w.parent = v
+        v.childs = list(childs)
+        for index, w in enumerate(v.childs):
+            w.index = index
+        self.changedNodes.add(v)
+
+    def removeNode(self, v):
+        """ removeNode(v: NodeLW) -> None
+        Removes a node from the tree. Its childs have to be given
+        another parent or be removed before the next update.
+
+        """
+        self.detachNode(v)
+        for w in v.childs:
+            self.oldParents.setdefault(w, v)
+            self.changedNodes.add(w)
+            w.parent = None
+        v.childs = []
+        self.countNode(v, -1)
+        self.removedNodes.add(v)
+
+    def setNodeSize(self, v, width, height):
+        self.countNode(v, -1)
+        v.width = width
+        v.height = height
+        self.countNode(v, 1)
+        self.changedNodes.add(v)
+
+    def setLevel(self, v, level, changed):
+        x = [(v, level)]
+        while x:
+            v, level = x.pop()
+            self.countNode(v, -1)
+            v.level = level
+            self.countNode(v, 1)
+            changed.add(v)
+            x.extend((w, level + 1) for w in v.childs)
+
+    def boundingBox(self):
+        """ boundingBox() -> [minx, miny, width, height]
+        Same as TreeLW.boundingBox(), only looking at the nodes on
+        the contours of the tree and at the positions of the levels.
+
+        """
+        lefts = []
+        w = self.tree.root()
+        while w is not None:
+            lefts.append(w.x-w.width/2.0)
+            w = self.nextLeft(w)
+        rights = []
+        w = self.tree.root()
+        while w is not None:
+            rights.append(w.x+w.width/2.0)
+            w = self.nextRight(w)
+        minx = min(lefts)
+        miny = self.levelPositions[0][0]
+        position_level, height_level = self.levelPositions[-1]
+        return [minx, miny, max(rights) - minx,
+                position_level + height_level - miny]
+
+    def update(self):
+        """ update() -> set(NodeLW)
+        Updates the layout after the tree was edited, and returns
+        the nodes that were added, moved or resized.
+
+        """
+        tree = self.tree
+        root = tree.root()
+        for v in self.changedNodes:
+            if (v.parent is None and v is not root and
+                    v not in self.removedNodes):
+                raise ValueError("Node has no parent")
+
+        # the edited subtrees and all the subtrees that contain
+        # them, before and after the edits
+        dirty = set()
+        x = list(self.changedNodes)
+        while x:
+            v = x.pop()
+            if v is not None and v not in dirty:
+                dirty.add(v)
+                x.append(v.parent)
+                x.append(self.oldParents.get(v))
+
+        # restore the contours of the other subtrees, undoing the
+        # alignments that changed them in reverse order
+        logs = [self.undoLogs.pop(v) for v in dirty if v in self.undoLogs]
+        logs.sort(reverse=True)
+        for walk, log in logs:
+            for v, thread, mod, ancestor in reversed(log):
+                v.thread = thread
+                v.mod = mod
+                v.ancestor = ancestor
+
+        if self.removedNodes:
+            tree.nodes = [v for v in tree.nodes
+                          if v not in self.removedNodes]
+        changed = self.changedNodes.difference(self.removedNodes)
+
+        # list the dirty nodes in preorder, fixing the levels
+        # of the subtrees that were moved
+        order = []
+        x = []
+        if root in dirty:
+            x.append(root)
+        while x:
+            v = x.pop()
+            order.append(v)
+            for w in v.childs:
+                if w.level != v.level + 1:
+                    self.setLevel(w, v.level + 1, changed)
+                if w in dirty:
+                    x.append(w)
+
+        # first walk, only for the dirty nodes
+        for v in reversed(order):
+            if v.hasChild():
+                self.undoLog = []
+                self.placeChilds(v)
+                self.walkCount += 1
+                self.undoLogs[v] = (self.walkCount, self.undoLog)
+        self.undoLog = None
+        if root in dirty:
+            self.placeNode(root)
+
+        # second walk, skipping the subtrees whose offset
+        # did not change
+        x = [(root, -root.prelim)]
+        while x:
+            v, m = x.pop()
+            if v.x != v.prelim + m:
+                v.x = v.prelim + m
+                changed.add(v)
+            m += v.mod
+            if v in dirty or v.offset != m:
+                v.offset = m
+                x.extend((w, m) for w in v.childs)
+
+        # vertical positions, for all the nodes if the position
+        # of a level changed
+        while self.levelHeights and not self.levelHeights[-1]:
+            self.levelHeights.pop()
+        levelPositions = self.getLevelPositions(
+            [max(0, max(heights)) for heights in self.levelHeights])
+        tree.maxLevel = len(levelPositions) - 1
+        if any(p1 != p2 for p1, p2 in zip(self.levelPositions,
+                                          levelPositions)):
+            nodes = tree.nodes
+        else:
+            nodes = list(changed)
+        self.levelPositions = levelPositions
+        for w in nodes:
+            y = self.getVerticalPosition(w, levelPositions)
+            if w.y != y:
+                w.y = y
+                changed.add(w)
+
+        self.changedNodes = set()
+        self.removedNodes = set()
+        self.oldParents = {}
+        return changed
+
+class TestIncrementalTreeLayoutLW(unittest.TestCase):
+    def subtree(self, v):
+        nodes = []
+        x = [v]
+        while x:
+            v = x.pop()
+            nodes.append(v)
+            x.extend(v.childs)
+        return nodes
+
+    def assert_layout(self, tree):
+        """Checks the positions of the nodes against the layout of a
+        copy of the tree computed from scratch."""
+        copy = TreeLW()
+        copies = {}
+        x = [(tree.root(), None)]
+        while x:
+            v, parent = x.pop()
+            copies[v] = copy.addNode(parent, v.width, v.height)
+            x.extend((w, copies[v]) for w in reversed(v.childs))
+        TreeLayoutLW(copy, TreeLayoutLW.MIDDLE, 7, 9)
+        self.assertEqual(len(copies), len(tree.nodes))
+        for v in tree.nodes:
+            self.assertEqual((v.x, v.y), (copies[v].x, copies[v].y))
+
+    def edit(self, rng, layout):
+        nodes = self.subtree(layout.tree.root())
+        v = rng.choice(nodes)
+        op = rng.random()
+        if op < 0.3:
+            w = layout.addNode(rng.uniform(5, 15), 10)
+            childs = list(v.childs)
+            childs.insert(rng.randint(0, len(childs)), w)
+            layout.setChilds(v, childs)
+        elif op < 0.45 and v.parent is not None:
+            # the childs take the place of the removed node
+            childs = list(v.parent.childs)
+            childs[v.index:v.index + 1] = v.childs
+            layout.setChilds(v.parent, childs)
+            layout.removeNode(v)
+        elif op < 0.55 and v.parent is not None:
+            for w in self.subtree(v):
+                layout.removeNode(w)
+        elif op < 0.7 and v.parent is not None:
+            subtree = set(self.subtree(v))
+            parent = rng.choice([w for w in nodes if w not in subtree])
+            childs = [w for w in parent.childs if w is not v]
+            childs.insert(rng.randint(0, len(childs)), v)
+            layout.setChilds(parent, childs)
+        elif op < 0.8:
+            childs = list(v.childs)
+            rng.shuffle(childs)
+            layout.setChilds(v, childs)
+        else:
+            layout.setNodeSize(v, rng.uniform(5, 15), rng.choice([5, 10]))
+
+    def test_update(self):
+        rng = random.Random(1)
+        tree = TreeLW()
+        root = tree.addNode(None, 10, 10)
+        for i in xrange(20):
+            tree.addNode(rng.choice(tree.nodes), rng.uniform(5, 15), 10)
+        layout = IncrementalTreeLayoutLW(tree, TreeLayoutLW.MIDDLE, 7, 9)
+        self.assert_layout(tree)
+        for i in xrange(300):
+            before = dict((v, (v.x, v.y, v.width, v.height))
+                          for v in tree.nodes)
+            for j in xrange(rng.randint(1, 3)):
+                self.edit(rng, layout)
+            changed = layout.update()
+            self.assert_layout(tree)
+            for v in tree.nodes:
+                if before.get(v) != (v.x, v.y, v.width, v.height):
+                    self.assertIn(v, changed)
+            bounding_box = tree.boundingBox()
+            for a, b in zip(layout.boundingBox(), bounding_box):
+                self.assertAlmostEqual(a, b)
+
+    def test_orphan(self):
+        tree = TreeLW()
+        root = tree.addNode(None, 10, 10)
+        layout = IncrementalTreeLayoutLW(tree)
+        layout.addNode(10, 10)
+        self.assertRaises(ValueError, layout.update)
+
 # graph
 if __name__ == "__main__":
 
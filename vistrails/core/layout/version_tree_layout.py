@@ -37,9 +37,13 @@ Interface Vistrails - TreeLayoutLW to align version trees.
 Originally written by Lauro D. Lins.
 
 """
-from tree_layout import TreeLW, NodeLW, TreeLayoutLW
+from tree_layout import TreeLW, NodeLW, TreeLayoutLW, IncrementalTreeLayoutLW
 from vistrails.core.data_structures.point import Point
 
+import copy
+import random
+import unittest
+
 ################################################################################
 
 class NodeVistrailsTreeLayoutLW(object):
@@ -86,6 +90,57 @@ class VistrailsTreeLayoutLW(object):
         self.scale = 0.0
         self.width = 0.0
 
+        # layout of the last tree, kept to update it, and its
+        # nodes by version id
+        self._layout = None
+        self._tree_nodes = {}
+
+        # ids of the versions whose node or links changed since
+        # the last call to take_changes(), None if all of them
+        self._changes = None
+
+    def __copy__(self):
+        """ __copy__() -> VistrailsTreeLayoutLW
+        Returns a snapshot of the positions of the nodes. The nodes
+        are shared, as the layout replaces the nodes that move
+        instead of changing them.
+
+        """
+        cp = VistrailsTreeLayoutLW(self.text_width_f, self.text_height,
+                                   self.text_horizontal_margin,
+                                   self.text_vertical_margin)
+        cp.nodes = dict(self.nodes)
+        cp.height = self.height
+        cp.scale = self.scale
+        cp.width = self.width
+        return cp
+
+    def __deepcopy__(self, memo):
+        cp = copy.copy(self)
+        cp.nodes = copy.deepcopy(self.nodes, memo)
+        return cp
+
+    def get_node_label(self, vistrail, id):
+        """ get_node_label(vistrail: Vistrail, id: int) -> str
+        Returns the text shown on a version: its tag, else its
+        description
+
+        """
+        if id == 0:
+            return ""
+        tag = vistrail.get_tag(id)
+        if tag is not None:
+            return tag
+        return vistrail.get_description(id)
+
+    def get_node_width(self, label):
+        """ get_node_width(label: str) -> float
+
+        """
+        empty_width = self.text_horizontal_margin + self.text_width_f(" " * 5)
+        width = self.text_horizontal_margin + self.text_width_f(label)
+        return max(width, empty_width)
+
     def generateTreeLW(self, vistrail, graph):
         """ output_vistrail_graph(f: str) -> None
         Using vistrail and graph to generate layout
@@ -123,9 +178,6 @@ class VistrailsTreeLayoutLW(object):
                     nodes.append((first, vistrail.get_description(first)))
                     X.add(first)
 
-        # get widths and heights for the nodes
-        empty_width = self.text_horizontal_margin + self.text_width_f(" " * 5)
-        
         # default height for all nodes
         height = self.text_height + self.text_vertical_margin
 
@@ -137,8 +189,7 @@ class VistrailsTreeLayoutLW(object):
 
         # add the remaining nodes
         for id, tag in nodes:
-            width = self.text_horizontal_margin + self.text_width_f(tag)
-            width = max(width, empty_width)
+            width = self.get_node_width(tag)
             # print "add node to the tree %d %s" % (id, tag)
             mapTreeNodes[id] = tree.addNode(None,width,height,(id,tag))
 
@@ -167,29 +218,114 @@ class VistrailsTreeLayoutLW(object):
         min_horizontal_separation = 20
         min_vertical_separation = 50
 
-        layout = TreeLayoutLW(tree, TreeLayoutLW.TOP,
-                              min_horizontal_separation,
-                              min_vertical_separation)
+        layout = IncrementalTreeLayoutLW(tree, TreeLayoutLW.TOP,
+                                         min_horizontal_separation,
+                                         min_vertical_separation)
+        self._layout = layout
+        self._tree_nodes = dict((v.object[0], v) for v in tree.nodes)
+        self._changes = None
 
         # prepare the result
         self.nodes = {}
         for v in tree.nodes:
-            id, tag = v.object
-            newNode = NodeVistrailsTreeLayoutLW()
-            newNode.p = Point(v.x, v.y)
-            newNode.width = v.width
-            newNode.height = v.height
-            newNode.id = id
-            # newNode.label = tag 
-            self.nodes[id] = newNode
+            self.nodes[v.object[0]] = self.create_node(v)
 
         # keep track of the bounding box 
         # of the whole tree
-        (minx, miny, width, height) = tree.boundingBox()
+        (minx, miny, width, height) = layout.boundingBox()
         self.scale = 0.0
         self.width = width
         self.height = height
 
+    def update_from(self, vistrail, graph, versions):
+        """ update_from(vistrail: VisTrail, graph: Graph,
+                        versions: iterable of int) -> None
+        Updates the layout after the given versions were added to or
+        removed from graph, or had their children or tag changed,
+        moving only the nodes that need to. Lays out the whole graph
+        if the versions do not account for all the changes.
+
+        """
+        if self._layout is None:
+            self.layout_from(vistrail, graph)
+            return
+
+        layout = self._layout
+        tree_nodes = self._tree_nodes
+        height = self.text_height + self.text_vertical_margin
+        versions = set(versions)
+        try:
+            # create or resize the nodes first...
+            for id in versions:
+                if id in graph.vertices:
+                    tag = self.get_node_label(vistrail, id)
+                    width = self.get_node_width(tag)
+                    node = tree_nodes.get(id)
+                    if node is None:
+                        tree_nodes[id] = layout.addNode(width, height,
+                                                        (id, tag))
+                    else:
+                        node.object = (id, tag)
+                        if node.width != width or node.height != height:
+                            layout.setNodeSize(node, width, height)
+
+            # ...so they can be linked
+            for id in versions:
+                if id in graph.vertices:
+                    node = tree_nodes[id]
+                    childs = [tree_nodes[to]
+                              for (to, _) in graph.edges_from(id)]
+                    if childs != node.childs:
+                        layout.setChilds(node, childs)
+                elif id in tree_nodes:
+                    layout.removeNode(tree_nodes.pop(id))
+            if len(tree_nodes) != len(graph.vertices):
+                raise ValueError("Graph has changed versions that were "
+                                 "not given")
+            changed = layout.update()
+        except (KeyError, ValueError):
+            self.layout_from(vistrail, graph)
+            return
+
+        # nodes are replaced, not changed, so that copies of the
+        # layout keep the previous positions
+        for v in changed:
+            self.nodes[v.object[0]] = self.create_node(v)
+        for id in versions:
+            if id not in tree_nodes:
+                self.nodes.pop(id, None)
+        if self._changes is not None:
+            self._changes.update(versions)
+            self._changes.update(v.object[0] for v in changed)
+
+        (minx, miny, width, height) = layout.boundingBox()
+        self.width = width
+        self.height = height
+
+    def take_changes(self):
+        """ take_changes() -> set(int) or None
+        Returns the ids of the versions whose node or links changed
+        since the last call, or None if the whole graph was laid out
+        again.
+
+        """
+        changes = self._changes
+        self._changes = set()
+        return changes
+
+    def create_node(self, v):
+        """ create_node(v: NodeLW) -> NodeVistrailsTreeLayoutLW
+
+        """
+        id, tag = v.object
+        newNode = NodeVistrailsTreeLayoutLW()
+        newNode.p = Point(v.x, v.y)
+        newNode.width = v.width
+        newNode.height = v.height
+        newNode.id = id
+        # newNode.label = tag 
+        return newNode
+
     def move_node(self, id, x, y):
         """ move_node(id: int, x: float, y: float) -> None
 
@@ -201,3 +337,62 @@ class VistrailsTreeLayoutLW(object):
         
         """
         self.nodes[id] = node
+
+
+class TestVistrailsTreeLayoutLW(unittest.TestCase):
+    def create_layout(self):
+        return VistrailsTreeLayoutLW(lambda text: 7 * len(text), 12, 10, 4)
+
+    def test_update_from(self):
+        from vistrails.core.vistrail.action import Action
+        from vistrails.core.vistrail.controller import VistrailController
+        from vistrails.core.vistrail.vistrail import Vistrail
+
+        rng = random.Random(2)
+        vistrail = Vistrail()
+        controller = VistrailController(vistrail, auto_save=False)
+        controller.num_versions_always_shown = 3
+        controller.current_version = 0
+        controller.recompute_terse_graph()
+        layout = self.create_layout()
+        layout.layout_from(vistrail, controller._current_terse_graph)
+        self.assertIsNone(layout.take_changes())
+        for i in xrange(200):
+            version = rng.choice(sorted(controller._terse_anchors))
+            op = rng.random()
+            if op < 0.5:
+                controller.current_version = version
+                controller.add_new_action(Action())
+            elif op < 0.6:
+                if vistrail.has_tag(version):
+                    vistrail.set_tag(version, '')
+                elif version != 0:
+                    vistrail.set_tag(version, 'tag %d' % (version * 101))
+                controller.recompute_terse_graph([version])
+            elif op < 0.65:
+                vistrail.pruneVersion(version)
+                controller.recompute_terse_graph([version])
+            else:
+                if version != 0 and vistrail.actionMap[version].expand:
+                    vistrail.collapseVersion(version)
+                else:
+                    vistrail.expandVersion(version)
+                controller.recompute_terse_graph([version])
+            graph = controller._current_terse_graph
+            previous = copy.copy(layout)
+            layout.update_from(vistrail, graph,
+                               controller._terse_graph_changes)
+            changes = layout.take_changes()
+            self.assertIsNotNone(changes)
+
+            expected = self.create_layout()
+            expected.layout_from(vistrail, graph)
+            self.assertEqual(sorted(layout.nodes), sorted(expected.nodes))
+            for v, node in expected.nodes.iteritems():
+                self.assertEqual((layout.nodes[v].p.x, layout.nodes[v].p.y,
+                                  layout.nodes[v].width),
+                                 (node.p.x, node.p.y, node.width))
+                if layout.nodes[v] is not previous.nodes.get(v):
+                    self.assertIn(v, changes)
+            self.assertAlmostEqual(layout.width, expected.width)
+            self.assertAlmostEqual(layout.height, expected.height)
@@ -82,11 +82,13 @@ class LogController(object):
             processor=vistrails.core.system.current_processor(),
             ram=vistrails.core.system.guess_total_memory())
 
-    def __init__(self, log, machine=None):
+    def __init__(self, log, machine=None, loop_sampling=1):
         self.log = log
+        self.loop_sampling = loop_sampling
         self.module_execs = {}      # vistrails_module -> *Exec
         self.parent_execs = {}      # vistrails_module -> *Exec
         self.children_execs = {}    # vistrails_module -> [*Exec]
+        self.detached_iterations = {} # LoopIteration -> LoopExec
         if machine is not None:
             self.machine = machine
         else:
@@ -133,14 +135,56 @@ class LogController(object):
         """Signals the start of the execution of a pipeline.
         """
         return LogWorkflowExecController(self.log, self.machine, parent_exec,
-                                         vistrail, pipeline, currentVersion)
+                                         vistrail, pipeline, currentVersion,
+                                         loop_sampling=self.loop_sampling)
+
+
+class StreamingLogController(LogController):
+    """A log controller that writes executions to disk as they finish.
+
+    Each workflow execution is appended to the log file when it finishes
+    (using the appended format of the 'log' file in .vt bundles) and removed
+    from the in-memory log, so that memory doesn't grow with the number of
+    executions.
+    """
+    def __init__(self, log, filename, machine=None, loop_sampling=1):
+        super(StreamingLogController, self).__init__(log, machine,
+                                                     loop_sampling)
+        self.filename = filename
+
+    def start_workflow_execution(self, parent_exec,
+                                 vistrail=None, pipeline=None,
+                                 currentVersion=None):
+        """Signals the start of the execution of a pipeline.
+        """
+        return LogWorkflowExecController(self.log, self.machine, parent_exec,
+                                         vistrail, pipeline, currentVersion,
+                                         loop_sampling=self.loop_sampling,
+                                         writer=self.write_workflow_exec)
+
+    def write_workflow_exec(self, workflow_exec):
+        from vistrails.core.db.io import append_workflow_exec
+
+        append_workflow_exec(workflow_exec, self.filename)
+        self.log.db_delete_workflow_exec(workflow_exec)
 
 
 class LogLoopController(object):
-    def __init__(self, controller, loop_exec, loop_module):
+    """Logs the iterations of a loop.
+
+    If the controller has a loop_sampling other than 1, only one iteration
+    out of loop_sampling is kept in the log (none if it is 0), along with
+    the ones that failed or were suspended. The other iterations are not
+    attached to the LoopExec, and are simply dropped when they finish. The
+    number of iterations is then recorded as annotations on the exec that
+    owns the loop.
+    """
+    def __init__(self, controller, loop_exec, loop_module, owner_exec=None):
         self.controller = controller
         self.loop_exec = loop_exec
         self.loop_module = loop_module
+        self.owner_exec = owner_exec
+        self.iterations = 0
 
     def _create_loop_iteration(self, iteration):
         l_iteration_id = self.controller.log.id_scope.getNewId(
@@ -159,22 +203,43 @@ class LogLoopController(object):
             execs.discard(self.loop_exec)
         except KeyError:
             pass
+        if (self.controller.loop_sampling != 1 and
+                hasattr(self.owner_exec, 'add_annotation')):
+            id_scope = self.controller.log.id_scope
+            for key, value in (
+                    ('loopIterations', self.iterations),
+                    ('loggedIterations',
+                     len(self.loop_exec.loop_iterations))):
+                a_id = id_scope.getNewId(Annotation.vtType)
+                self.owner_exec.add_annotation(Annotation(id=a_id,
+                                                          key=key,
+                                                          value=str(value)))
 
     def start_iteration(self, looped_module, iteration):
         """Signals that we are executing a module as an iteration of the loop.
         """
         loop_iteration = self._create_loop_iteration(iteration)
-        self.loop_exec.add_loop_iteration(loop_iteration)
+        sampling = self.controller.loop_sampling
+        if sampling == 1 or (sampling and iteration % sampling == 0):
+            self.loop_exec.add_loop_iteration(loop_iteration)
+        else:
+            # attached later if the module fails, see finish_execution()
+            self.controller.detached_iterations[loop_iteration] = \
+                self.loop_exec
         self.controller.parent_execs[looped_module] = loop_iteration
 
     def finish_iteration(self, looped_module):
         """Signals that the iteration is done.
         """
-        loop_iteration = self.controller.parent_execs.get(looped_module)
+        # Remove it from parent_execs, it would otherwise keep a reference
+        # to every iteration of the loop
+        loop_iteration = self.controller.parent_execs.pop(looped_module, None)
         assert loop_iteration is not None
 
         loop_iteration.ts_end = vistrails.core.system.current_time()
         loop_iteration.completed = 1
+        self.iterations += 1
+        self.controller.detached_iterations.pop(loop_iteration, None)
 
 
 class LogWorkflowController(LogController):
@@ -200,8 +265,10 @@ class LogWorkflowController(LogController):
            finished with the same error as the module if it fails before they
            end
     """
-    def __init__(self, log, machine, parent_exec, workflow_exec):
-        super(LogWorkflowController, self).__init__(log, machine)
+    def __init__(self, log, machine, parent_exec, workflow_exec,
+                 loop_sampling=1):
+        super(LogWorkflowController, self).__init__(log, machine,
+                                                    loop_sampling)
         self.parent_exec = parent_exec
         self.workflow_exec = workflow_exec
 
@@ -213,7 +280,7 @@ class LogWorkflowController(LogController):
         if parent_exec in self.module_execs:
             parent_exec = self.module_execs[parent_exec]
         return LogWorkflowController(self.log, self.machine, parent_exec,
-                                     self.workflow_exec)
+                                     self.workflow_exec, self.loop_sampling)
 
     def get_iteration_from_module(self, module):
         """If executing this module as part of a loop, gets the iteration;
@@ -263,9 +330,10 @@ class LogWorkflowController(LogController):
                     parent_exec.add_loop_exec(loop_exec)
                 break
         else:
-            self.workflow_exec.add_item_exec(loop_exec)
+            parent_exec = self.workflow_exec
+            parent_exec.add_item_exec(loop_exec)
         self.children_execs.setdefault(loop_module, set()).add(loop_exec)
-        return LogLoopController(self, loop_exec, loop_module)
+        return LogLoopController(self, loop_exec, loop_module, parent_exec)
 
     def finish_execution(self, module, error, errorTrace=None, suspended=False):
         """Signals the end of the execution of a module.
@@ -294,6 +362,13 @@ class LogWorkflowController(LogController):
         else:
             module_exec.completed = 1
 
+        if error or suspended:
+            # Keep this iteration in the log even if it wasn't sampled
+            parent_exec = self.parent_execs.get(module)
+            loop_exec = self.detached_iterations.pop(parent_exec, None)
+            if loop_exec is not None:
+                loop_exec.add_loop_iteration(parent_exec)
+
         for child in self.children_execs.pop(module, ()):
             child.ts_end = vistrails.core.system.current_time()
             if suspended:
@@ -345,7 +420,7 @@ class LogWorkflowExecController(LogWorkflowController):
     obtained through recursing(), don't.
     """
     def __init__(self, log, machine, parent_exec, vistrail=None, pipeline=None,
-                 currentVersion=None):
+                 currentVersion=None, loop_sampling=1, writer=None):
         if vistrail is not None:
             parent_type = Vistrail.vtType
             parent_id = vistrail.id
@@ -372,7 +447,8 @@ class LogWorkflowExecController(LogWorkflowController):
                 machines=[machine])
         log.add_workflow_exec(workflow_exec)
 
-        super(LogWorkflowExecController, self).__init__(log, machine, parent_exec, workflow_exec)
+        super(LogWorkflowExecController, self).__init__(log, machine, parent_exec, workflow_exec, loop_sampling)
+        self.writer = writer
 
     def finish_workflow_execution(self, errors, suspended=False):
         """Signals the end of the execution of a pipeline.
@@ -384,3 +460,60 @@ class LogWorkflowExecController(LogWorkflowController):
             self.workflow_exec.completed = -1
         else:
             self.workflow_exec.completed = 1
+        if self.writer is not None:
+            self.writer(self.workflow_exec)
+
+
+import unittest
+
+
+class TestStreamingLogController(unittest.TestCase):
+    def test_stream(self):
+        import os
+        import shutil
+        import tempfile
+
+        from vistrails.core.db.io import open_log, open_workflow_exec
+        from vistrails.core.log.log import Log
+
+        testdir = tempfile.mkdtemp(prefix='vt_log_')
+        try:
+            filename = os.path.join(testdir, 'log')
+            log = Log()
+            controller = StreamingLogController(log, filename,
+                                                loop_sampling=4)
+            pipeline = Pipeline()
+            for run in xrange(2):
+                wf_controller = controller.start_workflow_execution(
+                        None, pipeline=pipeline)
+                module = object()
+                wf_controller.start_execution(module, 1, 'Looping')
+                loop = wf_controller.start_loop_execution(module, 10)
+                for i in xrange(10):
+                    looped = object()
+                    loop.start_iteration(looped, i)
+                    wf_controller.start_execution(looped, 1, 'Looping')
+                    wf_controller.finish_execution(looped,
+                                                   'fail' if i == 5 else None)
+                    loop.finish_iteration(looped)
+                loop.finish_loop_execution()
+                wf_controller.finish_execution(module, None)
+                wf_controller.finish_workflow_execution([])
+                # execution was written out
+                self.assertEqual(len(log.workflow_execs), 0)
+                self.assertEqual(controller.parent_execs, {})
+
+            self.assertEqual(len(open_log(filename, True).workflow_execs), 2)
+            workflow_exec = open_workflow_exec(filename, 1)
+            module_exec, = workflow_exec.item_execs
+            loop_exec, = module_exec.loop_execs
+            # sampled iterations, and the one that failed
+            self.assertEqual([it.iteration
+                              for it in loop_exec.loop_iterations],
+                             [0, 4, 5, 8])
+            self.assertEqual(
+                    dict((a.key, a.value)
+                         for a in module_exec.annotations),
+                    {'loopIterations': '10', 'loggedIterations': '4'})
+        finally:
+            shutil.rmtree(testdir)
@@ -300,6 +300,23 @@ _documentation = \
       specified namespace instead of the 'namespace' attribute of the
       descriptor.
 
+   ModuleSettings.thread_safe: Boolean
+
+      If True, the module may be updated on a worker thread,
+      concurrently with other modules, when the interpreter runs
+      independent branches of a pipeline in parallel. Only set this if
+      compute() doesn't touch the GUI or any state shared with other
+      modules.
+
+   ModuleSettings.persistent_cache: Boolean
+
+      If True, the outputs of the module may be saved to the on-disk
+      result store (if enabled in the configuration) and reused by
+      later sessions instead of calling compute(). Outputs must be
+      picklable, or be modules implementing the Serializable
+      interface. Only use this for modules whose outputs depend solely
+      on their inputs.
+
    Port.name: String
 
       The name of the of the port
@@ -474,7 +491,9 @@ ModuleSettings = namedtuple('ModuleSettings',
                            (('is_root', False),),
                            (('ghost_package', None),),
                            (('ghost_package_version', None),),
-                           (('ghost_namespace', None),),])
+                           (('ghost_namespace', None),),
+                           (('persistent_cache', False),),
+                           (('thread_safe', False),),])
 
 Port = namedtuple('Port', 
                      [("name",),
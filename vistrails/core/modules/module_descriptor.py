@@ -86,6 +86,11 @@ class ModuleDescriptor(DBModuleDescriptor):
     self._widget_item: stores a reference to the ModuleTreeWidgetItem so
       that when ports are added to modules things get correctly updated.
 
+    self._deferred_package: the Package of a descriptor that was read
+      from a registry snapshot (see core.modules.registry_snapshot) and
+      whose code has not been imported yet. Getting self.module or the
+      execution settings of such a descriptor initializes the package.
+
     self._input_port_cache, self._output_port_cache,
       self._port_caches: Dictionaries for fast port spec lookup,
       created because port spec lookups are sometimes part of hot code
@@ -96,6 +101,7 @@ class ModuleDescriptor(DBModuleDescriptor):
 
     def __init__(self, *args, **kwargs):
         self.children = []
+        self._deferred_package = None
         if 'module' in kwargs:
             self.module = kwargs['module']
             if 'name' not in kwargs:
@@ -139,7 +145,10 @@ class ModuleDescriptor(DBModuleDescriptor):
             self._widget_item = None
             self._is_hidden = False
             self._namespace_hidden = False
+            self._persistent_cache = False
+            self._thread_safe = False
             self._widget_classes = {}
+            self._deferred_package = None
             self.children = []
             # The ghost attributes represent the original values
             # for the descriptor of an upgraded package subworkflow
@@ -153,7 +162,8 @@ class ModuleDescriptor(DBModuleDescriptor):
             self.children = copy.copy(other.children)
             
             self._base_descriptor = other._base_descriptor
-            self.module = other.module
+            self._module = other._module
+            self._deferred_package = other._deferred_package
             self._port_count = other._port_count
             self._abstraction_refs = self._abstraction_refs
             self._is_abstract = other._is_abstract
@@ -167,6 +177,8 @@ class ModuleDescriptor(DBModuleDescriptor):
             self._widget_classes = dict((k,copy.copy(v)) for k, v in \
                                          other._widget_classes.iteritems())
             self._namespace_hidden = other._namespace_hidden
+            self._persistent_cache = other._persistent_cache
+            self._thread_safe = other._thread_safe
             self.ghost_identifier = other.ghost_identifier
             self.ghost_package_version = other.ghost_package_version
             self.ghost_namespace = other.ghost_namespace
@@ -196,7 +208,7 @@ class ModuleDescriptor(DBModuleDescriptor):
 
         # do more init stuff
         _desc.children = []
-        _desc.module = None
+        _desc._module = None
         _desc._base_descriptor = None
         _desc._port_count = 0
         _desc.set_defaults()
@@ -213,7 +225,30 @@ class ModuleDescriptor(DBModuleDescriptor):
     version = DBModuleDescriptor.db_version
     base_descriptor_id = DBModuleDescriptor.db_base_descriptor_id
     port_specs_list = DBModuleDescriptor.db_portSpecs
-    
+
+    def _get_module(self):
+        if self._module is None and self._deferred_package is not None:
+            self.load_deferred_package()
+        return self._module
+    def _set_module(self, module):
+        self._module = module
+    module = property(_get_module, _set_module)
+
+    def is_deferred(self):
+        """is_deferred() -> bool
+        Returns True if the descriptor comes from a registry snapshot
+        and the code of its package has not been imported yet.
+
+        """
+        return self._deferred_package is not None
+
+    def load_deferred_package(self):
+        if self._deferred_package is not None:
+            from vistrails.core.modules.module_registry import \
+                get_module_registry
+            get_module_registry().load_deferred_package(
+                self._deferred_package)
+
     def _get_base_descriptor(self):
         if self._base_descriptor is None and self.base_descriptor_id >= 0:
             from vistrails.core.modules.module_registry import get_module_registry
@@ -241,6 +276,7 @@ class ModuleDescriptor(DBModuleDescriptor):
     def module_abstract(self):
 #         if not self.has_ports():
 #             return True
+        self.load_deferred_package()
         return self._is_abstract
 
     def set_configuration_widget(self, configuration_widget_type):
@@ -319,6 +355,7 @@ class ModuleDescriptor(DBModuleDescriptor):
     def set_hasher_callable(self, callable_):
         self._hasher_callable = callable_
     def hasher_callable(self):
+        self.load_deferred_package()
         return self._hasher_callable
 
     def _get_is_hidden(self):
@@ -333,6 +370,20 @@ class ModuleDescriptor(DBModuleDescriptor):
         self._namespace_hidden = hidden
     namespace_hidden = property(_get_namespace_hidden, _set_namespace_hidden)
 
+    def _get_persistent_cache(self):
+        self.load_deferred_package()
+        return self._persistent_cache
+    def _set_persistent_cache(self, persistent_cache):
+        self._persistent_cache = persistent_cache
+    persistent_cache = property(_get_persistent_cache, _set_persistent_cache)
+
+    def _get_thread_safe(self):
+        self.load_deferred_package()
+        return self._thread_safe
+    def _set_thread_safe(self, thread_safe):
+        self._thread_safe = thread_safe
+    thread_safe = property(_get_thread_safe, _set_thread_safe)
+
     ##########################################################################
     # Operators
 
@@ -552,6 +552,7 @@ class ModuleRegistry(DBRegistry):
         self.package_versions = self.db_packages_identifier_index
         self.packages = {}
         self._module_key_map = {}
+        self.invalidate_type_index()
         for pkg in self.package_versions.itervalues():
             for key in chain(pkg.old_identifiers, [pkg.identifier]):
                 if key in self.packages:
@@ -564,8 +565,9 @@ class ModuleRegistry(DBRegistry):
                 self.descriptors_by_id[descriptor.id] = descriptor
                 k = (descriptor.identifier, descriptor.name, 
                      descriptor.namespace, pkg.version, descriptor.version)
-                if descriptor.module is not None:
-                    self._module_key_map[descriptor.module] = k
+                # don't import the code of deferred packages
+                if descriptor._module is not None:
+                    self._module_key_map[descriptor._module] = k
         for descriptor in self.descriptors_by_id.itervalues():
             if descriptor.base_descriptor_id in self.descriptors_by_id:
                 base_descriptor = \
@@ -623,12 +625,28 @@ class ModuleRegistry(DBRegistry):
         self.root_descriptor_id = descriptor.id
     root_descriptor = property(_get_root_descriptor, _set_root_descriptor)
 
+    def invalidate_type_index(self):
+        """invalidate_type_index() -> None
+        Forgets the memoized descriptor ancestry and port spec matches
+        (see is_descriptor_subclass and are_specs_matched). This is called
+        whenever descriptors are added or removed.
+
+        """
+        # maps a descriptor to the frozenset of itself and its bases
+        self._descriptor_ancestors = {}
+        # maps (sub descriptors, super descriptors) to whether they match
+        # without conversion
+        self._specs_matched = {}
+        # the Variant, List and Module descriptors
+        self._basic_type_descriptors = None
+
     def add_descriptor(self, desc, package=None):
         if package is None:
             package = self._default_package
         # self.descriptors[(desc.package, desc.name, desc.namespace)] = desc
         self.descriptors_by_id[desc.id] = desc
         package.add_descriptor(desc)
+        self.invalidate_type_index()
     def delete_descriptor(self, desc, package=None):
         if package is None:
             try:
@@ -640,6 +658,7 @@ class ModuleRegistry(DBRegistry):
         # del self.descriptors[(desc.package, desc.name, desc.namespace)]
         del self.descriptors_by_id[desc.id]
         package.delete_descriptor(desc)
+        self.invalidate_type_index()
     def add_package(self, package):
         DBRegistry.db_add_package(self, package)
         for key in chain(package.old_identifiers, [package.identifier]):
@@ -800,7 +819,13 @@ class ModuleRegistry(DBRegistry):
         # assert isinstance(module, type)
         # assert issubclass(module, core.modules.vistrails_module.Module)
         # assert self._module_key_map.has_key(module)
-        k = self._module_key_map[module]
+        try:
+            k = self._module_key_map[module]
+        except KeyError:
+            # the class might come from a package that is still deferred
+            if not self.load_deferred_package_of_class(module):
+                raise
+            k = self._module_key_map[module]
         return self.get_descriptor_by_name(*k)
 
     # get_descriptor_from_module is a synonym for get_descriptor
@@ -923,6 +948,23 @@ class ModuleRegistry(DBRegistry):
         else:
             package = self.package_versions[(identifier, package_version)]
 
+        descriptor = package.descriptor_versions.get(
+                (name, namespace or '', version or ''))
+        if descriptor is not None and descriptor.is_deferred():
+            # the package is being loaded, reuse the descriptor read from
+            # the snapshot, its ports are added again by the package
+            descriptor._deferred_package = None
+            descriptor.module = module
+            for spec in list(descriptor.port_specs_list):
+                descriptor.delete_port_spec(spec)
+            if issubclass(module,
+                    vistrails.core.modules.vistrails_module.Converter):
+                self._conversions = dict()
+                self._converters.add(descriptor)
+            self._module_key_map[module] = (identifier, name, namespace,
+                                            package_version, version)
+            return descriptor
+
         # create descriptor
         descriptor_id = self.idScope.getNewId(ModuleDescriptor.vtType)
         descriptor = ModuleDescriptor(id=descriptor_id,
@@ -1173,6 +1215,10 @@ class ModuleRegistry(DBRegistry):
         desc_key = (name, namespace, version)
         if desc_key in package.descriptor_versions:
             raise ModuleAlreadyExists(identifier, name)
+        deferred = package.descriptor_versions.get(
+                (name, namespace or '', version or ''))
+        if deferred is not None and not deferred.is_deferred():
+            deferred = None
 
         # We allow multiple inheritance as long as only one of the superclasses
         # is a subclass of Module.
@@ -1194,8 +1240,9 @@ class ModuleRegistry(DBRegistry):
             if identifier != 'local.abstractions':
                 raise DuplicateModule(self.get_descriptor(module), identifier,
                                       name, namespace)
-        elif self.has_descriptor_with_name(identifier, name, namespace,
-                                           package_version, version):
+        elif (deferred is None and
+                self.has_descriptor_with_name(identifier, name, namespace,
+                                              package_version, version)):
             raise DuplicateIdentifier(identifier, name, namespace,
                                       package_version, version)
         descriptor = self.update_registry(base_descriptor, module, identifier, 
@@ -1209,6 +1256,8 @@ class ModuleRegistry(DBRegistry):
         # descriptor.set_configuration_widget(configureWidget)
         descriptor.is_hidden = settings.hide_descriptor
         descriptor.namespace_hidden = settings.hide_namespace
+        descriptor.persistent_cache = settings.persistent_cache
+        descriptor.thread_safe = settings.thread_safe
 
         if settings.signature:
             descriptor.set_hasher_callable(settings.signature)
@@ -1262,9 +1311,10 @@ class ModuleRegistry(DBRegistry):
         if settings.ghost_namespace:
             descriptor.ghost_namespace = settings.ghost_namespace
                  
-        self.signals.emit_new_module(descriptor)
-        if self.is_abstraction(descriptor):
-            self.signals.emit_new_abstraction(descriptor)
+        if deferred is None:
+            self.signals.emit_new_module(descriptor)
+            if self.is_abstraction(descriptor):
+                self.signals.emit_new_abstraction(descriptor)
         return descriptor
 
     def auto_add_subworkflow(self, subworkflow):
@@ -1678,7 +1728,113 @@ class ModuleRegistry(DBRegistry):
         # The package might have decided to rename itself, let's store that
         self.set_current_package(None)
         debug.splashMessage("Initializing " + package.codepath + '... done.')
-        package._initialized = True 
+        package._initialized = True
+
+    def add_package_from_snapshot(self, package, snapshot, hooks):
+        """add_package_from_snapshot(package: Package, snapshot: DBRegistry,
+                                     hooks: list) -> None
+        Registers the descriptors and port specs of a loaded (but not
+        initialized) package from a registry snapshot written by
+        core.modules.registry_snapshot, without importing the package
+        code. The descriptors are deferred: the package is initialized
+        the first time the class of one of its modules is needed (see
+        load_deferred_package()).
+
+        """
+        debug.log("Registering %s from snapshot" % package.codepath)
+        if (package.identifier, package.version) not in self.package_versions:
+            self.add_package(package)
+        package.check_requirements()
+
+        # descriptors of the snapshot from other packages are only
+        # placeholders for the base descriptors
+        snapshot_desc = None
+        id_map = {}
+        for snapshot_pkg in snapshot.db_packages:
+            if snapshot_pkg.db_identifier == package.identifier:
+                snapshot_desc = snapshot_pkg
+                continue
+            for desc in snapshot_pkg.db_module_descriptors:
+                id_map[desc.db_id] = self.get_descriptor_by_name(
+                    desc.db_package, desc.db_name, desc.db_namespace,
+                    desc.db_package_version, desc.db_version)
+        if snapshot_desc is None:
+            raise MissingPackage(package.identifier)
+
+        descriptors = {}
+        for desc in snapshot_desc.db_module_descriptors:
+            descriptors[desc.db_id] = desc
+        def add_descriptor(desc):
+            base_id = desc.db_base_descriptor_id
+            if base_id in descriptors and base_id not in id_map:
+                add_descriptor(descriptors[base_id])
+            descriptor = ModuleDescriptor(
+                id=self.idScope.getNewId(ModuleDescriptor.vtType),
+                package=desc.db_package,
+                base_descriptor=id_map.get(base_id),
+                name=desc.db_name,
+                namespace=desc.db_namespace,
+                package_version=desc.db_package_version,
+                version=desc.db_version)
+            for spec in desc.db_portSpecs:
+                spec = spec.do_copy(True, self.idScope, {})
+                PortSpec.convert(spec)
+                descriptor.add_port_spec(spec)
+            descriptor._deferred_package = package
+            self.add_descriptor(descriptor, package)
+            id_map[desc.db_id] = descriptor
+        for desc in snapshot_desc.db_module_descriptors:
+            if desc.db_id not in id_map:
+                add_descriptor(desc)
+
+        # conversions are looked up when connecting ports
+        converter_desc = self.get_descriptor(
+                vistrails.core.modules.vistrails_module.Converter)
+        for descriptor in package.descriptor_list:
+            if self.is_descriptor_subclass(descriptor, converter_desc):
+                self._conversions = dict()
+                self._converters.add(descriptor)
+        package.set_deferred(hooks)
+
+    def load_deferred_package(self, package):
+        """load_deferred_package(package: Package) -> None
+        Initializes a package registered with add_package_from_snapshot(),
+        after the deferred packages it depends on. Its modules get
+        their classes and their ports are registered again by the package.
+
+        """
+        if not package.is_deferred():
+            return
+        for dep in package.dependencies():
+            if isinstance(dep, tuple):
+                dep = dep[0]
+            if dep in self.packages:
+                self.load_deferred_package(self.packages[dep])
+        package._deferred_hooks = None
+        package._initialized = False
+        debug.log("Loading deferred package %s" % package.codepath)
+        try:
+            self.initialize_package(package)
+        finally:
+            for descriptor in package.descriptor_list:
+                descriptor._deferred_package = None
+
+    def load_deferred_package_of_class(self, module):
+        """load_deferred_package_of_class(module: class) -> bool
+        Initializes the deferred package that defines the given module
+        class, if any. Returns True if one was initialized.
+
+        """
+        module_name = getattr(module, '__module__', None)
+        if not module_name:
+            return False
+        for package in self.package_list:
+            if (package.is_deferred() and package.prefix is not None and
+                    module_name.startswith(package.prefix +
+                                           package.codepath)):
+                self.load_deferred_package(package)
+                return True
+        return False
 
     def delete_module(self, identifier, module_name, namespace=None):
         """deleteModule(module_name): Removes a module from the registry."""
@@ -1698,8 +1854,8 @@ class ModuleRegistry(DBRegistry):
             self.signals.emit_deleted_abstraction(descriptor)
         package = self.packages[descriptor.identifier]
         self.delete_descriptor(descriptor, package)
-        if descriptor.module is not None:
-            del self._module_key_map[descriptor.module]
+        if descriptor._module is not None:
+            del self._module_key_map[descriptor._module]
 
     def remove_package(self, package):
         """remove_package(package) -> None:
@@ -1876,10 +2032,23 @@ class ModuleRegistry(DBRegistry):
         self._conversions[key] = converters
         return converters
 
+    def get_basic_type_descriptors(self):
+        """get_basic_type_descriptors() -> (ModuleDescriptor,
+                                              ModuleDescriptor,
+                                              ModuleDescriptor)
+        Returns the descriptors of Variant, List and Module, which port
+        type checking treats specially.
+
+        """
+        if self._basic_type_descriptors is None:
+            basic_pkg = get_vistrails_basic_pkg_id()
+            self._basic_type_descriptors = tuple(
+                    self.get_descriptor_by_name(basic_pkg, name)
+                    for name in ('Variant', 'List', 'Module'))
+        return self._basic_type_descriptors
+
     def is_descriptor_list_subclass(self, sub_descs, super_descs):
-        basic_pkg = get_vistrails_basic_pkg_id()
-        variant_desc = self.get_descriptor_by_name(basic_pkg, 'Variant')
-        module_desc = self.get_descriptor_by_name(basic_pkg, 'Module')
+        variant_desc, _, module_desc = self.get_basic_type_descriptors()
 
         for (sub_desc, super_desc) in izip(sub_descs, super_descs):
             if sub_desc == variant_desc or super_desc == variant_desc:
@@ -1902,9 +2071,6 @@ class ModuleRegistry(DBRegistry):
         
         """
         # For a connection, this gets called for sub -> super
-        basic_pkg = get_vistrails_basic_pkg_id()
-        variant_desc = self.get_descriptor_by_name(basic_pkg, 'Variant')
-        list_desc = self.get_descriptor_by_name(basic_pkg, 'List')
         # sometimes sub is coming None
         # I don't know if this is expected, so I will put a test here
         sub_descs = []
@@ -1912,13 +2078,43 @@ class ModuleRegistry(DBRegistry):
             sub_descs = sub.descriptors()
         if sub_descs is None:
             return False
-        elif sub_descs == [variant_desc]:
-            return True
         super_descs = []
         if super:
             super_descs = super.descriptors()
         if super_descs is None:
             return False
+
+        # The result only depends on the descriptors, and is memoized
+        # until descriptors get added or removed
+        key = (tuple(sub_descs), tuple(super_descs))
+        try:
+            matched = self._specs_matched[key]
+        except KeyError:
+            matched = self._specs_matched[key] = \
+                self.are_descriptor_lists_matched(sub_descs, super_descs)
+        if matched:
+            return True
+
+        if allow_conversion:
+            converters = self.get_converters(sub_descs, super_descs)
+            if converters:
+                if out_converters is not None:
+                    out_converters.extend(converters)
+                return True
+
+        return False
+
+    def are_descriptor_lists_matched(self, sub_descs, super_descs):
+        """are_descriptor_lists_matched(sub_descs: [ModuleDescriptor],
+                                        super_descs: [ModuleDescriptor])
+          -> bool
+        Check if a port of type sub_descs can connect to a port of type
+        super_descs without conversion.
+
+        """
+        variant_desc, list_desc, _ = self.get_basic_type_descriptors()
+        if sub_descs == [variant_desc]:
+            return True
         elif super_descs == [variant_desc]:
             return True
         elif [list_desc] in [super_descs, sub_descs]:
@@ -1933,18 +2129,8 @@ class ModuleRegistry(DBRegistry):
         #    # List is handled as Variant with depth 1
         #    return True
 
-        if (len(sub_descs) == len(super_descs) and
-                self.is_descriptor_list_subclass(sub_descs, super_descs)):
-            return True
-
-        if allow_conversion:
-            converters = self.get_converters(sub_descs, super_descs)
-            if converters:
-                if out_converters is not None:
-                    out_converters.extend(converters)
-                return True
-
-        return False
+        return (len(sub_descs) == len(super_descs) and
+                self.is_descriptor_list_subclass(sub_descs, super_descs))
 
     def get_module_hierarchy(self, descriptor):
         """get_module_hierarchy(descriptor) -> [klass].
@@ -2081,19 +2267,41 @@ class ModuleRegistry(DBRegistry):
                                   super: ModuleDescriptor) -> bool
         
         """
-        # use issubclass for speed if we've loaded the modules
-        if sub.module is not None and super.module is not None:
-            return issubclass(sub.module, super.module)
+        # use issubclass for speed if we've loaded the modules (but don't
+        # load deferred packages for this)
+        if sub._module is not None and super._module is not None:
+            return issubclass(sub._module, super._module)
         
         # otherwise, use descriptors themselves
-        if sub == super:
-            return True
-        while sub != self.root_descriptor:
-            sub = sub.base_descriptor
-            if sub == super:
-                return True
+        return super in self.get_descriptor_ancestors(sub)
 
-        return False
+    def get_descriptor_ancestors(self, descriptor):
+        """get_descriptor_ancestors(descriptor: ModuleDescriptor)
+          -> frozenset(ModuleDescriptor)
+        Returns the descriptor and all its base descriptors up to the root
+        descriptor. The sets are memoized, and built from the set of the
+        base descriptor so each descriptor is only walked once.
+
+        """
+        ancestors = self._descriptor_ancestors
+        try:
+            return ancestors[descriptor]
+        except KeyError:
+            pass
+        chain = []
+        result = frozenset()
+        while descriptor is not None:
+            if descriptor in ancestors:
+                result = ancestors[descriptor]
+                break
+            chain.append(descriptor)
+            if descriptor == self.root_descriptor:
+                break
+            descriptor = descriptor.base_descriptor
+        for descriptor in reversed(chain):
+            result = result.union((descriptor,))
+            ancestors[descriptor] = result
+        return result
 
     def find_descriptor_subclass(self, d1, d2):
         if self.is_descriptor_subclass(d1, d2):
@@ -2182,3 +2390,43 @@ class TestModuleRegistry(unittest.TestCase):
         t1 = PortSpec(signature=[Float, Integer])
         t2 = PortSpec(signature=[Integer, Float])
         self.assertNotEquals(t1, t2)
+
+    def test_type_index(self):
+        from vistrails.core.modules.basic_modules import Constant, String
+        from vistrails.core.modules.vistrails_module import Module
+        registry = get_module_registry()
+        string_desc = registry.get_descriptor(String)
+        constant_desc = registry.get_descriptor(Constant)
+        module_desc = registry.get_descriptor(Module)
+        ancestors = registry.get_descriptor_ancestors(string_desc)
+        self.assertIn(constant_desc, ancestors)
+        self.assertIn(module_desc, ancestors)
+        self.assertNotIn(string_desc,
+                         registry.get_descriptor_ancestors(constant_desc))
+        self.assertIs(registry.get_descriptor_ancestors(string_desc),
+                      ancestors)
+
+        string_spec = PortSpec(signature=String)
+        constant_spec = PortSpec(signature=Constant)
+        self.assertTrue(registry.are_specs_matched(string_spec,
+                                                   constant_spec))
+        self.assertFalse(registry.are_specs_matched(constant_spec,
+                                                    string_spec))
+        self.assertIn(((string_desc,), (constant_desc,)),
+                      registry._specs_matched)
+
+        # adding or removing a module invalidates the index
+        class TestTypeIndexModule(String):
+            pass
+        registry.add_module(TestTypeIndexModule,
+                            package=string_desc.identifier,
+                            package_version=string_desc.package_version)
+        desc = registry.get_descriptor(TestTypeIndexModule)
+        try:
+            self.assertEqual(registry._specs_matched, {})
+            self.assertIn(string_desc,
+                          registry.get_descriptor_ancestors(desc))
+        finally:
+            registry.delete_module(desc.identifier, desc.name,
+                                   desc.namespace)
+        self.assertEqual(registry._descriptor_ancestors, {})
@@ -142,6 +142,7 @@ class Package(DBPackage):
             self.old_identifiers = []
             self._default_configuration = None
             self._persistent_configuration = None
+            self._deferred_hooks = None
         else:
             self._module = other._module
             self._init_module = other._init_module
@@ -156,6 +157,7 @@ class Package(DBPackage):
                                         copy.copy(other._default_configuration)
             self._persistent_configuration = \
                                     copy.copy(other._persistent_configuration)
+            self._deferred_hooks = copy.copy(other._deferred_hooks)
 
         # FIXME decide whether we want None or ''
         if self.version is None:
@@ -222,9 +224,47 @@ class Package(DBPackage):
     module = property(_get_module)
 
     def _get_init_module(self):
+        if self._deferred_hooks is not None:
+            from vistrails.core.modules.module_registry import \
+                get_module_registry
+            get_module_registry().load_deferred_package(self)
         return self._init_module
     init_module = property(_get_init_module)
 
+    # Functions of the init module that VisTrails calls from outside the
+    # package; a registry snapshot records which ones a package defines so
+    # that they can be looked up without importing its code
+    HOOKS = ['handle_all_errors', 'handle_module_upgrade_request',
+             'handle_missing_module', 'can_handle_identifier',
+             'can_handle_vt_file', 'contextMenuName', 'callContextMenu',
+             'loadVistrailFileHook', 'saveVistrailFileHook', 'menu_items',
+             'finalize']
+
+    def has_hook(self, name):
+        if self._deferred_hooks is not None:
+            return name in self._deferred_hooks
+        return hasattr(self._init_module, name)
+
+    def hooks(self):
+        return [name for name in self.HOOKS if self.has_hook(name)]
+
+    def is_deferred(self):
+        """is_deferred() -> bool
+        Returns True if the package was registered from a registry
+        snapshot and its code has not been imported yet.
+
+        """
+        return self._deferred_hooks is not None
+
+    def set_deferred(self, hooks):
+        """set_deferred(hooks: list) -> None
+        Marks the package as registered from a snapshot, where hooks
+        lists the functions its init module defines (see HOOKS).
+
+        """
+        self._deferred_hooks = set(hooks)
+        self._initialized = True
+
     def _get_configuration(self):
         if hasattr(self._module, 'configuration'):
             return self._module.configuration
@@ -485,16 +525,16 @@ class Package(DBPackage):
             self.description = "(No description available)"
 
     def can_handle_all_errors(self):
-        return hasattr(self._init_module, 'handle_all_errors')
+        return self.has_hook('handle_all_errors')
 
     def can_handle_upgrades(self):
-        return hasattr(self._init_module, 'handle_module_upgrade_request')
+        return self.has_hook('handle_module_upgrade_request')
 
     def can_handle_identifier(self, identifier):
         """ Asks package if it can handle this package
         """
         try:
-            return (hasattr(self.init_module, 'can_handle_identifier') and
+            return (self.has_hook('can_handle_identifier') and
                     self.init_module.can_handle_identifier(identifier))
         except Exception, e:
             debug.critical("Got exception calling %s's can_handle_identifier: "
@@ -506,7 +546,7 @@ class Package(DBPackage):
         """ Asks package if it can handle a file inside a zipped vt file
         """
         try:
-            return (hasattr(self.init_module, 'can_handle_vt_file') and
+            return (self.has_hook('can_handle_vt_file') and
                     self.init_module.can_handle_vt_file(name))
         except Exception, e:
             debug.critical("Got exception calling %s's can_handle_vt_file: "
@@ -515,13 +555,13 @@ class Package(DBPackage):
             return False
 
     def can_handle_missing_modules(self):
-        return hasattr(self._init_module, 'handle_missing_module')
+        return self.has_hook('handle_missing_module')
 
     def handle_all_errors(self, *args, **kwargs):
-        return self._init_module.handle_all_errors(*args, **kwargs)
+        return self.init_module.handle_all_errors(*args, **kwargs)
 
     def handle_module_upgrade_request(self, *args, **kwargs):
-        return self._init_module.handle_module_upgrade_request(*args, **kwargs)
+        return self.init_module.handle_module_upgrade_request(*args, **kwargs)
         
     def handle_missing_module(self, *args, **kwargs):
         """report_missing_module(name, namespace):
@@ -530,7 +570,7 @@ class Package(DBPackage):
         present, to allow the package to dynamically add a missing
         module.
         """
-        return self._init_module.handle_missing_module(*args, **kwargs)
+        return self.init_module.handle_missing_module(*args, **kwargs)
 
     def add_abs_upgrade(self, new_desc, name, namespace, module_version):
         key = (name, namespace)
@@ -558,30 +598,30 @@ class Package(DBPackage):
         return None
 
     def has_contextMenuName(self):
-        return hasattr(self._init_module, 'contextMenuName')
+        return self.has_hook('contextMenuName')
 
     def contextMenuName(self, signature):
-        return self._init_module.contextMenuName(signature)
+        return self.init_module.contextMenuName(signature)
     
     def has_callContextMenu(self):
-        return hasattr(self._init_module, 'callContextMenu')
+        return self.has_hook('callContextMenu')
 
     def callContextMenu(self, signature):
-        return self._init_module.callContextMenu(signature)
+        return self.init_module.callContextMenu(signature)
 
     def loadVistrailFileHook(self, vistrail, tmp_dir):
-        if hasattr(self._init_module, 'loadVistrailFileHook'):
+        if self.has_hook('loadVistrailFileHook'):
             try:
-                self._init_module.loadVistrailFileHook(vistrail, tmp_dir)
+                self.init_module.loadVistrailFileHook(vistrail, tmp_dir)
             except Exception, e:
                 debug.critical("Got exception in %s's loadVistrailFileHook(): "
                                "%s: %s" % (self.name, type(e).__name__,
                                            ', '.join(e.args)))
 
     def saveVistrailFileHook(self, vistrail, tmp_dir):
-        if hasattr(self._init_module, 'saveVistrailFileHook'):
+        if self.has_hook('saveVistrailFileHook'):
             try:
-                self._init_module.saveVistrailFileHook(vistrail, tmp_dir)
+                self.init_module.saveVistrailFileHook(vistrail, tmp_dir)
             except Exception, e:
                 debug.critical("Got exception in %s's saveVistrailFileHook(): "
                                "%s: %s" % (self.name, type(e).__name__,
@@ -596,8 +636,14 @@ class Package(DBPackage):
             callable_()
 
     def menu_items(self):
+        if self.is_deferred():
+            if not self.has_hook('menu_items'):
+                return None
+            module = self.init_module
+        else:
+            module = self._module
         try:
-            callable_ = self._module.menu_items
+            callable_ = module.menu_items
         except AttributeError:
             return None
         else:
@@ -612,6 +658,9 @@ class Package(DBPackage):
             return
         debug.log("Finalizing %s" % self.name)
         try:
+            if self.is_deferred():
+                # the package code never ran
+                raise AttributeError
             callable_ = self._module.finalize
         except AttributeError:
             pass
@@ -628,6 +677,7 @@ class Package(DBPackage):
         self._module = None
         self._init_module = None
         self._initialized = False
+        self._deferred_hooks = None
 
     def dependencies(self):
         deps = []
@@ -0,0 +1,411 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""On-disk snapshots of the module registry, one per package.
+
+Initializing a package imports its code and lets it register its modules
+and ports, which can take a long time for packages that generate their
+modules (such as VTK). After a package is initialized, its descriptors
+and port specs are written to a registry XML file, keyed by the versions
+of VisTrails and of the package and by the files of the package, and the
+names of the hooks its init module defines to a JSON file next to it
+(see :py:attr:`Package.HOOKS`). When the key matches on a later run, the descriptors are read back from that
+file instead, and the package code is only imported once a module class
+or a package hook is needed (see
+:py:meth:`ModuleRegistry.add_package_from_snapshot`).
+
+A package whose modules depend on something other than its files, for
+example the version of a library it wraps, can define a
+``registry_snapshot_key()`` function in its ``__init__.py``; the string it
+returns is added to the key.
+
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+from vistrails.core import debug
+from vistrails.core.modules.module_registry import ModuleRegistryException
+from vistrails.core.system import vistrails_version, \
+    get_vistrails_basic_pkg_id
+from vistrails.db.domain import DBRegistry, DBPackage, DBModuleDescriptor
+from vistrails.db.versions import currentVersion
+
+##############################################################################
+
+class RegistrySnapshots(object):
+    """RegistrySnapshots keeps the snapshots of the packages of a registry
+    in a directory, one registry XML file per package.
+
+    """
+
+    suffix = '.xml'
+
+    def __init__(self, registry, directory):
+        self.registry = registry
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    hooks_suffix = '.hooks'
+
+    def get_filename(self, package, key):
+        return os.path.join(self.directory, '%s%s-%s%s' % (
+                package.prefix or '', package.codepath, key, self.suffix))
+
+    def get_hooks_filename(self, package, key):
+        return self.get_filename(package, key) + self.hooks_suffix
+
+    def remove_stale(self, package, key):
+        """remove_stale(package: Package, key: str) -> None
+        Removes the snapshots of the package that have another key.
+
+        """
+        prefix = '%s%s-' % (package.prefix or '', package.codepath)
+        current = os.path.basename(self.get_filename(package, key))
+        current = (current, current + self.hooks_suffix)
+        length = len(prefix) + 40 + len(self.suffix)
+        for f in os.listdir(self.directory):
+            if (f.startswith(prefix) and f not in current and
+                    ((f.endswith(self.suffix) and len(f) == length) or
+                     (f.endswith(self.suffix + self.hooks_suffix) and
+                      len(f) == length + len(self.hooks_suffix)))):
+                try:
+                    os.unlink(os.path.join(self.directory, f))
+                except OSError, e:
+                    debug.warning("Could not remove registry snapshot %s" %
+                                  f, e)
+
+    def snapshot_key(self, package):
+        """snapshot_key(package: Package) -> str or None
+        Computes the key of a loaded package, or returns None if it can't
+        be snapshotted.
+
+        """
+        if (package.identifier == get_vistrails_basic_pkg_id() or
+                package.codepath == 'abstraction' or
+                package.package_dir is None):
+            return None
+        key = hashlib.sha1()
+        for value in (vistrails_version(), currentVersion, sys.version,
+                      package.identifier, package.version, package.prefix,
+                      package.codepath):
+            key.update(repr(value))
+        if os.path.isdir(package.package_dir):
+            for dirpath, dirnames, filenames in os.walk(package.package_dir):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if not filename.endswith('.py'):
+                        continue
+                    fname = os.path.join(dirpath, filename)
+                    statinfo = os.stat(fname)
+                    key.update(repr((os.path.relpath(fname,
+                                                     package.package_dir),
+                                     statinfo.st_mtime, statinfo.st_size)))
+        else:
+            # single-file package
+            statinfo = os.stat(package.module.__file__)
+            key.update(repr((statinfo.st_mtime, statinfo.st_size)))
+        extra_key = getattr(package.module, 'registry_snapshot_key', None)
+        if extra_key is not None:
+            key.update(repr(extra_key()))
+        return key.hexdigest()
+
+    def can_snapshot(self, package):
+        """can_snapshot(package: Package) -> bool
+        Checks that an initialized package only registered what a snapshot
+        holds: modules and ports of its own, without subworkflows or
+        constant hashers.
+
+        """
+        registry = self.registry
+        if package._abs_pkg_upgrades:
+            return False
+        if registry.root_descriptor in package.descriptor_list:
+            return False
+        for key in registry._constant_hasher_map:
+            if key[0] == package.identifier:
+                return False
+        for descriptor in package.descriptor_list:
+            if (descriptor.identifier != package.identifier or
+                    registry.is_abstraction(descriptor)):
+                return False
+        return True
+
+    def load(self, package, key):
+        """load(package: Package, key: str) -> (DBRegistry, list) or None
+        Returns the snapshot of the package and the hooks its init module
+        defines if there is one with this key, else None.
+
+        """
+        from vistrails.db.services.io import open_registry_from_xml
+        fname = self.get_filename(package, key)
+        hooks_fname = self.get_hooks_filename(package, key)
+        if not (os.path.exists(fname) and os.path.exists(hooks_fname)):
+            self.misses += 1
+            return None
+        try:
+            with open(hooks_fname, 'rb') as f:
+                hooks = json.load(f)
+            if (not isinstance(hooks, list) or
+                    not all(isinstance(h, basestring) for h in hooks)):
+                raise ValueError("invalid list of hooks")
+            snapshot = open_registry_from_xml(fname)
+        except Exception, e:
+            debug.warning("Could not read registry snapshot %s" % fname, e)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return snapshot, [str(h) for h in hooks]
+
+    def save(self, package, key):
+        """save(package: Package, key: str) -> bool
+        Writes the snapshot of an initialized package. Returns False if
+        the package can't be snapshotted, in which case nothing is written.
+
+        """
+        from vistrails.db.services.io import save_registry_to_xml
+        self.remove_stale(package, key)
+        if not self.can_snapshot(package):
+            return False
+        fname = self.get_filename(package, key)
+
+        # the base descriptors from other packages are written as
+        # placeholders, they are looked up by name when loading
+        placeholders = {}
+        for descriptor in package.descriptor_list:
+            base_id = descriptor.base_descriptor_id
+            if base_id == -1 or base_id in package.descriptors_by_id:
+                continue
+            base = self.registry.descriptors_by_id[base_id]
+            pkg_key = (base.identifier, base.package_version)
+            if pkg_key not in placeholders:
+                placeholders[pkg_key] = DBPackage(
+                    id=len(placeholders) + 1,
+                    identifier=base.identifier,
+                    version=base.package_version,
+                    codepath='',
+                    name='')
+            pkg = placeholders[pkg_key]
+            if not pkg.db_has_module_descriptor_with_id(base_id):
+                pkg.db_add_module_descriptor(DBModuleDescriptor(
+                    id=base_id,
+                    package=base.package,
+                    name=base.name,
+                    namespace=base.namespace,
+                    package_version=base.package_version,
+                    version=base.version,
+                    base_descriptor_id=-1))
+        descriptors = [DBModuleDescriptor.do_copy(d)
+                       for d in package.descriptor_list]
+        snapshot_pkg = DBPackage(id=0,
+                                 name=package.name,
+                                 identifier=package.identifier,
+                                 codepath=package.codepath,
+                                 load_configuration=package.load_configuration,
+                                 version=package.version,
+                                 description=package.description,
+                                 module_descriptors=descriptors)
+        snapshot = DBRegistry(id=0,
+                              version=currentVersion,
+                              root_descriptor_id=-1,
+                              packages=([snapshot_pkg] +
+                                        placeholders.values()))
+
+        def write_hooks(name):
+            with open(name, 'wb') as f:
+                json.dump(package.hooks(), f)
+        def write_registry(name):
+            save_registry_to_xml(snapshot, name)
+
+        # the hooks are written first, a snapshot is only used if both
+        # files exist
+        for target, write in [(self.get_hooks_filename(package, key),
+                               write_hooks),
+                              (fname, write_registry)]:
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory,
+                                            suffix='.tmp')
+            os.close(fd)
+            try:
+                write(tmp_name)
+                if os.path.exists(target):
+                    os.unlink(target)
+                os.rename(tmp_name, target)
+            except (IOError, OSError), e:
+                debug.warning("Could not write registry snapshot %s" %
+                              target, e)
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+                return False
+        return True
+
+    def initialize_package(self, package, defer=True):
+        """initialize_package(package: Package, defer: bool) -> None
+        Registers a loaded package from its snapshot if defer is True and
+        the snapshot is up to date, else initializes it through the
+        registry and writes its snapshot.
+
+        """
+        key = self.snapshot_key(package)
+        if key is None:
+            self.registry.initialize_package(package)
+            return
+        if defer:
+            result = self.load(package, key)
+            if result is not None:
+                snapshot, hooks = result
+                try:
+                    self.registry.add_package_from_snapshot(package,
+                                                            snapshot, hooks)
+                    return
+                except ModuleRegistryException, e:
+                    debug.warning("Registry snapshot of %s doesn't match, "
+                                  "initializing it" % package.codepath, e)
+        self.registry.initialize_package(package)
+        if not os.path.exists(self.get_filename(package, key)):
+            self.save(package, key)
+
+
+def create_registry_snapshots_from_configuration(registry,
+                                                 configuration=None):
+    """create_registry_snapshots_from_configuration(registry,
+                                                    configuration)
+      -> RegistrySnapshots or None
+    Builds the snapshots from the registryCache and registryCacheDir
+    configuration settings. Returns None if they are disabled.
+
+    """
+    from vistrails.core.system import get_vistrails_directory
+    if configuration is None:
+        from vistrails.core.configuration import get_vistrails_configuration
+        configuration = get_vistrails_configuration()
+    if configuration is None or not configuration.check('registryCache'):
+        return None
+    directory = get_vistrails_directory('registryCacheDir', configuration)
+    if directory is None:
+        return None
+    try:
+        return RegistrySnapshots(registry, directory)
+    except OSError, e:
+        debug.warning("Could not open registry snapshots in %s" % directory,
+                      e)
+        return None
+
+##############################################################################
+
+import shutil
+import unittest
+
+class TestRegistrySnapshots(unittest.TestCase):
+    def setUp(self):
+        from vistrails.core.packagemanager import get_package_manager
+        self.pm = get_package_manager()
+        self.registry = self.pm._registry
+        self.directory = tempfile.mkdtemp(prefix='vt_registry_')
+        self.snapshots = RegistrySnapshots(self.registry, self.directory)
+        self.old_snapshots = self.pm._registry_snapshots
+        self.pm._registry_snapshots = self.snapshots
+
+    def tearDown(self):
+        self.pm._registry_snapshots = self.old_snapshots
+        if self.pm.has_package('org.vistrails.vistrails.pythoncalc'):
+            self.pm.late_disable_package('pythonCalc')
+        shutil.rmtree(self.directory)
+
+    def test_deferred_package(self):
+        if self.pm.has_package('org.vistrails.vistrails.pythoncalc'):
+            self.skipTest("pythonCalc is already enabled")
+        self.pm.late_enable_package('pythonCalc')
+        self.assertEqual((self.snapshots.hits, self.snapshots.misses), (0, 1))
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+        pkg = self.pm.get_package('org.vistrails.vistrails.pythoncalc')
+        self.assertFalse(pkg.is_deferred())
+        hooks = pkg.hooks()
+        descriptor = pkg.descriptors[('PythonCalc', '')]
+        ports = [(spec.name, spec.type, spec.sigstring)
+                 for spec in descriptor.port_specs_list]
+        self.pm.late_disable_package('pythonCalc')
+
+        self.pm.late_enable_package('pythonCalc')
+        self.assertEqual((self.snapshots.hits, self.snapshots.misses), (1, 1))
+        pkg = self.pm.get_package('org.vistrails.vistrails.pythoncalc')
+        self.assertTrue(pkg.is_deferred())
+        self.assertEqual(pkg.hooks(), hooks)
+        self.assertNotIn('vistrails.packages.pythonCalc.init', sys.modules)
+        descriptor = self.registry.get_descriptor_by_name(
+            'org.vistrails.vistrails.pythoncalc', 'PythonCalc')
+        self.assertTrue(descriptor.is_deferred())
+        self.assertEqual(
+            sorted((spec.name, spec.type, spec.sigstring)
+                   for spec in descriptor.port_specs_list),
+            sorted(ports))
+        self.assertTrue(self.registry.has_port_spec_from_descriptor(
+            descriptor, 'value1', 'input'))
+
+        # getting the class initializes the package
+        module = descriptor.module
+        self.assertEqual(module.__name__, 'PythonCalc')
+        self.assertFalse(pkg.is_deferred())
+        self.assertFalse(descriptor.is_deferred())
+        self.assertIs(self.registry.get_descriptor(module), descriptor)
+        self.assertEqual(
+            sorted((spec.name, spec.type, spec.sigstring)
+                   for spec in descriptor.port_specs_list),
+            sorted(ports))
+
+    def test_stale_snapshot(self):
+        if self.pm.has_package('org.vistrails.vistrails.pythoncalc'):
+            self.skipTest("pythonCalc is already enabled")
+        self.pm.late_enable_package('pythonCalc')
+        pkg = self.pm.get_package('org.vistrails.vistrails.pythoncalc')
+        key = self.snapshots.snapshot_key(pkg)
+        self.pm.late_disable_package('pythonCalc')
+        for fname in (self.snapshots.get_filename(pkg, key),
+                      self.snapshots.get_hooks_filename(pkg, key)):
+            os.rename(fname, fname.replace(key, '0' * 40))
+
+        self.pm.late_enable_package('pythonCalc')
+        self.assertEqual((self.snapshots.hits, self.snapshots.misses), (0, 2))
+        pkg = self.pm.get_package('org.vistrails.vistrails.pythoncalc')
+        self.assertFalse(pkg.is_deferred())
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         [os.path.basename(
+                             self.snapshots.get_filename(pkg, key)),
+                          os.path.basename(
+                             self.snapshots.get_hooks_filename(pkg, key))])
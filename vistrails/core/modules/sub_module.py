@@ -145,11 +145,15 @@ def group_signature(pipeline, module, chm):
             sig = Hasher.module_signature(input_module, chm)
         input_module._input_port_signature = sig
 
-    module.pipeline.refresh_signatures()
+    # only the signatures that depend on the input ports have changed
+    module.pipeline.invalidate_signatures(
+            [m.id for m in module._input_remap.itervalues()])
+    sinks = module.pipeline.graph.sinks()
+    module.pipeline.compute_subpipeline_signatures(sinks)
 
     sig_list = []
     sig_list.append(Hasher.module_signature(module, chm))
-    for m_id in module.pipeline.graph.sinks():
+    for m_id in sinks:
         sig_list.append(module.pipeline.subpipeline_signature(m_id))
     return Hasher.compound_signature(sig_list)
 
@@ -327,6 +327,10 @@ class Module(Serializable):
 
         self.signature = None
 
+        # set when the outputs were loaded from the on-disk result store,
+        # in which case the upstream modules don't need to run
+        self.loaded_from_store = False
+
         # stores whether the output of the module should be annotated in the
         # execution log
         self.annotate_output = False
@@ -562,7 +566,7 @@ class Module(Serializable):
         elif self.computed:
             return
         self.logging.begin_update(self)
-        if not self.setJobCache():
+        if not self.setJobCache() and not self.loaded_from_store:
             self.update_upstream()
         if self.upToDate:
             if not self.computed:
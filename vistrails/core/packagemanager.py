@@ -43,13 +43,16 @@ import os
 import sys
 import warnings
 
-from vistrails.core import debug, get_vistrails_application, system
+from vistrails.core import debug, get_vistrails_application, system, \
+    is_running_gui
 from vistrails.core.configuration import ConfigurationObject
 import vistrails.core.data_structures.graph
 import vistrails.core.db.io
 from vistrails.core.modules.module_registry import ModuleRegistry, \
                                          MissingPackage, MissingPackageVersion
 from vistrails.core.modules.package import Package
+from vistrails.core.modules.registry_snapshot import \
+    create_registry_snapshots_from_configuration
 from vistrails.core.requirements import MissingRequirement
 from vistrails.core.utils import VistrailsInternalError, InstanceObject, \
     versions_increasing, VistrailsDeprecation
@@ -153,6 +156,8 @@ class PackageManager(object):
 
         self._registry = registry
         self._startup = startup
+        self._registry_snapshots = \
+            create_registry_snapshots_from_configuration(registry)
 
         # Contains packages that have not yet been enabled, but exist on the
         # filesystem
@@ -459,6 +464,20 @@ class PackageManager(object):
                                                    dep_name):
                 self._dependency_graph.add_edge(package.identifier, dep_name)
 
+    def initialize_package(self, package):
+        """initialize_package(package: Package) -> None
+        Initializes a loaded package in the registry, from its registry
+        snapshot if the registryCache option is set.
+
+        """
+        if self._registry_snapshots is not None:
+            # the GUI needs the module settings that are not in the
+            # snapshots, such as colors and configuration widgets
+            self._registry_snapshots.initialize_package(
+                package, defer=not is_running_gui())
+        else:
+            self._registry.initialize_package(package)
+
     def late_enable_package(self, codepath, prefix_dictionary={},
                             needs_add=True):
         """late_enable_package enables a package 'late', that is,
@@ -489,7 +508,7 @@ class PackageManager(object):
             self.add_dependencies(pkg)
             #check_requirements is now called in pkg.initialize()
             #pkg.check_requirements()
-            self._registry.initialize_package(pkg)
+            self.initialize_package(pkg)
             self._registry.signals.emit_new_package(pkg.identifier, True)
             app.send_notification("package_added", codepath)
             self.add_menu_items(pkg)
@@ -658,7 +677,7 @@ class PackageManager(object):
                 #check_requirements is now called in pkg.initialize()
                 #pkg.check_requirements()
                 try:
-                    self._registry.initialize_package(pkg)
+                    self.initialize_package(pkg)
                 except MissingRequirement, e:
                     if report_missing_dependencies:
                         debug.critical("Package <codepath %s> is missing a "
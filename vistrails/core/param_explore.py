@@ -38,7 +38,10 @@ This module handles Parameter Exploration in VisTrails
 from vistrails.core import debug
 from vistrails.core.vistrail.module_function import ModuleFunction
 from vistrails.core.vistrail.module_param import ModuleParam
-import copy
+import itertools
+from itertools import izip
+import multiprocessing
+import os
 
 import unittest
 
@@ -66,10 +69,23 @@ class ParameterExploration(object):
         values in self.specs
         
         """
-        pipelineList = [pipeline]
-        for i in xrange(len(self.specs)):
-            pipelineList = self.interpolateList(pipelineList, self.specs[i])
-        return pipelineList
+        return list(self.iter_explore(pipeline))
+
+    def iter_explore(self, pipeline):
+        """ iter_explore(pipeline: VisPipeline) -> iterator
+        Same as explore(), but yields the pipelines one at a time instead
+        of building all of them first
+        
+        """
+        specs = [interpList for interpList in self.specs if interpList]
+        steps = [xrange(interpList[0].stepCount)
+                 for interpList in reversed(specs)]
+        for combination in itertools.product(*steps):
+            newp = pipeline.cow_copy()
+            for interpList, step in izip(specs, reversed(combination)):
+                for interp in interpList:
+                    interp.perform(newp, step)
+            yield newp
 
     def interpolateList(self, pipelineList, interpList):
         """ interpolateList(pipeline: list[VisPipeLine],
@@ -84,7 +100,7 @@ class ParameterExploration(object):
         result = []
         for step in xrange(stepCount):
             for pipeline in pipelineList:
-                newp = copy.copy(pipeline)
+                newp = pipeline.cow_copy()
                 for interp in interpList:
                     interp.perform(newp, step)
                 result.append(newp)
@@ -160,7 +176,7 @@ class InterpolateDiscreteParam(object):
         pipeline
 
         """
-        m = pipeline.modules[self.module.id]
+        m = pipeline.unshare_module(self.module.id)
         f = ModuleFunction()
         f.name = self.function
         f.returnType = 'void'
@@ -173,6 +189,7 @@ class InterpolateDiscreteParam(object):
             p.strValue = str(v)
             f.params.append(p)
         m.functions.append(f)
+        pipeline.invalidate_signatures([m.id])
 
 class ActionBasedParameterExploration(object):
     """
@@ -206,38 +223,190 @@ class ActionBasedParameterExploration(object):
         """
         results = []
         resultActions = []
+        for result, performedActions in self.iter_explore(pipeline, actions,
+                                                          pre_actions):
+            results.append(result)
+            resultActions.append(performedActions)
+        return (results, resultActions)
+
+    def iter_explore(self, pipeline, actions, pre_actions=[]):
+        """ iter_explore(pipeline: Pipeline, actions: [action set],
+                         pre_actions: [action set]) -> iterator
+        Same as explore(), but yields the (pipeline, actions) tuples one
+        at a time, so that only the pipeline being used is kept in memory.
         
-        def exploreDimension(pipeline, performedActions, dim):
-            """ exploreDimension(pipeline: Pipeline, performedActions: [actions],
-                                 dim: int) -> None
-            Start applying actions to the pipeline at dimension
-            dim. 'pipeline' will not be modified in the function
-            
-            """
-            if dim<0:
-                results.append(pipeline)
-                resultActions.append(performedActions)
-                return
-            currentActions = actions[dim]
-            if len(currentActions)==0:
-                # Ignore empty dimension
-                exploreDimension(pipeline, performedActions, dim-1)
-                return
-            for actionSet in currentActions:
-                currentPipeline = copy.copy(pipeline)
-                currentPeformedActions = copy.copy(performedActions)
-                for action in actionSet:
-                    currentPipeline.perform_action(action)
-                    currentPeformedActions.append(action)
-                exploreDimension(currentPipeline, currentPeformedActions, dim-1)
+        """
+        base = self.prepare(pipeline, pre_actions)
+        for combination in self.combinations(actions):
+            yield self.build(base, actions, combination, pre_actions)
+
+    @staticmethod
+    def combinations(actions):
+        """ combinations(actions: [action set]) -> iterator
+        Yields the index of the action set to use in each dimension, for
+        every pipeline of the exploration, in the order explore() returns
+        them. Empty dimensions are skipped.
         
-        # perform pre_actions
-        currentPipeline = copy.copy(pipeline)
+        """
+        dims = [d for d in xrange(len(actions) - 1, -1, -1) if actions[d]]
+        for steps in itertools.product(*[xrange(len(actions[d]))
+                                         for d in dims]):
+            yield tuple(zip(dims, steps))
+
+    @staticmethod
+    def prepare(pipeline, pre_actions=[]):
+        """ prepare(pipeline: Pipeline, pre_actions: [action set]) -> Pipeline
+        Returns a copy of the pipeline with the pre_actions applied, that
+        build() uses as a starting point.
+        
+        """
+        currentPipeline = pipeline.cow_copy()
         for action in pre_actions:
             currentPipeline.perform_action(action)
+        return currentPipeline
+
+    @staticmethod
+    def build(base, actions, combination, pre_actions=[]):
+        """ build(base: Pipeline, actions: [action set],
+                  combination: tuple, pre_actions: [action set])
+                  -> (Pipeline, [actions])
+        Builds a single pipeline of the exploration, from the result of
+        prepare() and an element of combinations(). 'base' is not modified.
         
-        exploreDimension(currentPipeline, pre_actions, len(actions)-1)
-        return (results, resultActions)
+        """
+        currentPipeline = base.cow_copy()
+        currentPerformedActions = list(pre_actions)
+        for dim, step in combination:
+            for action in actions[dim][step]:
+                currentPipeline.perform_action(action)
+                currentPerformedActions.append(action)
+        return currentPipeline, currentPerformedActions
+
+class ExplorationExecutor(object):
+    """
+    ExplorationExecutor runs the pipelines of an action based parameter
+    exploration without a GUI, possibly on several processes.
+
+    The pipelines are built lazily, one at a time. The first one is
+    executed in this process, which fills the interpreter cache with the
+    upstream modules that all the pipelines share; the worker processes
+    are only forked after that, so they start with this cache. On
+    platforms that cannot fork, everything runs in this process.
+
+    """
+
+    def __init__(self, pipeline, actions, pre_actions=[], jobs=1):
+        """ ExplorationExecutor(pipeline: Pipeline, actions: [action set],
+                                pre_actions: [action set], jobs: int)
+                                -> ExplorationExecutor
+        The arguments are the same as ActionBasedParameterExploration's
+        explore(). jobs is the number of processes to use.
+
+        """
+        self.pipeline = pipeline
+        self.actions = actions
+        self.pre_actions = pre_actions
+        self.jobs = jobs
+        self.explorer = ActionBasedParameterExploration()
+        self.base = None
+
+    def execute(self, log=None, **kwargs):
+        """ execute(log: Log, **kwargs) -> [dict]
+        Executes all the pipelines, and returns for each of them a
+        dictionary mapping module ids to error messages. Executions are
+        added to log if it is given; kwargs are passed to the interpreter.
+
+        """
+        self.base = self.explorer.prepare(self.pipeline, self.pre_actions)
+        combinations = self.explorer.combinations(self.actions)
+        results = []
+        try:
+            first = combinations.next()
+        except StopIteration:
+            return results
+
+        results.append(self._execute(first, log, kwargs)[0])
+
+        if self.jobs <= 1 or not hasattr(os, 'fork'):
+            for combination in combinations:
+                results.append(self._execute(combination, log, kwargs)[0])
+            return results
+
+        global _current_executor
+        _current_executor = (self, log is not None, kwargs)
+        pool = multiprocessing.Pool(self.jobs)
+        try:
+            for errors, wf_exec in pool.imap(_execute_combination,
+                                             combinations):
+                results.append(errors)
+                if log is not None and wf_exec is not None:
+                    self._merge_log(log, wf_exec)
+        finally:
+            pool.terminate()
+            pool.join()
+            _current_executor = None
+        return results
+
+    def _execute(self, combination, log, kwargs):
+        """ _execute(combination: tuple, log: Log, kwargs: dict)
+                     -> (dict, WorkflowExec)
+        Builds and executes one of the pipelines
+
+        """
+        from vistrails.core.interpreter.default import get_default_interpreter
+        from vistrails.core.log.controller import DummyLogController, \
+            LogController
+
+        pipeline, performedActions = self.explorer.build(
+                self.base, self.actions, combination, self.pre_actions)
+        kwargs = dict(kwargs)
+        kwargs['actions'] = performedActions
+        if log is not None:
+            kwargs['logger'] = LogController(log)
+        else:
+            kwargs['logger'] = DummyLogController
+        interpreter = get_default_interpreter()
+        result = interpreter.execute(pipeline, **kwargs)
+        errors = dict((module_id, str(error))
+                      for module_id, error in result.errors.iteritems())
+        wf_exec = None
+        if log is not None and log.workflow_execs:
+            wf_exec = log.workflow_execs[-1]
+        return errors, wf_exec
+
+    @staticmethod
+    def _merge_log(log, wf_exec):
+        """ _merge_log(log: Log, wf_exec: str) -> None
+        Adds a workflow execution serialized by a worker to the log
+
+        """
+        from vistrails.core.db.io import unserialize
+        from vistrails.core.log.workflow_exec import WorkflowExec
+
+        wf_exec = unserialize(wf_exec, WorkflowExec)
+        wf_exec.id = log.id_scope.getNewId(WorkflowExec.vtType)
+        log.add_workflow_exec(wf_exec)
+
+# The executor running in the worker processes, inherited when forking
+_current_executor = None
+
+def _execute_combination(combination):
+    """ _execute_combination(combination: tuple) -> (dict, str)
+    Runs in the worker processes. Executes one pipeline, and returns the
+    errors and the serialized workflow execution
+
+    """
+    from vistrails.core.db.io import serialize
+    from vistrails.core.log.log import Log
+
+    executor, logging, kwargs = _current_executor
+    log = None
+    if logging:
+        log = Log()
+    errors, wf_exec = executor._execute(combination, log, kwargs)
+    if wf_exec is not None:
+        wf_exec = serialize(wf_exec)
+    return errors, wf_exec
 
 def _pipelinePositions(sheetCount, rowCount, colCount,
                        pipelines):
@@ -280,5 +449,102 @@ class TestParameterExploration(unittest.TestCase):
                           (5, 5.0, 'two'),
                           (10, 10.0, 'three')])
 
+    def test_iter_explore(self):
+        """ParameterExploration.iter_explore() yields what explore() did"""
+        from vistrails.core.vistrail.module import Module
+        from vistrails.core.vistrail.pipeline import Pipeline
+        pipeline = Pipeline()
+        pipeline.add_module(Module(id=0, name='Integer'))
+        pe = ParameterExploration([
+                [InterpolateDiscreteParam(pipeline.modules[0], 'a',
+                                          [(0, 2)], 3)],
+                [InterpolateDiscreteParam(pipeline.modules[0], 'b',
+                                          [('x', 'y')], 2)]])
+        pipelines = pe.explore(pipeline)
+        self.assertEqual(len(pipelines), 6)
+        self.assertEqual(
+                [[(f.name, f.params[0].strValue)
+                  for f in p.modules[0].functions]
+                 for p in pipelines],
+                [[('a', '0'), ('b', 'x')],
+                 [('a', '1'), ('b', 'x')],
+                 [('a', '2'), ('b', 'x')],
+                 [('a', '0'), ('b', 'y')],
+                 [('a', '1'), ('b', 'y')],
+                 [('a', '2'), ('b', 'y')]])
+        self.assertEqual(pipeline.modules[0].functions, [])
+
+
+class TestExplorationExecutor(unittest.TestCase):
+    @staticmethod
+    def make_exploration():
+        """Builds an Integer and a String module, and a 3 x 2 exploration
+        of their values
+
+        """
+        from vistrails.core.db.action import create_action
+        from vistrails.core.modules.module_registry import \
+            get_module_registry
+        from vistrails.core.system import get_vistrails_basic_pkg_id
+        from vistrails.core.vistrail.module import Module
+        from vistrails.core.vistrail.pipeline import Pipeline
+
+        basic_pkg = get_vistrails_basic_pkg_id()
+        version = get_module_registry().get_package_by_name(basic_pkg).version
+        pipeline = Pipeline()
+        dims = []
+        for i, (name, values) in enumerate([('Integer', ['1', '2', 'x']),
+                                            ('String', ['a', 'b'])]):
+            param = ModuleParam(id=i, pos=0, type=name, val=values[0])
+            function = ModuleFunction(id=i, name='value',
+                                      parameters=[param])
+            pipeline.add_module(Module(id=i, name=name, package=basic_pkg,
+                                       version=version,
+                                       functions=[function]))
+            actions = []
+            for j, value in enumerate(values):
+                new_param = ModuleParam(id=-(i * 10 + j + 1), pos=0,
+                                        type=name, val=value)
+                actions.append((create_action([('change', param, new_param,
+                                                 function.vtType,
+                                                 function.real_id)]),))
+            dims.append(actions)
+        return pipeline, dims
+
+    def test_combinations(self):
+        pipeline, actions = self.make_exploration()
+        explorer = ActionBasedParameterExploration()
+        pipelines, performed = explorer.explore(pipeline, actions)
+        self.assertEqual(
+                [(p.modules[0].functions[0].params[0].strValue,
+                  p.modules[1].functions[0].params[0].strValue)
+                 for p in pipelines],
+                [('1', 'a'), ('2', 'a'), ('x', 'a'),
+                 ('1', 'b'), ('2', 'b'), ('x', 'b')])
+        self.assertEqual(performed[4], [actions[1][1][0], actions[0][1][0]])
+        self.assertEqual(
+                pipeline.modules[0].functions[0].params[0].strValue, '1')
+
+    def execute(self, jobs):
+        from vistrails.core.db.locator import XMLFileLocator
+        from vistrails.core.log.log import Log
+
+        pipeline, actions = self.make_exploration()
+        log = Log()
+        executor = ExplorationExecutor(pipeline, actions, jobs=jobs)
+        results = executor.execute(log, locator=XMLFileLocator('foo.xml'),
+                                   current_version=1L)
+        self.assertEqual(len(results), 6)
+        self.assertEqual([sorted(r) for r in results],
+                         [[], [], [0], [], [], [0]])
+        self.assertEqual(len(log.workflow_execs), 6)
+        self.assertEqual(len(set(w.id for w in log.workflow_execs)), 6)
+
+    def test_execute(self):
+        self.execute(1)
+
+    def test_execute_parallel(self):
+        self.execute(2)
+
 if __name__ == '__main__':
     unittest.main()
@@ -33,6 +33,7 @@
 ##
 ###############################################################################
 import copy
+import heapq
 from itertools import izip
 import os
 import uuid
@@ -47,10 +48,13 @@ import vistrails.core.db.locator
 from vistrails.core import debug
 from vistrails.core.data_structures.graph import Graph
 from vistrails.core.interpreter.default import get_default_interpreter
+from vistrails.core.interpreter.profiler import get_configured_profiler, \
+    write_configured_profile
 from vistrails.core.vistrail.job import JobMonitor
 from vistrails.core.layout.workflow_layout import WorkflowLayout, \
     Pipeline as LayoutPipeline, Defaults as LayoutDefaults
-from vistrails.core.log.controller import LogController, DummyLogController
+from vistrails.core.log.controller import LogController, \
+    DummyLogController, StreamingLogController
 from vistrails.core.log.log import Log
 from vistrails.core.modules.abstraction import identifier as abstraction_pkg, \
     version as abstraction_ver
@@ -89,7 +93,8 @@ from vistrails.core.vistrail.vistrail import Vistrail
 from vistrails.core.theme import DefaultCoreTheme
 from vistrails.db import VistrailsDBException
 from vistrails.db.domain import IdScope, DBWorkflowExec
-from vistrails.db.services.io import create_temp_folder, remove_temp_folder
+from vistrails.db.services.io import create_temp_folder, \
+    get_log_index_filename, remove_temp_folder
 from vistrails.db.services.io import SaveBundle, open_vt_log_from_db
 from vistrails.db.services.vistrail import getSharedRoot
 from vistrails.core.utils import any
@@ -157,6 +162,17 @@ class VistrailController(object):
         self.flush_pipeline_cache()
         self._current_full_graph = None
         self._current_terse_graph = None
+        # state of the terse graph used to update it incrementally, see
+        # recompute_terse_graph()
+        self._terse_anchors = None
+        self._terse_settings = None
+        self._terse_current_version = None
+        self._terse_last_n = None
+        # versions of the terse graph changed by its last update, None if
+        # it was built again
+        self._terse_graph_changes = None
+        self._search_matches = {}
+        self._search_matches_query = None
         self.num_versions_always_shown = 1
 
         # if self.search is True, vistrail is currently being searched
@@ -177,6 +193,10 @@ class VistrailController(object):
         # when writing the vistrail
         self._mashups = []
 
+        # log file created by get_logger() for the executions of a vistrail
+        # that has none, removed by close_vistrail()
+        self._temp_log_filename = None
+
         # the redo stack stores the undone action ids 
         # (undo is automatic with us, through the version tree)
         self.redo_stack = []
@@ -215,7 +235,24 @@ class VistrailController(object):
             
     def get_logger(self):
         if self.logging_on():
-            return LogController(self.log)
+            config = get_vistrails_configuration()
+            if config.has('executionLogLoopSampling'):
+                loop_sampling = config.executionLogLoopSampling
+            else:
+                loop_sampling = 1
+            if config.check('executionLogStream'):
+                # Executions are appended to the log file as they finish; it
+                # gets copied in the bundle when the vistrail is saved
+                if self.vistrail.db_log_filename is None:
+                    self.remove_temp_log()
+                    fd, fname = tempfile.mkstemp(prefix='vt_log_')
+                    os.close(fd)
+                    self._temp_log_filename = fname
+                    self.vistrail.db_log_filename = fname
+                return StreamingLogController(self.log,
+                                              self.vistrail.db_log_filename,
+                                              loop_sampling=loop_sampling)
+            return LogController(self.log, loop_sampling=loop_sampling)
         else:
             return DummyLogController
         
@@ -265,6 +302,24 @@ class VistrailController(object):
         if locator is not None:
             locator.clean_temporaries()
             locator.close()
+        self.remove_temp_log()
+
+    def remove_temp_log(self):
+        """remove_temp_log() -> None
+        Removes the log file created by get_logger(), if any, along with its
+        index. Once saved, the vistrail uses the copy in its bundle.
+
+        """
+        if self._temp_log_filename is None:
+            return
+        if (self.vistrail is not None and
+                self.vistrail.db_log_filename == self._temp_log_filename):
+            self.vistrail.db_log_filename = None
+        for fname in (self._temp_log_filename,
+                      get_log_index_filename(self._temp_log_filename)):
+            if os.path.isfile(fname):
+                remove_temp_folder(fname)
+        self._temp_log_filename = None
 
     def cleanup(self):
         pass
@@ -596,7 +651,7 @@ class VistrailController(object):
                 self.vistrail.change_description(description, action.id)
             self.current_version = action.db_id
             self.set_changed(True)
-            self.recompute_terse_graph()
+            self.recompute_terse_graph([action.db_id])
             
     def create_module_from_descriptor(self, *args, **kwargs):
         return self.create_module_from_descriptor_static(self.id_scope,
@@ -2618,7 +2673,12 @@ class VistrailController(object):
             if self.get_vistrail_variables():
                 kwargs['vistrail_variables'] = \
                     self.get_vistrail_variable_by_uuid
+            profiler = get_configured_profiler()
+            if profiler is not None:
+                kwargs['profiler'] = profiler
             result = interpreter.execute(pipeline, **kwargs)
+            if profiler is not None:
+                write_configured_profile()
             
             thumb_cache = ThumbnailCache.getInstance()
             
@@ -2718,21 +2778,115 @@ class VistrailController(object):
                 debug.unexpected_exception(e)
                 raise
 
-    def recompute_terse_graph(self):
+    def recompute_terse_graph(self, versions=None):
+        """recompute_terse_graph(versions: iterable of int) -> None
+        Computes the terse version graph, that only shows the root, the
+        tagged and expanded versions, the branches and the current and
+        latest versions.
+
+        If versions is given, the graph computed previously is updated
+        instead: only these versions (that were added, tagged, pruned,
+        expanded or collapsed) and the path segments they affect are
+        looked at, along with the versions that the vistrail recorded as
+        tagged, pruned, expanded or collapsed since the last update. An
+        empty list means that only the current version or the view
+        settings changed, and keeps the search results.
+
+        The versions that were added to, removed from or changed in the
+        terse graph are then listed in self._terse_graph_changes, which
+        is None if the whole graph was computed again.
+
+        """
+        if versions is None:
+            # anything could have changed, including what the search
+            # matches
+            self._search_matches = {}
+        elif (self._terse_anchors is not None and
+                self._terse_settings == self._get_terse_settings() and
+                self._current_full_graph is
+                    self.vistrail.tree.getVersionTree()):
+            versions = set(versions)
+            versions.update(self.vistrail.changed_versions)
+            self.vistrail.changed_versions.clear()
+            self._update_terse_graph(versions)
+            return
+        self.vistrail.changed_versions.clear()
+        self._build_terse_graph()
+
+    def _get_terse_settings(self):
+        # the search only changes the graph when refining
+        return (self.full_tree, self.refine,
+                self.search if self.refine else None,
+                self.num_versions_always_shown)
+
+    def _search_match(self, version):
+        """_search_match(version: int) -> bool
+        Returns whether the current search matches a version. The results
+        are cached for the current query.
+
+        """
+        if self._search_matches_query is not self.search:
+            self._search_matches = {}
+            self._search_matches_query = self.search
+        try:
+            return self._search_matches[version]
+        except KeyError:
+            match = self._search_matches[version] = \
+                self.search.match(self.vistrail,
+                                  self.vistrail.actionMap[version])
+            return match
+
+    def _get_terse_children(self, version, am):
+        """_get_terse_children(version: int, am: dict) -> list of int
+        Returns the children of a version that are in the terse graph or
+        hidden in its segments.
+
+        """
+        if version in am and self.vistrail.is_pruned(version):
+            return []
+        return [to for (to, _) in
+                self._current_full_graph.adjacency_list[version]
+                if (to in am) and (not self.vistrail.is_pruned(to) or
+                                   to == self.current_version)]
+
+    def _is_terse_version_shown(self, version, num_children, am, has_tag,
+                                last_n):
+        if not (self.full_tree or
+                (version == 0) or  # is root
+                has_tag(version) or # hasTag:
+                (num_children != 1) or # not oneChild:
+                (version == self.current_version) or # isCurrentVersion
+                (am[version].expand) or  # forced expansion
+                (version in last_n)): # show latest
+            return False
+        # if we are refining, version view receives the graph without
+        # the non matching elements
+        return ((not self.refine) or
+                (not self.search) or
+                (version == 0) or
+                (version == self.current_version) or
+                self._search_match(version))
+
+    def _build_terse_graph(self):
         # get full version tree (including pruned nodes) this tree is
         # kept updated all the time. This data is read only and should
         # not be updated!
-        fullVersionTree = self.vistrail.tree.getVersionTree()
+        self._current_full_graph = self.vistrail.tree.getVersionTree()
 
         # create tersed tree
         x = [(0,None)]
         tersedVersionTree = Graph()
+        # maps every version that is shown or hidden in a segment of the
+        # terse graph to the version its children are attached to: itself
+        # if it is shown, else the closest shown ancestor
+        anchors = {}
 
         # cache actionMap and tagMap because they're properties, sort
         # of slow
         am = self.vistrail.actionMap
-        tm = self.vistrail.get_tagMap()
-        last_n = self.vistrail.getLastActions(self.num_versions_always_shown)
+        has_tag = self.vistrail.get_tagMap().__contains__
+        last_n = set(self.vistrail.getLastActions(
+                self.num_versions_always_shown))
 
         while 1:
             try:
@@ -2741,51 +2895,268 @@ class VistrailController(object):
                 break
 
             # mount childs list
-            if current in am and self.vistrail.is_pruned(current):
-                children = []
-            else:
-                children = \
-                    [to for (to, _) in fullVersionTree.adjacency_list[current]
-                     if (to in am) and (not self.vistrail.is_pruned(to) or \
-                                            to == self.current_version)]
-
-            if (self.full_tree or
-                (current == 0) or  # is root
-                (current in tm) or # hasTag:
-                (len(children) <> 1) or # not oneChild:
-                (current == self.current_version) or # isCurrentVersion
-                (am[current].expand) or  # forced expansion
-                (current in last_n)): # show latest
-
-                # yes it will!  this needs to be here because if we
-                # are refining version view receives the graph without
-                # the non matching elements
-                if( (not self.refine) or
-                    (self.refine and not self.search) or
-                    (current == 0) or
-                    (self.refine and self.search and
-                     self.search.match(self.vistrail,am[current]) or
-                     current == self.current_version)):
-                    # add vertex...
-                    tersedVersionTree.add_vertex(current)
-
-                    # ...and the parent
-                    if parent is not None:
-                        tersedVersionTree.add_edge(parent,current,0)
-
-                    # update the parent info that will be used by the
-                    # childs of this node
-                    parentToChildren = current
-                else:
-                    parentToChildren = parent
+            children = self._get_terse_children(current, am)
+
+            if self._is_terse_version_shown(current, len(children), am,
+                                            has_tag, last_n):
+                # add vertex...
+                tersedVersionTree.add_vertex(current)
+
+                # ...and the parent
+                if parent is not None:
+                    tersedVersionTree.add_edge(parent,current,0)
+
+                # update the parent info that will be used by the
+                # childs of this node
+                parentToChildren = current
             else:
                 parentToChildren = parent
+            anchors[current] = parentToChildren
 
             for child in reversed(children):
                 x.append((child, parentToChildren))
 
         self._current_terse_graph = tersedVersionTree
-        self._current_full_graph = self.vistrail.tree.getVersionTree()
+        self._terse_anchors = anchors
+        self._terse_settings = self._get_terse_settings()
+        self._terse_current_version = self.current_version
+        self._terse_last_n = last_n
+        self._terse_graph_changes = None
+
+    def _update_terse_graph(self, versions):
+        """_update_terse_graph(versions: iterable of int) -> None
+        Re-evaluates the given versions, and the current and latest
+        versions if they changed, in the terse graph.
+
+        """
+        full = self._current_full_graph
+        anchors = self._terse_anchors
+        am = self.vistrail.actionMap
+        has_tag = self.vistrail.has_tag
+        last_n = set(self.vistrail.getLastActions(
+                self.num_versions_always_shown))
+
+        touched = set(versions)
+        touched.update(last_n.symmetric_difference(self._terse_last_n))
+        if self.current_version != self._terse_current_version:
+            touched.add(self.current_version)
+            touched.add(self._terse_current_version)
+        touched.discard(None)
+        touched.discard(-1)
+        self._terse_current_version = self.current_version
+        self._terse_last_n = last_n
+        for version in touched:
+            self._search_matches.pop(version, None)
+        # the links from their parents depend on the touched versions too
+        changes = self._terse_graph_changes = set(touched)
+        changes.update(full.parent(version) for version in touched
+                       if version != 0 and version in full.vertices)
+
+        # parents have lower ids than their children, so they get
+        # updated first
+        heap = list(touched)
+        heapq.heapify(heap)
+        while heap:
+            version = heapq.heappop(heap)
+            if version == 0:
+                parent = None
+                reachable = True
+            elif version not in full.vertices:
+                continue
+            else:
+                parent = full.parent(version)
+                reachable = (parent in anchors and version in
+                             self._get_terse_children(parent, am))
+            if version in anchors:
+                if not reachable:
+                    self._remove_terse_subtree(version)
+                    heapq.heappush(heap, parent)
+                    continue
+                children = self._get_terse_children(version, am)
+                self._update_terse_version(
+                        version, parent,
+                        self._is_terse_version_shown(version, len(children),
+                                                     am, has_tag, last_n))
+                # pruning a version changes which children are reachable
+                for child, _ in full.adjacency_list[version]:
+                    if (child in anchors) != (child in children):
+                        heapq.heappush(heap, child)
+            elif reachable:
+                self._add_terse_subtree(version, anchors[parent], am,
+                                        has_tag, last_n)
+                heapq.heappush(heap, parent)
+
+    def _iter_terse_segment(self, version, anchor):
+        """_iter_terse_segment(version: int, anchor: int) -> generator
+        Walks the versions below version in preorder, without going past
+        the versions that aren't attached to anchor. Yields (version,
+        shown) pairs.
+
+        """
+        full = self._current_full_graph
+        anchors = self._terse_anchors
+        terse = self._current_terse_graph
+        x = [to for (to, _) in reversed(full.adjacency_list[version])
+             if to in anchors]
+        while x:
+            current = x.pop()
+            if current in terse.vertices:
+                yield current, True
+            elif anchors[current] == anchor:
+                yield current, False
+                x.extend(to for (to, _) in
+                         reversed(full.adjacency_list[current])
+                         if to in anchors)
+
+    def _terse_precedes(self, v1, v2, anchor):
+        """_terse_precedes(v1: int, v2: int, anchor: int) -> bool
+        Checks whether v1 comes before v2 in a preorder walk of the full
+        version tree, both being below anchor. This is the order of the
+        children of anchor in the terse graph.
+
+        """
+        full = self._current_full_graph
+        # maps the versions from v1 up to anchor to the child leading to v1
+        path = {v1: None}
+        current = v1
+        while current != anchor:
+            child, current = current, full.parent(current)
+            path[current] = child
+        child, current = None, v2
+        while current not in path:
+            child, current = current, full.parent(current)
+        child1 = path[current]
+        if child1 is None:
+            # v1 is an ancestor of v2
+            return True
+        elif child is None:
+            return False
+        for to, _ in full.adjacency_list[current]:
+            if to == child1:
+                return True
+            elif to == child:
+                return False
+        return False
+
+    def _insert_terse_edges(self, parent, index, children):
+        """_insert_terse_edges(parent: int, index: int,
+                               children: list of int) -> None
+        Attaches children to parent in the terse graph, at the given
+        position among its children.
+
+        """
+        graph = self._current_terse_graph
+        graph.adjacency_list[parent][index:index] = \
+            [(child, 0) for child in children]
+        for child in children:
+            graph.inverse_adjacency_list[child] = [(parent, 0)]
+        self._terse_graph_changes.add(parent)
+        self._terse_graph_changes.update(children)
+
+    def _attach_terse_version(self, parent, version):
+        # the children of a version in the terse graph are in preorder
+        edges = self._current_terse_graph.adjacency_list[parent]
+        index = 0
+        while (index < len(edges) and
+               self._terse_precedes(edges[index][0], version, parent)):
+            index += 1
+        self._insert_terse_edges(parent, index, [version])
+
+    def _update_terse_version(self, version, parent, shown):
+        """_update_terse_version(version: int, parent: int, shown: bool)
+          -> None
+        Shows or hides a version of the terse graph, moving the shown
+        versions of the segment below it.
+
+        """
+        graph = self._current_terse_graph
+        anchors = self._terse_anchors
+        if shown == (version in graph.vertices):
+            return
+        anchor = anchors[parent]
+        edges = graph.adjacency_list[anchor]
+        self._terse_graph_changes.update([anchor, version])
+        if shown:
+            # version splits the segment between anchor and the shown
+            # versions below it
+            graph.add_vertex(version)
+            anchors[version] = version
+            moved = []
+            for current, current_shown in self._iter_terse_segment(version,
+                                                                   anchor):
+                if current_shown:
+                    moved.append(current)
+                else:
+                    anchors[current] = version
+            if moved:
+                index = edges.index((moved[0], 0))
+                del edges[index:index + len(moved)]
+                self._insert_terse_edges(anchor, index, [version])
+                self._insert_terse_edges(version, 0, moved)
+            else:
+                self._attach_terse_version(anchor, version)
+        else:
+            # the shown versions below version take its place
+            moved = [child for (child, _) in graph.adjacency_list[version]]
+            index = edges.index((version, 0))
+            del edges[index]
+            self._insert_terse_edges(anchor, index, moved)
+            graph.adjacency_list[version] = []
+            graph.inverse_adjacency_list[version] = []
+            graph.delete_vertex(version)
+            for current, current_shown in self._iter_terse_segment(version,
+                                                                   version):
+                if not current_shown:
+                    anchors[current] = anchor
+            anchors[version] = anchor
+
+    def _add_terse_subtree(self, version, anchor, am, has_tag, last_n):
+        """_add_terse_subtree(version: int, anchor: int, am: dict,
+                              has_tag: callable, last_n: set) -> None
+        Adds a version that became reachable and its descendants to the
+        terse graph, below the shown version anchor.
+
+        """
+        graph = self._current_terse_graph
+        anchors = self._terse_anchors
+        x = [(version, anchor)]
+        while x:
+            current, parent = x.pop()
+            children = self._get_terse_children(current, am)
+            if self._is_terse_version_shown(current, len(children), am,
+                                            has_tag, last_n):
+                graph.add_vertex(current)
+                if parent == anchor:
+                    self._attach_terse_version(anchor, current)
+                else:
+                    graph.add_edge(parent, current, 0)
+                    self._terse_graph_changes.update([parent, current])
+                parent = current
+            anchors[current] = parent
+            for child in reversed(children):
+                x.append((child, parent))
+
+    def _remove_terse_subtree(self, version):
+        """_remove_terse_subtree(version: int) -> None
+        Removes a version that was pruned and its descendants from the
+        terse graph.
+
+        """
+        full = self._current_full_graph
+        graph = self._current_terse_graph
+        anchors = self._terse_anchors
+        x = [version]
+        while x:
+            current = x.pop()
+            del anchors[current]
+            if current in graph.vertices:
+                self._terse_graph_changes.add(current)
+                self._terse_graph_changes.update(
+                    parent for (parent, _) in
+                    graph.inverse_adjacency_list[current])
+                graph.delete_vertex(current)
+            x.extend(to for (to, _) in full.adjacency_list[current]
+                     if to in anchors)
 
     def save_version_graph(self, filename, tersed=True):
         if tersed:
@@ -3444,7 +3815,9 @@ class VistrailController(object):
                     if self.current_version == -1 or self.current_version == 0:
                         result = Pipeline()
                     else:
-                        result = copy.copy(self.current_pipeline)
+                        # the current pipeline is replaced, so it can
+                        # share its modules with the new one
+                        result = self.current_pipeline.cow_copy()
                     result.perform_action(action)
                 if self._cache_pipelines and \
                         self.vistrail.has_tag(long(version)):
@@ -3770,6 +4143,10 @@ class VistrailController(object):
                     self.log.delete_all_workflow_execs()
                 self.set_changed(False)
                 locator.clean_temporaries()
+                if (self.vistrail.db_log_filename !=
+                        self._temp_log_filename):
+                    # the log was copied in the bundle
+                    self.remove_temp_log()
 
             # delete any temporary subworkflows
                 try:
@@ -4008,3 +4385,130 @@ class VistrailController(object):
         return self.move_modules_ops(moves)
         
             
+
+
+##############################################################################
+# Testing
+
+import random
+import unittest
+
+class TestTerseGraph(unittest.TestCase):
+    class ModuloSearch(object):
+        def match(self, vistrail, action):
+            return action.id % 3 != 0
+
+    def get_edges(self, controller):
+        graph = controller._current_terse_graph
+        return dict((v, list(graph.adjacency_list[v]))
+                    for v in graph.vertices)
+
+    def assert_terse_graph(self, controller, previous):
+        """Checks that the graph that was updated incrementally is the one
+        computed from scratch, and that the versions whose edges changed
+        since previous were reported."""
+        graph = controller._current_terse_graph
+        anchors = dict(controller._terse_anchors)
+        changes = controller._terse_graph_changes
+        if changes is not None:
+            current = self.get_edges(controller)
+            for v in set(previous).union(current):
+                if previous.get(v) != current.get(v):
+                    self.assertIn(v, changes)
+        controller.recompute_terse_graph()
+        expected = controller._current_terse_graph
+        self.assertEqual(sorted(graph.vertices), sorted(expected.vertices))
+        for v in expected.vertices:
+            self.assertEqual(graph.adjacency_list[v],
+                             expected.adjacency_list[v])
+            self.assertEqual(graph.inverse_adjacency_list[v],
+                             expected.inverse_adjacency_list[v])
+        self.assertEqual(anchors, controller._terse_anchors)
+
+    def check_incremental_update(self, seed, steps):
+        rng = random.Random(seed)
+        vistrail = Vistrail()
+        controller = VistrailController(vistrail, auto_save=False)
+        controller.num_versions_always_shown = 3
+        controller.current_version = 0
+        controller.recompute_terse_graph()
+        for i in xrange(steps):
+            previous = self.get_edges(controller)
+            versions = sorted(controller._terse_anchors)
+            version = rng.choice(versions)
+            op = rng.random()
+            if op < 0.5:
+                if rng.random() < 0.2:
+                    controller.current_version = version
+                controller.add_new_action(Action())
+            elif op < 0.6:
+                if vistrail.has_tag(version):
+                    vistrail.set_tag(version, '')
+                elif version != 0:
+                    vistrail.set_tag(version, 'tag %d' % version)
+                # the vistrail records the change if it isn't passed
+                if rng.random() < 0.5:
+                    controller.recompute_terse_graph([version])
+                else:
+                    controller.recompute_terse_graph(())
+            elif op < 0.65:
+                if vistrail.is_pruned(version):
+                    continue
+                vistrail.pruneVersion(version)
+                controller.recompute_terse_graph([version])
+            elif op < 0.8:
+                if version != 0 and vistrail.actionMap[version].expand:
+                    vistrail.collapseVersion(version)
+                else:
+                    vistrail.expandVersion(version)
+                controller.recompute_terse_graph([version])
+            elif op < 0.95:
+                controller.current_version = version
+                controller.recompute_terse_graph(())
+            else:
+                controller.refine = not controller.refine
+                controller.search = self.ModuloSearch()
+                controller.recompute_terse_graph(())
+            self.assert_terse_graph(controller, previous)
+        return controller
+
+    def test_incremental_update(self):
+        controller = self.check_incremental_update(4, 400)
+        self.assertGreater(len(controller.vistrail.actionMap), 100)
+
+    def test_unreported_tag(self):
+        """Tags set directly on the vistrail show up in the next update."""
+        vistrail = Vistrail()
+        controller = VistrailController(vistrail, auto_save=False)
+        controller.num_versions_always_shown = 1
+        for i in xrange(4):
+            controller.add_new_action(Action())
+            controller.current_version = vistrail.get_latest_version()
+        controller.recompute_terse_graph()
+        self.assertNotIn(2, controller._current_terse_graph.vertices)
+        vistrail.set_tag(2, 'tagged')
+        controller.recompute_terse_graph(())
+        self.assertIn(2, controller._current_terse_graph.vertices)
+        self.assertIn(2, controller._terse_graph_changes)
+        self.assertFalse(vistrail.changed_versions)
+
+
+class TestStreamedLog(unittest.TestCase):
+    def test_temp_log_removed(self):
+        """The log file created for a new vistrail is removed on close."""
+        conf = get_vistrails_configuration()
+        old = conf.executionLog, conf.executionLogStream
+        conf.executionLog = conf.executionLogStream = True
+        try:
+            controller = VistrailController(Vistrail(), auto_save=False)
+            controller.get_logger()
+        finally:
+            conf.executionLog, conf.executionLogStream = old
+        fname = controller.vistrail.db_log_filename
+        self.assertEqual(fname, controller._temp_log_filename)
+        with open(get_log_index_filename(fname), 'wb') as f:
+            f.write('0 0.0\n')
+        controller.close_vistrail(None)
+        self.assertFalse(os.path.exists(fname))
+        self.assertFalse(os.path.exists(get_log_index_filename(fname)))
+        self.assertIsNone(controller.vistrail.db_log_filename)
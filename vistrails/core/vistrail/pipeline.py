@@ -34,7 +34,7 @@
 ###############################################################################
 ##TODO Tests
 """ This module defines the class Pipeline """
-from vistrails.core.cache.hasher import Hasher
+from vistrails.core.cache.hasher import Hasher, sha_hash
 from vistrails.core.configuration import get_vistrails_configuration
 from vistrails.core.data_structures.bijectivedict import Bidict
 from vistrails.core.data_structures.graph import Graph
@@ -137,6 +137,11 @@ class Pipeline(DBWorkflow):
         self.set_defaults()
 
     def set_defaults(self, other=None):
+        # ids of the modules that may be shared with other pipelines, see
+        # cow_copy()
+        self._shared_modules = set()
+        # id of the module of each function, see get_function_module_id()
+        self._function_modules = {}
         if other is None:
             self.is_valid = False
             self.aliases = Bidict()
@@ -163,6 +168,7 @@ class Pipeline(DBWorkflow):
             # there should be another way to do this
             m_id = module.id
             for fun in module.functions:
+                self._function_modules[fun.real_id] = m_id
                 for par in fun.parameters:
                     self.change_alias(par.alias,
                                       par.vtType,
@@ -200,6 +206,100 @@ class Pipeline(DBWorkflow):
         cp.set_defaults(self)
         return cp
 
+    def cow_copy(self):
+        """cow_copy() -> Pipeline
+        Returns a copy of the pipeline that shares its modules, with their
+        functions and parameters, with this one. A shared module is only
+        copied when one of the pipelines changes it, either through
+        perform_operation() and the other editing methods, or after
+        getting it from unshare_module(); code that modifies the modules
+        of a pipeline directly must use the latter.
+
+        Connections and the other children of the workflow are copied.
+
+        """
+        cp = DBWorkflow(id=self.db_id,
+                        entity_type=self.db_entity_type,
+                        name=self.db_name,
+                        version=self.db_version,
+                        last_modified=self.db_last_modified,
+                        vistrail_id=self.db_vistrail_id,
+                        modules=list(self.db_modules),
+                        connections=[c.do_copy()
+                                     for c in self.db_connections],
+                        annotations=[a.do_copy()
+                                     for a in self.db_annotations],
+                        plugin_datas=[p.do_copy()
+                                      for p in self.db_plugin_datas],
+                        others=[o.do_copy() for o in self.db_others])
+        cp.is_dirty = self.is_dirty
+        cp.is_new = self.is_new
+        cp.objects = dict(self.objects)
+        for obj_list in (cp.db_connections, cp.db_annotations,
+                         cp.db_plugin_datas, cp.db_others):
+            for obj in obj_list:
+                for (child, _, _) in obj.db_children():
+                    cp.add_to_index(child)
+        cp.tmp_id = copy.copy(self.tmp_id)
+        cp.__class__ = Pipeline
+
+        # both pipelines now have to copy a module before changing it
+        self._shared_modules.update(self.modules)
+        cp._shared_modules = set(self._shared_modules)
+        cp._function_modules = dict(self._function_modules)
+        cp.is_valid = self.is_valid
+        cp.aliases = copy.copy(self.aliases)
+        cp._subpipeline_signatures = copy.copy(self._subpipeline_signatures)
+        cp._module_signatures = copy.copy(self._module_signatures)
+        cp._connection_signatures = copy.copy(self._connection_signatures)
+        cp.graph = copy.copy(self.graph)
+        return cp
+
+    def unshare_module(self, module_id):
+        """unshare_module(module_id: int) -> Module
+        Returns the module with the given id, after replacing it with a
+        copy if it might be shared with another pipeline (see cow_copy()),
+        so that it can be modified.
+
+        """
+        module = self.modules[module_id]
+        if module_id not in self._shared_modules:
+            return module
+        self._shared_modules.discard(module_id)
+        module_copy = module.do_copy()
+        modules = self.db_modules
+        for i in xrange(len(modules)):
+            if modules[i] is module:
+                modules[i] = module_copy
+                break
+        self.db_modules_id_index[module_id] = module_copy
+        for (child, _, _) in module_copy.db_children():
+            self.add_to_index(child)
+        return module_copy
+
+    def _unshare_operation_target(self, op):
+        """Copies the shared module that op modifies, if any."""
+        parent_type = op.db_parentObjType
+        if parent_type is None or parent_type in ('workflow', 'connection'):
+            # modules only change through their connections, which
+            # unshare them
+            return
+        parent_id = op.db_parentObjId
+        if parent_type in ('module', 'abstraction', 'group'):
+            module_id = parent_id
+        elif parent_type == 'function':
+            module_id = self.get_function_module_id(parent_id)
+        else:
+            module_id = None
+            parent = self.db_get_object(parent_type, parent_id)
+            for shared_id in self._shared_modules:
+                if any(child is parent for (child, _, _) in
+                       self.modules[shared_id].db_children()):
+                    module_id = shared_id
+                    break
+        if module_id in self._shared_modules:
+            self.unshare_module(module_id)
+
     @staticmethod
     def convert(_workflow):
         if _workflow.__class__ == Pipeline:
@@ -346,6 +446,8 @@ class Pipeline(DBWorkflow):
         else:
             what = op.db_what
         funname = '%s_%s' % (op.vtType, what)
+        if self._shared_modules:
+            self._unshare_operation_target(op)
         try:
             f = getattr(self, funname)
         except AttributeError:
@@ -363,6 +465,9 @@ class Pipeline(DBWorkflow):
             f(op.objectId, op.what, op.parentObjType, op.parentObjId)
         elif op.vtType == 'change':
             f(op.oldObjId, op.data, op.parentObjType, op.parentObjId)
+        if what in ('function', 'controlParameter'):
+            # these are part of the module signature
+            self.invalidate_signatures([op.parentObjId])
 
     def add_module(self, m, *args):
         """add_module(m: Module) -> None 
@@ -376,13 +481,21 @@ class Pipeline(DBWorkflow):
 #             m.abstraction = self.abstraction_map[m.abstraction_id]
         self.db_add_object(m)
         self.graph.add_vertex(m.id)
+        for f in m.functions:
+            self._function_modules[f.real_id] = m.id
 
     def change_module(self, old_id, m, *args):
         if not self.has_module_with_id(old_id):
             raise VistrailsInternalError("module %s doesn't exist" % old_id)
+        self.invalidate_signatures([old_id])
+        self._shared_modules.discard(old_id)
+        for f in self.modules[old_id].functions:
+            self._function_modules.pop(f.real_id, None)
         self.db_change_object(old_id, m)
         self.graph.delete_vertex(old_id)
         self.graph.add_vertex(m.id)
+        for f in m.functions:
+            self._function_modules[f.real_id] = m.id
 
     def delete_module(self, id, *args):
         """delete_module(id:int) -> None 
@@ -392,19 +505,21 @@ class Pipeline(DBWorkflow):
         if not self.has_module_with_id(id):
             raise VistrailsInternalError("id missing in modules")
 
+        self.invalidate_signatures([id])
         # we're hiding the necessary operations by doing this!
         for (_, conn_id) in self.graph.adjacency_list[id][:]:
             self.delete_connection(conn_id)
         for (_, conn_id) in self.graph.inverse_adjacency_list[id][:]:
             self.delete_connection(conn_id)
 
+        for f in self.modules[id].functions:
+            self._function_modules.pop(f.real_id, None)
         # self.modules.pop(id)
         self.db_delete_object(id, Module.vtType)
+        self._shared_modules.discard(id)
         self.graph.delete_vertex(id)
         if id in self._module_signatures:
             del self._module_signatures[id]
-        if id in self._subpipeline_signatures:
-            del self._subpipeline_signatures[id]
 
     def add_connection(self, c, *args):
         """add_connection(c: Connection) -> None 
@@ -417,17 +532,20 @@ class Pipeline(DBWorkflow):
         self.db_add_object(c)
         if c.source is not None and c.destination is not None:
             assert(c.sourceId != c.destinationId)        
+            self.invalidate_signatures([c.destinationId], module=False)
             self.graph.add_edge(c.sourceId, c.destinationId, c.id)
             self.ensure_connection_specs([c.id])
 
             source_name = c.source.name
-            output_ports = self.modules[c.sourceId].connected_output_ports
+            output_ports = \
+                self.unshare_module(c.sourceId).connected_output_ports
             if source_name not in output_ports:
                 output_ports[source_name] = 0
             output_ports[source_name] += 1
                 
             dest_name = c.destination.name
-            input_ports = self.modules[c.destinationId].connected_input_ports
+            input_ports = \
+                self.unshare_module(c.destinationId).connected_input_ports
             if dest_name not in input_ports:
                 input_ports[dest_name] = 0
             input_ports[dest_name] += 1
@@ -442,25 +560,27 @@ class Pipeline(DBWorkflow):
 
         old_conn = self.connections[old_id]
         if old_conn.source is not None and old_conn.destination is not None:
+            self.invalidate_signatures([old_conn.destinationId], module=False)
             self.graph.delete_edge(old_conn.sourceId, old_conn.destinationId,
                                    old_conn.id)
             if self.graph.out_degree(old_conn.sourceId) < 1:
-                self.modules[old_conn.sourceId].connected_output_ports.discard(
-                    old_conn.source.name)
+                module = self.unshare_module(old_conn.sourceId)
+                module.connected_output_ports.discard(old_conn.source.name)
             if self.graph.in_degree(old_conn.destinationId) < 1:
-                connected_input_ports = \
-                    self.modules[old_conn.destinationId].connected_input_ports
-                connected_input_ports.discard(conn.destination.name)
+                module = self.unshare_module(old_conn.destinationId)
+                module.connected_input_ports.discard(conn.destination.name)
 
         if old_id in self._connection_signatures:
             del self._connection_signatures[old_id]
         self.db_change_object(old_id, c)        
         if c.source is not None and c.destination is not None:
             assert(c.sourceId != c.destinationId)
+            self.invalidate_signatures([c.destinationId], module=False)
             self.graph.add_edge(c.sourceId, c.destinationId, c.id)
             self.ensure_connection_specs([c.id])
-            self.modules[c.sourceId].connected_output_ports.add(c.source.name)
-            self.modules[c.destinationId].connected_input_ports.add(
+            self.unshare_module(c.sourceId).connected_output_ports.add(
+                c.source.name)
+            self.unshare_module(c.destinationId).connected_input_ports.add(
                 c.destination.name)
 
     def delete_connection(self, id, *args):
@@ -477,22 +597,44 @@ class Pipeline(DBWorkflow):
         if conn.source is not None and conn.destination is not None and \
                 (conn.destinationId, conn.id) in \
                 self.graph.edges_from(conn.sourceId):
+            self.invalidate_signatures([conn.destinationId], module=False)
             self.graph.delete_edge(conn.sourceId, conn.destinationId, conn.id)
 
             c = conn
             source_name = c.source.name
-            output_ports = self.modules[c.sourceId].connected_output_ports
+            output_ports = \
+                self.unshare_module(c.sourceId).connected_output_ports
             output_ports[source_name] -= 1
                 
             dest_name = c.destination.name
-            input_ports = self.modules[c.destinationId].connected_input_ports
+            input_ports = \
+                self.unshare_module(c.destinationId).connected_input_ports
             input_ports[dest_name] -= 1
 
         if id in self._connection_signatures:
             del self._connection_signatures[id]
         
+    def add_function(self, function, parent_type, parent_id):
+        self.db_add_object(function, parent_type, parent_id)
+        self._function_modules[function.real_id] = parent_id
+
+    def delete_function(self, function_id, function_type, parent_type,
+                        parent_id):
+        self.db_delete_object(function_id, function_type,
+                              parent_type, parent_id)
+        self._function_modules.pop(function_id, None)
+
+    def change_function(self, old_function_id, function, parent_type,
+                        parent_id):
+        self.db_change_object(old_function_id, function,
+                              parent_type, parent_id)
+        self._function_modules.pop(old_function_id, None)
+        self._function_modules[function.real_id] = parent_id
+
     def add_parameter(self, param, parent_type, parent_id):
         self.db_add_object(param, parent_type, parent_id)
+        self.invalidate_signatures(
+                [self.get_function_module_id(parent_id)])
         if not self.has_alias(param.alias):
             self.change_alias(param.alias, 
                               param.vtType, 
@@ -504,6 +646,8 @@ class Pipeline(DBWorkflow):
     def delete_parameter(self, param_id, param_type, parent_type, parent_id):
         self.db_delete_object(param_id, ModuleParam.vtType,
                               parent_type, parent_id)
+        self.invalidate_signatures(
+                [self.get_function_module_id(parent_id)])
         self.remove_alias(ModuleParam.vtType, param_id, parent_type, 
                           parent_id, None)
 
@@ -512,6 +656,8 @@ class Pipeline(DBWorkflow):
                           parent_type, parent_id, None)
         self.db_change_object(old_param_id, param,
                               parent_type, parent_id)
+        self.invalidate_signatures(
+                [self.get_function_module_id(parent_id)])
         if not self.has_alias(param.alias):
             self.change_alias(param.alias, 
                               param.vtType, 
@@ -530,13 +676,15 @@ class Pipeline(DBWorkflow):
                                 connection.id)
             c = connection
             source_name = c.source.name
-            output_ports = self.modules[c.sourceId].connected_output_ports
+            output_ports = \
+                self.unshare_module(c.sourceId).connected_output_ports
             if source_name not in output_ports:
                 output_ports[source_name] = 0
             output_ports[source_name] += 1
                 
             dest_name = c.destination.name
-            input_ports = self.modules[c.destinationId].connected_input_ports
+            input_ports = \
+                self.unshare_module(c.destinationId).connected_input_ports
             if dest_name not in input_ports:
                 input_ports[dest_name] = 0
             input_ports[dest_name] += 1
@@ -549,11 +697,13 @@ class Pipeline(DBWorkflow):
                                    conn.id)
             c = conn
             source_name = c.source.name
-            output_ports = self.modules[c.sourceId].connected_output_ports
+            output_ports = \
+                self.unshare_module(c.sourceId).connected_output_ports
             output_ports[source_name] -= 1
                 
             dest_name = c.destination.name
-            input_ports = self.modules[c.destinationId].connected_input_ports
+            input_ports = \
+                self.unshare_module(c.destinationId).connected_input_ports
             input_ports[dest_name] -= 1
             
         self.db_delete_object(port_id, Port.vtType, parent_type, parent_id)
@@ -686,8 +836,10 @@ class Pipeline(DBWorkflow):
         else:
             if what == 'parameter':
                 #FIXME: check if a change parameter action needs to be generated
+                self.unshare_module(mId)
                 parameter = self.db_get_object(what, oId)
                 parameter.strValue = str(value)
+                self.invalidate_signatures([mId])
             else:
                 raise VistrailsInternalError("only parameters are supported")
         
@@ -780,28 +932,53 @@ class Pipeline(DBWorkflow):
 
     # Subpipelines
 
-    def subpipeline_signature(self, module_id, visited_ids=None):
+    def subpipeline_signature(self, module_id):
         """subpipeline_signature(module_id): string
         Returns the signature for the subpipeline whose sink id is module_id."""
-        if visited_ids is None:
-            visited_ids = set([module_id])
-        elif module_id in visited_ids:
-            raise CycleInPipeline()
         try:
             return self._subpipeline_signatures[module_id]
         except KeyError:
-            upstream_sigs = [(self.subpipeline_signature(
-                                      m,
-                                      visited_ids | set([module_id])) +
-                              Hasher.connection_signature(
-                                      self.connections[edge_id]))
-                             for (m, edge_id) in
-                             self.graph.edges_to(module_id)]
-            module_sig = self.module_signature(module_id)
-            sig = Hasher.subpipeline_signature(module_sig,
-                                               upstream_sigs)
-            self._subpipeline_signatures[module_id] = sig
-            return sig
+            self.compute_subpipeline_signatures([module_id])
+            return self._subpipeline_signatures[module_id]
+
+    def compute_subpipeline_signatures(self, module_ids):
+        """compute_subpipeline_signatures(module_ids: list) -> None
+        Computes the subpipeline signatures of the given modules and of
+        the modules upstream of them that don't have one yet.
+
+        This is a single depth-first traversal of the upstream modules,
+        without recursion, so that long chains can't exceed the recursion
+        limit; signatures are computed in topological order. Raises
+        CycleInPipeline if it finds a cycle."""
+        sigs = self._subpipeline_signatures
+        edges_to = self.graph.inverse_adjacency_list
+        # modules on the stack, whose upstream is being computed
+        in_progress = set()
+        for start_id in module_ids:
+            if start_id in sigs:
+                continue
+            in_progress.add(start_id)
+            stack = [(start_id, iter(edges_to[start_id]))]
+            while stack:
+                module_id, upstream = stack[-1]
+                for (m, _) in upstream:
+                    if m not in sigs:
+                        if m in in_progress:
+                            raise CycleInPipeline()
+                        in_progress.add(m)
+                        stack.append((m, iter(edges_to[m])))
+                        break
+                else:
+                    # all upstream signatures are known
+                    stack.pop()
+                    in_progress.remove(module_id)
+                    upstream_sigs = [(sigs[m] +
+                                      Hasher.connection_signature(
+                                              self.connections[edge_id]))
+                                     for (m, edge_id) in edges_to[module_id]]
+                    module_sig = self.module_signature(module_id)
+                    sigs[module_id] = Hasher.subpipeline_signature(
+                            module_sig, upstream_sigs)
 
     def subpipeline_id_from_signature(self, signature):
         """subpipeline_id_from_signature(sig): int
@@ -834,17 +1011,108 @@ class Pipeline(DBWorkflow):
     def has_connection_signature(self, signature):
         return signature in self._connection_signatures.inverse
 
+    def invalidate_signatures(self, module_ids, module=True):
+        """invalidate_signatures(module_ids: list, module: bool) -> None
+        Forgets the cached signatures that depend on the given modules: the
+        subpipeline signatures of these modules and of everything
+        downstream, the signatures of the connections into them, and the
+        module signatures of the given modules if module is True.
+
+        Editing methods call this, so that only what changed gets hashed
+        again by compute_signatures()."""
+        if module:
+            for module_id in module_ids:
+                if module_id in self._module_signatures:
+                    del self._module_signatures[module_id]
+        # A subpipeline signature is only cached if the signatures of all
+        # its upstream modules are, so we can stop at modules that have none
+        to_visit = [m for m in module_ids
+                    if m in self._subpipeline_signatures]
+        while to_visit:
+            module_id = to_visit.pop()
+            if module_id not in self._subpipeline_signatures:
+                continue
+            del self._subpipeline_signatures[module_id]
+            for (_, conn_id) in self.graph.edges_to(module_id):
+                if conn_id in self._connection_signatures:
+                    del self._connection_signatures[conn_id]
+            for (m, _) in self.graph.edges_from(module_id):
+                if m in self._subpipeline_signatures:
+                    to_visit.append(m)
+
+    def get_function_module_id(self, function_id):
+        """get_function_module_id(function_id: int) -> int
+        Returns the id of the module that has the given function.
+
+        The modules of the functions are indexed as they are added through
+        the pipeline; the index is rebuilt if a function was added to or
+        moved between modules directly.
+
+        """
+        for rebuild in (False, True):
+            if rebuild:
+                self._function_modules = dict(
+                    (f.real_id, m.id)
+                    for m in self.modules.itervalues()
+                    for f in m.functions)
+            module_id = self._function_modules.get(function_id)
+            if (module_id is not None and
+                    module_id in self.modules and
+                    self.modules[module_id].has_function_with_real_id(
+                        function_id)):
+                return module_id
+        raise VistrailsInternalError("function %s doesn't exist" %
+                                     function_id)
+
+    def copy_signatures(self, other, module_id_map, connection_id_map):
+        """copy_signatures(other: Pipeline, module_id_map: dict,
+                           connection_id_map: dict) -> None
+        Sets the signatures of modules and connections copied from another
+        pipeline, the maps going from ids in other to ids in self.
+
+        The copied modules must not have anything upstream in self that is
+        not also upstream of them in other."""
+        for other_id, module_id in module_id_map.iteritems():
+            self._module_signatures[module_id] = \
+                other.module_signature(other_id)
+            self._subpipeline_signatures[module_id] = \
+                other.subpipeline_signature(other_id)
+        for other_id, connection_id in connection_id_map.iteritems():
+            self._connection_signatures[connection_id] = \
+                other.connection_signature(other_id)
+
+    def structure_signature(self):
+        """structure_signature() -> str
+        Returns a signature for the structure of the pipeline: its modules,
+        their functions and their connections, but not the values of the
+        parameters. Pipelines with the same structure validate the same.
+
+        Returns None if validating the pipeline depends on more than that
+        (groups, subworkflows and vistrail variables)."""
+        hasher = sha_hash()
+        for module_id in sorted(self.modules.iterkeys()):
+            module = self.modules[module_id]
+            if (module.is_group() or module.is_abstraction() or
+                    module.is_vistrail_var()):
+                return None
+            hasher.update(Hasher.module_structure_signature(module))
+        for conn_id in sorted(self.connections.iterkeys()):
+            c = self.connections[conn_id]
+            hasher.update(repr((c.id,
+                                c.source.moduleId, c.source.name,
+                                c.destination.moduleId, c.destination.name)))
+        return hasher.digest()
+
     def refresh_signatures(self):
-        self._connection_signatures = {}
-        self._subpipeline_signatures = {}
-        self._module_signatures = {}
+        self._connection_signatures = Bidict()
+        self._subpipeline_signatures = Bidict()
+        self._module_signatures = Bidict()
         self.compute_signatures()
 
     def compute_signatures(self):
         """compute_signatures(): compute all module and subpipeline signatures
         for this pipeline."""
-        for i in self.modules.iterkeys():
-            self.subpipeline_signature(i)
+        self.compute_subpipeline_signatures(self.modules.iterkeys())
         for c in self.connections.iterkeys():
             self.connection_signature(c)
 
@@ -1124,6 +1392,8 @@ class Pipeline(DBWorkflow):
         affects downstream. This slightly increases performance.
 
         """
+        from vistrails.core.modules.basic_modules import List, Variant
+
         result = []
         is_upstream = module_ids
         for module_id in self.graph.vertices_topological_sort():
@@ -1133,13 +1403,13 @@ class Pipeline(DBWorkflow):
                 else:
                     continue
             module = self.get_module_by_id(module_id)
-            module.list_depth = 0
+            list_depth = 0
             ports = []
             for module_from_id, conn_id in self.graph.edges_to(module_id):
                 prev_depth = self.get_module_by_id(module_from_id).list_depth
-                conn = self.get_connection_by_id(conn_id)
+                # validate() already computed the connection specs
+                conn = self.connections[conn_id]
                 source_depth = 0
-                from vistrails.core.modules.basic_modules import List, Variant
                 if conn.source.spec:
                     source_depth = conn.source.spec.depth
                     src_descs = conn.source.spec.descriptors()
@@ -1169,9 +1439,13 @@ class Pipeline(DBWorkflow):
                 # list to match its depth
                 # if source depth is greater this module will be executed
                 # once for each input in the (possibly nested) list
-                module.list_depth = max(module.list_depth, depth)
-            result.append((module_id, module.list_depth))
-            module.iterated_ports = ports
+                list_depth = max(list_depth, depth)
+            if (module.list_depth != list_depth or
+                    module.iterated_ports != ports):
+                module = self.unshare_module(module_id)
+                module.list_depth = list_depth
+                module.iterated_ports = ports
+            result.append((module_id, list_depth))
         return result
 
 
@@ -1446,6 +1720,39 @@ class TestPipeline(unittest.TestCase):
     def test_create_pipeline_signature(self):
         self.pipeline.subpipeline_signature(self.sink_id)
 
+    def create_chain(self, length):
+        p = Pipeline()
+        pkg = '%s.pythoncalc' % get_vistrails_default_pkg_prefix()
+        for i in xrange(length):
+            p.add_module(Module(id=i, name='PythonCalc', package=pkg))
+        for i in xrange(1, length):
+            source = Port(id=2 * i, type='source', moduleId=i - 1,
+                          moduleName='PythonCalc', name='value')
+            destination = Port(id=2 * i + 1, type='destination', moduleId=i,
+                               moduleName='PythonCalc', name='value1')
+            p.add_connection(Connection(id=i, ports=[source, destination]))
+        return p
+
+    def test_deep_pipeline_signature(self):
+        """Computes signatures of a chain deeper than the recursion limit."""
+        import sys
+        length = sys.getrecursionlimit() + 100
+        p = self.create_chain(length)
+        sig = p.subpipeline_signature(length - 1)
+        self.assertEqual(len(p._subpipeline_signatures), length)
+        p.compute_signatures()
+        self.assertEqual(len(p._connection_signatures), length - 1)
+        self.assertEqual(p.subpipeline_signature(length - 1), sig)
+
+    def test_signature_cycle(self):
+        p = self.create_chain(3)
+        source = Port(id=100, type='source', moduleId=2,
+                      moduleName='PythonCalc', name='value')
+        destination = Port(id=101, type='destination', moduleId=0,
+                           moduleName='PythonCalc', name='value2')
+        p.add_connection(Connection(id=100, ports=[source, destination]))
+        self.assertRaises(CycleInPipeline, p.compute_signatures)
+
     def test_delete_signatures(self):
         """Makes sure signatures are deleted when other things are."""
         p = self.create_default_pipeline()
@@ -1461,6 +1768,63 @@ class TestPipeline(unittest.TestCase):
         self.assertNotEquals(c_sig_size_before, c_sig_size_after)
         self.assertNotEquals(p_sig_size_before, p_sig_size_after)
 
+    def test_function_module_id(self):
+        """Makes sure the modules of the functions are found."""
+        from vistrails.core.vistrail.operation import AddOp, DeleteOp
+
+        p = self.create_default_pipeline()
+        for m in p.module_list:
+            for f in m.functions:
+                self.assertEqual(p.get_function_module_id(f.real_id), m.id)
+        function = ModuleFunction(id=10, name='value1')
+        p.perform_operation(AddOp(id=-1, what=ModuleFunction.vtType,
+                                  objectId=function.real_id,
+                                  parentObjId=1, parentObjType=Module.vtType,
+                                  data=function))
+        self.assertEqual(p.get_function_module_id(10), 1)
+        p.perform_operation(DeleteOp(id=-2, what=ModuleFunction.vtType,
+                                     objectId=10, parentObjId=1,
+                                     parentObjType=Module.vtType))
+        self.assertRaises(VistrailsInternalError,
+                          p.get_function_module_id, 10)
+        # functions added to the modules directly are found too
+        p.modules[0].add_function(ModuleFunction(id=11, name='value1'))
+        self.assertEqual(p.get_function_module_id(11), 0)
+
+    def test_incremental_signatures(self):
+        """Makes sure editing a module only invalidates what depends on it."""
+        from vistrails.core.vistrail.operation import AddOp
+
+        p = self.create_default_pipeline()
+        sigs = dict((m, p.subpipeline_signature(m)) for m in p.modules)
+        function = ModuleFunction(id=10, name='value1')
+        p.perform_operation(AddOp(id=-1, what=ModuleFunction.vtType,
+                                  objectId=function.real_id,
+                                  parentObjId=0, parentObjType=Module.vtType,
+                                  data=function))
+        self.assertNotIn(0, p._module_signatures)
+        self.assertNotIn(2, p._subpipeline_signatures)
+        self.assertEqual(len(p._connection_signatures), 0)
+        self.assertEqual(p._subpipeline_signatures[1], sigs[1])
+
+        p.compute_signatures()
+        self.assertNotEqual(p.subpipeline_signature(0), sigs[0])
+        self.assertNotEqual(p.subpipeline_signature(2), sigs[2])
+        sigs = dict((m, p.subpipeline_signature(m)) for m in p.modules)
+        param = ModuleParam(id=11, type='Float', val='1.0')
+        p.add_parameter(param, ModuleFunction.vtType, function.real_id)
+        p.compute_signatures()
+        self.assertNotEqual(p.subpipeline_signature(0), sigs[0])
+        self.assertEqual(p.subpipeline_signature(1), sigs[1])
+        fresh = copy.copy(p)
+        fresh.refresh_signatures()
+        for m in p.modules:
+            self.assertEqual(p.subpipeline_signature(m),
+                             fresh.subpipeline_signature(m))
+        for c in p.connections:
+            self.assertEqual(p.connection_signature(c),
+                             fresh.connection_signature(c))
+
     def test_delete_connections(self):
         p = self.create_default_pipeline()
         p.delete_connection(0)
@@ -1496,6 +1860,50 @@ class TestPipeline(unittest.TestCase):
         self.assertNotEquals(p1, p3)
         self.assertNotEquals(p1.id, p3.id)
 
+    def test_cow_copy(self):
+        import vistrails.core.db.io
+        id_scope = IdScope()
+
+        p1 = self.create_default_pipeline(id_scope)
+        p2 = p1.cow_copy()
+        self.assertEquals(p1, p2)
+        for m_id, module in p1.modules.iteritems():
+            self.assertIs(module, p2.modules[m_id])
+
+        # changing a parameter of the copy copies its module only
+        module = p2.modules[p2.modules.keys()[0]]
+        function = module.functions[0]
+        old_param = function.params[0]
+        new_param = ModuleParam(id=id_scope.getNewId(ModuleParam.vtType),
+                                pos=old_param.pos,
+                                type=old_param.type,
+                                val='changed')
+        action = vistrails.core.db.io.create_action(
+            [('change', old_param, new_param,
+              ModuleFunction.vtType, function.real_id)])
+        p2.perform_operation_chain(action.operations)
+        self.assertIsNot(p1.modules[module.id], p2.modules[module.id])
+        self.assertEquals(p1.modules[module.id].functions[0].params[0].strValue,
+                          old_param.strValue)
+        self.assertEquals(p2.modules[module.id].functions[0].params[0].strValue,
+                          'changed')
+        self.assertNotEquals(p1, p2)
+        for m_id in p1.modules:
+            if m_id != module.id:
+                self.assertIs(p1.modules[m_id], p2.modules[m_id])
+
+        # deleting a connection updates the port counts of the copy only
+        c_id = p1.connections.keys()[0]
+        p2.delete_connection(c_id)
+        self.assertIn(c_id, p1.connections)
+        self.assertNotIn(c_id, p2.connections)
+        for m_id, module in p1.modules.iteritems():
+            self.assertEquals(sum(module.connected_input_ports.values()) +
+                              sum(module.connected_output_ports.values()),
+                              sum(1 for c in p1.connections.itervalues()
+                                  if m_id in (c.source.moduleId,
+                                              c.destination.moduleId)))
+
     def test_serialization(self):
         import vistrails.core.db.io
         p1 = self.create_default_pipeline()
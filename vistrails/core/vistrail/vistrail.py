@@ -37,6 +37,7 @@ from vistrails.core.paramexplore.paramexplore import ParameterExploration
 import copy
 import datetime
 import getpass
+import heapq
 
 from vistrails.db.domain import DBVistrail
 from vistrails.db.services.io import open_vt_log_from_db, open_log_from_xml
@@ -115,6 +116,9 @@ class Vistrail(DBVistrail):
             self.currentVersion = other.currentVersion
             self.savedQueries = copy.copy(other.savedQueries)
             self.is_abstraction = other.is_abstraction
+        # versions whose tag, prune or expand flag changed since the
+        # controller last updated its terse graph
+        self.changed_versions = set()
 
         # object to keep explicit expanded 
         # version tree always updated
@@ -518,9 +522,9 @@ class Vistrail(DBVistrail):
         num_actions = len(self.actionMap)
         if num_actions < n:
             n = num_actions
-        if n > 0:
-            sorted_keys = sorted(self.actionMap.keys())
-            last_n = sorted_keys[num_actions-n:num_actions-1]
+        if n > 1:
+            # only the n highest ids are needed, don't sort all of them
+            last_n = heapq.nlargest(n, self.actionMap.iterkeys())[:0:-1]
         return last_n
 
     def hasVersion(self, version):
@@ -619,6 +623,8 @@ class Vistrail(DBVistrail):
             changed = True
         if changed:
             self.changed = True
+            if key in (Vistrail.TAG_ANNOTATION, Vistrail.PRUNE_ANNOTATION):
+                self.changed_versions.add(action_id)
             return True
         return False
 
@@ -999,6 +1005,7 @@ class Vistrail(DBVistrail):
         """
         if version!=0: # not root
             self.actionMap[version].expand = 1
+            self.changed_versions.add(version)
 
     def collapseVersion(self, version):
         """ collapseVersion(version: int) -> None
@@ -1007,6 +1014,7 @@ class Vistrail(DBVistrail):
         """
         if version!=0:
             self.actionMap[version].expand = 0
+            self.changed_versions.add(version)
 
     def setSavedQueries(self, savedQueries):
         """ setSavedQueries(savedQueries: list of (str, str, str)) -> None
@@ -125,6 +125,22 @@ class Field(object):
     def getPrivateName(self):
         return '_%s' % Field.getFieldName(self)
 
+    def getDeletedName(self):
+        return 'db_deleted_%s' % Field.getRegularName(self)
+
+    def getPrivateDeletedName(self):
+        return '_%s' % Field.getDeletedName(self)
+
+    def getIndexNames(self):
+        names = []
+        for index in Field.getAllIndices(self):
+            if type(index) == type([]):
+                index = index[0]
+            if index[0] == '!':
+                index = index[1:]
+            names.append('db_%s_%s_index' % (Field.getRegularName(self), index))
+        return names
+
     def getMapping(self):
         try:
             return self.params['mapping']
@@ -408,6 +424,28 @@ class Object(object):
             pass
         return None
 
+    def useSlots(self):
+        # objects whose core classes are combined through multiple
+        # inheritance (module, group, abstraction) cannot use __slots__
+        try:
+            return self.params['slots'] != 'false'
+        except KeyError:
+            pass
+        return True
+
+    def getSlotNames(self):
+        # keep __dict__ and __weakref__ so that subclasses without
+        # __slots__ stay layout-compatible for __class__ assignment
+        slots = ['__dict__', '__weakref__']
+        for field in self.getPythonFields():
+            if field.isReference():
+                slots.append(field.getPrivateDeletedName())
+            if field.isPlural():
+                slots.extend(field.getIndexNames())
+            slots.append(field.getPrivateName())
+        slots.extend(['is_dirty', 'is_new'])
+        return slots
+
     def getConstructorNames(self):
         return [f.getRegularName() for f in self.getPythonFields()]
 
@@ -59,11 +59,13 @@ DOMAIN_INIT = """from auto_gen import *"""
 PERSISTENCE_INIT = \
 """from xml.auto_gen import XMLDAOListBase
 from sql.auto_gen import SQLDAOListBase
+from bin.auto_gen import BinDAOListBase
 
 class DAOList(dict):
     def __init__(self):
         self['xml'] = XMLDAOListBase()
         self['sql'] = SQLDAOListBase()
+        self['bin'] = BinDAOListBase()
 
 """
 COPYRIGHT_NOTICE = \
@@ -148,7 +150,7 @@ def indent_python(fname):
                      stdout=subprocess.PIPE).communicate()
 
 def run_template(template_fname, objects, version, version_string, output_file,
-                 indent=False):
+                 indent=False, **kwargs):
     [prefix, suffix] = os.path.basename(template_fname).split('.', 1)
     (fd, p_fname) = tempfile.mkstemp(prefix=prefix, suffix=suffix)
     os.close(fd)
@@ -159,7 +161,8 @@ def run_template(template_fname, objects, version, version_string, output_file,
         f = open(output_file, 'w')
         f.write(template.render(objs=objects,
                                 version=version,
-                                version_string=version_string))
+                                version_string=version_string,
+                                **kwargs))
         f.close()
         if indent:
             indent_python(output_file)
@@ -195,6 +198,7 @@ def dirStructure(baseDir):
     dirs['schemas'] = os.path.join(dirs['base'], 'schemas')
     dirs['xmlPersistence'] = os.path.join(dirs['persistence'], 'xml')
     dirs['sqlPersistence'] = os.path.join(dirs['persistence'], 'sql')
+    dirs['binPersistence'] = os.path.join(dirs['persistence'], 'bin')
     dirs['xmlSchema'] = os.path.join(dirs['schemas'], 'xml')
     dirs['sqlSchema'] = os.path.join(dirs['schemas'], 'sql')
     return dirs
@@ -222,13 +226,15 @@ def main(argv=None):
     options = {}
     objects = None
 
-    optionsUsage = {'a': ('generate all database information (-p -s -x)', 
+    optionsUsage = {'a': ('generate all database information (-p -s -x -y)',
                           False),
                     'b:': ('base directory', False, 'dir'),
                     'd:': ('versions directory', False, 'dir'),
                     'p': ('generate python domain classes', False),
+                    'l': ('use __slots__ in python domain classes', False),
                     's': ('generate sql schema and persistence classes', False),
                     'x': ('generate xml schema and persistence classes', False),
+                    'y': ('generate binary persistence classes', False),
                     'v:': ('vistrail version tag', True, 'version'),
                     'm': ('make all directories', False),
                     'n': ('do not change current version', False)}
@@ -305,7 +311,7 @@ def main(argv=None):
             objects = parser.parse(versionDirs['specs'])
         run_template('templates/domain.py.mako', objects, version, versionName,
                      os.path.join(versionDirs['domain'], 'auto_gen.py'),
-                     True)
+                     True, slots=options['l'])
 
         if not options['n']:
             domainFile = os.path.join(baseDirs['domain'], '__init__.py')
@@ -348,6 +354,19 @@ def main(argv=None):
                      os.path.join(versionDirs['xmlPersistence'], 'auto_gen.py'),
                      True)
 
+    if options['y'] or options['a']:
+        # generate binary dao objects, they store the same fields as xml
+        print "generating binary dao objects..."
+        if objects is None:
+            parser = AutoGenParser()
+            objects = parser.parse(versionDirs['specs'])
+        bin_objects = xml_gen_objects.convert(objects)
+
+        run_template('templates/bin.py.mako', bin_objects, version,
+                     versionName,
+                     os.path.join(versionDirs['binPersistence'], 'auto_gen.py'),
+                     False)
+
     if options['s'] or options['a']:
         # generate sql schema and dao objects
         print "generating sql schema and dao objects..."
@@ -0,0 +1,190 @@
+<%text>###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+</%text>
+"""generated automatically by auto_dao.py"""
+
+from bin_dao import BinDAO
+from vistrails.db.versions.${version_string}.domain import *
+
+<%def name="from_bin_value(prop, value)">\\
+% if prop.getPythonType() in ('date', 'datetime'):
+self.convertFromBin(${value}, '${prop.getPythonType()}')\\
+% else:
+${value}\\
+% endif
+</%def>\\
+<%def name="to_bin_value(prop, value)">\\
+% if prop.getPythonType() in ('str', 'date', 'datetime'):
+self.convertToBin(${value}, '${prop.getPythonType()}')\\
+% else:
+${value}\\
+% endif
+</%def>\\
+% for obj in objs:
+<% fields = obj.getXMLAttributes() + obj.getXMLElements() + obj.getXMLChoices() %>\\
+class ${obj.getClassName()}BinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+    % if len(fields) > 0:
+        (${', '.join([f.getRegularName() for f in fields])}${',' if len(fields) == 1 else ''}) = self.checkRecord(record, ${obj.getClassName()}.vtType, ${len(fields)})
+    % else:
+        self.checkRecord(record, ${obj.getClassName()}.vtType, 0)
+    % endif
+    % for prop in obj.getXMLAttributes():
+        % if prop.getPythonType() in ('date', 'datetime'):
+        ${prop.getRegularName()} = ${from_bin_value(prop, prop.getRegularName())}
+        % endif
+    % endfor
+    % for field in obj.getXMLElements() + obj.getXMLChoices():
+        % if field.isChoice():
+        <% name = field.getRegularName() %>\\
+        % if field.isPlural():
+        _${name} = []
+        for _data in ${name}:
+        % else:
+        _${name} = None
+        if ${name} is not None:
+            _data = ${name}
+        % endif
+            _tag = _data[0]
+            <% cond = 'if' %>\\
+            % for prop in field.getXMLProperties():
+            ${cond} _tag == '${prop.getReference()}':
+                % if prop.isReference():
+                _data = self.getDao('${prop.getReference()}').fromBin(_data)
+                % else:
+                _data = ${from_bin_value(prop, "self.checkRecord(_data, _tag, 1)[0]")}
+                % endif
+            <% cond = 'elif' %>\\
+            % endfor
+            else:
+                self.unexpectedRecord(_data, '${obj.getRegularName()}.${name}')
+            % if field.isPlural():
+            % if field.getPythonType() == 'hash':
+            _${name}[_data.${field.getReferencedObject().getKey().getFieldName()}] = _data
+            % else:
+            _${name}.append(_data)
+            % endif
+            % else:
+            _${name} = _data
+            % endif
+        ${name} = _${name}
+        % elif field.isReference():
+        <% dao = "self.getDao('%s')" % field.getReference() %>\\
+        % if not field.isPlural():
+        if ${field.getRegularName()} is not None:
+            ${field.getRegularName()} = ${dao}.fromBin(${field.getRegularName()})
+        % elif field.getPythonType() == 'hash':
+        ${field.getRegularName()} = dict((_data.${field.getReferencedObject().getKey().getFieldName()}, _data) for _data in map(${dao}.fromBin, ${field.getRegularName()}))
+        % else:
+        ${field.getRegularName()} = map(${dao}.fromBin, ${field.getRegularName()})
+        % endif
+        % elif field.getPythonType() in ('date', 'datetime'):
+        ${field.getRegularName()} = ${from_bin_value(field, field.getRegularName())}
+        % endif
+    % endfor
+        obj = ${obj.getClassName()}(${', '.join(['%s=%s' % f for f in obj.getConstructorPairs()])})
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, ${obj.getRegularName()}):
+    % for field in obj.getXMLChoices():
+        <% name = field.getRegularName() %>\\
+        % if field.isPlural():
+        ${name} = []
+        for _obj in ${obj.getRegularName()}.${field.getFieldName()}${'.itervalues()' if field.getPythonType() == 'hash' else ''}:
+        % else:
+        ${name} = None
+        _obj = ${obj.getRegularName()}.${field.getFieldName()}
+        if _obj is not None:
+        % endif
+            <% cond = 'if' %>\\
+            % for prop in field.getXMLProperties():
+            ${cond} _obj.vtType == '${prop.getReference()}':
+                % if prop.isReference():
+                _data = self.getDao('${prop.getReference()}').toBin(_obj)
+                % else:
+                _data = ('${prop.getReference()}', (${to_bin_value(prop, '_obj')},))
+                % endif
+            <% cond = 'elif' %>\\
+            % endfor
+            else:
+                ${'continue' if field.isPlural() else '_data = None'}
+            % if field.isPlural():
+            ${name}.append(_data)
+            % else:
+            ${name} = _data
+            % endif
+    % endfor
+        return (${obj.getClassName()}.vtType, (
+    % for field in fields:
+        <% value = '%s.%s' % (obj.getRegularName(), field.getFieldName()) %>\\
+        % if field.isChoice():
+            ${field.getRegularName()},
+        % elif field.isReference():
+        <% dao = "self.getDao('%s')" % field.getReference() %>\\
+        % if not field.isPlural():
+            ${dao}.toBin(${value}) if ${value} is not None else None,
+        % elif field.getPythonType() == 'hash':
+            map(${dao}.toBin, ${value}.itervalues()),
+        % else:
+            map(${dao}.toBin, ${value}),
+        % endif
+        % else:
+            ${to_bin_value(field, value)},
+        % endif
+    % endfor
+            ))
+
+% endfor
+"""generated automatically by auto_dao.py"""
+
+class BinDAOListBase(dict):
+
+    def __init__(self, daos=None):
+        if daos is not None:
+            dict.update(self, daos)
+
+        % for obj in objs:
+        if '${obj.getRegularName()}' not in self:
+            self['${obj.getRegularName()}'] = \
+                ${obj.getClassName()}BinDAOBase(self)
+        % endfor
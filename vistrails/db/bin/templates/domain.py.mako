@@ -66,15 +66,25 @@ def shouldIgnoreIndexDelete(index):
 import copy
 
 % for obj in objs:
+<% use_slots = slots and obj.useSlots() %> \\
 class ${obj.getClassName()}(object):
 
     vtType = '${obj.getRegularName()}'
 
+    % if use_slots:
+    __slots__ = (${',\n                 '.join(["'%s'" % n \
+                                               for n in obj.getSlotNames()])})
+
+    % endif
     def __init__(self, ${', '.join(['%s=None' % n \
                                     for n in obj.getConstructorNames()])}):
         % for field in obj.getPythonFields():
         % if field.isReference() and not field.isInverse():
-        self.db_deleted_${field.getRegularName()} = []
+        % if use_slots:
+        self.${field.getPrivateDeletedName()} = None
+        % else:
+        self.${field.getDeletedName()} = []
+        % endif
         % endif
         % if field.isPlural():
         % for index in field.getAllIndices():
@@ -339,6 +349,16 @@ class ${obj.getClassName()}(object):
     def db_deleted_children(self, remove=False):
         children = []
         % if len(obj.getNonInverseReferences()) > 0:
+        % if use_slots:
+        % for ref in obj.getNonInverseReferences():
+        if self.${ref.getPrivateDeletedName()} is not None:
+            children.extend(self.${ref.getPrivateDeletedName()})
+        % endfor
+        if remove:
+            % for ref in obj.getNonInverseReferences():
+            self.${ref.getPrivateDeletedName()} = None
+            % endfor
+        % else:
         % for ref in obj.getNonInverseReferences():
         children.extend(self.db_deleted_${ref.getRegularName()})
         % endfor
@@ -347,6 +367,7 @@ class ${obj.getClassName()}(object):
             self.db_deleted_${ref.getRegularName()} = []
             % endfor
         % endif
+        % endif
         return children
     ## dirty method
     def has_changes(self):
@@ -373,6 +394,17 @@ class ${obj.getClassName()}(object):
         self.is_dirty = True
     ${field.getFieldName()} = property(${field.getDefineAccessor()}, \
                                             ${field.getDefineMutator()})
+    % if use_slots and field.isReference() and not field.isInverse():
+    ## deleted lists are only allocated when something is deleted
+    def __get_${field.getDeletedName()}(self):
+        if self.${field.getPrivateDeletedName()} is None:
+            self.${field.getPrivateDeletedName()} = []
+        return self.${field.getPrivateDeletedName()}
+    def __set_${field.getDeletedName()}(self, deleted):
+        self.${field.getPrivateDeletedName()} = deleted
+    ${field.getDeletedName()} = property(__get_${field.getDeletedName()}, \
+                                          __set_${field.getDeletedName()})
+    % endif
     % if not field.isPlural():
     def ${field.getAppender()}(self, ${field.getName()}):
         self.${field.getPrivateName()} = ${field.getName()}
@@ -33,6 +33,8 @@
 ##
 ###############################################################################
 
+from collections import OrderedDict
+
 def getActionChain(obj, version, start=0):
     result = []
     currentId = version
@@ -88,32 +90,29 @@ def getCurrentOperationDict(actions, currentOperations=None):
     # change replaces the current value in the dict
     for action in actions:
         for operation in action.db_operations:
+            # read the private fields directly, they are slots on the
+            # generated classes
             operationvtType = operation.vtType
-            d = operation.__dict__
             if operationvtType == 'add':
-                currentOperations[(d['_db_what'], 
-                                   d['_db_objectId'])] = \
-                                   operation
+                currentOperations[(operation._db_what,
+                                   operation._db_objectId)] = operation
             elif operationvtType == 'delete':
-                what = d['_db_what']
-                objectId = d['_db_objectId']
-                t = (what, objectId)
+                t = (operation._db_what, operation._db_objectId)
                 try:
                     del currentOperations[t]
                 except KeyError:
-                    msg = "Illegal delete operation: %d" % d['_db_id']
+                    msg = "Illegal delete operation: %d" % operation._db_id
                     raise RuntimeError(msg)
             elif operationvtType == 'change':
-                what = d['_db_what']
-                objectId = d['_db_oldObjId']
-                t = (what, objectId)
+                what = operation._db_what
+                t = (what, operation._db_oldObjId)
                 try:
                     del currentOperations[t]
                 except KeyError:
-                    msg = "Illegal change operation: %d" % d['_db_id']
+                    msg = "Illegal change operation: %d" % operation._db_id
                     raise RuntimeError(msg)
                 currentOperations[(what,
-                                   d['_db_newObjId'])] = operation
+                                   operation._db_newObjId)] = operation
             else:
                 msg = "Unrecognized operation '%s'" % operation.vtType
                 raise TypeError(msg)
@@ -126,3 +125,101 @@ def getCurrentOperations(actions):
     sortedOperations.sort(key=lambda x: x.db_id)
     return sortedOperations
 
+class CheckpointIndex(object):
+    """CheckpointIndex keeps the current operation dictionaries (see
+    getCurrentOperationDict) of some versions of a vistrail, so that
+    materializing a version only needs to replay the actions since the
+    nearest checkpointed ancestor instead of the whole chain from the root.
+
+    A checkpoint is taken every 'interval' actions along a chain, and for
+    every version that is requested. Checkpoints only hold references to
+    the operations of the vistrail; 'max_operations' bounds the total
+    number of references kept, the least recently used checkpoints being
+    dropped first.
+
+    """
+
+    def __init__(self, interval=50, max_operations=1000000):
+        self.interval = interval
+        self.max_operations = max_operations
+        self.hits = 0
+        self.misses = 0
+        self.clear()
+
+    def clear(self):
+        self._checkpoints = OrderedDict()
+        self._size = 0
+
+    def __len__(self):
+        return len(self._checkpoints)
+
+    def _add(self, action, depth, operation_dict):
+        version = action.db_id
+        if version in self._checkpoints:
+            return
+        self._checkpoints[version] = (action, depth, dict(operation_dict))
+        self._size += len(operation_dict)
+        while self._size > self.max_operations and len(self._checkpoints) > 1:
+            self._remove(self._checkpoints.iterkeys().next())
+
+    def _remove(self, version):
+        (_, _, operation_dict) = self._checkpoints.pop(version)
+        self._size -= len(operation_dict)
+
+    def get_operation_dict(self, vistrail, version):
+        """get_operation_dict(vistrail, version: int) -> dict
+        Returns a new current operation dictionary for the version, like
+        getCurrentOperationDict(getActionChain(vistrail, version)) would.
+
+        """
+        chain = []
+        checkpoint = None
+        current = version
+        while current > 0:
+            action = vistrail.db_get_action_by_id(current)
+            checkpoint = self._checkpoints.get(current)
+            if checkpoint is not None:
+                if checkpoint[0] is action:
+                    # move to the end, it is now the most recently used
+                    del self._checkpoints[current]
+                    self._checkpoints[current] = checkpoint
+                    break
+                # the action was replaced, checkpoint is stale
+                self._remove(current)
+                checkpoint = None
+            chain.append(action)
+            current = action.db_prevId
+        if checkpoint is not None:
+            self.hits += 1
+            (_, depth, operation_dict) = checkpoint
+            operation_dict = dict(operation_dict)
+        else:
+            self.misses += 1
+            depth = 0
+            operation_dict = {}
+        chain.reverse()
+        for action in chain:
+            getCurrentOperationDict([action], operation_dict)
+            depth += 1
+            if depth % self.interval == 0 or action is chain[-1]:
+                self._add(action, depth, operation_dict)
+        return operation_dict
+
+def getCheckpointIndex(vistrail):
+    """getCheckpointIndex(vistrail) -> CheckpointIndex
+    Returns the checkpoint index of a vistrail, creating it if needed.
+
+    """
+    index = getattr(vistrail, '_checkpoint_index', None)
+    if index is None:
+        index = CheckpointIndex()
+        vistrail._checkpoint_index = index
+    return index
+
+def getOperationDict(vistrail, version):
+    """getOperationDict(vistrail, version: int) -> dict
+    Returns the current operation dictionary for the version, using the
+    checkpoints of the vistrail.
+
+    """
+    return getCheckpointIndex(vistrail).get_operation_dict(vistrail, version)
@@ -35,6 +35,7 @@
 from __future__ import with_statement
 
 from datetime import datetime
+from itertools import izip
 from vistrails.core import debug
 from vistrails.core.bundles import py_import
 from vistrails.core.system import get_elementtree_library, strftime
@@ -46,9 +47,12 @@ from vistrails.core.modules.sub_module import get_cur_abs_namespace,\
 import vistrails.core.requirements
 
 import os.path
+import re
 import shutil
+import struct
 import tempfile
 import copy
+import gc
 import zipfile
 
 from vistrails.db import VistrailsDBException
@@ -63,17 +67,41 @@ import vistrails.db.services.registry
 import vistrails.db.services.workflow
 import vistrails.db.services.vistrail
 from vistrails.db.versions import getVersionDAO, currentVersion, getVersionSchemaDir, \
-    translate_vistrail, translate_workflow, translate_log, translate_registry, translate_startup
+    translate_vistrail, translate_workflow, translate_log, translate_registry, translate_startup, \
+    translate_mashuptrail
 
 import unittest
 import vistrails.core.system
 
+try:
+    import sqlite3
+except ImportError: # pragma: no cover
+    sqlite3 = None
+
 ElementTree = get_elementtree_library()
 
 CONNECT_TIMEOUT = 15
 
+# Binary files start with BIN_MAGIC, the BIN_FORMAT byte, and the version
+# and vtType as strings prefixed with their length (BIN_HEADER_LENGTH); the
+# encoded records of the object follow (see DAOList.write_bin_object())
+BIN_MAGIC = 'VTBIN\r\n\x1a'
+BIN_FORMAT = 2
+BIN_HEADER_LENGTH = struct.Struct('<H')
+
 _db_lib = None
-def get_db_lib():
+def get_db_lib(db_connection=None):
+    """get_db_lib(db_connection) -> module
+
+    Returns the DB-API module used by a connection. Connections to SQLite
+    databases know their module; for the others, or if no connection is
+    given, the default library (MySQLdb) is returned.
+
+    """
+    if db_connection is not None:
+        db_lib = getattr(db_connection, 'db_lib', None)
+        if db_lib is not None:
+            return db_lib
     global _db_lib
     if _db_lib is None:
         MySQLdb = py_import('MySQLdb', {
@@ -81,13 +109,83 @@ def get_db_lib():
                 'linux-debian': 'python-mysqldb',
                 'linux-ubuntu': 'python-mysqldb',
                 'linux-fedora': 'MySQL-python'})
-        # import sqlite3
         _db_lib = MySQLdb
     return _db_lib
 def set_db_lib(lib):
     global _db_lib
     _db_lib = lib
 
+def format_db_error(e):
+    """format_db_error(e: Exception) -> str
+    Formats an error from the DB library. MySQLdb errors have a code and a
+    message, sqlite3 ones only a message.
+
+    """
+    if len(e.args) >= 2:
+        return "%s: %s" % (e.args[0], e.args[1])
+    return str(e)
+
+if sqlite3 is not None:
+    class SQLiteConnection(sqlite3.Connection):
+        """A connection to a SQLite database file.
+
+        This adds the methods of MySQLdb connections that VisTrails uses, so
+        that both can be used interchangeably.
+        """
+        db_lib = sqlite3
+
+        def __init__(self, *args, **kwargs):
+            sqlite3.Connection.__init__(self, *args, **kwargs)
+            # byte strings are stored and returned as is, like MySQLdb
+            self.text_factory = str
+
+        def begin(self):
+            # the sqlite3 module opens transactions implicitly
+            pass
+
+        def ping(self):
+            try:
+                self.execute("SELECT 1;")
+            except sqlite3.ProgrammingError, e:
+                # connection was closed
+                raise sqlite3.OperationalError(*e.args)
+
+    def _convert_sqlite_datetime(value):
+        return datetime.strptime(value.split('.', 1)[0], '%Y-%m-%d %H:%M:%S')
+
+    # columns declared as datetime are returned as datetime objects, as
+    # MySQLdb does
+    sqlite3.register_converter('datetime', _convert_sqlite_datetime)
+
+def is_sqlite_connection(db_connection):
+    return (sqlite3 is not None and
+            getattr(db_connection, 'db_lib', None) is sqlite3)
+
+def connect_db(config):
+    """connect_db(config: dict) -> connection
+
+    Connects to the database described by config. If its 'backend' is
+    'sqlite', 'db' is the path of the database file; else it is a MySQL
+    database and config is passed to MySQLdb.
+
+    """
+    config = dict(config)
+    backend = config.pop('backend', 'mysql')
+    if backend == 'sqlite':
+        if sqlite3 is None:
+            raise VistrailsDBException("SQLite is not available")
+        try:
+            return sqlite3.connect(config['db'], factory=SQLiteConnection,
+                                   detect_types=sqlite3.PARSE_DECLTYPES,
+                                   timeout=config.get('connect_timeout',
+                                                      CONNECT_TIMEOUT))
+        except sqlite3.Error, e:
+            raise VistrailsDBException("cannot open connection (%s)" %
+                                       format_db_error(e))
+    elif backend != 'mysql':
+        raise VistrailsDBException("Unknown database backend %r" % backend)
+    return get_db_lib().connect(**config)
+
 
 class SaveBundle(object):
     """Transient bundle of objects to be saved or loaded.
@@ -165,17 +263,17 @@ class SaveBundle(object):
         
         return cp
 
-def format_prepared_statement(statement):
-    """format_prepared_statement(statement: str) -> str
-    Formats a prepared statement for compatibility with the currently
-    loaded database library's paramstyle.
+def format_prepared_statement(statement, db_connection=None):
+    """format_prepared_statement(statement: str, db_connection) -> str
+    Formats a prepared statement for compatibility with the
+    database library's paramstyle.
 
     Currently only supports 'qmark' and 'format' paramstyles.
     May be expanded later to allow for more compatibility options
     on input and output.  See PEP 249 for more info.
 
     """
-    style = get_db_lib().paramstyle
+    style = get_db_lib(db_connection).paramstyle
     if style == 'format':
         return statement.replace("?", "%s")
     elif style == 'qmark':
@@ -191,12 +289,13 @@ def open_db_connection(config):
         config['connect_timeout'] = CONNECT_TIMEOUT
     try:
         # FIXME allow config to be kwargs and args?
-        db_connection = get_db_lib().connect(**config)
-        #db_connection = get_db_lib().connect(config)
+        db_connection = connect_db(config)
         return db_connection
+    except VistrailsDBException:
+        raise
     except get_db_lib().Error, e:
         # should have a DB exception type
-        msg = "cannot open connection (%d: %s)" % (e.args[0], e.args[1])
+        msg = "cannot open connection (%s)" % format_db_error(e)
         raise VistrailsDBException(msg)
 
 def close_db_connection(db_connection):
@@ -212,10 +311,12 @@ def test_db_connection(config):
     if 'connect_timeout' not in config:
         config['connect_timeout'] = CONNECT_TIMEOUT
     try:
-        db_connection = get_db_lib().connect(**config)
+        db_connection = connect_db(config)
         close_db_connection(db_connection)
+    except VistrailsDBException:
+        raise
     except get_db_lib().Error, e:
-        msg = "connection test failed (%d: %s)" % (e.args[0], e.args[1])
+        msg = "connection test failed (%s)" % format_db_error(e)
         raise VistrailsDBException(msg)
     except TypeError, e:
         msg = "connection test failed (%s)" %str(e)
@@ -229,7 +330,7 @@ def ping_db_connection(db_connection):
     """
     try:
         db_connection.ping()
-    except get_db_lib().OperationalError:
+    except get_db_lib(db_connection).OperationalError:
         return False
     return True
     
@@ -287,9 +388,9 @@ def get_db_object_list(config, obj_type):
         c.close()
         close_db_connection(db)
         
-    except get_db_lib().Error, e:
-        msg = "Couldn't get list of vistrails objects from db (%d : %s)" % \
-            (e.args[0], e.args[1])
+    except get_db_lib(db).Error, e:
+        msg = "Couldn't get list of vistrails objects from db (%s)" % \
+            format_db_error(e)
         raise VistrailsDBException(msg)
     return result
 
@@ -307,9 +408,9 @@ def get_db_object_modification_time(db_connection, obj_id, obj_type):
         db_connection.commit()
         time = c.fetchall()[0][0]
         c.close()
-    except get_db_lib().Error, e:
-        msg = "Couldn't get object modification time from db (%d : %s)" % \
-            (e.args[0], e.args[1])
+    except get_db_lib(db_connection).Error, e:
+        msg = "Couldn't get object modification time from db (%s)" % \
+            format_db_error(e)
         raise VistrailsDBException(msg)
     return time
 
@@ -326,9 +427,9 @@ def get_db_object_version(db_connection, obj_id, obj_type):
         c.execute(command % (translate_to_tbl_name(obj_type), obj_id))
         version = c.fetchall()[0][0]
         c.close()
-    except get_db_lib().Error, e:
-        msg = "Couldn't get object version from db (%d : %s)" % \
-            (e.args[0], e.args[1])
+    except get_db_lib(db_connection).Error, e:
+        msg = "Couldn't get object version from db (%s)" % \
+            format_db_error(e)
         raise VistrailsDBException(msg)
     return version
 
@@ -343,7 +444,7 @@ def get_db_version(db_connection):
         c.execute(command)
         version = c.fetchall()[0][0]
         c.close()
-    except get_db_lib().Error, e:
+    except get_db_lib(db_connection).Error, e:
         # just return None if we hit an error
         return None
     return version
@@ -373,7 +474,7 @@ def get_db_id_from_name(db_connection, obj_type, name):
         else:
             c.close()
             return int(rows[0][0])
-    except get_db_lib().Error, e:
+    except get_db_lib(db_connection).Error, e:
         c.close()
         msg = "Connection error when trying to get db id from name"
         raise VistrailsDBException(msg)
@@ -404,9 +505,9 @@ def get_db_abstraction_modification_time(db_connection, abstraction):
                              id_value))
         modtime = c.fetchall()[0][0]
         c.close()
-    except get_db_lib().Error, e:
-        msg = "Couldn't get modification time from db (%d : %s)" % \
-            (e.args[0], e.args[1])
+    except get_db_lib(db_connection).Error, e:
+        msg = "Couldn't get modification time from db (%s)" % \
+            format_db_error(e)
         raise VistrailsDBException(msg)
     return modtime
 
@@ -441,9 +542,9 @@ def get_db_ids_from_vistrail(db_connection, vt_id, id_key):
         c.execute(command%(translate_to_tbl_name(DBAnnotation.vtType), id_key, vt_id))
         abs_ids = c.fetchall()
         c.close()
-    except get_db_lib().Error, e:
-        msg = "Couldn't get object ids from db (%d : %s)" % \
-            (e.args[0], e.args[1])
+    except get_db_lib(db_connection).Error, e:
+        msg = "Couldn't get object ids from db (%s)" % \
+            format_db_error(e)
         raise VistrailsDBException(msg)
     return [i[0] for i in abs_ids]
 
@@ -478,30 +579,59 @@ def get_matching_abstraction_id(db_connection, abstraction):
         if len(result) > 0:
             #print 'got result:', result
             id = result[0][0]
-    except get_db_lib().Error, e:
-        msg = "Couldn't get object modification time from db (%d : %s)" % \
-            (e.args[0], e.args[1])
+    except get_db_lib(db_connection).Error, e:
+        msg = "Couldn't get object modification time from db (%s)" % \
+            format_db_error(e)
         raise VistrailsDBException(msg)
     return id
 
+# Columns that reference other rows, and get an index
+INDEXED_COLUMNS = ['parent_id', 'entity_id', 'vistrail_id']
+
+def translate_sql_for_sqlite(cmd):
+    """translate_sql_for_sqlite(cmd: str) -> list of str
+    Translates a statement of the MySQL schema files to SQLite.
+
+    """
+    m = re.match(r'(?is)\s*DROP\s+TABLE\s+IF\s+EXISTS\s+(.*);$', cmd)
+    if m is not None:
+        # SQLite only drops one table at a time
+        return ['DROP TABLE IF EXISTS %s;' % table.strip()
+                for table in m.group(1).split(',')]
+    cmd = re.sub(r'(?i)\s*engine\s*=\s*InnoDB', '', cmd)
+    cmd = re.sub(r'(?i)\bint\s+not\s+null\s+auto_increment\s+primary\s+key',
+                 'integer primary key autoincrement', cmd)
+    return [cmd]
+
+def get_index_statements(cmd):
+    """get_index_statements(cmd: str) -> list of str
+    Returns the statements creating the indexes for a CREATE TABLE
+    statement, on the columns that reference other objects.
+
+    """
+    m = re.match(r'(?is)\s*CREATE\s+TABLE\s+`?(\w+)`?\s*\((.*)\)', cmd)
+    if m is None:
+        return []
+    table, columns = m.groups()
+    statements = []
+    for column in columns.split(','):
+        column = column.split()
+        if column and column[0].strip('`') in INDEXED_COLUMNS:
+            column = column[0].strip('`')
+            statements.append("CREATE INDEX %s_%s_idx ON %s(%s);" % (
+                              table, column, table, column))
+    return statements
+
 def setup_db_tables(db_connection, version=None, old_version=None):
     if version is None:
         version = currentVersion
     if old_version is None:
         old_version = version
+    sqlite = is_sqlite_connection(db_connection)
     try:
         def execute_file(c, f):
             cmd = ""
-#             auto_inc_str = 'auto_increment'
-#             not_null_str = 'not null'
-#             engine_str = 'engine=InnoDB;'
             for line in f:
-#                 if line.find(auto_inc_str) > 0:
-#                     num = line.find(auto_inc_str)
-#                     line = line[:num] + line[num+len(auto_inc_str):]
-#                 if line.find(not_null_str) > 0:
-#                     num = line.find(not_null_str)
-#                     line = line[:num] + line[num+len(not_null_str):]
                 line = line.strip()
                 if cmd or not line.startswith('--'):
                     cmd += line
@@ -509,12 +639,15 @@ def setup_db_tables(db_connection, version=None, old_version=None):
                 else:
                     ending = None
                 if ending and ending[-1] == ';':
-                    # FIXME engine stuff switch for MySQLdb, sqlite3
                     cmd = cmd.rstrip()
-#                     if cmd.endswith(engine_str):
-#                         cmd = cmd[:-len(engine_str)] + ';'
-                    #print cmd
-                    c.execute(cmd)
+                    if sqlite:
+                        cmds = translate_sql_for_sqlite(cmd)
+                    else:
+                        cmds = [cmd]
+                    for cmd in cmds:
+                        c.execute(cmd)
+                        for index_cmd in get_index_statements(cmd):
+                            c.execute(index_cmd)
                     cmd = ""
 
         # delete tables
@@ -522,8 +655,6 @@ def setup_db_tables(db_connection, version=None, old_version=None):
         schemaDir = getVersionSchemaDir(old_version)
         f = open(os.path.join(schemaDir, 'vistrails_drop.sql'))
         execute_file(c, f)
-#         db_script = f.read()
-#         c.execute(db_script)
         c.close()
         f.close()
 
@@ -532,19 +663,18 @@ def setup_db_tables(db_connection, version=None, old_version=None):
         schemaDir = getVersionSchemaDir(version)
         f = open(os.path.join(schemaDir, 'vistrails.sql'))
         execute_file(c, f)
-#         db_script = f.read()
-#         c.execute(db_script)
         f.close()
         c.close()
-    except get_db_lib().Error, e:
+        db_connection.commit()
+    except get_db_lib(db_connection).Error, e:
         raise VistrailsDBException("unable to create tables: " + str(e))
 
 ##############################################################################
 # General I/O
 
-def open_from_xml(filename, type):
+def open_from_xml(filename, type, lazy=False):
     if type == DBVistrail.vtType:
-        return open_vistrail_from_xml(filename)
+        return open_vistrail_from_xml(filename, lazy)
     elif type == DBWorkflow.vtType:
         return open_workflow_from_xml(filename)
     elif type == DBLog.vtType:
@@ -572,9 +702,27 @@ def save_to_xml(obj, filename, version=None):
         raise VistrailsDBException("cannot save object of type "
                                    "'%s' to xml" % type)
 
-def open_bundle_from_zip_xml(bundle_type, filename):
+def open_from_bin(filename, type):
+    if type == DBVistrail.vtType:
+        return open_vistrail_from_bin(filename)
+    elif type == DBLog.vtType:
+        return open_log_from_bin(filename)
+    else:
+        raise VistrailsDBException("cannot open object of type "
+                                   "'%s' from binary file" % type)
+
+def save_to_bin(obj, filename, version=None):
+    if obj.vtType == DBVistrail.vtType:
+        return save_vistrail_to_bin(obj, filename, version)
+    elif obj.vtType == DBLog.vtType:
+        return save_log_to_bin(obj, filename, version)
+    else:
+        raise VistrailsDBException("cannot save object of type "
+                                   "'%s' to binary file" % obj.vtType)
+
+def open_bundle_from_zip_xml(bundle_type, filename, lazy=False):
     if bundle_type == DBVistrail.vtType:
-        return open_vistrail_bundle_from_zip_xml(filename)
+        return open_vistrail_bundle_from_zip_xml(filename, lazy)
     else:
         raise VistrailsDBException("cannot open bundle of type '%s' from zip" %\
                                        bundle_type)
@@ -680,13 +828,24 @@ def unserialize(str, obj_type):
 ##############################################################################
 # Vistrail I/O
 
-def open_vistrail_from_xml(filename):
-    """open_vistrail_from_xml(filename) -> Vistrail"""
-    tree = ElementTree.parse(filename)
-    version = get_version_for_xml(tree.getroot())
+def open_vistrail_from_xml(filename, lazy=False):
+    """open_vistrail_from_xml(filename, lazy: bool) -> Vistrail
+
+    If lazy is True and the file is in the current version, the
+    operations of the actions are only read when they are first accessed.
+
+    """
+    version = get_version_for_xml_file(filename)
     try:
         daoList = getVersionDAO(version)
-        vistrail = daoList.open_from_xml(filename, DBVistrail.vtType, tree)
+        if lazy and version == currentVersion:
+            vistrail = daoList.open_from_xml_lazy(filename,
+                                                  DBVistrail.vtType)
+        elif version == currentVersion:
+            vistrail = daoList.open_from_xml_stream(filename,
+                                                    DBVistrail.vtType)
+        else:
+            vistrail = daoList.open_from_xml(filename, DBVistrail.vtType)
         if vistrail is None:
             raise VistrailsDBException("Couldn't read vistrail from XML")
         vistrail = translate_vistrail(vistrail, version)
@@ -700,8 +859,8 @@ def open_vistrail_from_xml(filename):
 
     return vistrail
 
-def open_vistrail_bundle_from_zip_xml(filename):
-    """open_vistrail_bundle_from_zip_xml(filename) -> SaveBundle
+def open_vistrail_bundle_from_zip_xml(filename, lazy=False):
+    """open_vistrail_bundle_from_zip_xml(filename, lazy: bool) -> SaveBundle
     Open a vistrail from a zip compressed format.
     It expects that the vistrail file inside archive has name 'vistrail',
     the log inside archive has name 'log',
@@ -728,7 +887,8 @@ def open_vistrail_bundle_from_zip_xml(filename):
         for root, dirs, files in os.walk(vt_save_dir):
             for fname in files:
                 if fname == 'vistrail' and root == vt_save_dir:
-                    vistrail = open_vistrail_from_xml(os.path.join(root, fname))
+                    vistrail = open_vistrail_from_xml(os.path.join(root, fname),
+                                                      lazy)
                 elif fname == 'log' and root == vt_save_dir:
                     # FIXME read log to get execution info
                     # right now, just ignore the file
@@ -736,6 +896,10 @@ def open_vistrail_bundle_from_zip_xml(filename):
                     log_fname = os.path.join(root, fname)
                     # log = open_log_from_xml(os.path.join(root, fname))
                     # objs.append(DBLog.vtType, log)
+                elif (fname == get_log_index_filename('log') and
+                      root == vt_save_dir):
+                    # index of the log, rebuilt when needed
+                    pass
                 elif fname.startswith('abstraction_'):
                     abstraction_file = os.path.join(root, fname)
                     abstraction_files.append(abstraction_file)
@@ -859,6 +1023,29 @@ def save_vistrail_to_xml(vistrail, filename, version=None):
     vistrail.db_currentVersion = current_action
     return vistrail
 
+def open_vistrail_from_bin(filename):
+    """open_vistrail_from_bin(filename) -> Vistrail"""
+    vistrail, version = _open_from_bin(filename, DBVistrail.vtType)
+    vistrail = translate_vistrail(vistrail, version)
+    vistrails.db.services.vistrail.update_id_scope(vistrail)
+    return vistrail
+
+def save_vistrail_to_bin(vistrail, filename, version=None):
+    if version is None:
+        version = currentVersion
+    if not vistrail.db_version:
+        vistrail.db_version = currentVersion
+
+    current_action = 0L
+    if hasattr(vistrail, 'db_currentVersion'):
+        current_action = vistrail.db_currentVersion
+
+    vistrail = translate_vistrail(vistrail, vistrail.db_version, version)
+    _save_to_bin(vistrail, filename, version)
+    vistrail = translate_vistrail(vistrail, version)
+    vistrail.db_currentVersion = current_action
+    return vistrail
+
 def save_vistrail_bundle_to_zip_xml(save_bundle, filename, vt_save_dir=None, version=None):
     """save_vistrail_bundle_to_zip_xml(save_bundle: SaveBundle, filename: str,
                                 vt_save_dir: str, version: str)
@@ -983,6 +1170,10 @@ def save_vistrail_bundle_to_zip_xml(save_bundle, filename, vt_save_dir=None, ver
             # zip current directory
             for root, dirs, files in os.walk('.'):
                 for f in files:
+                    if (root == '.' and
+                            f == get_log_index_filename('log')):
+                        # the log index is local, it is not saved
+                        continue
                     z.write(os.path.join(root, f))
         z.close()
         shutil.copyfile(tmp_zip_file, filename)
@@ -1179,7 +1370,10 @@ def get_saved_workflows(vistrail, db_connection):
     if not vistrail.db_id:
         return []
     c = db_connection.cursor()
-    c.execute("SELECT parent_id FROM workflow WHERE vistrail_id=%s;", (vistrail.db_id,))
+    c.execute(format_prepared_statement(
+                  "SELECT parent_id FROM workflow WHERE vistrail_id=%s;",
+                  db_connection),
+              (vistrail.db_id,))
     ids = [i[0] for i in c.fetchall()]
     c.close()
     return ids
@@ -1187,37 +1381,149 @@ def get_saved_workflows(vistrail, db_connection):
 ##############################################################################
 # Logging I/O
 
+def _read_appended_workflow_exec(node):
+    """Reads a workflowExec element from an appended log, translating it to
+    the current version if needed.
+    """
+    version = get_version_for_xml(node)
+    daoList = getVersionDAO(version)
+    workflow_exec = daoList.read_xml_object(DBWorkflowExec.vtType, node)
+    if version != currentVersion:
+        # if version is wrong, dump this into a dummy log object,
+        # then translate, then get workflow_exec back
+        log = DBLog()
+        translate_log(log, currentVersion, version)
+        log.db_add_workflow_exec(workflow_exec)
+        log = translate_log(log, version)
+        workflow_exec = log.db_workflow_execs[0]
+    return workflow_exec
+
+def get_log_index_filename(filename):
+    return filename + '.idx'
+
+def _scan_log_chunks(f, start):
+    """Finds the offsets of the workflowExec elements in an appended log.
+
+    No parsing is needed: '<' is always escaped in attributes and text, so
+    every occurrence of the tag marks the start of a new execution.
+    """
+    offsets = []
+    f.seek(start)
+    buf = ''
+    pos = start
+    tag = '<workflowExec'
+    while True:
+        data = f.read(1 << 20)
+        if not data:
+            break
+        buf += data
+        i = buf.find(tag)
+        while i != -1:
+            if buf[i + len(tag):i + len(tag) + 1] in (' ', '\t', '\n',
+                                                      '>', '/'):
+                offsets.append(pos + i)
+            elif i + len(tag) >= len(buf):
+                # can't tell yet, keep it for the next read
+                break
+            i = buf.find(tag, i + 1)
+        # keep enough to recognize a tag split between two reads
+        if i == -1:
+            keep = min(len(tag), len(buf))
+        else:
+            keep = len(buf) - i
+        pos += len(buf) - keep
+        buf = buf[-keep:]
+    return offsets
+
+def _read_log_index(idx_filename):
+    """Reads the index of an appended log: a line with the offset of each
+    execution, then one with the size and modification time of the log.
+
+    Returns the offsets and size, and the time, or [0] and None if the
+    index can't be read.
+    """
+    try:
+        with open(idx_filename, 'rb') as f:
+            lines = f.read().splitlines()
+        size, mtime = lines[-1].split()
+        return [int(l) for l in lines[:-1]] + [int(size)], float(mtime)
+    except (IOError, ValueError, IndexError):
+        return [0], None
+
+def _write_log_index(idx_filename, index, mtime):
+    try:
+        with open(idx_filename, 'wb') as f:
+            f.write(''.join('%d\n' % o for o in index[:-1]))
+            f.write('%d %r\n' % (index[-1], mtime))
+    except IOError:
+        pass
+
+def get_log_index(filename):
+    """get_log_index(filename: str) -> list of int
+
+    Returns the offsets of the workflow executions in an appended log file,
+    followed by the size of the file, so that the i-th execution is between
+    index[i] and index[i+1].
+
+    The index is kept in a sidecar file, written by
+    append_workflow_exec_to_xml(), with the size and modification time of
+    the log. If either changed, the log was written to without updating the
+    index, and the index is rebuilt by scanning the file.
+    """
+    idx_filename = get_log_index_filename(filename)
+    index, mtime = _read_log_index(idx_filename)
+    with open(filename, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if (index[-1], mtime) != (st.st_size, st.st_mtime):
+            index = _scan_log_chunks(f, 0)
+            index.append(st.st_size)
+            _write_log_index(idx_filename, index, st.st_mtime)
+    return index
+
+def iter_workflow_execs_from_xml(filename):
+    """iter_workflow_execs_from_xml(filename: str) -> iter of DBWorkflowExec
+
+    Reads the workflow executions of an appended log one at a time, without
+    loading the whole file.
+    """
+    index = get_log_index(filename)
+    with open(filename, 'rb') as f:
+        for start, end in izip(index[:-1], index[1:]):
+            f.seek(start)
+            node = ElementTree.fromstring(f.read(end - start))
+            yield _read_appended_workflow_exec(node)
+
+def open_workflow_exec_from_xml(filename, index):
+    """open_workflow_exec_from_xml(filename: str, index: int)
+         -> DBWorkflowExec
+
+    Reads a single workflow execution from an appended log, using the
+    index to only parse that one. Executions are numbered from 0, in the
+    order in which they were appended.
+    """
+    offsets = get_log_index(filename)
+    if not 0 <= index < len(offsets) - 1:
+        raise VistrailsDBException("No workflow execution %d in log %s" % (
+                                   index, filename))
+    with open(filename, 'rb') as f:
+        f.seek(offsets[index])
+        node = ElementTree.fromstring(
+                f.read(offsets[index + 1] - offsets[index]))
+    return _read_appended_workflow_exec(node)
+
 def open_log_from_xml(filename, was_appended=False):
     """open_log_from_xml(filename) -> DBLog"""
     if was_appended:
-        parser = ElementTree.XMLTreeBuilder()
-        parser.feed("<log>\n")
-        f = open(filename, "rb")
-        parser.feed(f.read())
-        parser.feed("</log>\n")
-        root = parser.close()
-        workflow_execs = []
-        for node in root:
-            version = get_version_for_xml(node)
-            daoList = getVersionDAO(version)
-            workflow_exec = \
-                daoList.read_xml_object(DBWorkflowExec.vtType, node)
-            if version != currentVersion:
-                # if version is wrong, dump this into a dummy log object, 
-                # then translate, then get workflow_exec back
-                log = DBLog()
-                translate_log(log, currentVersion, version)
-                log.db_add_workflow_exec(workflow_exec)
-                log = translate_log(log, version)
-                workflow_exec = log.db_workflow_execs[0]
-            workflow_execs.append(workflow_exec)
+        workflow_execs = list(iter_workflow_execs_from_xml(filename))
         log = DBLog(workflow_execs=workflow_execs)
         vistrails.db.services.log.update_ids(log)
     else:
-        tree = ElementTree.parse(filename)
-        version = get_version_for_xml(tree.getroot())
+        version = get_version_for_xml_file(filename)
         daoList = getVersionDAO(version)
-        log = daoList.open_from_xml(filename, DBLog.vtType, tree)
+        if version == currentVersion:
+            log = daoList.open_from_xml_stream(filename, DBLog.vtType)
+        else:
+            log = daoList.open_from_xml(filename, DBLog.vtType)
         log = translate_log(log, version)
         vistrails.db.services.log.update_id_scope(log)
     return log
@@ -1246,12 +1552,14 @@ def open_vt_log_from_db(db_connection, vt_id, version=None):
     if db_connection is not None:
         try:
             c = db_connection.cursor()
-            # FIXME MySQL versus sqlite3
-            res = c.execute("SELECT id FROM log_tbl WHERE vistrail_id=%s;", (vt_id,))
+            res = c.execute(format_prepared_statement(
+                                "SELECT id FROM log_tbl WHERE vistrail_id=%s;",
+                                db_connection),
+                            (vt_id,))
             ids = [i[0] for i in c.fetchall()]
             c.close()
-        except get_db_lib().Error, e:
-            debug.critical("Error getting log id:s %d: %s" % (e.args[0], e.args[1]))
+        except get_db_lib(db_connection).Error, e:
+            debug.critical("Error getting log id:s %s" % format_db_error(e))
     log = DBLog()
     if hasattr(dao_list, 'open_many_from_db'): # does not exist pre 1.0.2
         logs = dao_list.open_many_from_db(db_connection, DBLog.vtType, ids)
@@ -1274,15 +1582,8 @@ def save_log_to_xml(log, filename, version=None, do_append=False):
 
     daoList = getVersionDAO(version)
     if do_append:
-        log_file = open(filename, 'ab')
         for workflow_exec in log.db_workflow_execs:
-            # cannot do correct numbering here...
-            # but need to save so that we can use it for deletes
-            wf_exec_id = workflow_exec.db_id
-            workflow_exec.db_id = -1L
-            daoList.save_to_xml(workflow_exec, log_file, {}, version)
-            workflow_exec.db_id = wf_exec_id
-        log_file.close()
+            _append_workflow_exec(daoList, workflow_exec, filename, version)
     else:
         tags = {'xmlns:xsi': 'http://www.w3.org/2001/XMLSchema-instance',
                 'xsi:schemaLocation': 'http://www.vistrails.org/log.xsd'
@@ -1291,6 +1592,70 @@ def save_log_to_xml(log, filename, version=None, do_append=False):
     log = translate_log(log, version)
     return log
 
+def open_log_from_bin(filename):
+    """open_log_from_bin(filename) -> DBLog"""
+    log, version = _open_from_bin(filename, DBLog.vtType)
+    log = translate_log(log, version)
+    vistrails.db.services.log.update_id_scope(log)
+    return log
+
+def save_log_to_bin(log, filename, version=None):
+    if version is None:
+        version = currentVersion
+    if not log.db_version:
+        log.db_version = currentVersion
+    log = translate_log(log, log.db_version, version)
+    _save_to_bin(log, filename, version)
+    log = translate_log(log, version)
+    return log
+
+def _append_workflow_exec(daoList, workflow_exec, filename, version):
+    # keep the index in sync if it is up to date
+    idx_filename = get_log_index_filename(filename)
+    try:
+        st = os.stat(filename)
+        start, start_mtime = st.st_size, st.st_mtime
+    except OSError:
+        start, start_mtime = 0, None
+    if start == 0:
+        index, up_to_date = [0], True
+    else:
+        index, mtime = _read_log_index(idx_filename)
+        up_to_date = (index[-1], mtime) == (start, start_mtime)
+
+    with open(filename, 'ab') as log_file:
+        # cannot do correct numbering here...
+        # but need to save so that we can use it for deletes
+        wf_exec_id = workflow_exec.db_id
+        workflow_exec.db_id = -1L
+        try:
+            daoList.save_to_xml(workflow_exec, log_file, {}, version)
+        finally:
+            workflow_exec.db_id = wf_exec_id
+        end = log_file.tell()
+
+    if up_to_date:
+        # the execution starts where the log ended
+        index.append(end)
+        _write_log_index(idx_filename, index, os.path.getmtime(filename))
+
+def append_workflow_exec_to_xml(workflow_exec, filename, version=None):
+    """append_workflow_exec_to_xml(workflow_exec: DBWorkflowExec,
+                                   filename: str, version: str) -> None
+
+    Appends a single workflow execution to an appended log file (the format
+    of the 'log' file in .vt bundles), updating its index.
+
+    This is used to stream the log to disk as executions finish.
+    """
+    if version is None:
+        version = currentVersion
+    log = DBLog(version=currentVersion)
+    log.db_add_workflow_exec(workflow_exec)
+    log = translate_log(log, currentVersion, version)
+    _append_workflow_exec(getVersionDAO(version), log.db_workflow_execs[0],
+                          filename, version)
+
 def save_log_bundle_to_xml(save_bundle, filename, version=None):
     if save_bundle.log is None:
         raise VistrailsDBException('save_log_bundle_to_xml failed, '
@@ -1581,15 +1946,15 @@ def open_thumbnails_from_db(db_connection, obj_type, obj_id, tmp_dir=None):
     SELECT a.value
     FROM action_annotation a
     WHERE a.akey = '__thumb__' AND a.entity_id = ? AND a.entity_type = ?
-    """)
+    """, db_connection)
     try:
         c = db_connection.cursor()
         c.execute(prepared_statement, (obj_id, obj_type))
         file_names = [file_name for (file_name,) in c.fetchall()]
         c.close()
-    except get_db_lib().Error, e:
-        msg = "Couldn't get thumbnails list from db (%d : %s)" % \
-            (e.args[0], e.args[1])
+    except get_db_lib(db_connection).Error, e:
+        msg = "Couldn't get thumbnails list from db (%s)" % \
+            format_db_error(e)
         raise VistrailsDBException(msg)
     # Next get all thumbnails from the db that aren't already in tmp_dir
     get_db_file_names = [fname for fname in file_names if fname not in os.listdir(tmp_dir)]
@@ -1599,15 +1964,15 @@ def open_thumbnails_from_db(db_connection, obj_type, obj_id, tmp_dir=None):
         SELECT t.image_bytes
         FROM thumbnail t
         WHERE t.file_name = ?
-        """)
+        """, db_connection)
         try:
             c = db_connection.cursor()
             c.execute(prepared_statement, (file_name,))
             row = c.fetchone()
             c.close()
-        except get_db_lib().Error, e:
-            msg = "Couldn't get thumbnail from db (%d : %s)" % \
-                (e.args[0], e.args[1])
+        except get_db_lib(db_connection).Error, e:
+            msg = "Couldn't get thumbnail from db (%s)" % \
+                format_db_error(e)
             raise VistrailsDBException(msg)
         if row is not None:
             image_bytes = row[0]
@@ -1642,7 +2007,10 @@ def save_thumbnails_to_db(absfnames, db_connection):
     FROM thumbnail t
     WHERE t.file_name IN %s
     """
-    check_file_names = [os.path.basename(absfname).replace("'", "''").replace("\\", "\\\\") for absfname in absfnames]
+    check_file_names = [os.path.basename(absfname).replace("'", "''") for absfname in absfnames]
+    if not is_sqlite_connection(db_connection):
+        # MySQL also uses backslash as an escape character
+        check_file_names = [fname.replace("\\", "\\\\") for fname in check_file_names]
     # SQL syntax needs SOMETHING if list is empty - use filename that's illegal on all platforms
     check_file_names.append(':/')
     sql_in_token = str(tuple(check_file_names))
@@ -1651,9 +2019,9 @@ def save_thumbnails_to_db(absfnames, db_connection):
         c.execute(statement % sql_in_token)
         db_file_names = [file_name for (file_name,) in c.fetchall()]
         c.close()
-    except get_db_lib().Error, e:
-        msg = "Couldn't check which thumbnails already exist in db (%d : %s)" % \
-            (e.args[0], e.args[1])
+    except get_db_lib(db_connection).Error, e:
+        msg = "Couldn't check which thumbnails already exist in db (%s)" % \
+            format_db_error(e)
         raise VistrailsDBException(msg)
     insert_absfnames = [absfname for absfname in absfnames if os.path.basename(absfname) not in db_file_names]
 
@@ -1662,22 +2030,23 @@ def save_thumbnails_to_db(absfnames, db_connection):
     """
     INSERT INTO thumbnail(file_name, image_bytes, last_modified)
     VALUES (?, ?, ?)
-    """)
+    """, db_connection)
     try:
         c = db_connection.cursor()
         for absfname in insert_absfnames:
             image_file = open(absfname, 'rb')
             image_bytes = image_file.read()
             image_file.close()
+            image_bytes = get_db_lib(db_connection).Binary(image_bytes)
             c.execute(prepared_statement, (os.path.basename(absfname), image_bytes, strftime(get_current_time(db_connection), '%Y-%m-%d %H:%M:%S')))
             db_connection.commit()
         c.close()
     except IOError, e:
         msg = "Couldn't read thumbnail file for writing to db: %s" % absfname
         raise VistrailsDBException(msg)
-    except get_db_lib().Error, e:
-        msg = "Couldn't insert thumbnail into db (%d : %s)" % \
-            (e.args[0], e.args[1])
+    except get_db_lib(db_connection).Error, e:
+        msg = "Couldn't insert thumbnail into db (%s)" % \
+            format_db_error(e)
         raise VistrailsDBException(msg)
     return None
 ##############################################################################
@@ -1698,6 +2067,7 @@ def open_mashuptrail_from_xml(filename):
         mashuptrail = daoList.open_from_xml(filename, DBMashuptrail.vtType, tree)
         if old_version == "0.1.0":
             mashuptrail.db_version = version
+        mashuptrail = translate_mashuptrail(mashuptrail, version)
         Mashuptrail.convert(mashuptrail)
         mashuptrail.currentVersion = mashuptrail.getLatestVersion()
         mashuptrail.updateIdScope()
@@ -1730,6 +2100,7 @@ def open_mashuptrail_from_db(db_connection, mashup_id, lock=False):
     try:
         daoList = getVersionDAO(version)
         mashuptrail = daoList.open_from_db(db_connection, DBMashuptrail.vtType, mashup_id, lock)
+        mashuptrail = translate_mashuptrail(mashuptrail, version)
         Mashuptrail.convert(mashuptrail)
         mashuptrail.currentVersion = mashuptrail.getLatestVersion()
         mashuptrail.updateIdScope()
@@ -1832,25 +2203,106 @@ def get_version_for_xml(root):
     msg = "Cannot find version information"
     raise VistrailsDBException(msg)
 
+def get_version_for_xml_file(filename):
+    """get_version_for_xml_file(filename: str) -> str
+
+    Reads the version from the root element of an XML file, without
+    parsing the rest of the file.
+    """
+    with open(filename, 'rb') as f:
+        for event, root in ElementTree.iterparse(f, ('start',)):
+            return get_version_for_xml(root)
+
+def _get_bin_dao_list(version):
+    daoList = getVersionDAO(version)
+    if 'bin' not in daoList:
+        raise VistrailsDBException("Binary files are not supported for "
+                                   "version %s" % version)
+    return daoList
+
+def _read_bin_header(f, filename):
+    if f.read(len(BIN_MAGIC)) != BIN_MAGIC:
+        raise VistrailsDBException("'%s' is not a binary VisTrails file" %
+                                   filename)
+    bin_format = f.read(1)
+    if bin_format != chr(BIN_FORMAT):
+        raise VistrailsDBException("'%s' uses an unknown binary format" %
+                                   filename)
+    header = []
+    for i in xrange(2):
+        length = f.read(BIN_HEADER_LENGTH.size)
+        if len(length) == BIN_HEADER_LENGTH.size:
+            length, = BIN_HEADER_LENGTH.unpack(length)
+            value = f.read(length)
+            if len(value) == length:
+                header.append(value)
+                continue
+        raise VistrailsDBException("'%s' has an invalid header" % filename)
+    version, vtType = header
+    return version, vtType
+
+def get_version_for_bin_file(filename):
+    """get_version_for_bin_file(filename: str) -> str
+
+    Reads the version from the header of a binary file.
+    """
+    with open(filename, 'rb') as f:
+        return _read_bin_header(f, filename)[0]
+
+def _open_from_bin(filename, vtType):
+    with open(filename, 'rb') as f:
+        version, file_vtType = _read_bin_header(f, filename)
+        if file_vtType != vtType:
+            raise VistrailsDBException("'%s' contains a %s, not a %s" %
+                                       (filename, file_vtType, vtType))
+        daoList = _get_bin_dao_list(version)
+        data = f.read()
+    # everything allocated here stays alive, running the cycle collector
+    # while creating the objects only slows the loading down
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        try:
+            return daoList.read_bin_object(vtType, data), version
+        except VistrailsDBException, e:
+            raise VistrailsDBException("Cannot read '%s': %s" %
+                                       (filename, e.msg))
+        except (TypeError, ValueError, AttributeError), e:
+            # fields that don't have the structure the DAOs expect
+            raise VistrailsDBException("Cannot read '%s': invalid data (%s)" %
+                                       (filename, e))
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+def _save_to_bin(obj, filename, version):
+    daoList = _get_bin_dao_list(version)
+    data = daoList.write_bin_object(obj)
+    with open(filename, 'wb') as f:
+        f.write(BIN_MAGIC)
+        f.write(chr(BIN_FORMAT))
+        for value in (version, obj.vtType):
+            f.write(BIN_HEADER_LENGTH.pack(len(value)))
+            f.write(value)
+        f.write(data)
+
 def get_type_for_xml(root):
     return root.tag
 
 def get_current_time(db_connection=None):
     timestamp = datetime.now()
-    if db_connection is not None:
+    # SQLite databases are local files, the server time is our time
+    if (db_connection is not None and
+            not is_sqlite_connection(db_connection)):
         try:
             c = db_connection.cursor()
-            # FIXME MySQL versus sqlite3
             c.execute("SELECT NOW();")
-            # c.execute("SELECT DATETIME('NOW');")
             row = c.fetchone()
             if row:
-                # FIXME MySQL versus sqlite3
                 timestamp = row[0]
-                # timestamp = strptime(row[0], '%Y-%m-%d %H:%M:%S')
             c.close()
-        except get_db_lib().Error, e:
-            debug.critical("Logger Error %d: %s" % (e.args[0], e.args[1]))
+        except get_db_lib(db_connection).Error, e:
+            debug.critical("Logger Error %s" % format_db_error(e))
 
     return timestamp
 
@@ -1927,3 +2379,285 @@ class TestDBIO(unittest.TestCase):
                 self.fail(str(e))
         finally:
             os.rmdir(testdir)
+
+    def test_stream_xml(self):
+        """test reading a vistrail incrementally"""
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        filename = os.path.join(testdir, 'dummy.xml')
+        try:
+            vistrail = open_vistrail_from_xml(
+                os.path.join(vistrails.core.system.vistrails_root_directory(),
+                             'tests/resources/dummy.xml'))
+            save_vistrail_to_xml(vistrail, filename)
+            self.assertEqual(get_version_for_xml_file(filename),
+                             currentVersion)
+
+            daoList = getVersionDAO(currentVersion)
+            streamed = daoList.open_from_xml_stream(filename,
+                                                    DBVistrail.vtType)
+            parsed = daoList.open_from_xml(filename, DBVistrail.vtType)
+            self.assertFalse(streamed.is_dirty)
+            self.assertEqual(len(streamed.db_actions),
+                             len(vistrail.db_actions))
+            self.assertEqual(
+                    ElementTree.tostring(daoList.write_xml_object(streamed)),
+                    ElementTree.tostring(daoList.write_xml_object(parsed)))
+        finally:
+            shutil.rmtree(testdir)
+
+    def test_lazy_xml(self):
+        """test reading the operations of a vistrail on demand"""
+        from vistrails.db.services.vistrail import materializeWorkflow
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        filename = os.path.join(testdir, 'dummy.xml')
+        try:
+            vistrail = open_vistrail_from_xml(
+                os.path.join(vistrails.core.system.vistrails_root_directory(),
+                             'tests/resources/dummy.xml'))
+            save_vistrail_to_xml(vistrail, filename)
+
+            eager = open_vistrail_from_xml(filename)
+            lazy = open_vistrail_from_xml(filename, lazy=True)
+            self.assertFalse(lazy.is_dirty)
+            self.assertEqual(lazy.idScope.ids, eager.idScope.ids)
+            self.assertFalse(any(a.db_has_operations_loaded()
+                                 for a in lazy.db_actions
+                                 if a.db_id in eager.db_actions_id_index and
+                                 eager.db_get_action_by_id(a.db_id)
+                                 .db_operations))
+
+            version = max(a.db_id for a in eager.db_actions)
+            chain = set()
+            v = version
+            while v > 0:
+                chain.add(v)
+                v = lazy.db_get_action_by_id(v).db_prevId
+            workflow = materializeWorkflow(lazy, version)
+            self.assertEqual(serialize(workflow),
+                             serialize(materializeWorkflow(eager, version)))
+            loaded = set(a.db_id for a in lazy.db_actions
+                         if a.db_has_operations_loaded())
+            self.assertTrue(chain <= loaded)
+
+            daoList = getVersionDAO(currentVersion)
+            self.assertEqual(
+                    ElementTree.tostring(daoList.write_xml_object(lazy)),
+                    ElementTree.tostring(daoList.write_xml_object(eager)))
+            self.assertEqual(sorted(lazy.db_objects),
+                             sorted(eager.db_objects))
+        finally:
+            shutil.rmtree(testdir)
+
+    def test_bin(self):
+        """test saving and loading vistrails and logs in binary files"""
+        from datetime import datetime
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        xml_filename = os.path.join(testdir, 'dummy.xml')
+        bin_filename = os.path.join(testdir, 'dummy.vtb')
+        try:
+            vistrail = open_vistrail_from_xml(
+                os.path.join(vistrails.core.system.vistrails_root_directory(),
+                             'tests/resources/dummy.xml'))
+            save_vistrail_to_xml(vistrail, xml_filename)
+            save_vistrail_to_bin(vistrail, bin_filename)
+            self.assertEqual(get_version_for_bin_file(bin_filename),
+                             currentVersion)
+            self.assertLess(os.path.getsize(bin_filename),
+                            os.path.getsize(xml_filename))
+
+            from_xml = open_vistrail_from_xml(xml_filename)
+            from_bin = open_vistrail_from_bin(bin_filename)
+            self.assertFalse(from_bin.is_dirty)
+            self.assertEqual(from_bin.idScope.ids, from_xml.idScope.ids)
+            daoList = getVersionDAO(currentVersion)
+            self.assertEqual(
+                    ElementTree.tostring(daoList.write_xml_object(from_bin)),
+                    ElementTree.tostring(daoList.write_xml_object(from_xml)))
+
+            # unlike XML, the binary format keeps unicode strings
+            from_bin.db_add_annotation(DBAnnotation(id=-1, key='name',
+                                                    value=u'caf\xe9'))
+            save_vistrail_to_bin(from_bin, bin_filename)
+            annotation = open_vistrail_from_bin(bin_filename) \
+                    .db_get_annotation_by_key('name')
+            self.assertEqual(annotation.db_value, u'caf\xe9')
+
+            log = DBLog(workflow_execs=[
+                    DBWorkflowExec(id=i, user='user%d' % i, completed=1,
+                                   ts_start=datetime(2014, 3, 1, 12, 0, i))
+                    for i in xrange(3)])
+            save_log_to_bin(log, bin_filename)
+            log = open_log_from_bin(bin_filename)
+            self.assertEqual([(wf.db_user, wf.db_ts_start)
+                              for wf in log.db_workflow_execs],
+                             [('user%d' % i, datetime(2014, 3, 1, 12, 0, i))
+                              for i in xrange(3)])
+
+            with self.assertRaises(VistrailsDBException):
+                open_vistrail_from_bin(bin_filename)
+            with self.assertRaises(VistrailsDBException):
+                open_vistrail_from_bin(xml_filename)
+        finally:
+            shutil.rmtree(testdir)
+
+    def test_bin_validation(self):
+        """test that binary files with invalid records are rejected"""
+        from vistrails.db.versions.v1_0_4.persistence.bin.bin_dao import \
+            encode_record, decode_record
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        filename = os.path.join(testdir, 'dummy.vtb')
+        try:
+            vistrail = open_vistrail_from_xml(
+                os.path.join(vistrails.core.system.vistrails_root_directory(),
+                             'tests/resources/dummy.xml'))
+            save_vistrail_to_bin(vistrail, filename)
+            with open(filename, 'rb') as f:
+                data = f.read()
+            header_length = (len(BIN_MAGIC) + 1 +
+                             2 * BIN_HEADER_LENGTH.size +
+                             len(currentVersion) + len(DBVistrail.vtType))
+            header = data[:header_length]
+            vtType, fields = decode_record(data[header_length:])
+            self.assertEqual(vtType, DBVistrail.vtType)
+            actions = fields[3]
+
+            def check_invalid(body):
+                with open(filename, 'wb') as f:
+                    f.write(header + body)
+                with self.assertRaises(VistrailsDBException):
+                    open_vistrail_from_bin(filename)
+
+            # wrong type or number of fields for the vistrail
+            check_invalid(encode_record((DBLog.vtType, fields)))
+            check_invalid(encode_record((vtType, fields[:-1])))
+            # wrong type or number of fields for an action
+            action_type, action_fields = actions[0]
+            for action in [('tag', action_fields),
+                           (action_type, action_fields + (None,))]:
+                check_invalid(encode_record(
+                        (vtType, fields[:3] + ([action] + actions[1:],) +
+                         fields[4:])))
+            # a string where an action is expected
+            check_invalid(encode_record(
+                    (vtType, fields[:3] + ([action_type],) + fields[4:])))
+            # truncated or extended data
+            check_invalid(data[header_length:-1])
+            check_invalid(data[header_length:] + 'N')
+        finally:
+            shutil.rmtree(testdir)
+
+    def test_append_log(self):
+        """test the index of appended logs"""
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        filename = os.path.join(testdir, 'log')
+        try:
+            for i in xrange(3):
+                workflow_exec = DBWorkflowExec(id=i, user='user%d' % i,
+                                               completed=1)
+                append_workflow_exec_to_xml(workflow_exec, filename)
+            index = get_log_index(filename)
+            self.assertEqual(len(index), 4)
+            self.assertEqual(index[0], 0)
+            self.assertEqual(index[-1], os.path.getsize(filename))
+            self.assertEqual(
+                    open_workflow_exec_from_xml(filename, 1).db_user,
+                    'user1')
+            with self.assertRaises(VistrailsDBException):
+                open_workflow_exec_from_xml(filename, 3)
+
+            # index gets rebuilt
+            os.unlink(get_log_index_filename(filename))
+            self.assertEqual(get_log_index(filename), index)
+
+            # or if the log was appended to without it
+            log = DBLog(workflow_execs=[DBWorkflowExec(id=1, user='user3',
+                                                       completed=1)])
+            with open(get_log_index_filename(filename), 'wb') as f:
+                f.write('0\n%d 0.0\n' % index[1])
+            save_log_to_xml(log, filename, do_append=True)
+            log = open_log_from_xml(filename, True)
+            self.assertEqual([wf.db_user for wf in log.db_workflow_execs],
+                             ['user0', 'user1', 'user2', 'user3'])
+            self.assertEqual(
+                    open_workflow_exec_from_xml(filename, 3).db_user,
+                    'user3')
+
+            # or replaced by a log of the same size
+            with open(filename, 'rb') as f:
+                data = f.read()
+            with open(filename, 'wb') as f:
+                f.write(data.replace('user0', 'userA', 1) + ' ' * 10)
+            index = get_log_index(filename)
+            with open(filename, 'wb') as f:
+                f.write(' ' * 10 + data.replace('user0', 'userA', 1))
+            os.utime(filename, (0, 0))
+            self.assertEqual(get_log_index(filename),
+                             [o + 10 for o in index[:-1]] + [index[-1]])
+            self.assertEqual(
+                    open_workflow_exec_from_xml(filename, 0).db_user,
+                    'userA')
+        finally:
+            shutil.rmtree(testdir)
+
+    @unittest.skipIf(sqlite3 is None, "SQLite is not available")
+    def test_sqlite(self):
+        """test saving and loading a vistrail to a SQLite database"""
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        try:
+            config = {'backend': 'sqlite',
+                      'db': os.path.join(testdir, 'vistrails.db')}
+            db_connection = open_db_connection(config)
+            try:
+                setup_db_tables(db_connection)
+                vistrail = open_vistrail_from_xml(
+                    os.path.join(vistrails.core.system.vistrails_root_directory(),
+                                 'tests/resources/dummy.xml'))
+                nb_actions = len(vistrail.db_actions)
+                vistrail = save_vistrail_to_db(vistrail, db_connection, True)
+                vistrail = open_vistrail_from_db(db_connection,
+                                                 vistrail.db_id)
+                self.assertEqual(len(vistrail.db_actions), nb_actions)
+
+                # saving again updates the existing rows
+                vistrail.db_name = 'renamed'
+                vistrail = save_vistrail_to_db(vistrail, db_connection)
+                self.assertEqual(
+                        open_vistrail_from_db(db_connection,
+                                              vistrail.db_id).db_name,
+                        'renamed')
+            finally:
+                close_db_connection(db_connection)
+        finally:
+            shutil.rmtree(testdir)
+
+    def test_sqlite_failed_group(self):
+        """test that a failed group of statements isn't left half-written"""
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        try:
+            config = {'backend': 'sqlite',
+                      'db': os.path.join(testdir, 'vistrails.db')}
+            db_connection = open_db_connection(config)
+            try:
+                setup_db_tables(db_connection)
+                dao = getVersionDAO(currentVersion)['sql'][DBVistrail.vtType]
+                insert = "INSERT INTO vistrail(id, name) VALUES (%s,%s);"
+                dao.executeSQLGroup(db_connection, [(insert, (1, 'first'))],
+                                    False)
+                db_connection.commit()
+                # the second row is a duplicate, the third one isn't written
+                # either
+                with self.assertRaises(VistrailsDBException):
+                    dao.executeSQLGroup(db_connection,
+                                        [(insert, (2, 'second')),
+                                         (insert, (1, 'duplicate')),
+                                         (insert, (3, 'third'))],
+                                        False)
+                self.assertEqual(
+                        dao.executeSQL(db_connection,
+                                       ("SELECT id, name FROM vistrail;", ()),
+                                       True),
+                        [(1, 'first')])
+            finally:
+                close_db_connection(db_connection)
+        finally:
+            shutil.rmtree(testdir)
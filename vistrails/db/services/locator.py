@@ -184,7 +184,7 @@ class BaseLocator(object):
             url = BaseLocator.convert_filename_to_url(url)
         if scheme == 'untitled':
             return UntitledLocator.from_url(url)
-        elif scheme == 'db':
+        elif scheme in ('db', 'sqlite'):
             return DBLocator.from_url(url)
         elif scheme == 'file':
             old_uses_query = urlparse.uses_query
@@ -196,6 +196,8 @@ class BaseLocator(object):
                 return ZIPFileLocator.from_url(url)
             elif path.endswith(".xml"):
                 return XMLFileLocator.from_url(url)
+            elif path.endswith(".vtb"):
+                return BinaryFileLocator.from_url(url)
         return None
 
     @staticmethod
@@ -490,12 +492,12 @@ class XMLFileLocator(SaveTemporariesMixin, BaseLocator):
         self._parameterexploration = kwargs.get('parameterExploration', None)
         self.kwargs = kwargs
 
-    def load(self, type):
+    def load(self, type, lazy=False):
         fname = self.get_temporary()
         if fname:
             obj = io.open_from_xml(fname, type)
         else:
-            obj = io.open_from_xml(self._name, type)
+            obj = io.open_from_xml(self._name, type, lazy)
         obj.locator = self
         return obj
 
@@ -633,6 +635,41 @@ class XMLFileLocator(SaveTemporariesMixin, BaseLocator):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+class BinaryFileLocator(XMLFileLocator):
+    """Files are in the binary format of db.services.io. The
+    temporaries are still in xml"""
+
+    def load(self, type):
+        fname = self.get_temporary()
+        if fname:
+            obj = io.open_from_xml(fname, type)
+        else:
+            obj = io.open_from_bin(self._name, type)
+        obj.locator = self
+        return obj
+
+    def save(self, obj, do_copy=True, version=None):
+        is_bundle = False
+        if type(obj) == type(SaveBundle(None)):
+            is_bundle = True
+            save_bundle = obj
+            obj = save_bundle.get_primary_obj()
+        obj = io.save_to_bin(obj, self._name, version)
+        obj.locator = self
+        # Only remove the temporaries if save succeeded!
+        self.clean_temporaries()
+        if is_bundle:
+            return SaveBundle(save_bundle.bundle_type, obj)
+        return obj
+
+    ###########################################################################
+    # Operators
+
+    def __eq__(self, other):
+        if not isinstance(other, BinaryFileLocator):
+            return False
+        return self._name == other._name
+
 class ZIPFileLocator(XMLFileLocator):
     """Files are compressed in zip format. The temporaries are
     still in xml"""
@@ -640,14 +677,16 @@ class ZIPFileLocator(XMLFileLocator):
         XMLFileLocator.__init__(self, filename, **kwargs)
         self.tmp_dir = None
 
-    def load(self, type):
+    def load(self, type, lazy=False):
         fname = self.get_temporary()
         if fname:
             from vistrails.db.domain import DBVistrail
             obj = io.open_from_xml(fname, type)
             return SaveBundle(DBVistrail.vtType, obj)
         else:
-            (save_bundle, tmp_dir) = io.open_bundle_from_zip_xml(type, self._name)
+            (save_bundle, tmp_dir) = io.open_bundle_from_zip_xml(type,
+                                                                 self._name,
+                                                                 lazy)
             self.tmp_dir = tmp_dir
             for obj in save_bundle.get_db_objs():
                 obj.locator = self
@@ -725,6 +764,12 @@ class ZIPFileLocator(XMLFileLocator):
 #     def load(self, type):
         
 class DBLocator(BaseLocator):
+    """Locator for objects stored in a database.
+
+    By default this is a MySQL server. If the 'backend' keyword argument is
+    'sqlite', database is the path of a SQLite database file instead, and
+    host, port, user and passwd are ignored.
+    """
     cache = {}
     cache_timestamps = {}
     connections = {}
@@ -732,8 +777,9 @@ class DBLocator(BaseLocator):
         
     def __init__(self, host, port, database, user, passwd, name=None,
                  **kwargs):
+        self._backend = kwargs.pop('backend', 'mysql')
         self._host = host
-        self._port = int(port)
+        self._port = int(port or 0)
         self._db = database
         self._user = user
         self._passwd = passwd
@@ -763,6 +809,10 @@ class DBLocator(BaseLocator):
     def _get_db(self):
         return self._db
     db = property(_get_db)
+
+    def _get_backend(self):
+        return self._backend
+    backend = property(_get_backend)
     
     def _get_obj_id(self):
         return self._obj_id
@@ -826,11 +876,15 @@ class DBLocator(BaseLocator):
                     self._conn_id = 1
                 else:
                     self._conn_id = max(DBLocator.connections.keys()) + 1
-        config = {'host': self._host,
-                  'port': self._port,
-                  'db': self._db,
-                  'user': self._user,
-                  'passwd': self._passwd}
+        if self._backend == 'sqlite':
+            config = {'backend': 'sqlite',
+                      'db': self._db}
+        else:
+            config = {'host': self._host,
+                      'port': self._port,
+                      'db': self._db,
+                      'user': self._user,
+                      'passwd': self._passwd}
         #print "config:", config
         connection = io.open_db_connection(config)
             
@@ -912,6 +966,8 @@ class DBLocator(BaseLocator):
         locator.setAttribute('host', str(self._host))
         locator.setAttribute('port', str(self._port))
         locator.setAttribute('db', str(self._db))
+        if self._backend != 'mysql':
+            locator.setAttribute('backend', self._backend)
         locator.setAttribute('vt_id', str(self._obj_id))
         node = dom.createElement('name')
         filename = dom.createTextNode(str(self._name))
@@ -930,6 +986,7 @@ class DBLocator(BaseLocator):
             host = str(element.getAttribute('host'))
             port = int(element.getAttribute('port'))
             database = str(element.getAttribute('db'))
+            backend = str(element.getAttribute('backend')) or 'mysql'
             vt_id = str(element.getAttribute('vt_id'))
             user = ""
             passwd = ""
@@ -938,13 +995,20 @@ class DBLocator(BaseLocator):
                     name = str(n.firstChild.nodeValue).strip(" \n\t")
                     #print host, port, database, name, vt_id
                     return DBLocator(host, port, database,
-                                     user, passwd, name, obj_id=vt_id)
+                                     user, passwd, name, obj_id=vt_id,
+                                     backend=backend)
             return None
         else:
             return None
     
     @staticmethod
     def from_url(url):
+        if url.startswith('sqlite://'):
+            # sqlite:///path/to/file.db?args
+            path, _, args_str = url[len('sqlite://'):].partition('?')
+            kwargs = BaseLocator.parse_args(args_str)
+            return DBLocator('', 0, urllib.unquote(str(path)), '', '',
+                             backend='sqlite', **kwargs)
         format = re.compile(
                 r"^"
                 "([a-zA-Z0-9_-]+)://"   # scheme
@@ -970,10 +1034,13 @@ class DBLocator(BaseLocator):
             return DBLocator(host, port, db_name, user, passwd, **kwargs)
     
     def to_url(self):
-        # FIXME may also want to allow database type to be encoded in 
-        # scheme (ie mysql://host/db, sqlite3://path/to)
-        net_loc = '%s:%s' % (self._host, self._port)
         args_str = BaseLocator.generate_args(self.kwargs)
+        if self._backend == 'sqlite':
+            url = 'sqlite://' + urllib.quote(self._db)
+            if args_str:
+                url += '?' + args_str
+            return url
+        net_loc = '%s:%s' % (self._host, self._port)
         # query_str = '%s=%s' % (self._obj_type, self._obj_id)
         url_tuple = ('db', net_loc, urllib.quote(self._db, ''), args_str, '')
         return urlparse.urlunsplit(url_tuple)
@@ -990,6 +1057,8 @@ class DBLocator(BaseLocator):
         node.set('host', str(self._host))
         node.set('port', str(self._port))
         node.set('db', str(self._db))
+        if self._backend != 'mysql':
+            node.set('backend', self._backend)
         node.set('vt_id', str(self._obj_id))
         node.set('user', str(self._user))
         if include_name:
@@ -1043,6 +1112,8 @@ class DBLocator(BaseLocator):
             port = convert_from_str(data,'int')
             data = node.get('db', None)
             database = convert_from_str(data,'str')
+            data = node.get('backend', 'mysql')
+            backend = convert_from_str(data, 'str')
             data = node.get('vt_id')
             vt_id = convert_from_str(data, 'str')
             data = node.get('user')
@@ -1054,7 +1125,8 @@ class DBLocator(BaseLocator):
                     if child.tag == 'name':
                         name = str(child.text).strip(" \n\t")
             return DBLocator(host, port, database,
-                             user, passwd, name, obj_id=vt_id, obj_type='vistrail')
+                             user, passwd, name, obj_id=vt_id, obj_type='vistrail',
+                             backend=backend)
         else:
             return None
 
@@ -1069,7 +1141,8 @@ vistrail_name="%s"/>' % ( self._host, self._port, self._db,
     def __eq__(self, other):
         if type(other) != type(self):
             return False
-        return (self._host == other._host and
+        return (self._backend == other._backend and
+                self._host == other._host and
                 self._port == other._port and
                 self._db == other._db and
                 self._user == other._user and
@@ -1170,6 +1243,14 @@ class TestLocators(unittest.TestCase):
         self.assertEqual(loc.short_filename, "test_parse_xml_file \xE9 \xEA")
         self.assertEqual(loc.to_url(), loc_str)
 
+    def test_parse_bin_file(self):
+        loc_str = self.path2url(
+                "/vistrails/tmp/test_parse_bin_file \xE9 \xEA.vtb")
+        loc = BaseLocator.from_url(loc_str)
+        self.assertIsInstance(loc, BinaryFileLocator)
+        self.assertEqual(loc.short_filename, "test_parse_bin_file \xE9 \xEA")
+        self.assertEqual(loc.to_url(), loc_str)
+
     def test_short_names(self):
         enc = sys.getfilesystemencoding() or locale.getpreferredencoding()
         if (enc.lower() not in ('mbcs', 'utf-8', 'utf8',
@@ -1226,6 +1307,16 @@ class TestLocators(unittest.TestCase):
         self.assertEqual(loc._db, "vistrails")
         self.assertEqual(loc.to_url(), loc_str)
 
+    def test_parse_sqlite(self):
+        loc_str = "sqlite:///tmp/vistrails.db?workflow=42"
+        loc = BaseLocator.from_url(loc_str)
+        self.assertIsInstance(loc, DBLocator)
+        self.assertEqual(loc.backend, 'sqlite')
+        self.assertEqual(loc.kwargs['version_node'], 42)
+        self.assertEqual(loc._db, "/tmp/vistrails.db")
+        self.assertEqual(loc.to_url(), loc_str)
+        self.assertEqual(DBLocator.from_xml(loc.to_xml()).backend, 'sqlite')
+
     def test_parse_bad_url(self):
         loc_str = "http://blah.com/"
         loc = BaseLocator.from_url(loc_str)
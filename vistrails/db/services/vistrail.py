@@ -35,7 +35,7 @@
 from vistrails.db.domain import DBWorkflow, DBAdd, DBDelete, DBAction, DBAbstraction, \
     DBModule, DBConnection, DBPort, DBFunction, DBParameter, DBGroup
 from vistrails.db.services.action_chain import getActionChain, getCurrentOperationDict, \
-    getCurrentOperations, simplify_ops
+    getCurrentOperations, getOperationDict, simplify_ops
 from vistrails.db import VistrailsDBException
 
 import copy
@@ -73,8 +73,10 @@ def materializeWorkflow(vistrail, version):
         workflow = DBWorkflow()
         #for action in getActionChain(vistrail, version):
         #    oldPerformAction(action, workflow)
-        performActions(getActionChain(vistrail, version), 
-                            workflow)
+        # replay from the nearest checkpoint instead of the root
+        operations = getOperationDict(vistrail, version).values()
+        operations.sort(key=lambda x: x.db_id)
+        performAdds(operations, workflow)
         workflow.db_id = version
         workflow.db_vistrailId = vistrail.db_id
         return workflow
@@ -639,8 +641,7 @@ def normalOperations(adds, deletes, do_copy=False):
 
 def getPathAsAction(vistrail, v1, v2, do_copy=False):
     sharedRoot = getSharedRoot(vistrail, [v1, v2])
-    sharedActionChain = getActionChain(vistrail, sharedRoot)
-    sharedOperationDict = getCurrentOperationDict(sharedActionChain)
+    sharedOperationDict = getOperationDict(vistrail, sharedRoot)
     v1Actions = getActionChain(vistrail, v1, sharedRoot)
     v2Actions = getActionChain(vistrail, v2, sharedRoot)
     (v1AddDict, v1DeleteDict) = getOperationDiff(v1Actions, 
@@ -703,8 +704,7 @@ def addAndFixActions(startDict, actions):
     return curDict
 
 def fixActions(vistrail, v, actions):
-    startingChain = getActionChain(vistrail, v)
-    startingDict = getCurrentOperationDict(startingChain)
+    startingDict = getOperationDict(vistrail, v)
     addAndFixActions(startingDict, actions)
     
 ################################################################################
@@ -794,8 +794,7 @@ def getObjects(actions):
 
 def getVersionDifferences(vistrail, versions):
     sharedRoot = getSharedRoot(vistrail, versions)
-    sharedActionChain = getActionChain(vistrail, sharedRoot)
-    sharedOperationDict = getCurrentOperationDict(sharedActionChain)
+    sharedOperationDict = getOperationDict(vistrail, sharedRoot)
 
     vOnlySorted = []
     for v in versions:
@@ -1627,5 +1626,31 @@ class TestDBVistrailService(unittest.TestCase):
         # test parameter change inequality
         assert heuristicModuleMatch(module1, module5) == 0
 
+    def test_checkpoints(self):
+        from vistrails.db.services.action_chain import CheckpointIndex
+        from vistrails.db.services.io import open_vistrail_from_xml
+        vistrail = open_vistrail_from_xml(
+                vistrails.core.system.vistrails_root_directory() +
+                '/tests/resources/test_change_vistrail.xml')
+        index = CheckpointIndex(interval=4, max_operations=2000)
+        versions = sorted(action.db_id for action in vistrail.db_actions)
+        for version in versions + list(reversed(versions)):
+            expected = getCurrentOperationDict(
+                    getActionChain(vistrail, version))
+            self.assertEqual(index.get_operation_dict(vistrail, version),
+                             expected)
+        self.assertGreater(index.hits, 0)
+        self.assertLessEqual(index._size, 2000)
+
+        # materializing uses the checkpoints
+        version = versions[-1]
+        workflow = materializeWorkflow(vistrail, version)
+        expected = DBWorkflow()
+        performActions(getActionChain(vistrail, version), expected)
+        self.assertEqual(sorted(workflow.db_modules_id_index),
+                         sorted(expected.db_modules_id_index))
+        self.assertEqual(sorted(workflow.db_connections_id_index),
+                         sorted(expected.db_connections_id_index))
+
 if __name__ == '__main__':
     unittest.main()
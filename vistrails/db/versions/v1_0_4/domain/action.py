@@ -0,0 +1,95 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+
+from auto_gen import DBAction as _DBAction
+
+class DBAction(_DBAction):
+    """DBAction whose operations can be read from a file on first access.
+
+    open_from_xml_lazy() builds actions without their operations and
+    hands them a loader; the operations are then parsed the first time
+    any of the attributes in _lazy_attributes is looked up.
+
+    """
+
+    _lazy_attributes = frozenset(['_db_operations', 'db_operations_id_index',
+                                  'db_deleted_operations'])
+    _operations_loader = None
+
+    def __copy__(self):
+        return DBAction.do_copy(self)
+
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+        cp = _DBAction.do_copy(self, new_ids, id_scope, id_remap)
+        cp.__class__ = DBAction
+        return cp
+
+    def __getattr__(self, name):
+        # only called when the attribute is missing, i.e. when the
+        # operations have not been read yet
+        loader = self._operations_loader
+        if loader is None or name not in DBAction._lazy_attributes:
+            raise AttributeError(name)
+        self._operations_loader = None
+        loader.load_operations(self)
+        self.db_operations_loaded()
+        return getattr(self, name)
+
+    def db_set_operations_loader(self, loader):
+        """db_set_operations_loader(loader) -> None
+
+        Drops the operations of this action; they will be obtained from
+        loader.load_operations(action) when they are first needed.
+
+        """
+        for name in DBAction._lazy_attributes:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                # not set, or a property over a slot (deleted lists)
+                pass
+        self._operations_loader = loader
+
+    def db_has_operations_loaded(self):
+        return self._operations_loader is None
+
+    def db_operations_loaded(self):
+        """db_operations_loaded() -> None
+
+        Called after the operations have been read on demand; subclasses
+        convert them here.
+
+        """
+        pass
@@ -41,19 +41,34 @@ class DBOpmWasGeneratedBy(object):
 
     vtType = 'opm_was_generated_by'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_effect',
+                 '_db_effect',
+                 '_db_deleted_role',
+                 '_db_role',
+                 '_db_deleted_cause',
+                 '_db_cause',
+                 '_db_deleted_accounts',
+                 '_db_accounts',
+                 '_db_deleted_opm_times',
+                 '_db_opm_times',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, opm_times=None):
-        self.db_deleted_effect = []
+        self._db_deleted_effect = None
         self._db_effect = effect
-        self.db_deleted_role = []
+        self._db_deleted_role = None
         self._db_role = role
-        self.db_deleted_cause = []
+        self._db_deleted_cause = None
         self._db_cause = cause
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_opm_times = []
+        self._db_deleted_opm_times = None
         if opm_times is None:
             self._db_opm_times = []
         else:
@@ -191,17 +206,22 @@ class DBOpmWasGeneratedBy(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_times)
+        if self._db_deleted_effect is not None:
+            children.extend(self._db_deleted_effect)
+        if self._db_deleted_role is not None:
+            children.extend(self._db_deleted_role)
+        if self._db_deleted_cause is not None:
+            children.extend(self._db_deleted_cause)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_opm_times is not None:
+            children.extend(self._db_deleted_opm_times)
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_times = []
+            self._db_deleted_effect = None
+            self._db_deleted_role = None
+            self._db_deleted_cause = None
+            self._db_deleted_accounts = None
+            self._db_deleted_opm_times = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -225,6 +245,13 @@ class DBOpmWasGeneratedBy(object):
         self._db_effect = effect
         self.is_dirty = True
     db_effect = property(__get_db_effect, __set_db_effect)
+    def __get_db_deleted_effect(self):
+        if self._db_deleted_effect is None:
+            self._db_deleted_effect = []
+        return self._db_deleted_effect
+    def __set_db_deleted_effect(self, deleted):
+        self._db_deleted_effect = deleted
+    db_deleted_effect = property(__get_db_deleted_effect, __set_db_deleted_effect)
     def db_add_effect(self, effect):
         self._db_effect = effect
     def db_change_effect(self, effect):
@@ -240,6 +267,13 @@ class DBOpmWasGeneratedBy(object):
         self._db_role = role
         self.is_dirty = True
     db_role = property(__get_db_role, __set_db_role)
+    def __get_db_deleted_role(self):
+        if self._db_deleted_role is None:
+            self._db_deleted_role = []
+        return self._db_deleted_role
+    def __set_db_deleted_role(self, deleted):
+        self._db_deleted_role = deleted
+    db_deleted_role = property(__get_db_deleted_role, __set_db_deleted_role)
     def db_add_role(self, role):
         self._db_role = role
     def db_change_role(self, role):
@@ -255,6 +289,13 @@ class DBOpmWasGeneratedBy(object):
         self._db_cause = cause
         self.is_dirty = True
     db_cause = property(__get_db_cause, __set_db_cause)
+    def __get_db_deleted_cause(self):
+        if self._db_deleted_cause is None:
+            self._db_deleted_cause = []
+        return self._db_deleted_cause
+    def __set_db_deleted_cause(self, deleted):
+        self._db_deleted_cause = deleted
+    db_deleted_cause = property(__get_db_deleted_cause, __set_db_deleted_cause)
     def db_add_cause(self, cause):
         self._db_cause = cause
     def db_change_cause(self, cause):
@@ -270,6 +311,13 @@ class DBOpmWasGeneratedBy(object):
         self._db_accounts = accounts
         self.is_dirty = True
     db_accounts = property(__get_db_accounts, __set_db_accounts)
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     def db_get_accounts(self):
         return self._db_accounts
     def db_add_account(self, account):
@@ -290,6 +338,13 @@ class DBOpmWasGeneratedBy(object):
         self._db_opm_times = opm_times
         self.is_dirty = True
     db_opm_times = property(__get_db_opm_times, __set_db_opm_times)
+    def __get_db_deleted_opm_times(self):
+        if self._db_deleted_opm_times is None:
+            self._db_deleted_opm_times = []
+        return self._db_deleted_opm_times
+    def __set_db_deleted_opm_times(self, deleted):
+        self._db_deleted_opm_times = deleted
+    db_deleted_opm_times = property(__get_db_deleted_opm_times, __set_db_deleted_opm_times)
     def db_get_opm_times(self):
         return self._db_opm_times
     def db_add_opm_time(self, opm_time):
@@ -310,8 +365,16 @@ class DBConfigKey(object):
 
     vtType = 'config_key'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_value',
+                 '_db_value',
+                 '_db_name',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, value=None, name=None):
-        self.db_deleted_value = []
+        self._db_deleted_value = None
         self._db_value = value
         self._db_name = name
         self.is_dirty = True
@@ -398,9 +461,10 @@ class DBConfigKey(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
+        if self._db_deleted_value is not None:
+            children.extend(self._db_deleted_value)
         if remove:
-            self.db_deleted_value = []
+            self._db_deleted_value = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -414,6 +478,13 @@ class DBConfigKey(object):
         self._db_value = value
         self.is_dirty = True
     db_value = property(__get_db_value, __set_db_value)
+    def __get_db_deleted_value(self):
+        if self._db_deleted_value is None:
+            self._db_deleted_value = []
+        return self._db_deleted_value
+    def __set_db_deleted_value(self, deleted):
+        self._db_deleted_value = deleted
+    db_deleted_value = property(__get_db_deleted_value, __set_db_deleted_value)
     def db_add_value(self, value):
         self._db_value = value
     def db_change_value(self, value):
@@ -443,10 +514,19 @@ class DBMashupAlias(object):
 
     vtType = 'mashup_alias'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_name',
+                 '_db_deleted_component',
+                 '_db_component',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, name=None, component=None):
         self._db_id = id
         self._db_name = name
-        self.db_deleted_component = []
+        self._db_deleted_component = None
         self._db_component = component
         self.is_dirty = True
         self.is_new = True
@@ -516,9 +596,10 @@ class DBMashupAlias(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_component)
+        if self._db_deleted_component is not None:
+            children.extend(self._db_deleted_component)
         if remove:
-            self.db_deleted_component = []
+            self._db_deleted_component = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -558,6 +639,13 @@ class DBMashupAlias(object):
         self._db_component = component
         self.is_dirty = True
     db_component = property(__get_db_component, __set_db_component)
+    def __get_db_deleted_component(self):
+        if self._db_deleted_component is None:
+            self._db_deleted_component = []
+        return self._db_deleted_component
+    def __set_db_deleted_component(self, deleted):
+        self._db_deleted_component = deleted
+    db_deleted_component = property(__get_db_deleted_component, __set_db_deleted_component)
     def db_add_component(self, component):
         self._db_component = component
     def db_change_component(self, component):
@@ -1072,24 +1160,41 @@ class DBOpmWasControlledBy(object):
 
     vtType = 'opm_was_controlled_by'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_effect',
+                 '_db_effect',
+                 '_db_deleted_role',
+                 '_db_role',
+                 '_db_deleted_cause',
+                 '_db_cause',
+                 '_db_deleted_accounts',
+                 '_db_accounts',
+                 '_db_deleted_starts',
+                 '_db_starts',
+                 '_db_deleted_ends',
+                 '_db_ends',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, starts=None, ends=None):
-        self.db_deleted_effect = []
+        self._db_deleted_effect = None
         self._db_effect = effect
-        self.db_deleted_role = []
+        self._db_deleted_role = None
         self._db_role = role
-        self.db_deleted_cause = []
+        self._db_deleted_cause = None
         self._db_cause = cause
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_starts = []
+        self._db_deleted_starts = None
         if starts is None:
             self._db_starts = []
         else:
             self._db_starts = starts
-        self.db_deleted_ends = []
+        self._db_deleted_ends = None
         if ends is None:
             self._db_ends = []
         else:
@@ -1249,19 +1354,25 @@ class DBOpmWasControlledBy(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_starts)
-        children.extend(self.db_deleted_ends)
+        if self._db_deleted_effect is not None:
+            children.extend(self._db_deleted_effect)
+        if self._db_deleted_role is not None:
+            children.extend(self._db_deleted_role)
+        if self._db_deleted_cause is not None:
+            children.extend(self._db_deleted_cause)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_starts is not None:
+            children.extend(self._db_deleted_starts)
+        if self._db_deleted_ends is not None:
+            children.extend(self._db_deleted_ends)
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_starts = []
-            self.db_deleted_ends = []
+            self._db_deleted_effect = None
+            self._db_deleted_role = None
+            self._db_deleted_cause = None
+            self._db_deleted_accounts = None
+            self._db_deleted_starts = None
+            self._db_deleted_ends = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -1288,6 +1399,13 @@ class DBOpmWasControlledBy(object):
         self._db_effect = effect
         self.is_dirty = True
     db_effect = property(__get_db_effect, __set_db_effect)
+    def __get_db_deleted_effect(self):
+        if self._db_deleted_effect is None:
+            self._db_deleted_effect = []
+        return self._db_deleted_effect
+    def __set_db_deleted_effect(self, deleted):
+        self._db_deleted_effect = deleted
+    db_deleted_effect = property(__get_db_deleted_effect, __set_db_deleted_effect)
     def db_add_effect(self, effect):
         self._db_effect = effect
     def db_change_effect(self, effect):
@@ -1303,6 +1421,13 @@ class DBOpmWasControlledBy(object):
         self._db_role = role
         self.is_dirty = True
     db_role = property(__get_db_role, __set_db_role)
+    def __get_db_deleted_role(self):
+        if self._db_deleted_role is None:
+            self._db_deleted_role = []
+        return self._db_deleted_role
+    def __set_db_deleted_role(self, deleted):
+        self._db_deleted_role = deleted
+    db_deleted_role = property(__get_db_deleted_role, __set_db_deleted_role)
     def db_add_role(self, role):
         self._db_role = role
     def db_change_role(self, role):
@@ -1318,6 +1443,13 @@ class DBOpmWasControlledBy(object):
         self._db_cause = cause
         self.is_dirty = True
     db_cause = property(__get_db_cause, __set_db_cause)
+    def __get_db_deleted_cause(self):
+        if self._db_deleted_cause is None:
+            self._db_deleted_cause = []
+        return self._db_deleted_cause
+    def __set_db_deleted_cause(self, deleted):
+        self._db_deleted_cause = deleted
+    db_deleted_cause = property(__get_db_deleted_cause, __set_db_deleted_cause)
     def db_add_cause(self, cause):
         self._db_cause = cause
     def db_change_cause(self, cause):
@@ -1333,6 +1465,13 @@ class DBOpmWasControlledBy(object):
         self._db_accounts = accounts
         self.is_dirty = True
     db_accounts = property(__get_db_accounts, __set_db_accounts)
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     def db_get_accounts(self):
         return self._db_accounts
     def db_add_account(self, account):
@@ -1353,6 +1492,13 @@ class DBOpmWasControlledBy(object):
         self._db_starts = starts
         self.is_dirty = True
     db_starts = property(__get_db_starts, __set_db_starts)
+    def __get_db_deleted_starts(self):
+        if self._db_deleted_starts is None:
+            self._db_deleted_starts = []
+        return self._db_deleted_starts
+    def __set_db_deleted_starts(self, deleted):
+        self._db_deleted_starts = deleted
+    db_deleted_starts = property(__get_db_deleted_starts, __set_db_deleted_starts)
     def db_get_starts(self):
         return self._db_starts
     def db_add_start(self, start):
@@ -1373,6 +1519,13 @@ class DBOpmWasControlledBy(object):
         self._db_ends = ends
         self.is_dirty = True
     db_ends = property(__get_db_ends, __set_db_ends)
+    def __get_db_deleted_ends(self):
+        if self._db_deleted_ends is None:
+            self._db_deleted_ends = []
+        return self._db_deleted_ends
+    def __set_db_deleted_ends(self, deleted):
+        self._db_deleted_ends = deleted
+    db_deleted_ends = property(__get_db_deleted_ends, __set_db_deleted_ends)
     def db_get_ends(self):
         return self._db_ends
     def db_add_end(self, end):
@@ -1393,8 +1546,20 @@ class DBAdd(object):
 
     vtType = 'add'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_data',
+                 '_db_data',
+                 '_db_id',
+                 '_db_what',
+                 '_db_objectId',
+                 '_db_parentObjId',
+                 '_db_parentObjType',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, data=None, id=None, what=None, objectId=None, parentObjId=None, parentObjType=None):
-        self.db_deleted_data = []
+        self._db_deleted_data = None
         self._db_data = data
         self._db_id = id
         self._db_what = what
@@ -1553,9 +1718,10 @@ class DBAdd(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_data)
+        if self._db_deleted_data is not None:
+            children.extend(self._db_deleted_data)
         if remove:
-            self.db_deleted_data = []
+            self._db_deleted_data = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -1569,6 +1735,13 @@ class DBAdd(object):
         self._db_data = data
         self.is_dirty = True
     db_data = property(__get_db_data, __set_db_data)
+    def __get_db_deleted_data(self):
+        if self._db_deleted_data is None:
+            self._db_deleted_data = []
+        return self._db_deleted_data
+    def __set_db_deleted_data(self, deleted):
+        self._db_deleted_data = deleted
+    db_deleted_data = property(__get_db_deleted_data, __set_db_deleted_data)
     def db_add_data(self, data):
         self._db_data = data
     def db_change_data(self, data):
@@ -1650,10 +1823,20 @@ class DBProvGeneration(object):
 
     vtType = 'prov_generation'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_prov_entity',
+                 '_db_prov_entity',
+                 '_db_deleted_prov_activity',
+                 '_db_prov_activity',
+                 '_db_prov_role',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, prov_entity=None, prov_activity=None, prov_role=None):
-        self.db_deleted_prov_entity = []
+        self._db_deleted_prov_entity = None
         self._db_prov_entity = prov_entity
-        self.db_deleted_prov_activity = []
+        self._db_deleted_prov_activity = None
         self._db_prov_activity = prov_activity
         self._db_prov_role = prov_role
         self.is_dirty = True
@@ -1734,11 +1917,13 @@ class DBProvGeneration(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_prov_entity)
-        children.extend(self.db_deleted_prov_activity)
+        if self._db_deleted_prov_entity is not None:
+            children.extend(self._db_deleted_prov_entity)
+        if self._db_deleted_prov_activity is not None:
+            children.extend(self._db_deleted_prov_activity)
         if remove:
-            self.db_deleted_prov_entity = []
-            self.db_deleted_prov_activity = []
+            self._db_deleted_prov_entity = None
+            self._db_deleted_prov_activity = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -1754,6 +1939,13 @@ class DBProvGeneration(object):
         self._db_prov_entity = prov_entity
         self.is_dirty = True
     db_prov_entity = property(__get_db_prov_entity, __set_db_prov_entity)
+    def __get_db_deleted_prov_entity(self):
+        if self._db_deleted_prov_entity is None:
+            self._db_deleted_prov_entity = []
+        return self._db_deleted_prov_entity
+    def __set_db_deleted_prov_entity(self, deleted):
+        self._db_deleted_prov_entity = deleted
+    db_deleted_prov_entity = property(__get_db_deleted_prov_entity, __set_db_deleted_prov_entity)
     def db_add_prov_entity(self, prov_entity):
         self._db_prov_entity = prov_entity
     def db_change_prov_entity(self, prov_entity):
@@ -1769,6 +1961,13 @@ class DBProvGeneration(object):
         self._db_prov_activity = prov_activity
         self.is_dirty = True
     db_prov_activity = property(__get_db_prov_activity, __set_db_prov_activity)
+    def __get_db_deleted_prov_activity(self):
+        if self._db_deleted_prov_activity is None:
+            self._db_deleted_prov_activity = []
+        return self._db_deleted_prov_activity
+    def __set_db_deleted_prov_activity(self, deleted):
+        self._db_deleted_prov_activity = deleted
+    db_deleted_prov_activity = property(__get_db_deleted_prov_activity, __set_db_deleted_prov_activity)
     def db_add_prov_activity(self, prov_activity):
         self._db_prov_activity = prov_activity
     def db_change_prov_activity(self, prov_activity):
@@ -1797,19 +1996,34 @@ class DBOpmUsed(object):
 
     vtType = 'opm_used'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_effect',
+                 '_db_effect',
+                 '_db_deleted_role',
+                 '_db_role',
+                 '_db_deleted_cause',
+                 '_db_cause',
+                 '_db_deleted_accounts',
+                 '_db_accounts',
+                 '_db_deleted_opm_times',
+                 '_db_opm_times',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, opm_times=None):
-        self.db_deleted_effect = []
+        self._db_deleted_effect = None
         self._db_effect = effect
-        self.db_deleted_role = []
+        self._db_deleted_role = None
         self._db_role = role
-        self.db_deleted_cause = []
+        self._db_deleted_cause = None
         self._db_cause = cause
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_opm_times = []
+        self._db_deleted_opm_times = None
         if opm_times is None:
             self._db_opm_times = []
         else:
@@ -1947,17 +2161,22 @@ class DBOpmUsed(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_times)
+        if self._db_deleted_effect is not None:
+            children.extend(self._db_deleted_effect)
+        if self._db_deleted_role is not None:
+            children.extend(self._db_deleted_role)
+        if self._db_deleted_cause is not None:
+            children.extend(self._db_deleted_cause)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_opm_times is not None:
+            children.extend(self._db_deleted_opm_times)
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_times = []
+            self._db_deleted_effect = None
+            self._db_deleted_role = None
+            self._db_deleted_cause = None
+            self._db_deleted_accounts = None
+            self._db_deleted_opm_times = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -1981,6 +2200,13 @@ class DBOpmUsed(object):
         self._db_effect = effect
         self.is_dirty = True
     db_effect = property(__get_db_effect, __set_db_effect)
+    def __get_db_deleted_effect(self):
+        if self._db_deleted_effect is None:
+            self._db_deleted_effect = []
+        return self._db_deleted_effect
+    def __set_db_deleted_effect(self, deleted):
+        self._db_deleted_effect = deleted
+    db_deleted_effect = property(__get_db_deleted_effect, __set_db_deleted_effect)
     def db_add_effect(self, effect):
         self._db_effect = effect
     def db_change_effect(self, effect):
@@ -1996,6 +2222,13 @@ class DBOpmUsed(object):
         self._db_role = role
         self.is_dirty = True
     db_role = property(__get_db_role, __set_db_role)
+    def __get_db_deleted_role(self):
+        if self._db_deleted_role is None:
+            self._db_deleted_role = []
+        return self._db_deleted_role
+    def __set_db_deleted_role(self, deleted):
+        self._db_deleted_role = deleted
+    db_deleted_role = property(__get_db_deleted_role, __set_db_deleted_role)
     def db_add_role(self, role):
         self._db_role = role
     def db_change_role(self, role):
@@ -2011,6 +2244,13 @@ class DBOpmUsed(object):
         self._db_cause = cause
         self.is_dirty = True
     db_cause = property(__get_db_cause, __set_db_cause)
+    def __get_db_deleted_cause(self):
+        if self._db_deleted_cause is None:
+            self._db_deleted_cause = []
+        return self._db_deleted_cause
+    def __set_db_deleted_cause(self, deleted):
+        self._db_deleted_cause = deleted
+    db_deleted_cause = property(__get_db_deleted_cause, __set_db_deleted_cause)
     def db_add_cause(self, cause):
         self._db_cause = cause
     def db_change_cause(self, cause):
@@ -2026,6 +2266,13 @@ class DBOpmUsed(object):
         self._db_accounts = accounts
         self.is_dirty = True
     db_accounts = property(__get_db_accounts, __set_db_accounts)
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     def db_get_accounts(self):
         return self._db_accounts
     def db_add_account(self, account):
@@ -2046,6 +2293,13 @@ class DBOpmUsed(object):
         self._db_opm_times = opm_times
         self.is_dirty = True
     db_opm_times = property(__get_db_opm_times, __set_db_opm_times)
+    def __get_db_deleted_opm_times(self):
+        if self._db_deleted_opm_times is None:
+            self._db_deleted_opm_times = []
+        return self._db_deleted_opm_times
+    def __set_db_deleted_opm_times(self, deleted):
+        self._db_deleted_opm_times = deleted
+    db_deleted_opm_times = property(__get_db_deleted_opm_times, __set_db_deleted_opm_times)
     def db_get_opm_times(self):
         return self._db_opm_times
     def db_add_opm_time(self, opm_time):
@@ -2066,6 +2320,12 @@ class DBOpmArtifactIdCause(object):
 
     vtType = 'opm_artifact_id_cause'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -2138,6 +2398,12 @@ class DBRefProvEntity(object):
 
     vtType = 'ref_prov_entity'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_prov_ref',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -2210,6 +2476,18 @@ class DBVtConnection(object):
 
     vtType = 'vt_connection'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_vt_source',
+                 '_db_vt_dest',
+                 '_db_vt_source_port',
+                 '_db_vt_dest_port',
+                 '_db_vt_source_signature',
+                 '_db_vt_dest_signature',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, vt_source=None, vt_dest=None, vt_source_port=None, vt_dest_port=None, vt_source_signature=None, vt_dest_signature=None):
         self._db_id = id
         self._db_vt_source = vt_source
@@ -2401,6 +2679,13 @@ class DBOpmAccount(object):
 
     vtType = 'opm_account'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_value',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, value=None):
         self._db_id = id
         self._db_value = value
@@ -2492,8 +2777,29 @@ class DBGroupExec(object):
 
     vtType = 'group_exec'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_item_execs',
+                 'db_item_execs_id_index',
+                 '_db_item_execs',
+                 '_db_id',
+                 '_db_ts_start',
+                 '_db_ts_end',
+                 '_db_cached',
+                 '_db_module_id',
+                 '_db_group_name',
+                 '_db_group_type',
+                 '_db_completed',
+                 '_db_error',
+                 '_db_machine_id',
+                 '_db_deleted_annotations',
+                 'db_annotations_id_index',
+                 '_db_annotations',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, item_execs=None, id=None, ts_start=None, ts_end=None, cached=None, module_id=None, group_name=None, group_type=None, completed=None, error=None, machine_id=None, annotations=None):
-        self.db_deleted_item_execs = []
+        self._db_deleted_item_execs = None
         self.db_item_execs_id_index = {}
         if item_execs is None:
             self._db_item_execs = []
@@ -2511,7 +2817,7 @@ class DBGroupExec(object):
         self._db_completed = completed
         self._db_error = error
         self._db_machine_id = machine_id
-        self.db_deleted_annotations = []
+        self._db_deleted_annotations = None
         self.db_annotations_id_index = {}
         if annotations is None:
             self._db_annotations = []
@@ -2681,11 +2987,13 @@ class DBGroupExec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_item_execs)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_item_execs is not None:
+            children.extend(self._db_deleted_item_execs)
         if remove:
-            self.db_deleted_annotations = []
-            self.db_deleted_item_execs = []
+            self._db_deleted_annotations = None
+            self._db_deleted_item_execs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -2703,6 +3011,13 @@ class DBGroupExec(object):
         self._db_item_execs = item_execs
         self.is_dirty = True
     db_item_execs = property(__get_db_item_execs, __set_db_item_execs)
+    def __get_db_deleted_item_execs(self):
+        if self._db_deleted_item_execs is None:
+            self._db_deleted_item_execs = []
+        return self._db_deleted_item_execs
+    def __set_db_deleted_item_execs(self, deleted):
+        self._db_deleted_item_execs = deleted
+    db_deleted_item_execs = property(__get_db_deleted_item_execs, __set_db_deleted_item_execs)
     def db_get_item_execs(self):
         return self._db_item_execs
     def db_add_item_exec(self, item_exec):
@@ -2875,6 +3190,13 @@ class DBGroupExec(object):
         self._db_annotations = annotations
         self.is_dirty = True
     db_annotations = property(__get_db_annotations, __set_db_annotations)
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
     def db_get_annotations(self):
         return self._db_annotations
     def db_add_annotation(self, annotation):
@@ -2918,6 +3240,12 @@ class DBOpmAgentId(object):
 
     vtType = 'opm_agent_id'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -2990,6 +3318,17 @@ class DBParameter(object):
 
     vtType = 'parameter'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_pos',
+                 '_db_name',
+                 '_db_type',
+                 '_db_val',
+                 '_db_alias',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, pos=None, name=None, type=None, val=None, alias=None):
         self._db_id = id
         self._db_pos = pos
@@ -3161,13 +3500,50 @@ class DBVistrail(object):
 
     vtType = 'vistrail'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_entity_type',
+                 '_db_version',
+                 '_db_name',
+                 '_db_last_modified',
+                 '_db_deleted_actions',
+                 'db_actions_id_index',
+                 '_db_actions',
+                 '_db_deleted_tags',
+                 'db_tags_id_index',
+                 'db_tags_name_index',
+                 '_db_tags',
+                 '_db_deleted_annotations',
+                 'db_annotations_id_index',
+                 'db_annotations_key_index',
+                 '_db_annotations',
+                 '_db_deleted_controlParameters',
+                 'db_controlParameters_id_index',
+                 'db_controlParameters_name_index',
+                 '_db_controlParameters',
+                 '_db_deleted_vistrailVariables',
+                 'db_vistrailVariables_name_index',
+                 'db_vistrailVariables_uuid_index',
+                 '_db_vistrailVariables',
+                 '_db_deleted_parameter_explorations',
+                 'db_parameter_explorations_id_index',
+                 '_db_parameter_explorations',
+                 '_db_deleted_actionAnnotations',
+                 'db_actionAnnotations_id_index',
+                 'db_actionAnnotations_action_id_index',
+                 'db_actionAnnotations_key_index',
+                 '_db_actionAnnotations',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, entity_type=None, version=None, name=None, last_modified=None, actions=None, tags=None, annotations=None, controlParameters=None, vistrailVariables=None, parameter_explorations=None, actionAnnotations=None):
         self._db_id = id
         self._db_entity_type = entity_type
         self._db_version = version
         self._db_name = name
         self._db_last_modified = last_modified
-        self.db_deleted_actions = []
+        self._db_deleted_actions = None
         self.db_actions_id_index = {}
         if actions is None:
             self._db_actions = []
@@ -3175,7 +3551,7 @@ class DBVistrail(object):
             self._db_actions = actions
             for v in self._db_actions:
                 self.db_actions_id_index[v.db_id] = v
-        self.db_deleted_tags = []
+        self._db_deleted_tags = None
         self.db_tags_id_index = {}
         self.db_tags_name_index = {}
         if tags is None:
@@ -3185,7 +3561,7 @@ class DBVistrail(object):
             for v in self._db_tags:
                 self.db_tags_id_index[v.db_id] = v
                 self.db_tags_name_index[v.db_name] = v
-        self.db_deleted_annotations = []
+        self._db_deleted_annotations = None
         self.db_annotations_id_index = {}
         self.db_annotations_key_index = {}
         if annotations is None:
@@ -3195,7 +3571,7 @@ class DBVistrail(object):
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
                 self.db_annotations_key_index[v.db_key] = v
-        self.db_deleted_controlParameters = []
+        self._db_deleted_controlParameters = None
         self.db_controlParameters_id_index = {}
         self.db_controlParameters_name_index = {}
         if controlParameters is None:
@@ -3205,7 +3581,7 @@ class DBVistrail(object):
             for v in self._db_controlParameters:
                 self.db_controlParameters_id_index[v.db_id] = v
                 self.db_controlParameters_name_index[v.db_name] = v
-        self.db_deleted_vistrailVariables = []
+        self._db_deleted_vistrailVariables = None
         self.db_vistrailVariables_name_index = {}
         self.db_vistrailVariables_uuid_index = {}
         if vistrailVariables is None:
@@ -3215,7 +3591,7 @@ class DBVistrail(object):
             for v in self._db_vistrailVariables:
                 self.db_vistrailVariables_name_index[v.db_name] = v
                 self.db_vistrailVariables_uuid_index[v.db_uuid] = v
-        self.db_deleted_parameter_explorations = []
+        self._db_deleted_parameter_explorations = None
         self.db_parameter_explorations_id_index = {}
         if parameter_explorations is None:
             self._db_parameter_explorations = []
@@ -3223,7 +3599,7 @@ class DBVistrail(object):
             self._db_parameter_explorations = parameter_explorations
             for v in self._db_parameter_explorations:
                 self.db_parameter_explorations_id_index[v.db_id] = v
-        self.db_deleted_actionAnnotations = []
+        self._db_deleted_actionAnnotations = None
         self.db_actionAnnotations_id_index = {}
         self.db_actionAnnotations_action_id_index = {}
         self.db_actionAnnotations_key_index = {}
@@ -3472,21 +3848,28 @@ class DBVistrail(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_actions)
-        children.extend(self.db_deleted_tags)
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_controlParameters)
-        children.extend(self.db_deleted_vistrailVariables)
-        children.extend(self.db_deleted_parameter_explorations)
-        children.extend(self.db_deleted_actionAnnotations)
+        if self._db_deleted_actions is not None:
+            children.extend(self._db_deleted_actions)
+        if self._db_deleted_tags is not None:
+            children.extend(self._db_deleted_tags)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_controlParameters is not None:
+            children.extend(self._db_deleted_controlParameters)
+        if self._db_deleted_vistrailVariables is not None:
+            children.extend(self._db_deleted_vistrailVariables)
+        if self._db_deleted_parameter_explorations is not None:
+            children.extend(self._db_deleted_parameter_explorations)
+        if self._db_deleted_actionAnnotations is not None:
+            children.extend(self._db_deleted_actionAnnotations)
         if remove:
-            self.db_deleted_actions = []
-            self.db_deleted_tags = []
-            self.db_deleted_annotations = []
-            self.db_deleted_controlParameters = []
-            self.db_deleted_vistrailVariables = []
-            self.db_deleted_parameter_explorations = []
-            self.db_deleted_actionAnnotations = []
+            self._db_deleted_actions = None
+            self._db_deleted_tags = None
+            self._db_deleted_annotations = None
+            self._db_deleted_controlParameters = None
+            self._db_deleted_vistrailVariables = None
+            self._db_deleted_parameter_explorations = None
+            self._db_deleted_actionAnnotations = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -3584,6 +3967,13 @@ class DBVistrail(object):
         self._db_actions = actions
         self.is_dirty = True
     db_actions = property(__get_db_actions, __set_db_actions)
+    def __get_db_deleted_actions(self):
+        if self._db_deleted_actions is None:
+            self._db_deleted_actions = []
+        return self._db_deleted_actions
+    def __set_db_deleted_actions(self, deleted):
+        self._db_deleted_actions = deleted
+    db_deleted_actions = property(__get_db_deleted_actions, __set_db_deleted_actions)
     def db_get_actions(self):
         return self._db_actions
     def db_add_action(self, action):
@@ -3626,6 +4016,13 @@ class DBVistrail(object):
         self._db_tags = tags
         self.is_dirty = True
     db_tags = property(__get_db_tags, __set_db_tags)
+    def __get_db_deleted_tags(self):
+        if self._db_deleted_tags is None:
+            self._db_deleted_tags = []
+        return self._db_deleted_tags
+    def __set_db_deleted_tags(self, deleted):
+        self._db_deleted_tags = deleted
+    db_deleted_tags = property(__get_db_deleted_tags, __set_db_deleted_tags)
     def db_get_tags(self):
         return self._db_tags
     def db_add_tag(self, tag):
@@ -3675,6 +4072,13 @@ class DBVistrail(object):
         self._db_annotations = annotations
         self.is_dirty = True
     db_annotations = property(__get_db_annotations, __set_db_annotations)
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
     def db_get_annotations(self):
         return self._db_annotations
     def db_add_annotation(self, annotation):
@@ -3724,6 +4128,13 @@ class DBVistrail(object):
         self._db_controlParameters = controlParameters
         self.is_dirty = True
     db_controlParameters = property(__get_db_controlParameters, __set_db_controlParameters)
+    def __get_db_deleted_controlParameters(self):
+        if self._db_deleted_controlParameters is None:
+            self._db_deleted_controlParameters = []
+        return self._db_deleted_controlParameters
+    def __set_db_deleted_controlParameters(self, deleted):
+        self._db_deleted_controlParameters = deleted
+    db_deleted_controlParameters = property(__get_db_deleted_controlParameters, __set_db_deleted_controlParameters)
     def db_get_controlParameters(self):
         return self._db_controlParameters
     def db_add_controlParameter(self, controlParameter):
@@ -3773,6 +4184,13 @@ class DBVistrail(object):
         self._db_vistrailVariables = vistrailVariables
         self.is_dirty = True
     db_vistrailVariables = property(__get_db_vistrailVariables, __set_db_vistrailVariables)
+    def __get_db_deleted_vistrailVariables(self):
+        if self._db_deleted_vistrailVariables is None:
+            self._db_deleted_vistrailVariables = []
+        return self._db_deleted_vistrailVariables
+    def __set_db_deleted_vistrailVariables(self, deleted):
+        self._db_deleted_vistrailVariables = deleted
+    db_deleted_vistrailVariables = property(__get_db_deleted_vistrailVariables, __set_db_deleted_vistrailVariables)
     def db_get_vistrailVariables(self):
         return self._db_vistrailVariables
     def db_add_vistrailVariable(self, vistrailVariable):
@@ -3822,6 +4240,13 @@ class DBVistrail(object):
         self._db_parameter_explorations = parameter_explorations
         self.is_dirty = True
     db_parameter_explorations = property(__get_db_parameter_explorations, __set_db_parameter_explorations)
+    def __get_db_deleted_parameter_explorations(self):
+        if self._db_deleted_parameter_explorations is None:
+            self._db_deleted_parameter_explorations = []
+        return self._db_deleted_parameter_explorations
+    def __set_db_deleted_parameter_explorations(self, deleted):
+        self._db_deleted_parameter_explorations = deleted
+    db_deleted_parameter_explorations = property(__get_db_deleted_parameter_explorations, __set_db_deleted_parameter_explorations)
     def db_get_parameter_explorations(self):
         return self._db_parameter_explorations
     def db_add_parameter_exploration(self, parameter_exploration):
@@ -3864,6 +4289,13 @@ class DBVistrail(object):
         self._db_actionAnnotations = actionAnnotations
         self.is_dirty = True
     db_actionAnnotations = property(__get_db_actionAnnotations, __set_db_actionAnnotations)
+    def __get_db_deleted_actionAnnotations(self):
+        if self._db_deleted_actionAnnotations is None:
+            self._db_deleted_actionAnnotations = []
+        return self._db_deleted_actionAnnotations
+    def __set_db_deleted_actionAnnotations(self, deleted):
+        self._db_deleted_actionAnnotations = deleted
+    db_deleted_actionAnnotations = property(__get_db_deleted_actionAnnotations, __set_db_deleted_actionAnnotations)
     def db_get_actionAnnotations(self):
         return self._db_actionAnnotations
     def db_add_actionAnnotation(self, actionAnnotation):
@@ -3924,8 +4356,15 @@ class DBOpmArtifactValue(object):
 
     vtType = 'opm_artifact_value'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_value',
+                 '_db_value',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, value=None):
-        self.db_deleted_value = []
+        self._db_deleted_value = None
         self._db_value = value
         self.is_dirty = True
         self.is_new = True
@@ -3991,9 +4430,10 @@ class DBOpmArtifactValue(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
+        if self._db_deleted_value is not None:
+            children.extend(self._db_deleted_value)
         if remove:
-            self.db_deleted_value = []
+            self._db_deleted_value = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -4007,6 +4447,13 @@ class DBOpmArtifactValue(object):
         self._db_value = value
         self.is_dirty = True
     db_value = property(__get_db_value, __set_db_value)
+    def __get_db_deleted_value(self):
+        if self._db_deleted_value is None:
+            self._db_deleted_value = []
+        return self._db_deleted_value
+    def __set_db_deleted_value(self, deleted):
+        self._db_deleted_value = deleted
+    db_deleted_value = property(__get_db_deleted_value, __set_db_deleted_value)
     def db_add_value(self, value):
         self._db_value = value
     def db_change_value(self, value):
@@ -4022,6 +4469,12 @@ class DBConfigStr(object):
 
     vtType = 'config_str'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_value',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -4092,13 +4545,25 @@ class DBStartup(object):
 
     vtType = 'startup'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_version',
+                 '_db_deleted_configuration',
+                 '_db_configuration',
+                 '_db_deleted_enabled_packages',
+                 '_db_enabled_packages',
+                 '_db_deleted_disabled_packages',
+                 '_db_disabled_packages',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, version=None, configuration=None, enabled_packages=None, disabled_packages=None):
         self._db_version = version
-        self.db_deleted_configuration = []
+        self._db_deleted_configuration = None
         self._db_configuration = configuration
-        self.db_deleted_enabled_packages = []
+        self._db_deleted_enabled_packages = None
         self._db_enabled_packages = enabled_packages
-        self.db_deleted_disabled_packages = []
+        self._db_deleted_disabled_packages = None
         self._db_disabled_packages = disabled_packages
         self.is_dirty = True
         self.is_new = True
@@ -4194,13 +4659,16 @@ class DBStartup(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_configuration)
-        children.extend(self.db_deleted_enabled_packages)
-        children.extend(self.db_deleted_disabled_packages)
+        if self._db_deleted_configuration is not None:
+            children.extend(self._db_deleted_configuration)
+        if self._db_deleted_enabled_packages is not None:
+            children.extend(self._db_deleted_enabled_packages)
+        if self._db_deleted_disabled_packages is not None:
+            children.extend(self._db_deleted_disabled_packages)
         if remove:
-            self.db_deleted_configuration = []
-            self.db_deleted_enabled_packages = []
-            self.db_deleted_disabled_packages = []
+            self._db_deleted_configuration = None
+            self._db_deleted_enabled_packages = None
+            self._db_deleted_disabled_packages = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -4231,6 +4699,13 @@ class DBStartup(object):
         self._db_configuration = configuration
         self.is_dirty = True
     db_configuration = property(__get_db_configuration, __set_db_configuration)
+    def __get_db_deleted_configuration(self):
+        if self._db_deleted_configuration is None:
+            self._db_deleted_configuration = []
+        return self._db_deleted_configuration
+    def __set_db_deleted_configuration(self, deleted):
+        self._db_deleted_configuration = deleted
+    db_deleted_configuration = property(__get_db_deleted_configuration, __set_db_deleted_configuration)
     def db_add_configuration(self, configuration):
         self._db_configuration = configuration
     def db_change_configuration(self, configuration):
@@ -4246,6 +4721,13 @@ class DBStartup(object):
         self._db_enabled_packages = enabled_packages
         self.is_dirty = True
     db_enabled_packages = property(__get_db_enabled_packages, __set_db_enabled_packages)
+    def __get_db_deleted_enabled_packages(self):
+        if self._db_deleted_enabled_packages is None:
+            self._db_deleted_enabled_packages = []
+        return self._db_deleted_enabled_packages
+    def __set_db_deleted_enabled_packages(self, deleted):
+        self._db_deleted_enabled_packages = deleted
+    db_deleted_enabled_packages = property(__get_db_deleted_enabled_packages, __set_db_deleted_enabled_packages)
     def db_add_enabled_packages(self, enabled_packages):
         self._db_enabled_packages = enabled_packages
     def db_change_enabled_packages(self, enabled_packages):
@@ -4261,6 +4743,13 @@ class DBStartup(object):
         self._db_disabled_packages = disabled_packages
         self.is_dirty = True
     db_disabled_packages = property(__get_db_disabled_packages, __set_db_disabled_packages)
+    def __get_db_deleted_disabled_packages(self):
+        if self._db_deleted_disabled_packages is None:
+            self._db_deleted_disabled_packages = []
+        return self._db_deleted_disabled_packages
+    def __set_db_deleted_disabled_packages(self, deleted):
+        self._db_deleted_disabled_packages = deleted
+    db_deleted_disabled_packages = property(__get_db_deleted_disabled_packages, __set_db_deleted_disabled_packages)
     def db_add_disabled_packages(self, disabled_packages):
         self._db_disabled_packages = disabled_packages
     def db_change_disabled_packages(self, disabled_packages):
@@ -4829,6 +5318,17 @@ class DBPort(object):
 
     vtType = 'port'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_type',
+                 '_db_moduleId',
+                 '_db_moduleName',
+                 '_db_name',
+                 '_db_signature',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, type=None, moduleId=None, moduleName=None, name=None, signature=None):
         self._db_id = id
         self._db_type = type
@@ -5002,8 +5502,16 @@ class DBOpmAgents(object):
 
     vtType = 'opm_agents'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_agents',
+                 'db_agents_id_index',
+                 '_db_agents',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, agents=None):
-        self.db_deleted_agents = []
+        self._db_deleted_agents = None
         self.db_agents_id_index = {}
         if agents is None:
             self._db_agents = []
@@ -5075,9 +5583,10 @@ class DBOpmAgents(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_agents)
+        if self._db_deleted_agents is not None:
+            children.extend(self._db_deleted_agents)
         if remove:
-            self.db_deleted_agents = []
+            self._db_deleted_agents = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -5092,6 +5601,13 @@ class DBOpmAgents(object):
         self._db_agents = agents
         self.is_dirty = True
     db_agents = property(__get_db_agents, __set_db_agents)
+    def __get_db_deleted_agents(self):
+        if self._db_deleted_agents is None:
+            self._db_deleted_agents = []
+        return self._db_deleted_agents
+    def __set_db_deleted_agents(self, deleted):
+        self._db_deleted_agents = deleted
+    db_deleted_agents = property(__get_db_deleted_agents, __set_db_deleted_agents)
     def db_get_agents(self):
         return self._db_agents
     def db_add_agent(self, agent):
@@ -5134,8 +5650,15 @@ class DBOpmDependencies(object):
 
     vtType = 'opm_dependencies'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_dependencys',
+                 '_db_dependencys',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, dependencys=None):
-        self.db_deleted_dependencys = []
+        self._db_deleted_dependencys = None
         if dependencys is None:
             self._db_dependencys = []
         else:
@@ -5225,9 +5748,10 @@ class DBOpmDependencies(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_dependencys)
+        if self._db_deleted_dependencys is not None:
+            children.extend(self._db_deleted_dependencys)
         if remove:
-            self.db_deleted_dependencys = []
+            self._db_deleted_dependencys = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -5242,6 +5766,13 @@ class DBOpmDependencies(object):
         self._db_dependencys = dependencys
         self.is_dirty = True
     db_dependencys = property(__get_db_dependencys, __set_db_dependencys)
+    def __get_db_deleted_dependencys(self):
+        if self._db_deleted_dependencys is None:
+            self._db_deleted_dependencys = []
+        return self._db_deleted_dependencys
+    def __set_db_deleted_dependencys(self, deleted):
+        self._db_deleted_dependencys = deleted
+    db_deleted_dependencys = property(__get_db_deleted_dependencys, __set_db_deleted_dependencys)
     def db_get_dependencys(self):
         return self._db_dependencys
     def db_add_dependency(self, dependency):
@@ -5262,12 +5793,24 @@ class DBPEFunction(object):
 
     vtType = 'pe_function'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_module_id',
+                 '_db_port_name',
+                 '_db_is_alias',
+                 '_db_deleted_parameters',
+                 'db_parameters_id_index',
+                 '_db_parameters',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, module_id=None, port_name=None, is_alias=None, parameters=None):
         self._db_id = id
         self._db_module_id = module_id
         self._db_port_name = port_name
         self._db_is_alias = is_alias
-        self.db_deleted_parameters = []
+        self._db_deleted_parameters = None
         self.db_parameters_id_index = {}
         if parameters is None:
             self._db_parameters = []
@@ -5364,9 +5907,10 @@ class DBPEFunction(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_parameters)
+        if self._db_deleted_parameters is not None:
+            children.extend(self._db_deleted_parameters)
         if remove:
-            self.db_deleted_parameters = []
+            self._db_deleted_parameters = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -5433,6 +5977,13 @@ class DBPEFunction(object):
         self._db_parameters = parameters
         self.is_dirty = True
     db_parameters = property(__get_db_parameters, __set_db_parameters)
+    def __get_db_deleted_parameters(self):
+        if self._db_deleted_parameters is None:
+            self._db_deleted_parameters = []
+        return self._db_deleted_parameters
+    def __set_db_deleted_parameters(self, deleted):
+        self._db_deleted_parameters = deleted
+    db_deleted_parameters = property(__get_db_deleted_parameters, __set_db_deleted_parameters)
     def db_get_parameters(self):
         return self._db_parameters
     def db_add_parameter(self, parameter):
@@ -5476,8 +6027,34 @@ class DBWorkflow(object):
 
     vtType = 'workflow'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_modules',
+                 'db_modules_id_index',
+                 '_db_modules',
+                 '_db_id',
+                 '_db_entity_type',
+                 '_db_name',
+                 '_db_version',
+                 '_db_last_modified',
+                 '_db_deleted_connections',
+                 'db_connections_id_index',
+                 '_db_connections',
+                 '_db_deleted_annotations',
+                 'db_annotations_id_index',
+                 '_db_annotations',
+                 '_db_deleted_plugin_datas',
+                 'db_plugin_datas_id_index',
+                 '_db_plugin_datas',
+                 '_db_deleted_others',
+                 'db_others_id_index',
+                 '_db_others',
+                 '_db_vistrail_id',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, modules=None, id=None, entity_type=None, name=None, version=None, last_modified=None, connections=None, annotations=None, plugin_datas=None, others=None, vistrail_id=None):
-        self.db_deleted_modules = []
+        self._db_deleted_modules = None
         self.db_modules_id_index = {}
         if modules is None:
             self._db_modules = []
@@ -5490,7 +6067,7 @@ class DBWorkflow(object):
         self._db_name = name
         self._db_version = version
         self._db_last_modified = last_modified
-        self.db_deleted_connections = []
+        self._db_deleted_connections = None
         self.db_connections_id_index = {}
         if connections is None:
             self._db_connections = []
@@ -5498,7 +6075,7 @@ class DBWorkflow(object):
             self._db_connections = connections
             for v in self._db_connections:
                 self.db_connections_id_index[v.db_id] = v
-        self.db_deleted_annotations = []
+        self._db_deleted_annotations = None
         self.db_annotations_id_index = {}
         if annotations is None:
             self._db_annotations = []
@@ -5506,7 +6083,7 @@ class DBWorkflow(object):
             self._db_annotations = annotations
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
-        self.db_deleted_plugin_datas = []
+        self._db_deleted_plugin_datas = None
         self.db_plugin_datas_id_index = {}
         if plugin_datas is None:
             self._db_plugin_datas = []
@@ -5514,7 +6091,7 @@ class DBWorkflow(object):
             self._db_plugin_datas = plugin_datas
             for v in self._db_plugin_datas:
                 self.db_plugin_datas_id_index[v.db_id] = v
-        self.db_deleted_others = []
+        self._db_deleted_others = None
         self.db_others_id_index = {}
         if others is None:
             self._db_others = []
@@ -5728,17 +6305,22 @@ class DBWorkflow(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_connections)
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_plugin_datas)
-        children.extend(self.db_deleted_others)
-        children.extend(self.db_deleted_modules)
+        if self._db_deleted_connections is not None:
+            children.extend(self._db_deleted_connections)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_plugin_datas is not None:
+            children.extend(self._db_deleted_plugin_datas)
+        if self._db_deleted_others is not None:
+            children.extend(self._db_deleted_others)
+        if self._db_deleted_modules is not None:
+            children.extend(self._db_deleted_modules)
         if remove:
-            self.db_deleted_connections = []
-            self.db_deleted_annotations = []
-            self.db_deleted_plugin_datas = []
-            self.db_deleted_others = []
-            self.db_deleted_modules = []
+            self._db_deleted_connections = None
+            self._db_deleted_annotations = None
+            self._db_deleted_plugin_datas = None
+            self._db_deleted_others = None
+            self._db_deleted_modules = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -5765,6 +6347,13 @@ class DBWorkflow(object):
         self._db_modules = modules
         self.is_dirty = True
     db_modules = property(__get_db_modules, __set_db_modules)
+    def __get_db_deleted_modules(self):
+        if self._db_deleted_modules is None:
+            self._db_deleted_modules = []
+        return self._db_deleted_modules
+    def __set_db_deleted_modules(self, deleted):
+        self._db_deleted_modules = deleted
+    db_deleted_modules = property(__get_db_deleted_modules, __set_db_deleted_modules)
     def db_get_modules(self):
         return self._db_modules
     def db_add_module(self, module):
@@ -5872,6 +6461,13 @@ class DBWorkflow(object):
         self._db_connections = connections
         self.is_dirty = True
     db_connections = property(__get_db_connections, __set_db_connections)
+    def __get_db_deleted_connections(self):
+        if self._db_deleted_connections is None:
+            self._db_deleted_connections = []
+        return self._db_deleted_connections
+    def __set_db_deleted_connections(self, deleted):
+        self._db_deleted_connections = deleted
+    db_deleted_connections = property(__get_db_deleted_connections, __set_db_deleted_connections)
     def db_get_connections(self):
         return self._db_connections
     def db_add_connection(self, connection):
@@ -5914,6 +6510,13 @@ class DBWorkflow(object):
         self._db_annotations = annotations
         self.is_dirty = True
     db_annotations = property(__get_db_annotations, __set_db_annotations)
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
     def db_get_annotations(self):
         return self._db_annotations
     def db_add_annotation(self, annotation):
@@ -5956,6 +6559,13 @@ class DBWorkflow(object):
         self._db_plugin_datas = plugin_datas
         self.is_dirty = True
     db_plugin_datas = property(__get_db_plugin_datas, __set_db_plugin_datas)
+    def __get_db_deleted_plugin_datas(self):
+        if self._db_deleted_plugin_datas is None:
+            self._db_deleted_plugin_datas = []
+        return self._db_deleted_plugin_datas
+    def __set_db_deleted_plugin_datas(self, deleted):
+        self._db_deleted_plugin_datas = deleted
+    db_deleted_plugin_datas = property(__get_db_deleted_plugin_datas, __set_db_deleted_plugin_datas)
     def db_get_plugin_datas(self):
         return self._db_plugin_datas
     def db_add_plugin_data(self, plugin_data):
@@ -5998,6 +6608,13 @@ class DBWorkflow(object):
         self._db_others = others
         self.is_dirty = True
     db_others = property(__get_db_others, __set_db_others)
+    def __get_db_deleted_others(self):
+        if self._db_deleted_others is None:
+            self._db_deleted_others = []
+        return self._db_deleted_others
+    def __set_db_deleted_others(self, deleted):
+        self._db_deleted_others = deleted
+    db_deleted_others = property(__get_db_deleted_others, __set_db_deleted_others)
     def db_get_others(self):
         return self._db_others
     def db_add_other(self, other):
@@ -6054,12 +6671,23 @@ class DBMashupAction(object):
 
     vtType = 'mashup_action'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_prevId',
+                 '_db_date',
+                 '_db_user',
+                 '_db_deleted_mashup',
+                 '_db_mashup',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, prevId=None, date=None, user=None, mashup=None):
         self._db_id = id
         self._db_prevId = prevId
         self._db_date = date
         self._db_user = user
-        self.db_deleted_mashup = []
+        self._db_deleted_mashup = None
         self._db_mashup = mashup
         self.is_dirty = True
         self.is_new = True
@@ -6143,9 +6771,10 @@ class DBMashupAction(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_mashup)
+        if self._db_deleted_mashup is not None:
+            children.extend(self._db_deleted_mashup)
         if remove:
-            self.db_deleted_mashup = []
+            self._db_deleted_mashup = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -6211,6 +6840,13 @@ class DBMashupAction(object):
         self._db_mashup = mashup
         self.is_dirty = True
     db_mashup = property(__get_db_mashup, __set_db_mashup)
+    def __get_db_deleted_mashup(self):
+        if self._db_deleted_mashup is None:
+            self._db_deleted_mashup = []
+        return self._db_deleted_mashup
+    def __set_db_deleted_mashup(self, deleted):
+        self._db_deleted_mashup = deleted
+    db_deleted_mashup = property(__get_db_deleted_mashup, __set_db_deleted_mashup)
     def db_add_mashup(self, mashup):
         self._db_mashup = mashup
     def db_change_mashup(self, mashup):
@@ -6227,8 +6863,16 @@ class DBConfiguration(object):
 
     vtType = 'configuration'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_config_keys',
+                 'db_config_keys_name_index',
+                 '_db_config_keys',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, config_keys=None):
-        self.db_deleted_config_keys = []
+        self._db_deleted_config_keys = None
         self.db_config_keys_name_index = {}
         if config_keys is None:
             self._db_config_keys = []
@@ -6300,9 +6944,10 @@ class DBConfiguration(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_config_keys)
+        if self._db_deleted_config_keys is not None:
+            children.extend(self._db_deleted_config_keys)
         if remove:
-            self.db_deleted_config_keys = []
+            self._db_deleted_config_keys = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -6317,6 +6962,13 @@ class DBConfiguration(object):
         self._db_config_keys = config_keys
         self.is_dirty = True
     db_config_keys = property(__get_db_config_keys, __set_db_config_keys)
+    def __get_db_deleted_config_keys(self):
+        if self._db_deleted_config_keys is None:
+            self._db_deleted_config_keys = []
+        return self._db_deleted_config_keys
+    def __set_db_deleted_config_keys(self, deleted):
+        self._db_deleted_config_keys = deleted
+    db_deleted_config_keys = property(__get_db_deleted_config_keys, __set_db_deleted_config_keys)
     def db_get_config_keys(self):
         return self._db_config_keys
     def db_add_config_key(self, config_key):
@@ -6359,8 +7011,21 @@ class DBChange(object):
 
     vtType = 'change'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_data',
+                 '_db_data',
+                 '_db_id',
+                 '_db_what',
+                 '_db_oldObjId',
+                 '_db_newObjId',
+                 '_db_parentObjId',
+                 '_db_parentObjType',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, data=None, id=None, what=None, oldObjId=None, newObjId=None, parentObjId=None, parentObjType=None):
-        self.db_deleted_data = []
+        self._db_deleted_data = None
         self._db_data = data
         self._db_id = id
         self._db_what = what
@@ -6528,9 +7193,10 @@ class DBChange(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_data)
+        if self._db_deleted_data is not None:
+            children.extend(self._db_deleted_data)
         if remove:
-            self.db_deleted_data = []
+            self._db_deleted_data = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -6544,6 +7210,13 @@ class DBChange(object):
         self._db_data = data
         self.is_dirty = True
     db_data = property(__get_db_data, __set_db_data)
+    def __get_db_deleted_data(self):
+        if self._db_deleted_data is None:
+            self._db_deleted_data = []
+        return self._db_deleted_data
+    def __set_db_deleted_data(self, deleted):
+        self._db_deleted_data = deleted
+    db_deleted_data = property(__get_db_deleted_data, __set_db_deleted_data)
     def db_add_data(self, data):
         self._db_data = data
     def db_change_data(self, data):
@@ -6638,6 +7311,22 @@ class DBPackage(object):
 
     vtType = 'package'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_name',
+                 '_db_identifier',
+                 '_db_codepath',
+                 '_db_load_configuration',
+                 '_db_version',
+                 '_db_description',
+                 '_db_deleted_module_descriptors',
+                 'db_module_descriptors_id_index',
+                 'db_module_descriptors_name_index',
+                 '_db_module_descriptors',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, name=None, identifier=None, codepath=None, load_configuration=None, version=None, description=None, module_descriptors=None):
         self._db_id = id
         self._db_name = name
@@ -6646,7 +7335,7 @@ class DBPackage(object):
         self._db_load_configuration = load_configuration
         self._db_version = version
         self._db_description = description
-        self.db_deleted_module_descriptors = []
+        self._db_deleted_module_descriptors = None
         self.db_module_descriptors_id_index = {}
         self.db_module_descriptors_name_index = {}
         if module_descriptors is None:
@@ -6762,9 +7451,10 @@ class DBPackage(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_module_descriptors)
+        if self._db_deleted_module_descriptors is not None:
+            children.extend(self._db_deleted_module_descriptors)
         if remove:
-            self.db_deleted_module_descriptors = []
+            self._db_deleted_module_descriptors = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -6870,6 +7560,13 @@ class DBPackage(object):
         self._db_module_descriptors = module_descriptors
         self.is_dirty = True
     db_module_descriptors = property(__get_db_module_descriptors, __set_db_module_descriptors)
+    def __get_db_deleted_module_descriptors(self):
+        if self._db_deleted_module_descriptors is None:
+            self._db_deleted_module_descriptors = []
+        return self._db_deleted_module_descriptors
+    def __set_db_deleted_module_descriptors(self, deleted):
+        self._db_deleted_module_descriptors = deleted
+    db_deleted_module_descriptors = property(__get_db_deleted_module_descriptors, __set_db_deleted_module_descriptors)
     def db_get_module_descriptors(self):
         return self._db_module_descriptors
     def db_add_module_descriptor(self, module_descriptor):
@@ -6920,11 +7617,22 @@ class DBLoopExec(object):
 
     vtType = 'loop_exec'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_ts_start',
+                 '_db_ts_end',
+                 '_db_deleted_loop_iterations',
+                 'db_loop_iterations_id_index',
+                 '_db_loop_iterations',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, ts_start=None, ts_end=None, loop_iterations=None):
         self._db_id = id
         self._db_ts_start = ts_start
         self._db_ts_end = ts_end
-        self.db_deleted_loop_iterations = []
+        self._db_deleted_loop_iterations = None
         self.db_loop_iterations_id_index = {}
         if loop_iterations is None:
             self._db_loop_iterations = []
@@ -7013,9 +7721,10 @@ class DBLoopExec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_loop_iterations)
+        if self._db_deleted_loop_iterations is not None:
+            children.extend(self._db_deleted_loop_iterations)
         if remove:
-            self.db_deleted_loop_iterations = []
+            self._db_deleted_loop_iterations = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -7069,6 +7778,13 @@ class DBLoopExec(object):
         self._db_loop_iterations = loop_iterations
         self.is_dirty = True
     db_loop_iterations = property(__get_db_loop_iterations, __set_db_loop_iterations)
+    def __get_db_deleted_loop_iterations(self):
+        if self._db_deleted_loop_iterations is None:
+            self._db_deleted_loop_iterations = []
+        return self._db_deleted_loop_iterations
+    def __set_db_deleted_loop_iterations(self, deleted):
+        self._db_deleted_loop_iterations = deleted
+    db_deleted_loop_iterations = property(__get_db_deleted_loop_iterations, __set_db_deleted_loop_iterations)
     def db_get_loop_iterations(self):
         return self._db_loop_iterations
     def db_add_loop_iteration(self, loop_iteration):
@@ -7112,9 +7828,19 @@ class DBConnection(object):
 
     vtType = 'connection'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_deleted_ports',
+                 'db_ports_id_index',
+                 'db_ports_type_index',
+                 '_db_ports',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, ports=None):
         self._db_id = id
-        self.db_deleted_ports = []
+        self._db_deleted_ports = None
         self.db_ports_id_index = {}
         self.db_ports_type_index = {}
         if ports is None:
@@ -7194,9 +7920,10 @@ class DBConnection(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_ports)
+        if self._db_deleted_ports is not None:
+            children.extend(self._db_deleted_ports)
         if remove:
-            self.db_deleted_ports = []
+            self._db_deleted_ports = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -7224,6 +7951,13 @@ class DBConnection(object):
         self._db_ports = ports
         self.is_dirty = True
     db_ports = property(__get_db_ports, __set_db_ports)
+    def __get_db_deleted_ports(self):
+        if self._db_deleted_ports is None:
+            self._db_deleted_ports = []
+        return self._db_deleted_ports
+    def __set_db_deleted_ports(self, deleted):
+        self._db_deleted_ports = deleted
+    db_deleted_ports = property(__get_db_deleted_ports, __set_db_deleted_ports)
     def db_get_ports(self):
         return self._db_ports
     def db_add_port(self, port):
@@ -7274,6 +8008,12 @@ class DBConfigBool(object):
 
     vtType = 'config_bool'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_value',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -7344,8 +8084,25 @@ class DBAction(object):
 
     vtType = 'action'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_operations',
+                 'db_operations_id_index',
+                 '_db_operations',
+                 '_db_id',
+                 '_db_prevId',
+                 '_db_date',
+                 '_db_session',
+                 '_db_user',
+                 '_db_deleted_annotations',
+                 'db_annotations_id_index',
+                 'db_annotations_key_index',
+                 '_db_annotations',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, operations=None, id=None, prevId=None, date=None, session=None, user=None, annotations=None):
-        self.db_deleted_operations = []
+        self._db_deleted_operations = None
         self.db_operations_id_index = {}
         if operations is None:
             self._db_operations = []
@@ -7358,7 +8115,7 @@ class DBAction(object):
         self._db_date = date
         self._db_session = session
         self._db_user = user
-        self.db_deleted_annotations = []
+        self._db_deleted_annotations = None
         self.db_annotations_id_index = {}
         self.db_annotations_key_index = {}
         if annotations is None:
@@ -7499,11 +8256,13 @@ class DBAction(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_operations)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_operations is not None:
+            children.extend(self._db_deleted_operations)
         if remove:
-            self.db_deleted_annotations = []
-            self.db_deleted_operations = []
+            self._db_deleted_annotations = None
+            self._db_deleted_operations = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -7521,6 +8280,13 @@ class DBAction(object):
         self._db_operations = operations
         self.is_dirty = True
     db_operations = property(__get_db_operations, __set_db_operations)
+    def __get_db_deleted_operations(self):
+        if self._db_deleted_operations is None:
+            self._db_deleted_operations = []
+        return self._db_deleted_operations
+    def __set_db_deleted_operations(self, deleted):
+        self._db_deleted_operations = deleted
+    db_deleted_operations = property(__get_db_deleted_operations, __set_db_deleted_operations)
     def db_get_operations(self):
         return self._db_operations
     def db_add_operation(self, operation):
@@ -7628,6 +8394,13 @@ class DBAction(object):
         self._db_annotations = annotations
         self.is_dirty = True
     db_annotations = property(__get_db_annotations, __set_db_annotations)
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
     def db_get_annotations(self):
         return self._db_annotations
     def db_add_annotation(self, annotation):
@@ -7678,9 +8451,17 @@ class DBStartupPackage(object):
 
     vtType = 'startup_package'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_name',
+                 '_db_deleted_configuration',
+                 '_db_configuration',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, name=None, configuration=None):
         self._db_name = name
-        self.db_deleted_configuration = []
+        self._db_deleted_configuration = None
         self._db_configuration = configuration
         self.is_dirty = True
         self.is_new = True
@@ -7744,9 +8525,10 @@ class DBStartupPackage(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_configuration)
+        if self._db_deleted_configuration is not None:
+            children.extend(self._db_deleted_configuration)
         if remove:
-            self.db_deleted_configuration = []
+            self._db_deleted_configuration = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -7773,6 +8555,13 @@ class DBStartupPackage(object):
         self._db_configuration = configuration
         self.is_dirty = True
     db_configuration = property(__get_db_configuration, __set_db_configuration)
+    def __get_db_deleted_configuration(self):
+        if self._db_deleted_configuration is None:
+            self._db_deleted_configuration = []
+        return self._db_deleted_configuration
+    def __set_db_deleted_configuration(self, deleted):
+        self._db_deleted_configuration = deleted
+    db_deleted_configuration = property(__get_db_deleted_configuration, __set_db_deleted_configuration)
     def db_add_configuration(self, configuration):
         self._db_configuration = configuration
     def db_change_configuration(self, configuration):
@@ -7788,6 +8577,12 @@ class DBConfigInt(object):
 
     vtType = 'config_int'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_value',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -7858,6 +8653,12 @@ class DBOpmProcessIdEffect(object):
 
     vtType = 'opm_process_id_effect'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -7930,6 +8731,12 @@ class DBRefProvPlan(object):
 
     vtType = 'ref_prov_plan'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_prov_ref',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -8002,8 +8809,18 @@ class DBOpmAccounts(object):
 
     vtType = 'opm_accounts'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_accounts',
+                 'db_accounts_id_index',
+                 '_db_accounts',
+                 '_db_deleted_opm_overlapss',
+                 '_db_opm_overlapss',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, accounts=None, opm_overlapss=None):
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         self.db_accounts_id_index = {}
         if accounts is None:
             self._db_accounts = []
@@ -8011,7 +8828,7 @@ class DBOpmAccounts(object):
             self._db_accounts = accounts
             for v in self._db_accounts:
                 self.db_accounts_id_index[v.db_id] = v
-        self.db_deleted_opm_overlapss = []
+        self._db_deleted_opm_overlapss = None
         if opm_overlapss is None:
             self._db_opm_overlapss = []
         else:
@@ -8102,11 +8919,13 @@ class DBOpmAccounts(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_overlapss)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_opm_overlapss is not None:
+            children.extend(self._db_deleted_opm_overlapss)
         if remove:
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_overlapss = []
+            self._db_deleted_accounts = None
+            self._db_deleted_opm_overlapss = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -8124,6 +8943,13 @@ class DBOpmAccounts(object):
         self._db_accounts = accounts
         self.is_dirty = True
     db_accounts = property(__get_db_accounts, __set_db_accounts)
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     def db_get_accounts(self):
         return self._db_accounts
     def db_add_account(self, account):
@@ -8166,6 +8992,13 @@ class DBOpmAccounts(object):
         self._db_opm_overlapss = opm_overlapss
         self.is_dirty = True
     db_opm_overlapss = property(__get_db_opm_overlapss, __set_db_opm_overlapss)
+    def __get_db_deleted_opm_overlapss(self):
+        if self._db_deleted_opm_overlapss is None:
+            self._db_deleted_opm_overlapss = []
+        return self._db_deleted_opm_overlapss
+    def __set_db_deleted_opm_overlapss(self, deleted):
+        self._db_deleted_opm_overlapss = deleted
+    db_deleted_opm_overlapss = property(__get_db_deleted_opm_overlapss, __set_db_deleted_opm_overlapss)
     def db_get_opm_overlapss(self):
         return self._db_opm_overlapss
     def db_add_opm_overlaps(self, opm_overlaps):
@@ -8186,6 +9019,12 @@ class DBRefProvAgent(object):
 
     vtType = 'ref_prov_agent'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_prov_ref',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -8258,6 +9097,22 @@ class DBPortSpec(object):
 
     vtType = 'portSpec'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_name',
+                 '_db_type',
+                 '_db_optional',
+                 '_db_depth',
+                 '_db_sort_key',
+                 '_db_deleted_portSpecItems',
+                 'db_portSpecItems_id_index',
+                 '_db_portSpecItems',
+                 '_db_min_conns',
+                 '_db_max_conns',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, name=None, type=None, optional=None, depth=None, sort_key=None, portSpecItems=None, min_conns=None, max_conns=None):
         self._db_id = id
         self._db_name = name
@@ -8265,7 +9120,7 @@ class DBPortSpec(object):
         self._db_optional = optional
         self._db_depth = depth
         self._db_sort_key = sort_key
-        self.db_deleted_portSpecItems = []
+        self._db_deleted_portSpecItems = None
         self.db_portSpecItems_id_index = {}
         if portSpecItems is None:
             self._db_portSpecItems = []
@@ -8382,9 +9237,10 @@ class DBPortSpec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_portSpecItems)
+        if self._db_deleted_portSpecItems is not None:
+            children.extend(self._db_deleted_portSpecItems)
         if remove:
-            self.db_deleted_portSpecItems = []
+            self._db_deleted_portSpecItems = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -8477,6 +9333,13 @@ class DBPortSpec(object):
         self._db_portSpecItems = portSpecItems
         self.is_dirty = True
     db_portSpecItems = property(__get_db_portSpecItems, __set_db_portSpecItems)
+    def __get_db_deleted_portSpecItems(self):
+        if self._db_deleted_portSpecItems is None:
+            self._db_deleted_portSpecItems = []
+        return self._db_deleted_portSpecItems
+    def __set_db_deleted_portSpecItems(self, deleted):
+        self._db_deleted_portSpecItems = deleted
+    db_deleted_portSpecItems = property(__get_db_deleted_portSpecItems, __set_db_deleted_portSpecItems)
     def db_get_portSpecItems(self):
         return self._db_portSpecItems
     def db_add_portSpecItem(self, portSpecItem):
@@ -8546,8 +9409,16 @@ class DBEnabledPackages(object):
 
     vtType = 'enabled_packages'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_packages',
+                 'db_packages_name_index',
+                 '_db_packages',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, packages=None):
-        self.db_deleted_packages = []
+        self._db_deleted_packages = None
         self.db_packages_name_index = {}
         if packages is None:
             self._db_packages = []
@@ -8619,9 +9490,10 @@ class DBEnabledPackages(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_packages)
+        if self._db_deleted_packages is not None:
+            children.extend(self._db_deleted_packages)
         if remove:
-            self.db_deleted_packages = []
+            self._db_deleted_packages = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -8636,6 +9508,13 @@ class DBEnabledPackages(object):
         self._db_packages = packages
         self.is_dirty = True
     db_packages = property(__get_db_packages, __set_db_packages)
+    def __get_db_deleted_packages(self):
+        if self._db_deleted_packages is None:
+            self._db_deleted_packages = []
+        return self._db_deleted_packages
+    def __set_db_deleted_packages(self, deleted):
+        self._db_deleted_packages = deleted
+    db_deleted_packages = property(__get_db_deleted_packages, __set_db_deleted_packages)
     def db_get_packages(self):
         return self._db_packages
     def db_add_package(self, package):
@@ -8662,11 +9541,21 @@ class DBOpmArtifact(object):
 
     vtType = 'opm_artifact'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_deleted_value',
+                 '_db_value',
+                 '_db_deleted_accounts',
+                 '_db_accounts',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, value=None, accounts=None):
         self._db_id = id
-        self.db_deleted_value = []
+        self._db_deleted_value = None
         self._db_value = value
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
@@ -8755,11 +9644,13 @@ class DBOpmArtifact(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
-        children.extend(self.db_deleted_accounts)
+        if self._db_deleted_value is not None:
+            children.extend(self._db_deleted_value)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
         if remove:
-            self.db_deleted_value = []
-            self.db_deleted_accounts = []
+            self._db_deleted_value = None
+            self._db_deleted_accounts = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -8789,6 +9680,13 @@ class DBOpmArtifact(object):
         self._db_value = value
         self.is_dirty = True
     db_value = property(__get_db_value, __set_db_value)
+    def __get_db_deleted_value(self):
+        if self._db_deleted_value is None:
+            self._db_deleted_value = []
+        return self._db_deleted_value
+    def __set_db_deleted_value(self, deleted):
+        self._db_deleted_value = deleted
+    db_deleted_value = property(__get_db_deleted_value, __set_db_deleted_value)
     def db_add_value(self, value):
         self._db_value = value
     def db_change_value(self, value):
@@ -8804,6 +9702,13 @@ class DBOpmArtifact(object):
         self._db_accounts = accounts
         self.is_dirty = True
     db_accounts = property(__get_db_accounts, __set_db_accounts)
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     def db_get_accounts(self):
         return self._db_accounts
     def db_add_account(self, account):
@@ -8825,13 +9730,27 @@ class DBLog(object):
 
     vtType = 'log'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_entity_type',
+                 '_db_version',
+                 '_db_name',
+                 '_db_last_modified',
+                 '_db_deleted_workflow_execs',
+                 'db_workflow_execs_id_index',
+                 '_db_workflow_execs',
+                 '_db_vistrail_id',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, entity_type=None, version=None, name=None, last_modified=None, workflow_execs=None, vistrail_id=None):
         self._db_id = id
         self._db_entity_type = entity_type
         self._db_version = version
         self._db_name = name
         self._db_last_modified = last_modified
-        self.db_deleted_workflow_execs = []
+        self._db_deleted_workflow_execs = None
         self.db_workflow_execs_id_index = {}
         if workflow_execs is None:
             self._db_workflow_execs = []
@@ -8941,9 +9860,10 @@ class DBLog(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_workflow_execs)
+        if self._db_deleted_workflow_execs is not None:
+            children.extend(self._db_deleted_workflow_execs)
         if remove:
-            self.db_deleted_workflow_execs = []
+            self._db_deleted_workflow_execs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -9023,6 +9943,13 @@ class DBLog(object):
         self._db_workflow_execs = workflow_execs
         self.is_dirty = True
     db_workflow_execs = property(__get_db_workflow_execs, __set_db_workflow_execs)
+    def __get_db_deleted_workflow_execs(self):
+        if self._db_deleted_workflow_execs is None:
+            self._db_deleted_workflow_execs = []
+        return self._db_deleted_workflow_execs
+    def __set_db_deleted_workflow_execs(self, deleted):
+        self._db_deleted_workflow_execs = deleted
+    db_deleted_workflow_execs = property(__get_db_deleted_workflow_execs, __set_db_deleted_workflow_execs)
     def db_get_workflow_execs(self):
         return self._db_workflow_execs
     def db_add_workflow_exec(self, workflow_exec):
@@ -9079,8 +10006,22 @@ class DBLoopIteration(object):
 
     vtType = 'loop_iteration'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_item_execs',
+                 'db_item_execs_id_index',
+                 '_db_item_execs',
+                 '_db_id',
+                 '_db_ts_start',
+                 '_db_ts_end',
+                 '_db_iteration',
+                 '_db_completed',
+                 '_db_error',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, item_execs=None, id=None, ts_start=None, ts_end=None, iteration=None, completed=None, error=None):
-        self.db_deleted_item_execs = []
+        self._db_deleted_item_execs = None
         self.db_item_execs_id_index = {}
         if item_execs is None:
             self._db_item_execs = []
@@ -9205,9 +10146,10 @@ class DBLoopIteration(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_item_execs)
+        if self._db_deleted_item_execs is not None:
+            children.extend(self._db_deleted_item_execs)
         if remove:
-            self.db_deleted_item_execs = []
+            self._db_deleted_item_execs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -9222,6 +10164,13 @@ class DBLoopIteration(object):
         self._db_item_execs = item_execs
         self.is_dirty = True
     db_item_execs = property(__get_db_item_execs, __set_db_item_execs)
+    def __get_db_deleted_item_execs(self):
+        if self._db_deleted_item_execs is None:
+            self._db_deleted_item_execs = []
+        return self._db_deleted_item_execs
+    def __set_db_deleted_item_execs(self, deleted):
+        self._db_deleted_item_execs = deleted
+    db_deleted_item_execs = property(__get_db_deleted_item_execs, __set_db_deleted_item_execs)
     def db_get_item_execs(self):
         return self._db_item_execs
     def db_add_item_exec(self, item_exec):
@@ -9343,6 +10292,12 @@ class DBOpmProcessIdCause(object):
 
     vtType = 'opm_process_id_cause'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -9415,8 +10370,16 @@ class DBOpmArtifacts(object):
 
     vtType = 'opm_artifacts'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_artifacts',
+                 'db_artifacts_id_index',
+                 '_db_artifacts',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, artifacts=None):
-        self.db_deleted_artifacts = []
+        self._db_deleted_artifacts = None
         self.db_artifacts_id_index = {}
         if artifacts is None:
             self._db_artifacts = []
@@ -9488,9 +10451,10 @@ class DBOpmArtifacts(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_artifacts)
+        if self._db_deleted_artifacts is not None:
+            children.extend(self._db_deleted_artifacts)
         if remove:
-            self.db_deleted_artifacts = []
+            self._db_deleted_artifacts = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -9505,6 +10469,13 @@ class DBOpmArtifacts(object):
         self._db_artifacts = artifacts
         self.is_dirty = True
     db_artifacts = property(__get_db_artifacts, __set_db_artifacts)
+    def __get_db_deleted_artifacts(self):
+        if self._db_deleted_artifacts is None:
+            self._db_deleted_artifacts = []
+        return self._db_deleted_artifacts
+    def __set_db_deleted_artifacts(self, deleted):
+        self._db_deleted_artifacts = deleted
+    db_deleted_artifacts = property(__get_db_deleted_artifacts, __set_db_deleted_artifacts)
     def db_get_artifacts(self):
         return self._db_artifacts
     def db_add_artifact(self, artifact):
@@ -9547,6 +10518,16 @@ class DBPEParameter(object):
 
     vtType = 'pe_parameter'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_pos',
+                 '_db_interpolator',
+                 '_db_value',
+                 '_db_dimension',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, pos=None, interpolator=None, value=None, dimension=None):
         self._db_id = id
         self._db_pos = pos
@@ -9698,8 +10679,34 @@ class DBWorkflowExec(object):
 
     vtType = 'workflow_exec'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_item_execs',
+                 'db_item_execs_id_index',
+                 '_db_item_execs',
+                 '_db_id',
+                 '_db_user',
+                 '_db_ip',
+                 '_db_session',
+                 '_db_vt_version',
+                 '_db_ts_start',
+                 '_db_ts_end',
+                 '_db_parent_id',
+                 '_db_parent_type',
+                 '_db_parent_version',
+                 '_db_completed',
+                 '_db_name',
+                 '_db_deleted_annotations',
+                 'db_annotations_id_index',
+                 '_db_annotations',
+                 '_db_deleted_machines',
+                 'db_machines_id_index',
+                 '_db_machines',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, item_execs=None, id=None, user=None, ip=None, session=None, vt_version=None, ts_start=None, ts_end=None, parent_id=None, parent_type=None, parent_version=None, completed=None, name=None, annotations=None, machines=None):
-        self.db_deleted_item_execs = []
+        self._db_deleted_item_execs = None
         self.db_item_execs_id_index = {}
         if item_execs is None:
             self._db_item_execs = []
@@ -9719,7 +10726,7 @@ class DBWorkflowExec(object):
         self._db_parent_version = parent_version
         self._db_completed = completed
         self._db_name = name
-        self.db_deleted_annotations = []
+        self._db_deleted_annotations = None
         self.db_annotations_id_index = {}
         if annotations is None:
             self._db_annotations = []
@@ -9727,7 +10734,7 @@ class DBWorkflowExec(object):
             self._db_annotations = annotations
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
-        self.db_deleted_machines = []
+        self._db_deleted_machines = None
         self.db_machines_id_index = {}
         if machines is None:
             self._db_machines = []
@@ -9928,13 +10935,16 @@ class DBWorkflowExec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_machines)
-        children.extend(self.db_deleted_item_execs)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_machines is not None:
+            children.extend(self._db_deleted_machines)
+        if self._db_deleted_item_execs is not None:
+            children.extend(self._db_deleted_item_execs)
         if remove:
-            self.db_deleted_annotations = []
-            self.db_deleted_machines = []
-            self.db_deleted_item_execs = []
+            self._db_deleted_annotations = None
+            self._db_deleted_machines = None
+            self._db_deleted_item_execs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -9955,6 +10965,13 @@ class DBWorkflowExec(object):
         self._db_item_execs = item_execs
         self.is_dirty = True
     db_item_execs = property(__get_db_item_execs, __set_db_item_execs)
+    def __get_db_deleted_item_execs(self):
+        if self._db_deleted_item_execs is None:
+            self._db_deleted_item_execs = []
+        return self._db_deleted_item_execs
+    def __set_db_deleted_item_execs(self, deleted):
+        self._db_deleted_item_execs = deleted
+    db_deleted_item_execs = property(__get_db_deleted_item_execs, __set_db_deleted_item_execs)
     def db_get_item_execs(self):
         return self._db_item_execs
     def db_add_item_exec(self, item_exec):
@@ -10153,6 +11170,13 @@ class DBWorkflowExec(object):
         self._db_annotations = annotations
         self.is_dirty = True
     db_annotations = property(__get_db_annotations, __set_db_annotations)
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
     def db_get_annotations(self):
         return self._db_annotations
     def db_add_annotation(self, annotation):
@@ -10195,6 +11219,13 @@ class DBWorkflowExec(object):
         self._db_machines = machines
         self.is_dirty = True
     db_machines = property(__get_db_machines, __set_db_machines)
+    def __get_db_deleted_machines(self):
+        if self._db_deleted_machines is None:
+            self._db_deleted_machines = []
+        return self._db_deleted_machines
+    def __set_db_deleted_machines(self, deleted):
+        self._db_deleted_machines = deleted
+    db_deleted_machines = property(__get_db_deleted_machines, __set_db_deleted_machines)
     def db_get_machines(self):
         return self._db_machines
     def db_add_machine(self, machine):
@@ -10238,6 +11269,14 @@ class DBLocation(object):
 
     vtType = 'location'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_x',
+                 '_db_y',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, x=None, y=None):
         self._db_id = id
         self._db_x = x
@@ -10349,11 +11388,22 @@ class DBFunction(object):
 
     vtType = 'function'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_pos',
+                 '_db_name',
+                 '_db_deleted_parameters',
+                 'db_parameters_id_index',
+                 '_db_parameters',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, pos=None, name=None, parameters=None):
         self._db_id = id
         self._db_pos = pos
         self._db_name = name
-        self.db_deleted_parameters = []
+        self._db_deleted_parameters = None
         self.db_parameters_id_index = {}
         if parameters is None:
             self._db_parameters = []
@@ -10442,9 +11492,10 @@ class DBFunction(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_parameters)
+        if self._db_deleted_parameters is not None:
+            children.extend(self._db_deleted_parameters)
         if remove:
-            self.db_deleted_parameters = []
+            self._db_deleted_parameters = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -10498,6 +11549,13 @@ class DBFunction(object):
         self._db_parameters = parameters
         self.is_dirty = True
     db_parameters = property(__get_db_parameters, __set_db_parameters)
+    def __get_db_deleted_parameters(self):
+        if self._db_deleted_parameters is None:
+            self._db_deleted_parameters = []
+        return self._db_deleted_parameters
+    def __set_db_deleted_parameters(self, deleted):
+        self._db_deleted_parameters = deleted
+    db_deleted_parameters = property(__get_db_deleted_parameters, __set_db_deleted_parameters)
     def db_get_parameters(self):
         return self._db_parameters
     def db_add_parameter(self, parameter):
@@ -10541,6 +11599,17 @@ class DBActionAnnotation(object):
 
     vtType = 'actionAnnotation'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_key',
+                 '_db_value',
+                 '_db_action_id',
+                 '_db_date',
+                 '_db_user',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, key=None, value=None, action_id=None, date=None, user=None):
         self._db_id = id
         self._db_key = key
@@ -10714,6 +11783,22 @@ class DBProvActivity(object):
 
     vtType = 'prov_activity'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_startTime',
+                 '_db_endTime',
+                 '_db_vt_id',
+                 '_db_vt_type',
+                 '_db_vt_cached',
+                 '_db_vt_completed',
+                 '_db_vt_machine_id',
+                 '_db_vt_error',
+                 '_db_deleted_is_part_of',
+                 '_db_is_part_of',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, startTime=None, endTime=None, vt_id=None, vt_type=None, vt_cached=None, vt_completed=None, vt_machine_id=None, vt_error=None, is_part_of=None):
         self._db_id = id
         self._db_startTime = startTime
@@ -10724,7 +11809,7 @@ class DBProvActivity(object):
         self._db_vt_completed = vt_completed
         self._db_vt_machine_id = vt_machine_id
         self._db_vt_error = vt_error
-        self.db_deleted_is_part_of = []
+        self._db_deleted_is_part_of = None
         self._db_is_part_of = is_part_of
         self.is_dirty = True
         self.is_new = True
@@ -10836,9 +11921,10 @@ class DBProvActivity(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_is_part_of)
+        if self._db_deleted_is_part_of is not None:
+            children.extend(self._db_deleted_is_part_of)
         if remove:
-            self.db_deleted_is_part_of = []
+            self._db_deleted_is_part_of = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -10969,6 +12055,13 @@ class DBProvActivity(object):
         self._db_is_part_of = is_part_of
         self.is_dirty = True
     db_is_part_of = property(__get_db_is_part_of, __set_db_is_part_of)
+    def __get_db_deleted_is_part_of(self):
+        if self._db_deleted_is_part_of is None:
+            self._db_deleted_is_part_of = []
+        return self._db_deleted_is_part_of
+    def __set_db_deleted_is_part_of(self, deleted):
+        self._db_deleted_is_part_of = deleted
+    db_deleted_is_part_of = property(__get_db_deleted_is_part_of, __set_db_deleted_is_part_of)
     def db_add_is_part_of(self, is_part_of):
         self._db_is_part_of = is_part_of
     def db_change_is_part_of(self, is_part_of):
@@ -10985,10 +12078,20 @@ class DBProvUsage(object):
 
     vtType = 'prov_usage'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_prov_activity',
+                 '_db_prov_activity',
+                 '_db_deleted_prov_entity',
+                 '_db_prov_entity',
+                 '_db_prov_role',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, prov_activity=None, prov_entity=None, prov_role=None):
-        self.db_deleted_prov_activity = []
+        self._db_deleted_prov_activity = None
         self._db_prov_activity = prov_activity
-        self.db_deleted_prov_entity = []
+        self._db_deleted_prov_entity = None
         self._db_prov_entity = prov_entity
         self._db_prov_role = prov_role
         self.is_dirty = True
@@ -11069,11 +12172,13 @@ class DBProvUsage(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_prov_activity)
-        children.extend(self.db_deleted_prov_entity)
+        if self._db_deleted_prov_activity is not None:
+            children.extend(self._db_deleted_prov_activity)
+        if self._db_deleted_prov_entity is not None:
+            children.extend(self._db_deleted_prov_entity)
         if remove:
-            self.db_deleted_prov_activity = []
-            self.db_deleted_prov_entity = []
+            self._db_deleted_prov_activity = None
+            self._db_deleted_prov_entity = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -11089,6 +12194,13 @@ class DBProvUsage(object):
         self._db_prov_activity = prov_activity
         self.is_dirty = True
     db_prov_activity = property(__get_db_prov_activity, __set_db_prov_activity)
+    def __get_db_deleted_prov_activity(self):
+        if self._db_deleted_prov_activity is None:
+            self._db_deleted_prov_activity = []
+        return self._db_deleted_prov_activity
+    def __set_db_deleted_prov_activity(self, deleted):
+        self._db_deleted_prov_activity = deleted
+    db_deleted_prov_activity = property(__get_db_deleted_prov_activity, __set_db_deleted_prov_activity)
     def db_add_prov_activity(self, prov_activity):
         self._db_prov_activity = prov_activity
     def db_change_prov_activity(self, prov_activity):
@@ -11104,6 +12216,13 @@ class DBProvUsage(object):
         self._db_prov_entity = prov_entity
         self.is_dirty = True
     db_prov_entity = property(__get_db_prov_entity, __set_db_prov_entity)
+    def __get_db_deleted_prov_entity(self):
+        if self._db_deleted_prov_entity is None:
+            self._db_deleted_prov_entity = []
+        return self._db_deleted_prov_entity
+    def __set_db_deleted_prov_entity(self, deleted):
+        self._db_deleted_prov_entity = deleted
+    db_deleted_prov_entity = property(__get_db_deleted_prov_entity, __set_db_deleted_prov_entity)
     def db_add_prov_entity(self, prov_entity):
         self._db_prov_entity = prov_entity
     def db_change_prov_entity(self, prov_entity):
@@ -11132,6 +12251,12 @@ class DBOpmArtifactIdEffect(object):
 
     vtType = 'opm_artifact_id_effect'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -11204,16 +12329,31 @@ class DBOpmGraph(object):
 
     vtType = 'opm_graph'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_accounts',
+                 '_db_accounts',
+                 '_db_deleted_processes',
+                 '_db_processes',
+                 '_db_deleted_artifacts',
+                 '_db_artifacts',
+                 '_db_deleted_agents',
+                 '_db_agents',
+                 '_db_deleted_dependencies',
+                 '_db_dependencies',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, accounts=None, processes=None, artifacts=None, agents=None, dependencies=None):
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         self._db_accounts = accounts
-        self.db_deleted_processes = []
+        self._db_deleted_processes = None
         self._db_processes = processes
-        self.db_deleted_artifacts = []
+        self._db_deleted_artifacts = None
         self._db_artifacts = artifacts
-        self.db_deleted_agents = []
+        self._db_deleted_agents = None
         self._db_agents = agents
-        self.db_deleted_dependencies = []
+        self._db_deleted_dependencies = None
         self._db_dependencies = dependencies
         self.is_dirty = True
         self.is_new = True
@@ -11336,17 +12476,22 @@ class DBOpmGraph(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_processes)
-        children.extend(self.db_deleted_artifacts)
-        children.extend(self.db_deleted_agents)
-        children.extend(self.db_deleted_dependencies)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_processes is not None:
+            children.extend(self._db_deleted_processes)
+        if self._db_deleted_artifacts is not None:
+            children.extend(self._db_deleted_artifacts)
+        if self._db_deleted_agents is not None:
+            children.extend(self._db_deleted_agents)
+        if self._db_deleted_dependencies is not None:
+            children.extend(self._db_deleted_dependencies)
         if remove:
-            self.db_deleted_accounts = []
-            self.db_deleted_processes = []
-            self.db_deleted_artifacts = []
-            self.db_deleted_agents = []
-            self.db_deleted_dependencies = []
+            self._db_deleted_accounts = None
+            self._db_deleted_processes = None
+            self._db_deleted_artifacts = None
+            self._db_deleted_agents = None
+            self._db_deleted_dependencies = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -11368,6 +12513,13 @@ class DBOpmGraph(object):
         self._db_accounts = accounts
         self.is_dirty = True
     db_accounts = property(__get_db_accounts, __set_db_accounts)
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     def db_add_accounts(self, accounts):
         self._db_accounts = accounts
     def db_change_accounts(self, accounts):
@@ -11383,6 +12535,13 @@ class DBOpmGraph(object):
         self._db_processes = processes
         self.is_dirty = True
     db_processes = property(__get_db_processes, __set_db_processes)
+    def __get_db_deleted_processes(self):
+        if self._db_deleted_processes is None:
+            self._db_deleted_processes = []
+        return self._db_deleted_processes
+    def __set_db_deleted_processes(self, deleted):
+        self._db_deleted_processes = deleted
+    db_deleted_processes = property(__get_db_deleted_processes, __set_db_deleted_processes)
     def db_add_processes(self, processes):
         self._db_processes = processes
     def db_change_processes(self, processes):
@@ -11398,6 +12557,13 @@ class DBOpmGraph(object):
         self._db_artifacts = artifacts
         self.is_dirty = True
     db_artifacts = property(__get_db_artifacts, __set_db_artifacts)
+    def __get_db_deleted_artifacts(self):
+        if self._db_deleted_artifacts is None:
+            self._db_deleted_artifacts = []
+        return self._db_deleted_artifacts
+    def __set_db_deleted_artifacts(self, deleted):
+        self._db_deleted_artifacts = deleted
+    db_deleted_artifacts = property(__get_db_deleted_artifacts, __set_db_deleted_artifacts)
     def db_add_artifacts(self, artifacts):
         self._db_artifacts = artifacts
     def db_change_artifacts(self, artifacts):
@@ -11413,6 +12579,13 @@ class DBOpmGraph(object):
         self._db_agents = agents
         self.is_dirty = True
     db_agents = property(__get_db_agents, __set_db_agents)
+    def __get_db_deleted_agents(self):
+        if self._db_deleted_agents is None:
+            self._db_deleted_agents = []
+        return self._db_deleted_agents
+    def __set_db_deleted_agents(self, deleted):
+        self._db_deleted_agents = deleted
+    db_deleted_agents = property(__get_db_deleted_agents, __set_db_deleted_agents)
     def db_add_agents(self, agents):
         self._db_agents = agents
     def db_change_agents(self, agents):
@@ -11428,6 +12601,13 @@ class DBOpmGraph(object):
         self._db_dependencies = dependencies
         self.is_dirty = True
     db_dependencies = property(__get_db_dependencies, __set_db_dependencies)
+    def __get_db_deleted_dependencies(self):
+        if self._db_deleted_dependencies is None:
+            self._db_deleted_dependencies = []
+        return self._db_deleted_dependencies
+    def __set_db_deleted_dependencies(self, deleted):
+        self._db_deleted_dependencies = deleted
+    db_deleted_dependencies = property(__get_db_deleted_dependencies, __set_db_deleted_dependencies)
     def db_add_dependencies(self, dependencies):
         self._db_dependencies = dependencies
     def db_change_dependencies(self, dependencies):
@@ -11443,6 +12623,12 @@ class DBIsPartOf(object):
 
     vtType = 'is_part_of'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_prov_ref',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -11513,19 +12699,34 @@ class DBOpmWasDerivedFrom(object):
 
     vtType = 'opm_was_derived_from'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_effect',
+                 '_db_effect',
+                 '_db_deleted_role',
+                 '_db_role',
+                 '_db_deleted_cause',
+                 '_db_cause',
+                 '_db_deleted_accounts',
+                 '_db_accounts',
+                 '_db_deleted_opm_times',
+                 '_db_opm_times',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, opm_times=None):
-        self.db_deleted_effect = []
+        self._db_deleted_effect = None
         self._db_effect = effect
-        self.db_deleted_role = []
+        self._db_deleted_role = None
         self._db_role = role
-        self.db_deleted_cause = []
+        self._db_deleted_cause = None
         self._db_cause = cause
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_opm_times = []
+        self._db_deleted_opm_times = None
         if opm_times is None:
             self._db_opm_times = []
         else:
@@ -11663,17 +12864,22 @@ class DBOpmWasDerivedFrom(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_times)
+        if self._db_deleted_effect is not None:
+            children.extend(self._db_deleted_effect)
+        if self._db_deleted_role is not None:
+            children.extend(self._db_deleted_role)
+        if self._db_deleted_cause is not None:
+            children.extend(self._db_deleted_cause)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_opm_times is not None:
+            children.extend(self._db_deleted_opm_times)
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_times = []
+            self._db_deleted_effect = None
+            self._db_deleted_role = None
+            self._db_deleted_cause = None
+            self._db_deleted_accounts = None
+            self._db_deleted_opm_times = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -11697,6 +12903,13 @@ class DBOpmWasDerivedFrom(object):
         self._db_effect = effect
         self.is_dirty = True
     db_effect = property(__get_db_effect, __set_db_effect)
+    def __get_db_deleted_effect(self):
+        if self._db_deleted_effect is None:
+            self._db_deleted_effect = []
+        return self._db_deleted_effect
+    def __set_db_deleted_effect(self, deleted):
+        self._db_deleted_effect = deleted
+    db_deleted_effect = property(__get_db_deleted_effect, __set_db_deleted_effect)
     def db_add_effect(self, effect):
         self._db_effect = effect
     def db_change_effect(self, effect):
@@ -11712,6 +12925,13 @@ class DBOpmWasDerivedFrom(object):
         self._db_role = role
         self.is_dirty = True
     db_role = property(__get_db_role, __set_db_role)
+    def __get_db_deleted_role(self):
+        if self._db_deleted_role is None:
+            self._db_deleted_role = []
+        return self._db_deleted_role
+    def __set_db_deleted_role(self, deleted):
+        self._db_deleted_role = deleted
+    db_deleted_role = property(__get_db_deleted_role, __set_db_deleted_role)
     def db_add_role(self, role):
         self._db_role = role
     def db_change_role(self, role):
@@ -11727,6 +12947,13 @@ class DBOpmWasDerivedFrom(object):
         self._db_cause = cause
         self.is_dirty = True
     db_cause = property(__get_db_cause, __set_db_cause)
+    def __get_db_deleted_cause(self):
+        if self._db_deleted_cause is None:
+            self._db_deleted_cause = []
+        return self._db_deleted_cause
+    def __set_db_deleted_cause(self, deleted):
+        self._db_deleted_cause = deleted
+    db_deleted_cause = property(__get_db_deleted_cause, __set_db_deleted_cause)
     def db_add_cause(self, cause):
         self._db_cause = cause
     def db_change_cause(self, cause):
@@ -11742,6 +12969,13 @@ class DBOpmWasDerivedFrom(object):
         self._db_accounts = accounts
         self.is_dirty = True
     db_accounts = property(__get_db_accounts, __set_db_accounts)
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     def db_get_accounts(self):
         return self._db_accounts
     def db_add_account(self, account):
@@ -11762,6 +12996,13 @@ class DBOpmWasDerivedFrom(object):
         self._db_opm_times = opm_times
         self.is_dirty = True
     db_opm_times = property(__get_db_opm_times, __set_db_opm_times)
+    def __get_db_deleted_opm_times(self):
+        if self._db_deleted_opm_times is None:
+            self._db_deleted_opm_times = []
+        return self._db_deleted_opm_times
+    def __set_db_deleted_opm_times(self, deleted):
+        self._db_deleted_opm_times = deleted
+    db_deleted_opm_times = property(__get_db_deleted_opm_times, __set_db_deleted_opm_times)
     def db_get_opm_times(self):
         return self._db_opm_times
     def db_add_opm_time(self, opm_time):
@@ -11782,6 +13023,14 @@ class DBControlParameter(object):
 
     vtType = 'controlParameter'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_name',
+                 '_db_value',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, name=None, value=None):
         self._db_id = id
         self._db_name = name
@@ -11893,6 +13142,13 @@ class DBPluginData(object):
 
     vtType = 'plugin_data'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_data',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, data=None):
         self._db_id = id
         self._db_data = data
@@ -11984,6 +13240,16 @@ class DBDelete(object):
 
     vtType = 'delete'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_what',
+                 '_db_objectId',
+                 '_db_parentObjId',
+                 '_db_parentObjType',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, what=None, objectId=None, parentObjId=None, parentObjType=None):
         self._db_id = id
         self._db_what = what
@@ -12139,6 +13405,17 @@ class DBVistrailVariable(object):
 
     vtType = 'vistrailVariable'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_name',
+                 '_db_uuid',
+                 '_db_package',
+                 '_db_module',
+                 '_db_namespace',
+                 '_db_value',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, name=None, uuid=None, package=None, module=None, namespace=None, value=None):
         self._db_name = name
         self._db_uuid = uuid
@@ -12310,8 +13587,15 @@ class DBOpmOverlaps(object):
 
     vtType = 'opm_overlaps'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_opm_account_ids',
+                 '_db_opm_account_ids',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, opm_account_ids=None):
-        self.db_deleted_opm_account_ids = []
+        self._db_deleted_opm_account_ids = None
         if opm_account_ids is None:
             self._db_opm_account_ids = []
         else:
@@ -12379,9 +13663,10 @@ class DBOpmOverlaps(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_opm_account_ids)
+        if self._db_deleted_opm_account_ids is not None:
+            children.extend(self._db_deleted_opm_account_ids)
         if remove:
-            self.db_deleted_opm_account_ids = []
+            self._db_deleted_opm_account_ids = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -12396,6 +13681,13 @@ class DBOpmOverlaps(object):
         self._db_opm_account_ids = opm_account_ids
         self.is_dirty = True
     db_opm_account_ids = property(__get_db_opm_account_ids, __set_db_opm_account_ids)
+    def __get_db_deleted_opm_account_ids(self):
+        if self._db_deleted_opm_account_ids is None:
+            self._db_deleted_opm_account_ids = []
+        return self._db_deleted_opm_account_ids
+    def __set_db_deleted_opm_account_ids(self, deleted):
+        self._db_deleted_opm_account_ids = deleted
+    db_deleted_opm_account_ids = property(__get_db_deleted_opm_account_ids, __set_db_deleted_opm_account_ids)
     def db_get_opm_account_ids(self):
         return self._db_opm_account_ids
     def db_add_opm_account_id(self, opm_account_id):
@@ -12416,19 +13708,34 @@ class DBOpmWasTriggeredBy(object):
 
     vtType = 'opm_was_triggered_by'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_effect',
+                 '_db_effect',
+                 '_db_deleted_role',
+                 '_db_role',
+                 '_db_deleted_cause',
+                 '_db_cause',
+                 '_db_deleted_accounts',
+                 '_db_accounts',
+                 '_db_deleted_opm_times',
+                 '_db_opm_times',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, opm_times=None):
-        self.db_deleted_effect = []
+        self._db_deleted_effect = None
         self._db_effect = effect
-        self.db_deleted_role = []
+        self._db_deleted_role = None
         self._db_role = role
-        self.db_deleted_cause = []
+        self._db_deleted_cause = None
         self._db_cause = cause
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_opm_times = []
+        self._db_deleted_opm_times = None
         if opm_times is None:
             self._db_opm_times = []
         else:
@@ -12566,17 +13873,22 @@ class DBOpmWasTriggeredBy(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_times)
+        if self._db_deleted_effect is not None:
+            children.extend(self._db_deleted_effect)
+        if self._db_deleted_role is not None:
+            children.extend(self._db_deleted_role)
+        if self._db_deleted_cause is not None:
+            children.extend(self._db_deleted_cause)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_opm_times is not None:
+            children.extend(self._db_deleted_opm_times)
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_times = []
+            self._db_deleted_effect = None
+            self._db_deleted_role = None
+            self._db_deleted_cause = None
+            self._db_deleted_accounts = None
+            self._db_deleted_opm_times = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -12600,6 +13912,13 @@ class DBOpmWasTriggeredBy(object):
         self._db_effect = effect
         self.is_dirty = True
     db_effect = property(__get_db_effect, __set_db_effect)
+    def __get_db_deleted_effect(self):
+        if self._db_deleted_effect is None:
+            self._db_deleted_effect = []
+        return self._db_deleted_effect
+    def __set_db_deleted_effect(self, deleted):
+        self._db_deleted_effect = deleted
+    db_deleted_effect = property(__get_db_deleted_effect, __set_db_deleted_effect)
     def db_add_effect(self, effect):
         self._db_effect = effect
     def db_change_effect(self, effect):
@@ -12615,6 +13934,13 @@ class DBOpmWasTriggeredBy(object):
         self._db_role = role
         self.is_dirty = True
     db_role = property(__get_db_role, __set_db_role)
+    def __get_db_deleted_role(self):
+        if self._db_deleted_role is None:
+            self._db_deleted_role = []
+        return self._db_deleted_role
+    def __set_db_deleted_role(self, deleted):
+        self._db_deleted_role = deleted
+    db_deleted_role = property(__get_db_deleted_role, __set_db_deleted_role)
     def db_add_role(self, role):
         self._db_role = role
     def db_change_role(self, role):
@@ -12630,6 +13956,13 @@ class DBOpmWasTriggeredBy(object):
         self._db_cause = cause
         self.is_dirty = True
     db_cause = property(__get_db_cause, __set_db_cause)
+    def __get_db_deleted_cause(self):
+        if self._db_deleted_cause is None:
+            self._db_deleted_cause = []
+        return self._db_deleted_cause
+    def __set_db_deleted_cause(self, deleted):
+        self._db_deleted_cause = deleted
+    db_deleted_cause = property(__get_db_deleted_cause, __set_db_deleted_cause)
     def db_add_cause(self, cause):
         self._db_cause = cause
     def db_change_cause(self, cause):
@@ -12645,6 +13978,13 @@ class DBOpmWasTriggeredBy(object):
         self._db_accounts = accounts
         self.is_dirty = True
     db_accounts = property(__get_db_accounts, __set_db_accounts)
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     def db_get_accounts(self):
         return self._db_accounts
     def db_add_account(self, account):
@@ -12665,6 +14005,13 @@ class DBOpmWasTriggeredBy(object):
         self._db_opm_times = opm_times
         self.is_dirty = True
     db_opm_times = property(__get_db_opm_times, __set_db_opm_times)
+    def __get_db_deleted_opm_times(self):
+        if self._db_deleted_opm_times is None:
+            self._db_deleted_opm_times = []
+        return self._db_deleted_opm_times
+    def __set_db_deleted_opm_times(self, deleted):
+        self._db_deleted_opm_times = deleted
+    db_deleted_opm_times = property(__get_db_deleted_opm_times, __set_db_deleted_opm_times)
     def db_get_opm_times(self):
         return self._db_opm_times
     def db_add_opm_time(self, opm_time):
@@ -12685,6 +14032,22 @@ class DBModuleDescriptor(object):
 
     vtType = 'module_descriptor'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_name',
+                 '_db_package',
+                 '_db_namespace',
+                 '_db_package_version',
+                 '_db_version',
+                 '_db_base_descriptor_id',
+                 '_db_deleted_portSpecs',
+                 'db_portSpecs_id_index',
+                 'db_portSpecs_name_index',
+                 '_db_portSpecs',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, name=None, package=None, namespace=None, package_version=None, version=None, base_descriptor_id=None, portSpecs=None):
         self._db_id = id
         self._db_name = name
@@ -12693,7 +14056,7 @@ class DBModuleDescriptor(object):
         self._db_package_version = package_version
         self._db_version = version
         self._db_base_descriptor_id = base_descriptor_id
-        self.db_deleted_portSpecs = []
+        self._db_deleted_portSpecs = None
         self.db_portSpecs_id_index = {}
         self.db_portSpecs_name_index = {}
         if portSpecs is None:
@@ -12811,9 +14174,10 @@ class DBModuleDescriptor(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_portSpecs)
+        if self._db_deleted_portSpecs is not None:
+            children.extend(self._db_deleted_portSpecs)
         if remove:
-            self.db_deleted_portSpecs = []
+            self._db_deleted_portSpecs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -12919,6 +14283,13 @@ class DBModuleDescriptor(object):
         self._db_portSpecs = portSpecs
         self.is_dirty = True
     db_portSpecs = property(__get_db_portSpecs, __set_db_portSpecs)
+    def __get_db_deleted_portSpecs(self):
+        if self._db_deleted_portSpecs is None:
+            self._db_deleted_portSpecs = []
+        return self._db_deleted_portSpecs
+    def __set_db_deleted_portSpecs(self, deleted):
+        self._db_deleted_portSpecs = deleted
+    db_deleted_portSpecs = property(__get_db_deleted_portSpecs, __set_db_deleted_portSpecs)
     def db_get_portSpecs(self):
         return self._db_portSpecs
     def db_add_portSpec(self, portSpec):
@@ -12969,6 +14340,13 @@ class DBTag(object):
 
     vtType = 'tag'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_name',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, name=None):
         self._db_id = id
         self._db_name = name
@@ -13062,6 +14440,12 @@ class DBOpmRole(object):
 
     vtType = 'opm_role'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_value',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -13132,8 +14516,31 @@ class DBProvDocument(object):
 
     vtType = 'prov_document'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_prov_entitys',
+                 'db_prov_entitys_id_index',
+                 '_db_prov_entitys',
+                 '_db_deleted_prov_activitys',
+                 'db_prov_activitys_id_index',
+                 '_db_prov_activitys',
+                 '_db_deleted_prov_agents',
+                 'db_prov_agents_id_index',
+                 '_db_prov_agents',
+                 '_db_deleted_vt_connections',
+                 'db_vt_connections_id_index',
+                 '_db_vt_connections',
+                 '_db_deleted_prov_usages',
+                 '_db_prov_usages',
+                 '_db_deleted_prov_generations',
+                 '_db_prov_generations',
+                 '_db_deleted_prov_associations',
+                 '_db_prov_associations',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, prov_entitys=None, prov_activitys=None, prov_agents=None, vt_connections=None, prov_usages=None, prov_generations=None, prov_associations=None):
-        self.db_deleted_prov_entitys = []
+        self._db_deleted_prov_entitys = None
         self.db_prov_entitys_id_index = {}
         if prov_entitys is None:
             self._db_prov_entitys = []
@@ -13141,7 +14548,7 @@ class DBProvDocument(object):
             self._db_prov_entitys = prov_entitys
             for v in self._db_prov_entitys:
                 self.db_prov_entitys_id_index[v.db_id] = v
-        self.db_deleted_prov_activitys = []
+        self._db_deleted_prov_activitys = None
         self.db_prov_activitys_id_index = {}
         if prov_activitys is None:
             self._db_prov_activitys = []
@@ -13149,7 +14556,7 @@ class DBProvDocument(object):
             self._db_prov_activitys = prov_activitys
             for v in self._db_prov_activitys:
                 self.db_prov_activitys_id_index[v.db_id] = v
-        self.db_deleted_prov_agents = []
+        self._db_deleted_prov_agents = None
         self.db_prov_agents_id_index = {}
         if prov_agents is None:
             self._db_prov_agents = []
@@ -13157,7 +14564,7 @@ class DBProvDocument(object):
             self._db_prov_agents = prov_agents
             for v in self._db_prov_agents:
                 self.db_prov_agents_id_index[v.db_id] = v
-        self.db_deleted_vt_connections = []
+        self._db_deleted_vt_connections = None
         self.db_vt_connections_id_index = {}
         if vt_connections is None:
             self._db_vt_connections = []
@@ -13165,17 +14572,17 @@ class DBProvDocument(object):
             self._db_vt_connections = vt_connections
             for v in self._db_vt_connections:
                 self.db_vt_connections_id_index[v.db_id] = v
-        self.db_deleted_prov_usages = []
+        self._db_deleted_prov_usages = None
         if prov_usages is None:
             self._db_prov_usages = []
         else:
             self._db_prov_usages = prov_usages
-        self.db_deleted_prov_generations = []
+        self._db_deleted_prov_generations = None
         if prov_generations is None:
             self._db_prov_generations = []
         else:
             self._db_prov_generations = prov_generations
-        self.db_deleted_prov_associations = []
+        self._db_deleted_prov_associations = None
         if prov_associations is None:
             self._db_prov_associations = []
         else:
@@ -13379,21 +14786,28 @@ class DBProvDocument(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_prov_entitys)
-        children.extend(self.db_deleted_prov_activitys)
-        children.extend(self.db_deleted_prov_agents)
-        children.extend(self.db_deleted_vt_connections)
-        children.extend(self.db_deleted_prov_usages)
-        children.extend(self.db_deleted_prov_generations)
-        children.extend(self.db_deleted_prov_associations)
+        if self._db_deleted_prov_entitys is not None:
+            children.extend(self._db_deleted_prov_entitys)
+        if self._db_deleted_prov_activitys is not None:
+            children.extend(self._db_deleted_prov_activitys)
+        if self._db_deleted_prov_agents is not None:
+            children.extend(self._db_deleted_prov_agents)
+        if self._db_deleted_vt_connections is not None:
+            children.extend(self._db_deleted_vt_connections)
+        if self._db_deleted_prov_usages is not None:
+            children.extend(self._db_deleted_prov_usages)
+        if self._db_deleted_prov_generations is not None:
+            children.extend(self._db_deleted_prov_generations)
+        if self._db_deleted_prov_associations is not None:
+            children.extend(self._db_deleted_prov_associations)
         if remove:
-            self.db_deleted_prov_entitys = []
-            self.db_deleted_prov_activitys = []
-            self.db_deleted_prov_agents = []
-            self.db_deleted_vt_connections = []
-            self.db_deleted_prov_usages = []
-            self.db_deleted_prov_generations = []
-            self.db_deleted_prov_associations = []
+            self._db_deleted_prov_entitys = None
+            self._db_deleted_prov_activitys = None
+            self._db_deleted_prov_agents = None
+            self._db_deleted_vt_connections = None
+            self._db_deleted_prov_usages = None
+            self._db_deleted_prov_generations = None
+            self._db_deleted_prov_associations = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -13426,6 +14840,13 @@ class DBProvDocument(object):
         self._db_prov_entitys = prov_entitys
         self.is_dirty = True
     db_prov_entitys = property(__get_db_prov_entitys, __set_db_prov_entitys)
+    def __get_db_deleted_prov_entitys(self):
+        if self._db_deleted_prov_entitys is None:
+            self._db_deleted_prov_entitys = []
+        return self._db_deleted_prov_entitys
+    def __set_db_deleted_prov_entitys(self, deleted):
+        self._db_deleted_prov_entitys = deleted
+    db_deleted_prov_entitys = property(__get_db_deleted_prov_entitys, __set_db_deleted_prov_entitys)
     def db_get_prov_entitys(self):
         return self._db_prov_entitys
     def db_add_prov_entity(self, prov_entity):
@@ -13468,6 +14889,13 @@ class DBProvDocument(object):
         self._db_prov_activitys = prov_activitys
         self.is_dirty = True
     db_prov_activitys = property(__get_db_prov_activitys, __set_db_prov_activitys)
+    def __get_db_deleted_prov_activitys(self):
+        if self._db_deleted_prov_activitys is None:
+            self._db_deleted_prov_activitys = []
+        return self._db_deleted_prov_activitys
+    def __set_db_deleted_prov_activitys(self, deleted):
+        self._db_deleted_prov_activitys = deleted
+    db_deleted_prov_activitys = property(__get_db_deleted_prov_activitys, __set_db_deleted_prov_activitys)
     def db_get_prov_activitys(self):
         return self._db_prov_activitys
     def db_add_prov_activity(self, prov_activity):
@@ -13510,6 +14938,13 @@ class DBProvDocument(object):
         self._db_prov_agents = prov_agents
         self.is_dirty = True
     db_prov_agents = property(__get_db_prov_agents, __set_db_prov_agents)
+    def __get_db_deleted_prov_agents(self):
+        if self._db_deleted_prov_agents is None:
+            self._db_deleted_prov_agents = []
+        return self._db_deleted_prov_agents
+    def __set_db_deleted_prov_agents(self, deleted):
+        self._db_deleted_prov_agents = deleted
+    db_deleted_prov_agents = property(__get_db_deleted_prov_agents, __set_db_deleted_prov_agents)
     def db_get_prov_agents(self):
         return self._db_prov_agents
     def db_add_prov_agent(self, prov_agent):
@@ -13552,6 +14987,13 @@ class DBProvDocument(object):
         self._db_vt_connections = vt_connections
         self.is_dirty = True
     db_vt_connections = property(__get_db_vt_connections, __set_db_vt_connections)
+    def __get_db_deleted_vt_connections(self):
+        if self._db_deleted_vt_connections is None:
+            self._db_deleted_vt_connections = []
+        return self._db_deleted_vt_connections
+    def __set_db_deleted_vt_connections(self, deleted):
+        self._db_deleted_vt_connections = deleted
+    db_deleted_vt_connections = property(__get_db_deleted_vt_connections, __set_db_deleted_vt_connections)
     def db_get_vt_connections(self):
         return self._db_vt_connections
     def db_add_vt_connection(self, vt_connection):
@@ -13594,6 +15036,13 @@ class DBProvDocument(object):
         self._db_prov_usages = prov_usages
         self.is_dirty = True
     db_prov_usages = property(__get_db_prov_usages, __set_db_prov_usages)
+    def __get_db_deleted_prov_usages(self):
+        if self._db_deleted_prov_usages is None:
+            self._db_deleted_prov_usages = []
+        return self._db_deleted_prov_usages
+    def __set_db_deleted_prov_usages(self, deleted):
+        self._db_deleted_prov_usages = deleted
+    db_deleted_prov_usages = property(__get_db_deleted_prov_usages, __set_db_deleted_prov_usages)
     def db_get_prov_usages(self):
         return self._db_prov_usages
     def db_add_prov_usage(self, prov_usage):
@@ -13614,6 +15063,13 @@ class DBProvDocument(object):
         self._db_prov_generations = prov_generations
         self.is_dirty = True
     db_prov_generations = property(__get_db_prov_generations, __set_db_prov_generations)
+    def __get_db_deleted_prov_generations(self):
+        if self._db_deleted_prov_generations is None:
+            self._db_deleted_prov_generations = []
+        return self._db_deleted_prov_generations
+    def __set_db_deleted_prov_generations(self, deleted):
+        self._db_deleted_prov_generations = deleted
+    db_deleted_prov_generations = property(__get_db_deleted_prov_generations, __set_db_deleted_prov_generations)
     def db_get_prov_generations(self):
         return self._db_prov_generations
     def db_add_prov_generation(self, prov_generation):
@@ -13634,6 +15090,13 @@ class DBProvDocument(object):
         self._db_prov_associations = prov_associations
         self.is_dirty = True
     db_prov_associations = property(__get_db_prov_associations, __set_db_prov_associations)
+    def __get_db_deleted_prov_associations(self):
+        if self._db_deleted_prov_associations is None:
+            self._db_deleted_prov_associations = []
+        return self._db_deleted_prov_associations
+    def __set_db_deleted_prov_associations(self, deleted):
+        self._db_deleted_prov_associations = deleted
+    db_deleted_prov_associations = property(__get_db_deleted_prov_associations, __set_db_deleted_prov_associations)
     def db_get_prov_associations(self):
         return self._db_prov_associations
     def db_add_prov_association(self, prov_association):
@@ -13654,8 +15117,16 @@ class DBOpmProcesses(object):
 
     vtType = 'opm_processes'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_processs',
+                 'db_processs_id_index',
+                 '_db_processs',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, processs=None):
-        self.db_deleted_processs = []
+        self._db_deleted_processs = None
         self.db_processs_id_index = {}
         if processs is None:
             self._db_processs = []
@@ -13727,9 +15198,10 @@ class DBOpmProcesses(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_processs)
+        if self._db_deleted_processs is not None:
+            children.extend(self._db_deleted_processs)
         if remove:
-            self.db_deleted_processs = []
+            self._db_deleted_processs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -13744,6 +15216,13 @@ class DBOpmProcesses(object):
         self._db_processs = processs
         self.is_dirty = True
     db_processs = property(__get_db_processs, __set_db_processs)
+    def __get_db_deleted_processs(self):
+        if self._db_deleted_processs is None:
+            self._db_deleted_processs = []
+        return self._db_deleted_processs
+    def __set_db_deleted_processs(self, deleted):
+        self._db_deleted_processs = deleted
+    db_deleted_processs = property(__get_db_deleted_processs, __set_db_deleted_processs)
     def db_get_processs(self):
         return self._db_processs
     def db_add_process(self, process):
@@ -13786,6 +15265,12 @@ class DBOpmAccountId(object):
 
     vtType = 'opm_account_id'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -13858,6 +15343,20 @@ class DBPortSpecItem(object):
 
     vtType = 'portSpecItem'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_pos',
+                 '_db_module',
+                 '_db_package',
+                 '_db_namespace',
+                 '_db_label',
+                 '_db_default',
+                 '_db_values',
+                 '_db_entry_type',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, pos=None, module=None, package=None, namespace=None, label=None, default=None, values=None, entry_type=None):
         self._db_id = id
         self._db_pos = pos
@@ -14089,6 +15588,28 @@ class DBMashupComponent(object):
 
     vtType = 'mashup_component'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_vtid',
+                 '_db_vttype',
+                 '_db_vtparent_type',
+                 '_db_vtparent_id',
+                 '_db_vtpos',
+                 '_db_vtmid',
+                 '_db_pos',
+                 '_db_type',
+                 '_db_val',
+                 '_db_minVal',
+                 '_db_maxVal',
+                 '_db_stepSize',
+                 '_db_strvaluelist',
+                 '_db_widget',
+                 '_db_seq',
+                 '_db_parent',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, vtid=None, vttype=None, vtparent_type=None, vtparent_id=None, vtpos=None, vtmid=None, pos=None, type=None, val=None, minVal=None, maxVal=None, stepSize=None, strvaluelist=None, widget=None, seq=None, parent=None):
         self._db_id = id
         self._db_vtid = vtid
@@ -14480,11 +16001,27 @@ class DBMashup(object):
 
     vtType = 'mashup'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_name',
+                 '_db_version',
+                 '_db_deleted_aliases',
+                 'db_aliases_id_index',
+                 '_db_aliases',
+                 '_db_type',
+                 '_db_vtid',
+                 '_db_layout',
+                 '_db_geometry',
+                 '_db_has_seq',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, name=None, version=None, aliases=None, type=None, vtid=None, layout=None, geometry=None, has_seq=None):
         self._db_id = id
         self._db_name = name
         self._db_version = version
-        self.db_deleted_aliases = []
+        self._db_deleted_aliases = None
         self.db_aliases_id_index = {}
         if aliases is None:
             self._db_aliases = []
@@ -14610,9 +16147,10 @@ class DBMashup(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_aliases)
+        if self._db_deleted_aliases is not None:
+            children.extend(self._db_deleted_aliases)
         if remove:
-            self.db_deleted_aliases = []
+            self._db_deleted_aliases = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -14666,6 +16204,13 @@ class DBMashup(object):
         self._db_aliases = aliases
         self.is_dirty = True
     db_aliases = property(__get_db_aliases, __set_db_aliases)
+    def __get_db_deleted_aliases(self):
+        if self._db_deleted_aliases is None:
+            self._db_deleted_aliases = []
+        return self._db_deleted_aliases
+    def __set_db_deleted_aliases(self, deleted):
+        self._db_deleted_aliases = deleted
+    db_deleted_aliases = property(__get_db_deleted_aliases, __set_db_deleted_aliases)
     def db_get_aliases(self):
         return self._db_aliases
     def db_add_alias(self, alias):
@@ -14774,6 +16319,17 @@ class DBMachine(object):
 
     vtType = 'machine'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_name',
+                 '_db_os',
+                 '_db_architecture',
+                 '_db_processor',
+                 '_db_ram',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, name=None, os=None, architecture=None, processor=None, ram=None):
         self._db_id = id
         self._db_name = name
@@ -14947,6 +16503,12 @@ class DBConfigFloat(object):
 
     vtType = 'config_float'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_value',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -15017,6 +16579,14 @@ class DBOther(object):
 
     vtType = 'other'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_key',
+                 '_db_value',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, key=None, value=None):
         self._db_id = id
         self._db_key = key
@@ -15128,6 +16698,12 @@ class DBRefProvActivity(object):
 
     vtType = 'ref_prov_activity'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_prov_ref',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -15685,6 +17261,19 @@ class DBProvAgent(object):
 
     vtType = 'prov_agent'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_vt_id',
+                 '_db_prov_type',
+                 '_db_prov_label',
+                 '_db_vt_machine_os',
+                 '_db_vt_machine_architecture',
+                 '_db_vt_machine_processor',
+                 '_db_vt_machine_ram',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, vt_id=None, prov_type=None, prov_label=None, vt_machine_os=None, vt_machine_architecture=None, vt_machine_processor=None, vt_machine_ram=None):
         self._db_id = id
         self._db_vt_id = vt_id
@@ -15896,13 +17485,35 @@ class DBMashuptrail(object):
 
     vtType = 'mashuptrail'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_name',
+                 '_db_version',
+                 '_db_vtVersion',
+                 '_db_last_modified',
+                 '_db_deleted_actions',
+                 'db_actions_id_index',
+                 '_db_actions',
+                 '_db_deleted_annotations',
+                 'db_annotations_id_index',
+                 'db_annotations_key_index',
+                 '_db_annotations',
+                 '_db_deleted_actionAnnotations',
+                 'db_actionAnnotations_id_index',
+                 'db_actionAnnotations_action_id_index',
+                 'db_actionAnnotations_key_index',
+                 '_db_actionAnnotations',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, name=None, version=None, vtVersion=None, last_modified=None, actions=None, annotations=None, actionAnnotations=None):
         self._db_id = id
         self._db_name = name
         self._db_version = version
         self._db_vtVersion = vtVersion
         self._db_last_modified = last_modified
-        self.db_deleted_actions = []
+        self._db_deleted_actions = None
         self.db_actions_id_index = {}
         if actions is None:
             self._db_actions = []
@@ -15910,7 +17521,7 @@ class DBMashuptrail(object):
             self._db_actions = actions
             for v in self._db_actions:
                 self.db_actions_id_index[v.db_id] = v
-        self.db_deleted_annotations = []
+        self._db_deleted_annotations = None
         self.db_annotations_id_index = {}
         self.db_annotations_key_index = {}
         if annotations is None:
@@ -15920,7 +17531,7 @@ class DBMashuptrail(object):
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
                 self.db_annotations_key_index[v.db_key] = v
-        self.db_deleted_actionAnnotations = []
+        self._db_deleted_actionAnnotations = None
         self.db_actionAnnotations_id_index = {}
         self.db_actionAnnotations_action_id_index = {}
         self.db_actionAnnotations_key_index = {}
@@ -16074,13 +17685,16 @@ class DBMashuptrail(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_actions)
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_actionAnnotations)
+        if self._db_deleted_actions is not None:
+            children.extend(self._db_deleted_actions)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_actionAnnotations is not None:
+            children.extend(self._db_deleted_actionAnnotations)
         if remove:
-            self.db_deleted_actions = []
-            self.db_deleted_annotations = []
-            self.db_deleted_actionAnnotations = []
+            self._db_deleted_actions = None
+            self._db_deleted_annotations = None
+            self._db_deleted_actionAnnotations = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -16166,6 +17780,13 @@ class DBMashuptrail(object):
         self._db_actions = actions
         self.is_dirty = True
     db_actions = property(__get_db_actions, __set_db_actions)
+    def __get_db_deleted_actions(self):
+        if self._db_deleted_actions is None:
+            self._db_deleted_actions = []
+        return self._db_deleted_actions
+    def __set_db_deleted_actions(self, deleted):
+        self._db_deleted_actions = deleted
+    db_deleted_actions = property(__get_db_deleted_actions, __set_db_deleted_actions)
     def db_get_actions(self):
         return self._db_actions
     def db_add_action(self, action):
@@ -16208,6 +17829,13 @@ class DBMashuptrail(object):
         self._db_annotations = annotations
         self.is_dirty = True
     db_annotations = property(__get_db_annotations, __set_db_annotations)
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
     def db_get_annotations(self):
         return self._db_annotations
     def db_add_annotation(self, annotation):
@@ -16257,6 +17885,13 @@ class DBMashuptrail(object):
         self._db_actionAnnotations = actionAnnotations
         self.is_dirty = True
     db_actionAnnotations = property(__get_db_actionAnnotations, __set_db_actionAnnotations)
+    def __get_db_deleted_actionAnnotations(self):
+        if self._db_deleted_actionAnnotations is None:
+            self._db_deleted_actionAnnotations = []
+        return self._db_deleted_actionAnnotations
+    def __set_db_deleted_actionAnnotations(self, deleted):
+        self._db_deleted_actionAnnotations = deleted
+    db_deleted_actionAnnotations = property(__get_db_deleted_actionAnnotations, __set_db_deleted_actionAnnotations)
     def db_get_actionAnnotations(self):
         return self._db_actionAnnotations
     def db_add_actionAnnotation(self, actionAnnotation):
@@ -16317,6 +17952,21 @@ class DBRegistry(object):
 
     vtType = 'registry'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_entity_type',
+                 '_db_version',
+                 '_db_root_descriptor_id',
+                 '_db_name',
+                 '_db_last_modified',
+                 '_db_deleted_packages',
+                 'db_packages_id_index',
+                 'db_packages_identifier_index',
+                 '_db_packages',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, entity_type=None, version=None, root_descriptor_id=None, name=None, last_modified=None, packages=None):
         self._db_id = id
         self._db_entity_type = entity_type
@@ -16324,7 +17974,7 @@ class DBRegistry(object):
         self._db_root_descriptor_id = root_descriptor_id
         self._db_name = name
         self._db_last_modified = last_modified
-        self.db_deleted_packages = []
+        self._db_deleted_packages = None
         self.db_packages_id_index = {}
         self.db_packages_identifier_index = {}
         if packages is None:
@@ -16436,9 +18086,10 @@ class DBRegistry(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_packages)
+        if self._db_deleted_packages is not None:
+            children.extend(self._db_deleted_packages)
         if remove:
-            self.db_deleted_packages = []
+            self._db_deleted_packages = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -16531,6 +18182,13 @@ class DBRegistry(object):
         self._db_packages = packages
         self.is_dirty = True
     db_packages = property(__get_db_packages, __set_db_packages)
+    def __get_db_deleted_packages(self):
+        if self._db_deleted_packages is None:
+            self._db_deleted_packages = []
+        return self._db_deleted_packages
+    def __set_db_deleted_packages(self, deleted):
+        self._db_deleted_packages = deleted
+    db_deleted_packages = property(__get_db_deleted_packages, __set_db_deleted_packages)
     def db_get_packages(self):
         return self._db_packages
     def db_add_package(self, package):
@@ -16581,10 +18239,19 @@ class DBOpmAgent(object):
 
     vtType = 'opm_agent'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_value',
+                 '_db_deleted_accounts',
+                 '_db_accounts',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, value=None, accounts=None):
         self._db_id = id
         self._db_value = value
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
@@ -16663,9 +18330,10 @@ class DBOpmAgent(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_accounts)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
         if remove:
-            self.db_deleted_accounts = []
+            self._db_deleted_accounts = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -16706,6 +18374,13 @@ class DBOpmAgent(object):
         self._db_accounts = accounts
         self.is_dirty = True
     db_accounts = property(__get_db_accounts, __set_db_accounts)
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     def db_get_accounts(self):
         return self._db_accounts
     def db_add_account(self, account):
@@ -16727,6 +18402,25 @@ class DBProvEntity(object):
 
     vtType = 'prov_entity'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_prov_type',
+                 '_db_prov_label',
+                 '_db_prov_value',
+                 '_db_vt_id',
+                 '_db_vt_type',
+                 '_db_vt_desc',
+                 '_db_vt_package',
+                 '_db_vt_version',
+                 '_db_vt_cache',
+                 '_db_vt_location_x',
+                 '_db_vt_location_y',
+                 '_db_deleted_is_part_of',
+                 '_db_is_part_of',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, prov_type=None, prov_label=None, prov_value=None, vt_id=None, vt_type=None, vt_desc=None, vt_package=None, vt_version=None, vt_cache=None, vt_location_x=None, vt_location_y=None, is_part_of=None):
         self._db_id = id
         self._db_prov_type = prov_type
@@ -16740,7 +18434,7 @@ class DBProvEntity(object):
         self._db_vt_cache = vt_cache
         self._db_vt_location_x = vt_location_x
         self._db_vt_location_y = vt_location_y
-        self.db_deleted_is_part_of = []
+        self._db_deleted_is_part_of = None
         self._db_is_part_of = is_part_of
         self.is_dirty = True
         self.is_new = True
@@ -16870,9 +18564,10 @@ class DBProvEntity(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_is_part_of)
+        if self._db_deleted_is_part_of is not None:
+            children.extend(self._db_deleted_is_part_of)
         if remove:
-            self.db_deleted_is_part_of = []
+            self._db_deleted_is_part_of = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -17042,6 +18737,13 @@ class DBProvEntity(object):
         self._db_is_part_of = is_part_of
         self.is_dirty = True
     db_is_part_of = property(__get_db_is_part_of, __set_db_is_part_of)
+    def __get_db_deleted_is_part_of(self):
+        if self._db_deleted_is_part_of is None:
+            self._db_deleted_is_part_of = []
+        return self._db_deleted_is_part_of
+    def __set_db_deleted_is_part_of(self, deleted):
+        self._db_deleted_is_part_of = deleted
+    db_deleted_is_part_of = property(__get_db_deleted_is_part_of, __set_db_deleted_is_part_of)
     def db_add_is_part_of(self, is_part_of):
         self._db_is_part_of = is_part_of
     def db_change_is_part_of(self, is_part_of):
@@ -17058,6 +18760,14 @@ class DBAnnotation(object):
 
     vtType = 'annotation'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_key',
+                 '_db_value',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, key=None, value=None):
         self._db_id = id
         self._db_key = key
@@ -17169,6 +18879,14 @@ class DBOpmTime(object):
 
     vtType = 'opm_time'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_no_later_than',
+                 '_db_no_earlier_than',
+                 '_db_clock_id',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, no_later_than=None, no_earlier_than=None, clock_id=None):
         self._db_no_later_than = no_later_than
         self._db_no_earlier_than = no_earlier_than
@@ -17279,6 +18997,21 @@ class DBParameterExploration(object):
 
     vtType = 'parameter_exploration'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_action_id',
+                 '_db_name',
+                 '_db_date',
+                 '_db_user',
+                 '_db_dims',
+                 '_db_layout',
+                 '_db_deleted_functions',
+                 'db_functions_id_index',
+                 '_db_functions',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, action_id=None, name=None, date=None, user=None, dims=None, layout=None, functions=None):
         self._db_id = id
         self._db_action_id = action_id
@@ -17287,7 +19020,7 @@ class DBParameterExploration(object):
         self._db_user = user
         self._db_dims = dims
         self._db_layout = layout
-        self.db_deleted_functions = []
+        self._db_deleted_functions = None
         self.db_functions_id_index = {}
         if functions is None:
             self._db_functions = []
@@ -17402,9 +19135,10 @@ class DBParameterExploration(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_functions)
+        if self._db_deleted_functions is not None:
+            children.extend(self._db_deleted_functions)
         if remove:
-            self.db_deleted_functions = []
+            self._db_deleted_functions = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -17510,6 +19244,13 @@ class DBParameterExploration(object):
         self._db_functions = functions
         self.is_dirty = True
     db_functions = property(__get_db_functions, __set_db_functions)
+    def __get_db_deleted_functions(self):
+        if self._db_deleted_functions is None:
+            self._db_deleted_functions = []
+        return self._db_deleted_functions
+    def __set_db_deleted_functions(self, deleted):
+        self._db_deleted_functions = deleted
+    db_deleted_functions = property(__get_db_deleted_functions, __set_db_deleted_functions)
     def db_get_functions(self):
         return self._db_functions
     def db_add_function(self, function):
@@ -17553,6 +19294,17 @@ class DBMashupActionAnnotation(object):
 
     vtType = 'mashup_actionAnnotation'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_key',
+                 '_db_value',
+                 '_db_action_id',
+                 '_db_date',
+                 '_db_user',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, key=None, value=None, action_id=None, date=None, user=None):
         self._db_id = id
         self._db_key = key
@@ -17726,11 +19478,21 @@ class DBOpmProcess(object):
 
     vtType = 'opm_process'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_deleted_value',
+                 '_db_value',
+                 '_db_deleted_accounts',
+                 '_db_accounts',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, value=None, accounts=None):
         self._db_id = id
-        self.db_deleted_value = []
+        self._db_deleted_value = None
         self._db_value = value
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
@@ -17819,11 +19581,13 @@ class DBOpmProcess(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
-        children.extend(self.db_deleted_accounts)
+        if self._db_deleted_value is not None:
+            children.extend(self._db_deleted_value)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
         if remove:
-            self.db_deleted_value = []
-            self.db_deleted_accounts = []
+            self._db_deleted_value = None
+            self._db_deleted_accounts = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -17853,6 +19617,13 @@ class DBOpmProcess(object):
         self._db_value = value
         self.is_dirty = True
     db_value = property(__get_db_value, __set_db_value)
+    def __get_db_deleted_value(self):
+        if self._db_deleted_value is None:
+            self._db_deleted_value = []
+        return self._db_deleted_value
+    def __set_db_deleted_value(self, deleted):
+        self._db_deleted_value = deleted
+    db_deleted_value = property(__get_db_deleted_value, __set_db_deleted_value)
     def db_add_value(self, value):
         self._db_value = value
     def db_change_value(self, value):
@@ -17868,6 +19639,13 @@ class DBOpmProcess(object):
         self._db_accounts = accounts
         self.is_dirty = True
     db_accounts = property(__get_db_accounts, __set_db_accounts)
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     def db_get_accounts(self):
         return self._db_accounts
     def db_add_account(self, account):
@@ -17889,8 +19667,16 @@ class DBDisabledPackages(object):
 
     vtType = 'disabled_packages'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_packages',
+                 'db_packages_name_index',
+                 '_db_packages',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, packages=None):
-        self.db_deleted_packages = []
+        self._db_deleted_packages = None
         self.db_packages_name_index = {}
         if packages is None:
             self._db_packages = []
@@ -17962,9 +19748,10 @@ class DBDisabledPackages(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_packages)
+        if self._db_deleted_packages is not None:
+            children.extend(self._db_deleted_packages)
         if remove:
-            self.db_deleted_packages = []
+            self._db_deleted_packages = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -17979,6 +19766,13 @@ class DBDisabledPackages(object):
         self._db_packages = packages
         self.is_dirty = True
     db_packages = property(__get_db_packages, __set_db_packages)
+    def __get_db_deleted_packages(self):
+        if self._db_deleted_packages is None:
+            self._db_deleted_packages = []
+        return self._db_deleted_packages
+    def __set_db_deleted_packages(self, deleted):
+        self._db_deleted_packages = deleted
+    db_deleted_packages = property(__get_db_deleted_packages, __set_db_deleted_packages)
     def db_get_packages(self):
         return self._db_packages
     def db_add_package(self, package):
@@ -18005,6 +19799,26 @@ class DBModuleExec(object):
 
     vtType = 'module_exec'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_id',
+                 '_db_ts_start',
+                 '_db_ts_end',
+                 '_db_cached',
+                 '_db_module_id',
+                 '_db_module_name',
+                 '_db_completed',
+                 '_db_error',
+                 '_db_machine_id',
+                 '_db_deleted_annotations',
+                 'db_annotations_id_index',
+                 '_db_annotations',
+                 '_db_deleted_loop_execs',
+                 'db_loop_execs_id_index',
+                 '_db_loop_execs',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, id=None, ts_start=None, ts_end=None, cached=None, module_id=None, module_name=None, completed=None, error=None, machine_id=None, annotations=None, loop_execs=None):
         self._db_id = id
         self._db_ts_start = ts_start
@@ -18015,7 +19829,7 @@ class DBModuleExec(object):
         self._db_completed = completed
         self._db_error = error
         self._db_machine_id = machine_id
-        self.db_deleted_annotations = []
+        self._db_deleted_annotations = None
         self.db_annotations_id_index = {}
         if annotations is None:
             self._db_annotations = []
@@ -18023,7 +19837,7 @@ class DBModuleExec(object):
             self._db_annotations = annotations
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
-        self.db_deleted_loop_execs = []
+        self._db_deleted_loop_execs = None
         self.db_loop_execs_id_index = {}
         if loop_execs is None:
             self._db_loop_execs = []
@@ -18175,11 +19989,13 @@ class DBModuleExec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_loop_execs)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_loop_execs is not None:
+            children.extend(self._db_deleted_loop_execs)
         if remove:
-            self.db_deleted_annotations = []
-            self.db_deleted_loop_execs = []
+            self._db_deleted_annotations = None
+            self._db_deleted_loop_execs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -18314,6 +20130,13 @@ class DBModuleExec(object):
         self._db_annotations = annotations
         self.is_dirty = True
     db_annotations = property(__get_db_annotations, __set_db_annotations)
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
     def db_get_annotations(self):
         return self._db_annotations
     def db_add_annotation(self, annotation):
@@ -18356,6 +20179,13 @@ class DBModuleExec(object):
         self._db_loop_execs = loop_execs
         self.is_dirty = True
     db_loop_execs = property(__get_db_loop_execs, __set_db_loop_execs)
+    def __get_db_deleted_loop_execs(self):
+        if self._db_deleted_loop_execs is None:
+            self._db_deleted_loop_execs = []
+        return self._db_deleted_loop_execs
+    def __set_db_deleted_loop_execs(self, deleted):
+        self._db_deleted_loop_execs = deleted
+    db_deleted_loop_execs = property(__get_db_deleted_loop_execs, __set_db_deleted_loop_execs)
     def db_get_loop_execs(self):
         return self._db_loop_execs
     def db_add_loop_exec(self, loop_exec):
@@ -18399,12 +20229,24 @@ class DBProvAssociation(object):
 
     vtType = 'prov_association'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_prov_activity',
+                 '_db_prov_activity',
+                 '_db_deleted_prov_agent',
+                 '_db_prov_agent',
+                 '_db_deleted_prov_plan',
+                 '_db_prov_plan',
+                 '_db_prov_role',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, prov_activity=None, prov_agent=None, prov_plan=None, prov_role=None):
-        self.db_deleted_prov_activity = []
+        self._db_deleted_prov_activity = None
         self._db_prov_activity = prov_activity
-        self.db_deleted_prov_agent = []
+        self._db_deleted_prov_agent = None
         self._db_prov_agent = prov_agent
-        self.db_deleted_prov_plan = []
+        self._db_deleted_prov_plan = None
         self._db_prov_plan = prov_plan
         self._db_prov_role = prov_role
         self.is_dirty = True
@@ -18501,13 +20343,16 @@ class DBProvAssociation(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_prov_activity)
-        children.extend(self.db_deleted_prov_agent)
-        children.extend(self.db_deleted_prov_plan)
+        if self._db_deleted_prov_activity is not None:
+            children.extend(self._db_deleted_prov_activity)
+        if self._db_deleted_prov_agent is not None:
+            children.extend(self._db_deleted_prov_agent)
+        if self._db_deleted_prov_plan is not None:
+            children.extend(self._db_deleted_prov_plan)
         if remove:
-            self.db_deleted_prov_activity = []
-            self.db_deleted_prov_agent = []
-            self.db_deleted_prov_plan = []
+            self._db_deleted_prov_activity = None
+            self._db_deleted_prov_agent = None
+            self._db_deleted_prov_plan = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -18525,6 +20370,13 @@ class DBProvAssociation(object):
         self._db_prov_activity = prov_activity
         self.is_dirty = True
     db_prov_activity = property(__get_db_prov_activity, __set_db_prov_activity)
+    def __get_db_deleted_prov_activity(self):
+        if self._db_deleted_prov_activity is None:
+            self._db_deleted_prov_activity = []
+        return self._db_deleted_prov_activity
+    def __set_db_deleted_prov_activity(self, deleted):
+        self._db_deleted_prov_activity = deleted
+    db_deleted_prov_activity = property(__get_db_deleted_prov_activity, __set_db_deleted_prov_activity)
     def db_add_prov_activity(self, prov_activity):
         self._db_prov_activity = prov_activity
     def db_change_prov_activity(self, prov_activity):
@@ -18540,6 +20392,13 @@ class DBProvAssociation(object):
         self._db_prov_agent = prov_agent
         self.is_dirty = True
     db_prov_agent = property(__get_db_prov_agent, __set_db_prov_agent)
+    def __get_db_deleted_prov_agent(self):
+        if self._db_deleted_prov_agent is None:
+            self._db_deleted_prov_agent = []
+        return self._db_deleted_prov_agent
+    def __set_db_deleted_prov_agent(self, deleted):
+        self._db_deleted_prov_agent = deleted
+    db_deleted_prov_agent = property(__get_db_deleted_prov_agent, __set_db_deleted_prov_agent)
     def db_add_prov_agent(self, prov_agent):
         self._db_prov_agent = prov_agent
     def db_change_prov_agent(self, prov_agent):
@@ -18555,6 +20414,13 @@ class DBProvAssociation(object):
         self._db_prov_plan = prov_plan
         self.is_dirty = True
     db_prov_plan = property(__get_db_prov_plan, __set_db_prov_plan)
+    def __get_db_deleted_prov_plan(self):
+        if self._db_deleted_prov_plan is None:
+            self._db_deleted_prov_plan = []
+        return self._db_deleted_prov_plan
+    def __set_db_deleted_prov_plan(self, deleted):
+        self._db_deleted_prov_plan = deleted
+    db_deleted_prov_plan = property(__get_db_deleted_prov_plan, __set_db_deleted_prov_plan)
     def db_add_prov_plan(self, prov_plan):
         self._db_prov_plan = prov_plan
     def db_change_prov_plan(self, prov_plan):
@@ -18583,8 +20449,15 @@ class DBOpmProcessValue(object):
 
     vtType = 'opm_process_value'
 
+    __slots__ = ('__dict__',
+                 '__weakref__',
+                 '_db_deleted_value',
+                 '_db_value',
+                 'is_dirty',
+                 'is_new')
+
     def __init__(self, value=None):
-        self.db_deleted_value = []
+        self._db_deleted_value = None
         self._db_value = value
         self.is_dirty = True
         self.is_new = True
@@ -18655,9 +20528,10 @@ class DBOpmProcessValue(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
+        if self._db_deleted_value is not None:
+            children.extend(self._db_deleted_value)
         if remove:
-            self.db_deleted_value = []
+            self._db_deleted_value = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -18671,6 +20545,13 @@ class DBOpmProcessValue(object):
         self._db_value = value
         self.is_dirty = True
     db_value = property(__get_db_value, __set_db_value)
+    def __get_db_deleted_value(self):
+        if self._db_deleted_value is None:
+            self._db_deleted_value = []
+        return self._db_deleted_value
+    def __set_db_deleted_value(self, deleted):
+        self._db_deleted_value = deleted
+    db_deleted_value = property(__get_db_deleted_value, __set_db_deleted_value)
     def db_add_value(self, value):
         self._db_value = value
     def db_change_value(self, value):
@@ -38,6 +38,7 @@ import hashlib
 from auto_gen import DBVistrail as _DBVistrail
 from auto_gen import DBAdd, DBChange, DBDelete, DBAbstraction, DBGroup, \
     DBModule, DBAnnotation, DBActionAnnotation, DBParameterExploration
+from action import DBAction
 from id_scope import IdScope
 
 class DBVistrail(_DBVistrail):
@@ -103,6 +104,12 @@ class DBVistrail(_DBVistrail):
             self.idScope.updateBeginId('action', action.db_id+1)
             if action.db_session is not None:
                 self.idScope.updateBeginId('session', action.db_session + 1)
+            for annotation in action.db_annotations:
+                self.idScope.updateBeginId('annotation', annotation.db_id+1)
+            if (isinstance(action, DBAction) and
+                    not action.db_has_operations_loaded()):
+                # the lazy loader has already accounted for these ids
+                continue
             for operation in action.db_operations:
                 self.idScope.updateBeginId('operation', operation.db_id+1)
                 if operation.vtType == 'add' or operation.vtType == 'change':
@@ -113,8 +120,6 @@ class DBVistrail(_DBVistrail):
                         if operation.vtType == 'change':
                             operation.db_objectId = operation.db_oldObjId
                     self.db_add_object(operation.db_data)
-            for annotation in action.db_annotations:
-                self.idScope.updateBeginId('annotation', annotation.db_id+1)
         
         for annotation in self.db_annotations:
             self.idScope.updateBeginId('annotation', annotation.db_id+1)
@@ -32,25 +32,137 @@
 ## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
 ##
 ###############################################################################
+import os
+# the xml subpackage hides the standard library's xml.parsers.expat
+import pyexpat as expat
+import re
+
 from xml.auto_gen import XMLDAOListBase
 from sql.auto_gen import SQLDAOListBase
+from bin.auto_gen import BinDAOListBase
+from bin.bin_dao import encode_record, decode_record
 from vistrails.core.system import get_elementtree_library
 
 from vistrails.db import VistrailsDBException
 from vistrails.db.versions.v1_0_4 import version as my_version
 from vistrails.db.versions.v1_0_4.domain import DBGroup, DBWorkflow, DBVistrail, DBLog, \
-    DBRegistry, DBMashuptrail
+    DBRegistry, DBMashuptrail, DBAction
 
 root_set = set([DBVistrail.vtType, DBWorkflow.vtType, 
                 DBLog.vtType, DBRegistry.vtType, DBMashuptrail.vtType])
 
+# Children of the root elements that open_from_xml_stream() reads as they
+# are parsed: root vtType -> {tag: (dao, name of the add method)}
+stream_children = {
+    DBVistrail.vtType: {
+        'action': ('action', 'db_add_action'),
+        'tag': ('tag', 'db_add_tag'),
+        'annotation': ('annotation', 'db_add_annotation'),
+        'controlParameter': ('controlParameter', 'db_add_controlParameter'),
+        'vistrailVariable': ('vistrailVariable', 'db_add_vistrailVariable'),
+        'parameterExploration': ('parameter_exploration',
+                                 'db_add_parameter_exploration'),
+        'actionAnnotation': ('actionAnnotation', 'db_add_actionAnnotation'),
+        },
+    DBLog.vtType: {
+        'workflowExec': ('workflow_exec', 'db_add_workflow_exec'),
+        },
+    }
+
 ElementTree = get_elementtree_library()
 
+_xml_encoding_re = re.compile(r'<\?xml[^>]*encoding=["\']([A-Za-z0-9._-]+)')
+
+def _str(value):
+    # ElementTree only returns unicode for non-ASCII text, the DAOs rely on
+    # getting the same from expat
+    try:
+        return value.encode('ascii')
+    except UnicodeError:
+        return value
+
+class _ExpatTreeBuilder(object):
+    """Feeds expat events to an ElementTree.TreeBuilder."""
+
+    def __init__(self):
+        self.builder = ElementTree.TreeBuilder()
+
+    def start(self, tag, attrs):
+        self.builder.start(_str(tag),
+                           dict((_str(k), _str(v))
+                                for k, v in attrs.iteritems()))
+
+    def end(self, tag):
+        return self.builder.end(_str(tag))
+
+    def data(self, text):
+        self.builder.data(_str(text))
+
+    def close(self):
+        return self.builder.close()
+
+class LazyActionLoader(object):
+    """Reads the operations of the actions of a vistrail file on demand.
+
+    Keeps the byte range of each action in the file; see
+    DAOList.open_from_xml_lazy().
+
+    """
+
+    def __init__(self, daoList, filename, vistrail):
+        self.daoList = daoList
+        self.filename = filename
+        self.vistrail = vistrail
+        self.offsets = {}
+        self.file_stamp = self.get_file_stamp()
+
+    def get_file_stamp(self):
+        try:
+            st = os.stat(self.filename)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime)
+
+    def add_action(self, action, start, end_tag):
+        """add_action(action: DBAction, start: int, end_tag: int) -> None
+
+        start is the offset of the action's start tag in the file, and
+        end_tag the offset of its end tag.
+
+        """
+        self.offsets[action.db_id] = (start, end_tag)
+        action.db_set_operations_loader(self)
+
+    def load_operations(self, action):
+        start, end_tag = self.offsets.pop(action.db_id)
+        if self.get_file_stamp() != self.file_stamp:
+            raise VistrailsDBException("File '%s' changed since it was "
+                                       "opened, cannot read the operations "
+                                       "of action %s" %
+                                       (self.filename, action.db_id))
+        with open(self.filename, 'rb') as f:
+            f.seek(start)
+            data = f.read(end_tag - start)
+            tail = f.read(256)
+        end = tail.find('>')
+        if end == -1:
+            raise VistrailsDBException("Cannot read action %s from '%s'" %
+                                       (action.db_id, self.filename))
+        node = ElementTree.fromstring(data + tail[:end + 1])
+        loaded = self.daoList.read_xml_object(DBAction.vtType, node)
+        action._db_operations = loaded._db_operations
+        action.db_operations_id_index = loaded.db_operations_id_index
+        action.db_deleted_operations = []
+        for operation in action._db_operations:
+            if operation.vtType == 'add' or operation.vtType == 'change':
+                self.vistrail.db_add_object(operation.db_data)
+
 
 class DAOList(dict):
     def __init__(self):
         self['xml'] = XMLDAOListBase()
         self['sql'] = SQLDAOListBase()
+        self['bin'] = BinDAOListBase()
 
     def parse_xml_file(self, filename):
         return ElementTree.parse(filename)
@@ -87,6 +199,179 @@ class DAOList(dict):
         vistrail = self.read_xml_object(vtType, tree.getroot())
         return vistrail
 
+    def open_from_xml_stream(self, filename, vtType):
+        """open_from_xml_stream(filename: str, vtType: str) -> DBVistrail
+
+        Reads the file incrementally: each child of the root element is
+        turned into a domain object as soon as it is parsed, and its
+        subtree is then discarded, so that the whole document is never in
+        memory. Only the roots in stream_children can be read this way;
+        for the others, this falls back to open_from_xml().
+
+        """
+        if vtType not in stream_children:
+            return self.open_from_xml(filename, vtType)
+        children = stream_children[vtType]
+        xml_daos = self['xml']
+
+        obj = None
+        root = None
+        depth = 0
+        with open(filename, 'rb') as f:
+            for event, elem in ElementTree.iterparse(f, ('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    if depth == 1:
+                        # the attributes are known on the start tag; the
+                        # element may already have children when the event
+                        # is seen, those are added when they end
+                        root = elem
+                        obj = xml_daos[vtType].fromXML(
+                                ElementTree.Element(root.tag, root.attrib))
+                        if obj is None:
+                            return None
+                    continue
+                depth -= 1
+                if depth != 1:
+                    continue
+                tag = elem.tag
+                if tag[0] == '{':
+                    tag = tag.split('}')[1]
+                try:
+                    dao, add = children[tag]
+                except KeyError:
+                    if elem.text is not None and elem.text.strip() != '':
+                        print '*** ERROR *** tag = %s' % elem.tag
+                else:
+                    getattr(obj, add)(xml_daos[dao].fromXML(elem))
+                root.remove(elem)
+        if obj is not None:
+            obj.is_dirty = False
+        return obj
+
+    def open_from_xml_lazy(self, filename, vtType):
+        """open_from_xml_lazy(filename: str, vtType: str) -> DBVistrail
+
+        Reads a vistrail without the operations of its actions: only their
+        position in the file is kept, and they are parsed when first
+        accessed (see DBAction). The ids used by the operations are still
+        reserved in the vistrail's idScope. Files that are not UTF-8 and
+        other roots are read with open_from_xml_stream().
+
+        """
+        if vtType != DBVistrail.vtType:
+            return self.open_from_xml_stream(filename, vtType)
+        with open(filename, 'rb') as f:
+            m = _xml_encoding_re.match(f.read(256))
+        if m is not None and m.group(1).lower() not in ('utf-8', 'utf8',
+                                                        'us-ascii', 'ascii'):
+            return self.open_from_xml_stream(filename, vtType)
+        children = stream_children[vtType]
+        xml_daos = self['xml']
+
+        parser = expat.ParserCreate()
+        parser.buffer_text = True
+        state = {'obj': None, 'loader': None, 'builder': None, 'tag': None,
+                 'offset': None, 'end_tag': None, 'ops': 0, 'skip': 0}
+        depth = [0]
+        # maximum ids used by the operations that are not read
+        max_ids = {}
+        def update_max_id(what, id):
+            try:
+                id = long(id)
+            except (TypeError, ValueError):
+                return
+            if max_ids.get(what, -1) < id:
+                max_ids[what] = id
+
+        def start(tag, attrs):
+            depth[0] += 1
+            d = depth[0]
+            if d == 1:
+                obj = xml_daos[vtType].fromXML(
+                        ElementTree.Element(_str(tag),
+                                            dict((_str(k), _str(v))
+                                                 for k, v in
+                                                 attrs.iteritems())))
+                if obj is None:
+                    raise VistrailsDBException("Cannot read '%s' from '%s'" %
+                                               (vtType, filename))
+                state['obj'] = obj
+                state['loader'] = LazyActionLoader(self, filename, obj)
+            elif d == 2:
+                state['builder'] = _ExpatTreeBuilder()
+                state['tag'] = tag.split('}')[-1]
+                state['offset'] = parser.CurrentByteIndex
+                state['ops'] = 0
+                state['builder'].start(tag, attrs)
+            elif state['skip']:
+                return
+            elif d == 3 and state['tag'] == 'action' and \
+                    tag.split('}')[-1] != 'annotation':
+                # an operation: only keep track of the ids it uses, as
+                # DBVistrail.update_id_scope() would
+                state['skip'] = d
+                state['ops'] += 1
+                update_max_id('operation', attrs.get('id'))
+                op_type = tag.split('}')[-1]
+                if op_type == 'add':
+                    update_max_id(_str(attrs.get('what')),
+                                  attrs.get('objectId'))
+                elif op_type == 'change':
+                    update_max_id(_str(attrs.get('what')),
+                                  attrs.get('newObjId'))
+            else:
+                state['builder'].start(tag, attrs)
+
+        def end(tag):
+            d = depth[0]
+            depth[0] -= 1
+            if state['skip']:
+                if state['skip'] == d:
+                    state['skip'] = 0
+                return
+            if d == 1:
+                return
+            if d == 2:
+                # start of the end tag
+                state['end_tag'] = parser.CurrentByteIndex
+            state['builder'].end(tag)
+            if d != 2:
+                return
+            elem = state['builder'].close()
+            state['builder'] = None
+            try:
+                dao, add = children[state['tag']]
+            except KeyError:
+                if elem.text is not None and elem.text.strip() != '':
+                    print '*** ERROR *** tag = %s' % elem.tag
+                return
+            child = xml_daos[dao].fromXML(elem)
+            getattr(state['obj'], add)(child)
+            if state['tag'] == 'action' and state['ops']:
+                state['loader'].add_action(child, state['offset'],
+                                           state['end_tag'])
+
+        def data(text):
+            if depth[0] > 1 and not state['skip']:
+                state['builder'].data(text)
+
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = data
+        with open(filename, 'rb') as f:
+            try:
+                parser.ParseFile(f)
+            except expat.ExpatError, e:
+                raise VistrailsDBException("Cannot read '%s': %s" %
+                                           (filename, e))
+        obj = state['obj']
+        if obj is not None:
+            for what, id in max_ids.iteritems():
+                obj.idScope.updateBeginId(what, id + 1)
+            obj.is_dirty = False
+        return obj
+
     def save_to_xml(self, obj, filename, tags, version=None):
         """save_to_xml(obj : object, filename: str, tags: dict,
                        version: str) -> None
@@ -101,6 +386,14 @@ class DAOList(dict):
         tree = ElementTree.ElementTree(root)
         self.write_xml_file(filename, tree)
 
+    def read_bin_object(self, vtType, data):
+        obj = self['bin'][vtType].fromBin(decode_record(data))
+        obj.is_dirty = False
+        return obj
+
+    def write_bin_object(self, obj):
+        return encode_record(self['bin'][obj.vtType].toBin(obj))
+
     def open_from_db(self, db_connection, vtType, id=None, lock=False, 
                      global_props=None):
         all_objects = {}
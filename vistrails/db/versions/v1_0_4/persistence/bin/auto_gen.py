@@ -0,0 +1,2825 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+
+"""generated automatically by auto_dao.py"""
+
+from bin_dao import BinDAO
+from vistrails.db.versions.v1_0_4.domain import *
+
+class DBOpmWasGeneratedByBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (effect, role, cause, accounts, opm_times) = self.checkRecord(record, DBOpmWasGeneratedBy.vtType, 5)
+        if effect is not None:
+            effect = self.getDao('opm_artifact_id_effect').fromBin(effect)
+        if role is not None:
+            role = self.getDao('opm_role').fromBin(role)
+        if cause is not None:
+            cause = self.getDao('opm_process_id_cause').fromBin(cause)
+        accounts = map(self.getDao('opm_account_id').fromBin, accounts)
+        opm_times = map(self.getDao('opm_time').fromBin, opm_times)
+        obj = DBOpmWasGeneratedBy(effect=effect, role=role, cause=cause, accounts=accounts, opm_times=opm_times)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_was_generated_by):
+        return (DBOpmWasGeneratedBy.vtType, (
+            self.getDao('opm_artifact_id_effect').toBin(opm_was_generated_by.db_effect) if opm_was_generated_by.db_effect is not None else None,
+            self.getDao('opm_role').toBin(opm_was_generated_by.db_role) if opm_was_generated_by.db_role is not None else None,
+            self.getDao('opm_process_id_cause').toBin(opm_was_generated_by.db_cause) if opm_was_generated_by.db_cause is not None else None,
+            map(self.getDao('opm_account_id').toBin, opm_was_generated_by.db_accounts),
+            map(self.getDao('opm_time').toBin, opm_was_generated_by.db_opm_times),
+            ))
+
+class DBConfigKeyBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (name, value) = self.checkRecord(record, DBConfigKey.vtType, 2)
+        _value = None
+        if value is not None:
+            _data = value
+            _tag = _data[0]
+            if _tag == 'config_str':
+                _data = self.getDao('config_str').fromBin(_data)
+            elif _tag == 'config_int':
+                _data = self.getDao('config_int').fromBin(_data)
+            elif _tag == 'config_float':
+                _data = self.getDao('config_float').fromBin(_data)
+            elif _tag == 'config_bool':
+                _data = self.getDao('config_bool').fromBin(_data)
+            elif _tag == 'configuration':
+                _data = self.getDao('configuration').fromBin(_data)
+            else:
+                self.unexpectedRecord(_data, 'config_key.value')
+            _value = _data
+        value = _value
+        obj = DBConfigKey(value=value, name=name)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, config_key):
+        value = None
+        _obj = config_key.db_value
+        if _obj is not None:
+            if _obj.vtType == 'config_str':
+                _data = self.getDao('config_str').toBin(_obj)
+            elif _obj.vtType == 'config_int':
+                _data = self.getDao('config_int').toBin(_obj)
+            elif _obj.vtType == 'config_float':
+                _data = self.getDao('config_float').toBin(_obj)
+            elif _obj.vtType == 'config_bool':
+                _data = self.getDao('config_bool').toBin(_obj)
+            elif _obj.vtType == 'configuration':
+                _data = self.getDao('configuration').toBin(_obj)
+            else:
+                _data = None
+            value = _data
+        return (DBConfigKey.vtType, (
+            self.convertToBin(config_key.db_name, 'str'),
+            value,
+            ))
+
+class DBMashupAliasBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, name, component) = self.checkRecord(record, DBMashupAlias.vtType, 3)
+        if component is not None:
+            component = self.getDao('mashup_component').fromBin(component)
+        obj = DBMashupAlias(id=id, name=name, component=component)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, mashup_alias):
+        return (DBMashupAlias.vtType, (
+            mashup_alias.db_id,
+            self.convertToBin(mashup_alias.db_name, 'str'),
+            self.getDao('mashup_component').toBin(mashup_alias.db_component) if mashup_alias.db_component is not None else None,
+            ))
+
+class DBGroupBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, cache, name, namespace, package, version, workflow, location, functions, annotations, controlParameters) = self.checkRecord(record, DBGroup.vtType, 11)
+        if workflow is not None:
+            workflow = self.getDao('workflow').fromBin(workflow)
+        if location is not None:
+            location = self.getDao('location').fromBin(location)
+        functions = map(self.getDao('function').fromBin, functions)
+        annotations = map(self.getDao('annotation').fromBin, annotations)
+        controlParameters = map(self.getDao('controlParameter').fromBin, controlParameters)
+        obj = DBGroup(id=id, workflow=workflow, cache=cache, name=name, namespace=namespace, package=package, version=version, location=location, functions=functions, annotations=annotations, controlParameters=controlParameters)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, group):
+        return (DBGroup.vtType, (
+            group.db_id,
+            group.db_cache,
+            self.convertToBin(group.db_name, 'str'),
+            self.convertToBin(group.db_namespace, 'str'),
+            self.convertToBin(group.db_package, 'str'),
+            self.convertToBin(group.db_version, 'str'),
+            self.getDao('workflow').toBin(group.db_workflow) if group.db_workflow is not None else None,
+            self.getDao('location').toBin(group.db_location) if group.db_location is not None else None,
+            map(self.getDao('function').toBin, group.db_functions),
+            map(self.getDao('annotation').toBin, group.db_annotations),
+            map(self.getDao('controlParameter').toBin, group.db_controlParameters),
+            ))
+
+class DBOpmWasControlledByBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (effect, role, cause, accounts, starts, ends) = self.checkRecord(record, DBOpmWasControlledBy.vtType, 6)
+        if effect is not None:
+            effect = self.getDao('opm_process_id_effect').fromBin(effect)
+        if role is not None:
+            role = self.getDao('opm_role').fromBin(role)
+        if cause is not None:
+            cause = self.getDao('opm_agent_id').fromBin(cause)
+        accounts = map(self.getDao('opm_account_id').fromBin, accounts)
+        starts = map(self.getDao('opm_time').fromBin, starts)
+        ends = map(self.getDao('opm_time').fromBin, ends)
+        obj = DBOpmWasControlledBy(effect=effect, role=role, cause=cause, accounts=accounts, starts=starts, ends=ends)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_was_controlled_by):
+        return (DBOpmWasControlledBy.vtType, (
+            self.getDao('opm_process_id_effect').toBin(opm_was_controlled_by.db_effect) if opm_was_controlled_by.db_effect is not None else None,
+            self.getDao('opm_role').toBin(opm_was_controlled_by.db_role) if opm_was_controlled_by.db_role is not None else None,
+            self.getDao('opm_agent_id').toBin(opm_was_controlled_by.db_cause) if opm_was_controlled_by.db_cause is not None else None,
+            map(self.getDao('opm_account_id').toBin, opm_was_controlled_by.db_accounts),
+            map(self.getDao('opm_time').toBin, opm_was_controlled_by.db_starts),
+            map(self.getDao('opm_time').toBin, opm_was_controlled_by.db_ends),
+            ))
+
+class DBAddBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, what, objectId, parentObjId, parentObjType, data) = self.checkRecord(record, DBAdd.vtType, 6)
+        _data = None
+        if data is not None:
+            _data = data
+            _tag = _data[0]
+            if _tag == 'module':
+                _data = self.getDao('module').fromBin(_data)
+            elif _tag == 'location':
+                _data = self.getDao('location').fromBin(_data)
+            elif _tag == 'annotation':
+                _data = self.getDao('annotation').fromBin(_data)
+            elif _tag == 'controlParameter':
+                _data = self.getDao('controlParameter').fromBin(_data)
+            elif _tag == 'function':
+                _data = self.getDao('function').fromBin(_data)
+            elif _tag == 'connection':
+                _data = self.getDao('connection').fromBin(_data)
+            elif _tag == 'port':
+                _data = self.getDao('port').fromBin(_data)
+            elif _tag == 'parameter':
+                _data = self.getDao('parameter').fromBin(_data)
+            elif _tag == 'portSpec':
+                _data = self.getDao('portSpec').fromBin(_data)
+            elif _tag == 'abstraction':
+                _data = self.getDao('abstraction').fromBin(_data)
+            elif _tag == 'group':
+                _data = self.getDao('group').fromBin(_data)
+            elif _tag == 'other':
+                _data = self.getDao('other').fromBin(_data)
+            elif _tag == 'plugin_data':
+                _data = self.getDao('plugin_data').fromBin(_data)
+            else:
+                self.unexpectedRecord(_data, 'add.data')
+            _data = _data
+        data = _data
+        obj = DBAdd(data=data, id=id, what=what, objectId=objectId, parentObjId=parentObjId, parentObjType=parentObjType)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, add):
+        data = None
+        _obj = add.db_data
+        if _obj is not None:
+            if _obj.vtType == 'module':
+                _data = self.getDao('module').toBin(_obj)
+            elif _obj.vtType == 'location':
+                _data = self.getDao('location').toBin(_obj)
+            elif _obj.vtType == 'annotation':
+                _data = self.getDao('annotation').toBin(_obj)
+            elif _obj.vtType == 'controlParameter':
+                _data = self.getDao('controlParameter').toBin(_obj)
+            elif _obj.vtType == 'function':
+                _data = self.getDao('function').toBin(_obj)
+            elif _obj.vtType == 'connection':
+                _data = self.getDao('connection').toBin(_obj)
+            elif _obj.vtType == 'port':
+                _data = self.getDao('port').toBin(_obj)
+            elif _obj.vtType == 'parameter':
+                _data = self.getDao('parameter').toBin(_obj)
+            elif _obj.vtType == 'portSpec':
+                _data = self.getDao('portSpec').toBin(_obj)
+            elif _obj.vtType == 'abstraction':
+                _data = self.getDao('abstraction').toBin(_obj)
+            elif _obj.vtType == 'group':
+                _data = self.getDao('group').toBin(_obj)
+            elif _obj.vtType == 'other':
+                _data = self.getDao('other').toBin(_obj)
+            elif _obj.vtType == 'plugin_data':
+                _data = self.getDao('plugin_data').toBin(_obj)
+            else:
+                _data = None
+            data = _data
+        return (DBAdd.vtType, (
+            add.db_id,
+            self.convertToBin(add.db_what, 'str'),
+            add.db_objectId,
+            add.db_parentObjId,
+            self.convertToBin(add.db_parentObjType, 'str'),
+            data,
+            ))
+
+class DBProvGenerationBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (prov_entity, prov_activity, prov_role) = self.checkRecord(record, DBProvGeneration.vtType, 3)
+        if prov_entity is not None:
+            prov_entity = self.getDao('ref_prov_entity').fromBin(prov_entity)
+        if prov_activity is not None:
+            prov_activity = self.getDao('ref_prov_activity').fromBin(prov_activity)
+        obj = DBProvGeneration(prov_entity=prov_entity, prov_activity=prov_activity, prov_role=prov_role)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_generation):
+        return (DBProvGeneration.vtType, (
+            self.getDao('ref_prov_entity').toBin(prov_generation.db_prov_entity) if prov_generation.db_prov_entity is not None else None,
+            self.getDao('ref_prov_activity').toBin(prov_generation.db_prov_activity) if prov_generation.db_prov_activity is not None else None,
+            self.convertToBin(prov_generation.db_prov_role, 'str'),
+            ))
+
+class DBOpmUsedBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (effect, role, cause, accounts, opm_times) = self.checkRecord(record, DBOpmUsed.vtType, 5)
+        if effect is not None:
+            effect = self.getDao('opm_process_id_effect').fromBin(effect)
+        if role is not None:
+            role = self.getDao('opm_role').fromBin(role)
+        if cause is not None:
+            cause = self.getDao('opm_artifact_id_cause').fromBin(cause)
+        accounts = map(self.getDao('opm_account_id').fromBin, accounts)
+        opm_times = map(self.getDao('opm_time').fromBin, opm_times)
+        obj = DBOpmUsed(effect=effect, role=role, cause=cause, accounts=accounts, opm_times=opm_times)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_used):
+        return (DBOpmUsed.vtType, (
+            self.getDao('opm_process_id_effect').toBin(opm_used.db_effect) if opm_used.db_effect is not None else None,
+            self.getDao('opm_role').toBin(opm_used.db_role) if opm_used.db_role is not None else None,
+            self.getDao('opm_artifact_id_cause').toBin(opm_used.db_cause) if opm_used.db_cause is not None else None,
+            map(self.getDao('opm_account_id').toBin, opm_used.db_accounts),
+            map(self.getDao('opm_time').toBin, opm_used.db_opm_times),
+            ))
+
+class DBOpmArtifactIdCauseBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id,) = self.checkRecord(record, DBOpmArtifactIdCause.vtType, 1)
+        obj = DBOpmArtifactIdCause(id=id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_artifact_id_cause):
+        return (DBOpmArtifactIdCause.vtType, (
+            self.convertToBin(opm_artifact_id_cause.db_id, 'str'),
+            ))
+
+class DBRefProvEntityBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (prov_ref,) = self.checkRecord(record, DBRefProvEntity.vtType, 1)
+        obj = DBRefProvEntity(prov_ref=prov_ref)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, ref_prov_entity):
+        return (DBRefProvEntity.vtType, (
+            self.convertToBin(ref_prov_entity.db_prov_ref, 'str'),
+            ))
+
+class DBVtConnectionBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, vt_source, vt_dest, vt_source_port, vt_dest_port, vt_source_signature, vt_dest_signature) = self.checkRecord(record, DBVtConnection.vtType, 7)
+        obj = DBVtConnection(id=id, vt_source=vt_source, vt_dest=vt_dest, vt_source_port=vt_source_port, vt_dest_port=vt_dest_port, vt_source_signature=vt_source_signature, vt_dest_signature=vt_dest_signature)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, vt_connection):
+        return (DBVtConnection.vtType, (
+            self.convertToBin(vt_connection.db_id, 'str'),
+            self.convertToBin(vt_connection.db_vt_source, 'str'),
+            self.convertToBin(vt_connection.db_vt_dest, 'str'),
+            self.convertToBin(vt_connection.db_vt_source_port, 'str'),
+            self.convertToBin(vt_connection.db_vt_dest_port, 'str'),
+            self.convertToBin(vt_connection.db_vt_source_signature, 'str'),
+            self.convertToBin(vt_connection.db_vt_dest_signature, 'str'),
+            ))
+
+class DBOpmAccountBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, value) = self.checkRecord(record, DBOpmAccount.vtType, 2)
+        obj = DBOpmAccount(id=id, value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_account):
+        return (DBOpmAccount.vtType, (
+            self.convertToBin(opm_account.db_id, 'str'),
+            self.convertToBin(opm_account.db_value, 'str'),
+            ))
+
+class DBGroupExecBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, ts_start, ts_end, cached, module_id, group_name, group_type, completed, error, machine_id, annotations, item_execs) = self.checkRecord(record, DBGroupExec.vtType, 12)
+        ts_start = self.convertFromBin(ts_start, 'datetime')
+        ts_end = self.convertFromBin(ts_end, 'datetime')
+        annotations = map(self.getDao('annotation').fromBin, annotations)
+        _item_execs = []
+        for _data in item_execs:
+            _tag = _data[0]
+            if _tag == 'module_exec':
+                _data = self.getDao('module_exec').fromBin(_data)
+            elif _tag == 'group_exec':
+                _data = self.getDao('group_exec').fromBin(_data)
+            elif _tag == 'loop_exec':
+                _data = self.getDao('loop_exec').fromBin(_data)
+            else:
+                self.unexpectedRecord(_data, 'group_exec.item_execs')
+            _item_execs.append(_data)
+        item_execs = _item_execs
+        obj = DBGroupExec(item_execs=item_execs, id=id, ts_start=ts_start, ts_end=ts_end, cached=cached, module_id=module_id, group_name=group_name, group_type=group_type, completed=completed, error=error, machine_id=machine_id, annotations=annotations)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, group_exec):
+        item_execs = []
+        for _obj in group_exec.db_item_execs:
+            if _obj.vtType == 'module_exec':
+                _data = self.getDao('module_exec').toBin(_obj)
+            elif _obj.vtType == 'group_exec':
+                _data = self.getDao('group_exec').toBin(_obj)
+            elif _obj.vtType == 'loop_exec':
+                _data = self.getDao('loop_exec').toBin(_obj)
+            else:
+                continue
+            item_execs.append(_data)
+        return (DBGroupExec.vtType, (
+            group_exec.db_id,
+            self.convertToBin(group_exec.db_ts_start, 'datetime'),
+            self.convertToBin(group_exec.db_ts_end, 'datetime'),
+            group_exec.db_cached,
+            group_exec.db_module_id,
+            self.convertToBin(group_exec.db_group_name, 'str'),
+            self.convertToBin(group_exec.db_group_type, 'str'),
+            group_exec.db_completed,
+            self.convertToBin(group_exec.db_error, 'str'),
+            group_exec.db_machine_id,
+            map(self.getDao('annotation').toBin, group_exec.db_annotations),
+            item_execs,
+            ))
+
+class DBOpmAgentIdBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id,) = self.checkRecord(record, DBOpmAgentId.vtType, 1)
+        obj = DBOpmAgentId(id=id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_agent_id):
+        return (DBOpmAgentId.vtType, (
+            self.convertToBin(opm_agent_id.db_id, 'str'),
+            ))
+
+class DBParameterBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, pos, name, type, val, alias) = self.checkRecord(record, DBParameter.vtType, 6)
+        obj = DBParameter(id=id, pos=pos, name=name, type=type, val=val, alias=alias)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, parameter):
+        return (DBParameter.vtType, (
+            parameter.db_id,
+            parameter.db_pos,
+            self.convertToBin(parameter.db_name, 'str'),
+            self.convertToBin(parameter.db_type, 'str'),
+            self.convertToBin(parameter.db_val, 'str'),
+            self.convertToBin(parameter.db_alias, 'str'),
+            ))
+
+class DBVistrailBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, version, name, actions, tags, annotations, controlParameters, vistrailVariables, parameter_explorations, actionAnnotations) = self.checkRecord(record, DBVistrail.vtType, 10)
+        actions = map(self.getDao('action').fromBin, actions)
+        tags = map(self.getDao('tag').fromBin, tags)
+        annotations = map(self.getDao('annotation').fromBin, annotations)
+        controlParameters = map(self.getDao('controlParameter').fromBin, controlParameters)
+        vistrailVariables = map(self.getDao('vistrailVariable').fromBin, vistrailVariables)
+        parameter_explorations = map(self.getDao('parameter_exploration').fromBin, parameter_explorations)
+        actionAnnotations = map(self.getDao('actionAnnotation').fromBin, actionAnnotations)
+        obj = DBVistrail(id=id, version=version, name=name, actions=actions, tags=tags, annotations=annotations, controlParameters=controlParameters, vistrailVariables=vistrailVariables, parameter_explorations=parameter_explorations, actionAnnotations=actionAnnotations)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, vistrail):
+        return (DBVistrail.vtType, (
+            vistrail.db_id,
+            self.convertToBin(vistrail.db_version, 'str'),
+            self.convertToBin(vistrail.db_name, 'str'),
+            map(self.getDao('action').toBin, vistrail.db_actions),
+            map(self.getDao('tag').toBin, vistrail.db_tags),
+            map(self.getDao('annotation').toBin, vistrail.db_annotations),
+            map(self.getDao('controlParameter').toBin, vistrail.db_controlParameters),
+            map(self.getDao('vistrailVariable').toBin, vistrail.db_vistrailVariables),
+            map(self.getDao('parameter_exploration').toBin, vistrail.db_parameter_explorations),
+            map(self.getDao('actionAnnotation').toBin, vistrail.db_actionAnnotations),
+            ))
+
+class DBOpmArtifactValueBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (value,) = self.checkRecord(record, DBOpmArtifactValue.vtType, 1)
+        _value = None
+        if value is not None:
+            _data = value
+            _tag = _data[0]
+            if _tag == 'portSpec':
+                _data = self.getDao('portSpec').fromBin(_data)
+            elif _tag == 'function':
+                _data = self.getDao('function').fromBin(_data)
+            else:
+                self.unexpectedRecord(_data, 'opm_artifact_value.value')
+            _value = _data
+        value = _value
+        obj = DBOpmArtifactValue(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_artifact_value):
+        value = None
+        _obj = opm_artifact_value.db_value
+        if _obj is not None:
+            if _obj.vtType == 'portSpec':
+                _data = self.getDao('portSpec').toBin(_obj)
+            elif _obj.vtType == 'function':
+                _data = self.getDao('function').toBin(_obj)
+            else:
+                _data = None
+            value = _data
+        return (DBOpmArtifactValue.vtType, (
+            value,
+            ))
+
+class DBConfigStrBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (value,) = self.checkRecord(record, DBConfigStr.vtType, 1)
+        obj = DBConfigStr(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, config_str):
+        return (DBConfigStr.vtType, (
+            self.convertToBin(config_str.db_value, 'str'),
+            ))
+
+class DBStartupBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (version, configuration, enabled_packages, disabled_packages) = self.checkRecord(record, DBStartup.vtType, 4)
+        if configuration is not None:
+            configuration = self.getDao('configuration').fromBin(configuration)
+        if enabled_packages is not None:
+            enabled_packages = self.getDao('enabled_packages').fromBin(enabled_packages)
+        if disabled_packages is not None:
+            disabled_packages = self.getDao('disabled_packages').fromBin(disabled_packages)
+        obj = DBStartup(version=version, configuration=configuration, enabled_packages=enabled_packages, disabled_packages=disabled_packages)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, startup):
+        return (DBStartup.vtType, (
+            self.convertToBin(startup.db_version, 'str'),
+            self.getDao('configuration').toBin(startup.db_configuration) if startup.db_configuration is not None else None,
+            self.getDao('enabled_packages').toBin(startup.db_enabled_packages) if startup.db_enabled_packages is not None else None,
+            self.getDao('disabled_packages').toBin(startup.db_disabled_packages) if startup.db_disabled_packages is not None else None,
+            ))
+
+class DBModuleBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, cache, name, namespace, package, version, location, functions, annotations, controlParameters, portSpecs) = self.checkRecord(record, DBModule.vtType, 11)
+        if location is not None:
+            location = self.getDao('location').fromBin(location)
+        functions = map(self.getDao('function').fromBin, functions)
+        annotations = map(self.getDao('annotation').fromBin, annotations)
+        controlParameters = map(self.getDao('controlParameter').fromBin, controlParameters)
+        portSpecs = map(self.getDao('portSpec').fromBin, portSpecs)
+        obj = DBModule(id=id, cache=cache, name=name, namespace=namespace, package=package, version=version, location=location, functions=functions, annotations=annotations, controlParameters=controlParameters, portSpecs=portSpecs)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, module):
+        return (DBModule.vtType, (
+            module.db_id,
+            module.db_cache,
+            self.convertToBin(module.db_name, 'str'),
+            self.convertToBin(module.db_namespace, 'str'),
+            self.convertToBin(module.db_package, 'str'),
+            self.convertToBin(module.db_version, 'str'),
+            self.getDao('location').toBin(module.db_location) if module.db_location is not None else None,
+            map(self.getDao('function').toBin, module.db_functions),
+            map(self.getDao('annotation').toBin, module.db_annotations),
+            map(self.getDao('controlParameter').toBin, module.db_controlParameters),
+            map(self.getDao('portSpec').toBin, module.db_portSpecs),
+            ))
+
+class DBPortBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, type, moduleId, moduleName, name, signature) = self.checkRecord(record, DBPort.vtType, 6)
+        obj = DBPort(id=id, type=type, moduleId=moduleId, moduleName=moduleName, name=name, signature=signature)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, port):
+        return (DBPort.vtType, (
+            port.db_id,
+            self.convertToBin(port.db_type, 'str'),
+            port.db_moduleId,
+            self.convertToBin(port.db_moduleName, 'str'),
+            self.convertToBin(port.db_name, 'str'),
+            self.convertToBin(port.db_signature, 'str'),
+            ))
+
+class DBOpmAgentsBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (agents,) = self.checkRecord(record, DBOpmAgents.vtType, 1)
+        agents = map(self.getDao('opm_agent').fromBin, agents)
+        obj = DBOpmAgents(agents=agents)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_agents):
+        return (DBOpmAgents.vtType, (
+            map(self.getDao('opm_agent').toBin, opm_agents.db_agents),
+            ))
+
+class DBOpmDependenciesBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (dependencys,) = self.checkRecord(record, DBOpmDependencies.vtType, 1)
+        _dependencys = []
+        for _data in dependencys:
+            _tag = _data[0]
+            if _tag == 'opm_used':
+                _data = self.getDao('opm_used').fromBin(_data)
+            elif _tag == 'opm_was_generated_by':
+                _data = self.getDao('opm_was_generated_by').fromBin(_data)
+            elif _tag == 'opm_was_triggered_by':
+                _data = self.getDao('opm_was_triggered_by').fromBin(_data)
+            elif _tag == 'opm_was_derived_from':
+                _data = self.getDao('opm_was_derived_from').fromBin(_data)
+            elif _tag == 'opm_was_controlled_by':
+                _data = self.getDao('opm_was_controlled_by').fromBin(_data)
+            else:
+                self.unexpectedRecord(_data, 'opm_dependencies.dependencys')
+            _dependencys.append(_data)
+        dependencys = _dependencys
+        obj = DBOpmDependencies(dependencys=dependencys)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_dependencies):
+        dependencys = []
+        for _obj in opm_dependencies.db_dependencys:
+            if _obj.vtType == 'opm_used':
+                _data = self.getDao('opm_used').toBin(_obj)
+            elif _obj.vtType == 'opm_was_generated_by':
+                _data = self.getDao('opm_was_generated_by').toBin(_obj)
+            elif _obj.vtType == 'opm_was_triggered_by':
+                _data = self.getDao('opm_was_triggered_by').toBin(_obj)
+            elif _obj.vtType == 'opm_was_derived_from':
+                _data = self.getDao('opm_was_derived_from').toBin(_obj)
+            elif _obj.vtType == 'opm_was_controlled_by':
+                _data = self.getDao('opm_was_controlled_by').toBin(_obj)
+            else:
+                continue
+            dependencys.append(_data)
+        return (DBOpmDependencies.vtType, (
+            dependencys,
+            ))
+
+class DBPEFunctionBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, module_id, port_name, is_alias, parameters) = self.checkRecord(record, DBPEFunction.vtType, 5)
+        parameters = map(self.getDao('pe_parameter').fromBin, parameters)
+        obj = DBPEFunction(id=id, module_id=module_id, port_name=port_name, is_alias=is_alias, parameters=parameters)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, pe_function):
+        return (DBPEFunction.vtType, (
+            pe_function.db_id,
+            pe_function.db_module_id,
+            self.convertToBin(pe_function.db_port_name, 'str'),
+            pe_function.db_is_alias,
+            map(self.getDao('pe_parameter').toBin, pe_function.db_parameters),
+            ))
+
+class DBWorkflowBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, name, version, vistrail_id, connections, annotations, plugin_datas, others, modules) = self.checkRecord(record, DBWorkflow.vtType, 9)
+        connections = map(self.getDao('connection').fromBin, connections)
+        annotations = map(self.getDao('annotation').fromBin, annotations)
+        plugin_datas = map(self.getDao('plugin_data').fromBin, plugin_datas)
+        others = map(self.getDao('other').fromBin, others)
+        _modules = []
+        for _data in modules:
+            _tag = _data[0]
+            if _tag == 'module':
+                _data = self.getDao('module').fromBin(_data)
+            elif _tag == 'abstraction':
+                _data = self.getDao('abstraction').fromBin(_data)
+            elif _tag == 'group':
+                _data = self.getDao('group').fromBin(_data)
+            else:
+                self.unexpectedRecord(_data, 'workflow.modules')
+            _modules.append(_data)
+        modules = _modules
+        obj = DBWorkflow(modules=modules, id=id, name=name, version=version, connections=connections, annotations=annotations, plugin_datas=plugin_datas, others=others, vistrail_id=vistrail_id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, workflow):
+        modules = []
+        for _obj in workflow.db_modules:
+            if _obj.vtType == 'module':
+                _data = self.getDao('module').toBin(_obj)
+            elif _obj.vtType == 'abstraction':
+                _data = self.getDao('abstraction').toBin(_obj)
+            elif _obj.vtType == 'group':
+                _data = self.getDao('group').toBin(_obj)
+            else:
+                continue
+            modules.append(_data)
+        return (DBWorkflow.vtType, (
+            workflow.db_id,
+            self.convertToBin(workflow.db_name, 'str'),
+            self.convertToBin(workflow.db_version, 'str'),
+            workflow.db_vistrail_id,
+            map(self.getDao('connection').toBin, workflow.db_connections),
+            map(self.getDao('annotation').toBin, workflow.db_annotations),
+            map(self.getDao('plugin_data').toBin, workflow.db_plugin_datas),
+            map(self.getDao('other').toBin, workflow.db_others),
+            modules,
+            ))
+
+class DBMashupActionBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, prevId, date, user, mashup) = self.checkRecord(record, DBMashupAction.vtType, 5)
+        date = self.convertFromBin(date, 'datetime')
+        if mashup is not None:
+            mashup = self.getDao('mashup').fromBin(mashup)
+        obj = DBMashupAction(id=id, prevId=prevId, date=date, user=user, mashup=mashup)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, mashup_action):
+        return (DBMashupAction.vtType, (
+            mashup_action.db_id,
+            mashup_action.db_prevId,
+            self.convertToBin(mashup_action.db_date, 'datetime'),
+            self.convertToBin(mashup_action.db_user, 'str'),
+            self.getDao('mashup').toBin(mashup_action.db_mashup) if mashup_action.db_mashup is not None else None,
+            ))
+
+class DBConfigurationBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (config_keys,) = self.checkRecord(record, DBConfiguration.vtType, 1)
+        config_keys = map(self.getDao('config_key').fromBin, config_keys)
+        obj = DBConfiguration(config_keys=config_keys)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, configuration):
+        return (DBConfiguration.vtType, (
+            map(self.getDao('config_key').toBin, configuration.db_config_keys),
+            ))
+
+class DBChangeBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, what, oldObjId, newObjId, parentObjId, parentObjType, data) = self.checkRecord(record, DBChange.vtType, 7)
+        _data = None
+        if data is not None:
+            _data = data
+            _tag = _data[0]
+            if _tag == 'module':
+                _data = self.getDao('module').fromBin(_data)
+            elif _tag == 'location':
+                _data = self.getDao('location').fromBin(_data)
+            elif _tag == 'annotation':
+                _data = self.getDao('annotation').fromBin(_data)
+            elif _tag == 'controlParameter':
+                _data = self.getDao('controlParameter').fromBin(_data)
+            elif _tag == 'function':
+                _data = self.getDao('function').fromBin(_data)
+            elif _tag == 'connection':
+                _data = self.getDao('connection').fromBin(_data)
+            elif _tag == 'port':
+                _data = self.getDao('port').fromBin(_data)
+            elif _tag == 'parameter':
+                _data = self.getDao('parameter').fromBin(_data)
+            elif _tag == 'portSpec':
+                _data = self.getDao('portSpec').fromBin(_data)
+            elif _tag == 'abstraction':
+                _data = self.getDao('abstraction').fromBin(_data)
+            elif _tag == 'group':
+                _data = self.getDao('group').fromBin(_data)
+            elif _tag == 'other':
+                _data = self.getDao('other').fromBin(_data)
+            elif _tag == 'plugin_data':
+                _data = self.getDao('plugin_data').fromBin(_data)
+            else:
+                self.unexpectedRecord(_data, 'change.data')
+            _data = _data
+        data = _data
+        obj = DBChange(data=data, id=id, what=what, oldObjId=oldObjId, newObjId=newObjId, parentObjId=parentObjId, parentObjType=parentObjType)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, change):
+        data = None
+        _obj = change.db_data
+        if _obj is not None:
+            if _obj.vtType == 'module':
+                _data = self.getDao('module').toBin(_obj)
+            elif _obj.vtType == 'location':
+                _data = self.getDao('location').toBin(_obj)
+            elif _obj.vtType == 'annotation':
+                _data = self.getDao('annotation').toBin(_obj)
+            elif _obj.vtType == 'controlParameter':
+                _data = self.getDao('controlParameter').toBin(_obj)
+            elif _obj.vtType == 'function':
+                _data = self.getDao('function').toBin(_obj)
+            elif _obj.vtType == 'connection':
+                _data = self.getDao('connection').toBin(_obj)
+            elif _obj.vtType == 'port':
+                _data = self.getDao('port').toBin(_obj)
+            elif _obj.vtType == 'parameter':
+                _data = self.getDao('parameter').toBin(_obj)
+            elif _obj.vtType == 'portSpec':
+                _data = self.getDao('portSpec').toBin(_obj)
+            elif _obj.vtType == 'abstraction':
+                _data = self.getDao('abstraction').toBin(_obj)
+            elif _obj.vtType == 'group':
+                _data = self.getDao('group').toBin(_obj)
+            elif _obj.vtType == 'other':
+                _data = self.getDao('other').toBin(_obj)
+            elif _obj.vtType == 'plugin_data':
+                _data = self.getDao('plugin_data').toBin(_obj)
+            else:
+                _data = None
+            data = _data
+        return (DBChange.vtType, (
+            change.db_id,
+            self.convertToBin(change.db_what, 'str'),
+            change.db_oldObjId,
+            change.db_newObjId,
+            change.db_parentObjId,
+            self.convertToBin(change.db_parentObjType, 'str'),
+            data,
+            ))
+
+class DBPackageBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, name, identifier, codepath, load_configuration, version, description, module_descriptors) = self.checkRecord(record, DBPackage.vtType, 8)
+        module_descriptors = map(self.getDao('module_descriptor').fromBin, module_descriptors)
+        obj = DBPackage(id=id, name=name, identifier=identifier, codepath=codepath, load_configuration=load_configuration, version=version, description=description, module_descriptors=module_descriptors)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, package):
+        return (DBPackage.vtType, (
+            package.db_id,
+            self.convertToBin(package.db_name, 'str'),
+            self.convertToBin(package.db_identifier, 'str'),
+            self.convertToBin(package.db_codepath, 'str'),
+            package.db_load_configuration,
+            self.convertToBin(package.db_version, 'str'),
+            self.convertToBin(package.db_description, 'str'),
+            map(self.getDao('module_descriptor').toBin, package.db_module_descriptors),
+            ))
+
+class DBLoopExecBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, ts_start, ts_end, loop_iterations) = self.checkRecord(record, DBLoopExec.vtType, 4)
+        ts_start = self.convertFromBin(ts_start, 'datetime')
+        ts_end = self.convertFromBin(ts_end, 'datetime')
+        loop_iterations = map(self.getDao('loop_iteration').fromBin, loop_iterations)
+        obj = DBLoopExec(id=id, ts_start=ts_start, ts_end=ts_end, loop_iterations=loop_iterations)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, loop_exec):
+        return (DBLoopExec.vtType, (
+            loop_exec.db_id,
+            self.convertToBin(loop_exec.db_ts_start, 'datetime'),
+            self.convertToBin(loop_exec.db_ts_end, 'datetime'),
+            map(self.getDao('loop_iteration').toBin, loop_exec.db_loop_iterations),
+            ))
+
+class DBConnectionBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, ports) = self.checkRecord(record, DBConnection.vtType, 2)
+        ports = map(self.getDao('port').fromBin, ports)
+        obj = DBConnection(id=id, ports=ports)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, connection):
+        return (DBConnection.vtType, (
+            connection.db_id,
+            map(self.getDao('port').toBin, connection.db_ports),
+            ))
+
+class DBConfigBoolBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (value,) = self.checkRecord(record, DBConfigBool.vtType, 1)
+        obj = DBConfigBool(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, config_bool):
+        return (DBConfigBool.vtType, (
+            self.convertToBin(config_bool.db_value, 'str'),
+            ))
+
+class DBActionBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, prevId, date, session, user, annotations, operations) = self.checkRecord(record, DBAction.vtType, 7)
+        date = self.convertFromBin(date, 'datetime')
+        annotations = map(self.getDao('annotation').fromBin, annotations)
+        _operations = []
+        for _data in operations:
+            _tag = _data[0]
+            if _tag == 'add':
+                _data = self.getDao('add').fromBin(_data)
+            elif _tag == 'delete':
+                _data = self.getDao('delete').fromBin(_data)
+            elif _tag == 'change':
+                _data = self.getDao('change').fromBin(_data)
+            else:
+                self.unexpectedRecord(_data, 'action.operations')
+            _operations.append(_data)
+        operations = _operations
+        obj = DBAction(operations=operations, id=id, prevId=prevId, date=date, session=session, user=user, annotations=annotations)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, action):
+        operations = []
+        for _obj in action.db_operations:
+            if _obj.vtType == 'add':
+                _data = self.getDao('add').toBin(_obj)
+            elif _obj.vtType == 'delete':
+                _data = self.getDao('delete').toBin(_obj)
+            elif _obj.vtType == 'change':
+                _data = self.getDao('change').toBin(_obj)
+            else:
+                continue
+            operations.append(_data)
+        return (DBAction.vtType, (
+            action.db_id,
+            action.db_prevId,
+            self.convertToBin(action.db_date, 'datetime'),
+            action.db_session,
+            self.convertToBin(action.db_user, 'str'),
+            map(self.getDao('annotation').toBin, action.db_annotations),
+            operations,
+            ))
+
+class DBStartupPackageBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (name, configuration) = self.checkRecord(record, DBStartupPackage.vtType, 2)
+        if configuration is not None:
+            configuration = self.getDao('configuration').fromBin(configuration)
+        obj = DBStartupPackage(name=name, configuration=configuration)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, startup_package):
+        return (DBStartupPackage.vtType, (
+            self.convertToBin(startup_package.db_name, 'str'),
+            self.getDao('configuration').toBin(startup_package.db_configuration) if startup_package.db_configuration is not None else None,
+            ))
+
+class DBConfigIntBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (value,) = self.checkRecord(record, DBConfigInt.vtType, 1)
+        obj = DBConfigInt(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, config_int):
+        return (DBConfigInt.vtType, (
+            config_int.db_value,
+            ))
+
+class DBOpmProcessIdEffectBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id,) = self.checkRecord(record, DBOpmProcessIdEffect.vtType, 1)
+        obj = DBOpmProcessIdEffect(id=id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_process_id_effect):
+        return (DBOpmProcessIdEffect.vtType, (
+            self.convertToBin(opm_process_id_effect.db_id, 'str'),
+            ))
+
+class DBRefProvPlanBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (prov_ref,) = self.checkRecord(record, DBRefProvPlan.vtType, 1)
+        obj = DBRefProvPlan(prov_ref=prov_ref)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, ref_prov_plan):
+        return (DBRefProvPlan.vtType, (
+            self.convertToBin(ref_prov_plan.db_prov_ref, 'str'),
+            ))
+
+class DBOpmAccountsBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (accounts, opm_overlapss) = self.checkRecord(record, DBOpmAccounts.vtType, 2)
+        accounts = map(self.getDao('opm_account').fromBin, accounts)
+        opm_overlapss = map(self.getDao('opm_overlaps').fromBin, opm_overlapss)
+        obj = DBOpmAccounts(accounts=accounts, opm_overlapss=opm_overlapss)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_accounts):
+        return (DBOpmAccounts.vtType, (
+            map(self.getDao('opm_account').toBin, opm_accounts.db_accounts),
+            map(self.getDao('opm_overlaps').toBin, opm_accounts.db_opm_overlapss),
+            ))
+
+class DBRefProvAgentBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (prov_ref,) = self.checkRecord(record, DBRefProvAgent.vtType, 1)
+        obj = DBRefProvAgent(prov_ref=prov_ref)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, ref_prov_agent):
+        return (DBRefProvAgent.vtType, (
+            self.convertToBin(ref_prov_agent.db_prov_ref, 'str'),
+            ))
+
+class DBPortSpecBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, name, type, optional, depth, sort_key, min_conns, max_conns, portSpecItems) = self.checkRecord(record, DBPortSpec.vtType, 9)
+        portSpecItems = map(self.getDao('portSpecItem').fromBin, portSpecItems)
+        obj = DBPortSpec(id=id, name=name, type=type, optional=optional, depth=depth, sort_key=sort_key, portSpecItems=portSpecItems, min_conns=min_conns, max_conns=max_conns)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, portSpec):
+        return (DBPortSpec.vtType, (
+            portSpec.db_id,
+            self.convertToBin(portSpec.db_name, 'str'),
+            self.convertToBin(portSpec.db_type, 'str'),
+            portSpec.db_optional,
+            portSpec.db_depth,
+            portSpec.db_sort_key,
+            portSpec.db_min_conns,
+            portSpec.db_max_conns,
+            map(self.getDao('portSpecItem').toBin, portSpec.db_portSpecItems),
+            ))
+
+class DBEnabledPackagesBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (packages,) = self.checkRecord(record, DBEnabledPackages.vtType, 1)
+        packages = map(self.getDao('startup_package').fromBin, packages)
+        obj = DBEnabledPackages(packages=packages)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, enabled_packages):
+        return (DBEnabledPackages.vtType, (
+            map(self.getDao('startup_package').toBin, enabled_packages.db_packages),
+            ))
+
+class DBOpmArtifactBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, value, accounts) = self.checkRecord(record, DBOpmArtifact.vtType, 3)
+        if value is not None:
+            value = self.getDao('opm_artifact_value').fromBin(value)
+        accounts = map(self.getDao('opm_account_id').fromBin, accounts)
+        obj = DBOpmArtifact(id=id, value=value, accounts=accounts)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_artifact):
+        return (DBOpmArtifact.vtType, (
+            self.convertToBin(opm_artifact.db_id, 'str'),
+            self.getDao('opm_artifact_value').toBin(opm_artifact.db_value) if opm_artifact.db_value is not None else None,
+            map(self.getDao('opm_account_id').toBin, opm_artifact.db_accounts),
+            ))
+
+class DBLogBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, version, name, vistrail_id, workflow_execs) = self.checkRecord(record, DBLog.vtType, 5)
+        workflow_execs = map(self.getDao('workflow_exec').fromBin, workflow_execs)
+        obj = DBLog(id=id, version=version, name=name, workflow_execs=workflow_execs, vistrail_id=vistrail_id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, log):
+        return (DBLog.vtType, (
+            log.db_id,
+            self.convertToBin(log.db_version, 'str'),
+            self.convertToBin(log.db_name, 'str'),
+            log.db_vistrail_id,
+            map(self.getDao('workflow_exec').toBin, log.db_workflow_execs),
+            ))
+
+class DBLoopIterationBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, ts_start, ts_end, iteration, completed, error, item_execs) = self.checkRecord(record, DBLoopIteration.vtType, 7)
+        ts_start = self.convertFromBin(ts_start, 'datetime')
+        ts_end = self.convertFromBin(ts_end, 'datetime')
+        _item_execs = []
+        for _data in item_execs:
+            _tag = _data[0]
+            if _tag == 'module_exec':
+                _data = self.getDao('module_exec').fromBin(_data)
+            elif _tag == 'group_exec':
+                _data = self.getDao('group_exec').fromBin(_data)
+            elif _tag == 'loop_exec':
+                _data = self.getDao('loop_exec').fromBin(_data)
+            else:
+                self.unexpectedRecord(_data, 'loop_iteration.item_execs')
+            _item_execs.append(_data)
+        item_execs = _item_execs
+        obj = DBLoopIteration(item_execs=item_execs, id=id, ts_start=ts_start, ts_end=ts_end, iteration=iteration, completed=completed, error=error)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, loop_iteration):
+        item_execs = []
+        for _obj in loop_iteration.db_item_execs:
+            if _obj.vtType == 'module_exec':
+                _data = self.getDao('module_exec').toBin(_obj)
+            elif _obj.vtType == 'group_exec':
+                _data = self.getDao('group_exec').toBin(_obj)
+            elif _obj.vtType == 'loop_exec':
+                _data = self.getDao('loop_exec').toBin(_obj)
+            else:
+                continue
+            item_execs.append(_data)
+        return (DBLoopIteration.vtType, (
+            loop_iteration.db_id,
+            self.convertToBin(loop_iteration.db_ts_start, 'datetime'),
+            self.convertToBin(loop_iteration.db_ts_end, 'datetime'),
+            loop_iteration.db_iteration,
+            loop_iteration.db_completed,
+            self.convertToBin(loop_iteration.db_error, 'str'),
+            item_execs,
+            ))
+
+class DBOpmProcessIdCauseBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id,) = self.checkRecord(record, DBOpmProcessIdCause.vtType, 1)
+        obj = DBOpmProcessIdCause(id=id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_process_id_cause):
+        return (DBOpmProcessIdCause.vtType, (
+            self.convertToBin(opm_process_id_cause.db_id, 'str'),
+            ))
+
+class DBOpmArtifactsBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (artifacts,) = self.checkRecord(record, DBOpmArtifacts.vtType, 1)
+        artifacts = map(self.getDao('opm_artifact').fromBin, artifacts)
+        obj = DBOpmArtifacts(artifacts=artifacts)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_artifacts):
+        return (DBOpmArtifacts.vtType, (
+            map(self.getDao('opm_artifact').toBin, opm_artifacts.db_artifacts),
+            ))
+
+class DBPEParameterBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, pos, interpolator, value, dimension) = self.checkRecord(record, DBPEParameter.vtType, 5)
+        obj = DBPEParameter(id=id, pos=pos, interpolator=interpolator, value=value, dimension=dimension)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, pe_parameter):
+        return (DBPEParameter.vtType, (
+            pe_parameter.db_id,
+            pe_parameter.db_pos,
+            self.convertToBin(pe_parameter.db_interpolator, 'str'),
+            self.convertToBin(pe_parameter.db_value, 'str'),
+            pe_parameter.db_dimension,
+            ))
+
+class DBWorkflowExecBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, user, ip, session, vt_version, ts_start, ts_end, parent_id, parent_type, parent_version, completed, name, annotations, machines, item_execs) = self.checkRecord(record, DBWorkflowExec.vtType, 15)
+        ts_start = self.convertFromBin(ts_start, 'datetime')
+        ts_end = self.convertFromBin(ts_end, 'datetime')
+        annotations = map(self.getDao('annotation').fromBin, annotations)
+        machines = map(self.getDao('machine').fromBin, machines)
+        _item_execs = []
+        for _data in item_execs:
+            _tag = _data[0]
+            if _tag == 'module_exec':
+                _data = self.getDao('module_exec').fromBin(_data)
+            elif _tag == 'group_exec':
+                _data = self.getDao('group_exec').fromBin(_data)
+            elif _tag == 'loop_exec':
+                _data = self.getDao('loop_exec').fromBin(_data)
+            else:
+                self.unexpectedRecord(_data, 'workflow_exec.item_execs')
+            _item_execs.append(_data)
+        item_execs = _item_execs
+        obj = DBWorkflowExec(item_execs=item_execs, id=id, user=user, ip=ip, session=session, vt_version=vt_version, ts_start=ts_start, ts_end=ts_end, parent_id=parent_id, parent_type=parent_type, parent_version=parent_version, completed=completed, name=name, annotations=annotations, machines=machines)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, workflow_exec):
+        item_execs = []
+        for _obj in workflow_exec.db_item_execs:
+            if _obj.vtType == 'module_exec':
+                _data = self.getDao('module_exec').toBin(_obj)
+            elif _obj.vtType == 'group_exec':
+                _data = self.getDao('group_exec').toBin(_obj)
+            elif _obj.vtType == 'loop_exec':
+                _data = self.getDao('loop_exec').toBin(_obj)
+            else:
+                continue
+            item_execs.append(_data)
+        return (DBWorkflowExec.vtType, (
+            workflow_exec.db_id,
+            self.convertToBin(workflow_exec.db_user, 'str'),
+            self.convertToBin(workflow_exec.db_ip, 'str'),
+            workflow_exec.db_session,
+            self.convertToBin(workflow_exec.db_vt_version, 'str'),
+            self.convertToBin(workflow_exec.db_ts_start, 'datetime'),
+            self.convertToBin(workflow_exec.db_ts_end, 'datetime'),
+            workflow_exec.db_parent_id,
+            self.convertToBin(workflow_exec.db_parent_type, 'str'),
+            workflow_exec.db_parent_version,
+            workflow_exec.db_completed,
+            self.convertToBin(workflow_exec.db_name, 'str'),
+            map(self.getDao('annotation').toBin, workflow_exec.db_annotations),
+            map(self.getDao('machine').toBin, workflow_exec.db_machines),
+            item_execs,
+            ))
+
+class DBLocationBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, x, y) = self.checkRecord(record, DBLocation.vtType, 3)
+        obj = DBLocation(id=id, x=x, y=y)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, location):
+        return (DBLocation.vtType, (
+            location.db_id,
+            location.db_x,
+            location.db_y,
+            ))
+
+class DBFunctionBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, pos, name, parameters) = self.checkRecord(record, DBFunction.vtType, 4)
+        parameters = map(self.getDao('parameter').fromBin, parameters)
+        obj = DBFunction(id=id, pos=pos, name=name, parameters=parameters)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, function):
+        return (DBFunction.vtType, (
+            function.db_id,
+            function.db_pos,
+            self.convertToBin(function.db_name, 'str'),
+            map(self.getDao('parameter').toBin, function.db_parameters),
+            ))
+
+class DBActionAnnotationBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, key, value, action_id, date, user) = self.checkRecord(record, DBActionAnnotation.vtType, 6)
+        date = self.convertFromBin(date, 'datetime')
+        obj = DBActionAnnotation(id=id, key=key, value=value, action_id=action_id, date=date, user=user)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, actionAnnotation):
+        return (DBActionAnnotation.vtType, (
+            actionAnnotation.db_id,
+            self.convertToBin(actionAnnotation.db_key, 'str'),
+            self.convertToBin(actionAnnotation.db_value, 'str'),
+            actionAnnotation.db_action_id,
+            self.convertToBin(actionAnnotation.db_date, 'datetime'),
+            self.convertToBin(actionAnnotation.db_user, 'str'),
+            ))
+
+class DBProvActivityBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, startTime, endTime, vt_id, vt_type, vt_cached, vt_completed, vt_machine_id, vt_error, is_part_of) = self.checkRecord(record, DBProvActivity.vtType, 10)
+        if is_part_of is not None:
+            is_part_of = self.getDao('is_part_of').fromBin(is_part_of)
+        obj = DBProvActivity(id=id, startTime=startTime, endTime=endTime, vt_id=vt_id, vt_type=vt_type, vt_cached=vt_cached, vt_completed=vt_completed, vt_machine_id=vt_machine_id, vt_error=vt_error, is_part_of=is_part_of)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_activity):
+        return (DBProvActivity.vtType, (
+            self.convertToBin(prov_activity.db_id, 'str'),
+            self.convertToBin(prov_activity.db_startTime, 'str'),
+            self.convertToBin(prov_activity.db_endTime, 'str'),
+            self.convertToBin(prov_activity.db_vt_id, 'str'),
+            self.convertToBin(prov_activity.db_vt_type, 'str'),
+            self.convertToBin(prov_activity.db_vt_cached, 'str'),
+            self.convertToBin(prov_activity.db_vt_completed, 'str'),
+            self.convertToBin(prov_activity.db_vt_machine_id, 'str'),
+            self.convertToBin(prov_activity.db_vt_error, 'str'),
+            self.getDao('is_part_of').toBin(prov_activity.db_is_part_of) if prov_activity.db_is_part_of is not None else None,
+            ))
+
+class DBProvUsageBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (prov_activity, prov_entity, prov_role) = self.checkRecord(record, DBProvUsage.vtType, 3)
+        if prov_activity is not None:
+            prov_activity = self.getDao('ref_prov_activity').fromBin(prov_activity)
+        if prov_entity is not None:
+            prov_entity = self.getDao('ref_prov_entity').fromBin(prov_entity)
+        obj = DBProvUsage(prov_activity=prov_activity, prov_entity=prov_entity, prov_role=prov_role)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_usage):
+        return (DBProvUsage.vtType, (
+            self.getDao('ref_prov_activity').toBin(prov_usage.db_prov_activity) if prov_usage.db_prov_activity is not None else None,
+            self.getDao('ref_prov_entity').toBin(prov_usage.db_prov_entity) if prov_usage.db_prov_entity is not None else None,
+            self.convertToBin(prov_usage.db_prov_role, 'str'),
+            ))
+
+class DBOpmArtifactIdEffectBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id,) = self.checkRecord(record, DBOpmArtifactIdEffect.vtType, 1)
+        obj = DBOpmArtifactIdEffect(id=id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_artifact_id_effect):
+        return (DBOpmArtifactIdEffect.vtType, (
+            self.convertToBin(opm_artifact_id_effect.db_id, 'str'),
+            ))
+
+class DBOpmGraphBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (accounts, processes, artifacts, agents, dependencies) = self.checkRecord(record, DBOpmGraph.vtType, 5)
+        if accounts is not None:
+            accounts = self.getDao('opm_accounts').fromBin(accounts)
+        if processes is not None:
+            processes = self.getDao('opm_processes').fromBin(processes)
+        if artifacts is not None:
+            artifacts = self.getDao('opm_artifacts').fromBin(artifacts)
+        if agents is not None:
+            agents = self.getDao('opm_agents').fromBin(agents)
+        if dependencies is not None:
+            dependencies = self.getDao('opm_dependencies').fromBin(dependencies)
+        obj = DBOpmGraph(accounts=accounts, processes=processes, artifacts=artifacts, agents=agents, dependencies=dependencies)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_graph):
+        return (DBOpmGraph.vtType, (
+            self.getDao('opm_accounts').toBin(opm_graph.db_accounts) if opm_graph.db_accounts is not None else None,
+            self.getDao('opm_processes').toBin(opm_graph.db_processes) if opm_graph.db_processes is not None else None,
+            self.getDao('opm_artifacts').toBin(opm_graph.db_artifacts) if opm_graph.db_artifacts is not None else None,
+            self.getDao('opm_agents').toBin(opm_graph.db_agents) if opm_graph.db_agents is not None else None,
+            self.getDao('opm_dependencies').toBin(opm_graph.db_dependencies) if opm_graph.db_dependencies is not None else None,
+            ))
+
+class DBIsPartOfBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (prov_ref,) = self.checkRecord(record, DBIsPartOf.vtType, 1)
+        obj = DBIsPartOf(prov_ref=prov_ref)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, is_part_of):
+        return (DBIsPartOf.vtType, (
+            self.convertToBin(is_part_of.db_prov_ref, 'str'),
+            ))
+
+class DBOpmWasDerivedFromBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (effect, role, cause, accounts, opm_times) = self.checkRecord(record, DBOpmWasDerivedFrom.vtType, 5)
+        if effect is not None:
+            effect = self.getDao('opm_artifact_id_effect').fromBin(effect)
+        if role is not None:
+            role = self.getDao('opm_role').fromBin(role)
+        if cause is not None:
+            cause = self.getDao('opm_artifact_id_cause').fromBin(cause)
+        accounts = map(self.getDao('opm_account_id').fromBin, accounts)
+        opm_times = map(self.getDao('opm_time').fromBin, opm_times)
+        obj = DBOpmWasDerivedFrom(effect=effect, role=role, cause=cause, accounts=accounts, opm_times=opm_times)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_was_derived_from):
+        return (DBOpmWasDerivedFrom.vtType, (
+            self.getDao('opm_artifact_id_effect').toBin(opm_was_derived_from.db_effect) if opm_was_derived_from.db_effect is not None else None,
+            self.getDao('opm_role').toBin(opm_was_derived_from.db_role) if opm_was_derived_from.db_role is not None else None,
+            self.getDao('opm_artifact_id_cause').toBin(opm_was_derived_from.db_cause) if opm_was_derived_from.db_cause is not None else None,
+            map(self.getDao('opm_account_id').toBin, opm_was_derived_from.db_accounts),
+            map(self.getDao('opm_time').toBin, opm_was_derived_from.db_opm_times),
+            ))
+
+class DBControlParameterBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, name, value) = self.checkRecord(record, DBControlParameter.vtType, 3)
+        obj = DBControlParameter(id=id, name=name, value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, controlParameter):
+        return (DBControlParameter.vtType, (
+            controlParameter.db_id,
+            self.convertToBin(controlParameter.db_name, 'str'),
+            self.convertToBin(controlParameter.db_value, 'str'),
+            ))
+
+class DBPluginDataBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, data) = self.checkRecord(record, DBPluginData.vtType, 2)
+        obj = DBPluginData(id=id, data=data)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, plugin_data):
+        return (DBPluginData.vtType, (
+            plugin_data.db_id,
+            self.convertToBin(plugin_data.db_data, 'str'),
+            ))
+
+class DBDeleteBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, what, objectId, parentObjId, parentObjType) = self.checkRecord(record, DBDelete.vtType, 5)
+        obj = DBDelete(id=id, what=what, objectId=objectId, parentObjId=parentObjId, parentObjType=parentObjType)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, delete):
+        return (DBDelete.vtType, (
+            delete.db_id,
+            self.convertToBin(delete.db_what, 'str'),
+            delete.db_objectId,
+            delete.db_parentObjId,
+            self.convertToBin(delete.db_parentObjType, 'str'),
+            ))
+
+class DBVistrailVariableBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (name, uuid, package, module, namespace, value) = self.checkRecord(record, DBVistrailVariable.vtType, 6)
+        obj = DBVistrailVariable(name=name, uuid=uuid, package=package, module=module, namespace=namespace, value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, vistrailVariable):
+        return (DBVistrailVariable.vtType, (
+            self.convertToBin(vistrailVariable.db_name, 'str'),
+            self.convertToBin(vistrailVariable.db_uuid, 'str'),
+            self.convertToBin(vistrailVariable.db_package, 'str'),
+            self.convertToBin(vistrailVariable.db_module, 'str'),
+            self.convertToBin(vistrailVariable.db_namespace, 'str'),
+            self.convertToBin(vistrailVariable.db_value, 'str'),
+            ))
+
+class DBOpmOverlapsBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (opm_account_ids,) = self.checkRecord(record, DBOpmOverlaps.vtType, 1)
+        opm_account_ids = map(self.getDao('opm_account_id').fromBin, opm_account_ids)
+        obj = DBOpmOverlaps(opm_account_ids=opm_account_ids)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_overlaps):
+        return (DBOpmOverlaps.vtType, (
+            map(self.getDao('opm_account_id').toBin, opm_overlaps.db_opm_account_ids),
+            ))
+
+class DBOpmWasTriggeredByBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (effect, role, cause, accounts, opm_times) = self.checkRecord(record, DBOpmWasTriggeredBy.vtType, 5)
+        if effect is not None:
+            effect = self.getDao('opm_process_id_effect').fromBin(effect)
+        if role is not None:
+            role = self.getDao('opm_role').fromBin(role)
+        if cause is not None:
+            cause = self.getDao('opm_process_id_cause').fromBin(cause)
+        accounts = map(self.getDao('opm_account_id').fromBin, accounts)
+        opm_times = map(self.getDao('opm_time').fromBin, opm_times)
+        obj = DBOpmWasTriggeredBy(effect=effect, role=role, cause=cause, accounts=accounts, opm_times=opm_times)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_was_triggered_by):
+        return (DBOpmWasTriggeredBy.vtType, (
+            self.getDao('opm_process_id_effect').toBin(opm_was_triggered_by.db_effect) if opm_was_triggered_by.db_effect is not None else None,
+            self.getDao('opm_role').toBin(opm_was_triggered_by.db_role) if opm_was_triggered_by.db_role is not None else None,
+            self.getDao('opm_process_id_cause').toBin(opm_was_triggered_by.db_cause) if opm_was_triggered_by.db_cause is not None else None,
+            map(self.getDao('opm_account_id').toBin, opm_was_triggered_by.db_accounts),
+            map(self.getDao('opm_time').toBin, opm_was_triggered_by.db_opm_times),
+            ))
+
+class DBModuleDescriptorBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, name, package, namespace, package_version, version, base_descriptor_id, portSpecs) = self.checkRecord(record, DBModuleDescriptor.vtType, 8)
+        portSpecs = map(self.getDao('portSpec').fromBin, portSpecs)
+        obj = DBModuleDescriptor(id=id, name=name, package=package, namespace=namespace, package_version=package_version, version=version, base_descriptor_id=base_descriptor_id, portSpecs=portSpecs)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, module_descriptor):
+        return (DBModuleDescriptor.vtType, (
+            module_descriptor.db_id,
+            self.convertToBin(module_descriptor.db_name, 'str'),
+            self.convertToBin(module_descriptor.db_package, 'str'),
+            self.convertToBin(module_descriptor.db_namespace, 'str'),
+            self.convertToBin(module_descriptor.db_package_version, 'str'),
+            self.convertToBin(module_descriptor.db_version, 'str'),
+            module_descriptor.db_base_descriptor_id,
+            map(self.getDao('portSpec').toBin, module_descriptor.db_portSpecs),
+            ))
+
+class DBTagBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, name) = self.checkRecord(record, DBTag.vtType, 2)
+        obj = DBTag(id=id, name=name)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, tag):
+        return (DBTag.vtType, (
+            tag.db_id,
+            self.convertToBin(tag.db_name, 'str'),
+            ))
+
+class DBOpmRoleBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (value,) = self.checkRecord(record, DBOpmRole.vtType, 1)
+        obj = DBOpmRole(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_role):
+        return (DBOpmRole.vtType, (
+            self.convertToBin(opm_role.db_value, 'str'),
+            ))
+
+class DBProvDocumentBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (prov_entitys, prov_activitys, prov_agents, vt_connections, prov_usages, prov_generations, prov_associations) = self.checkRecord(record, DBProvDocument.vtType, 7)
+        prov_entitys = map(self.getDao('prov_entity').fromBin, prov_entitys)
+        prov_activitys = map(self.getDao('prov_activity').fromBin, prov_activitys)
+        prov_agents = map(self.getDao('prov_agent').fromBin, prov_agents)
+        vt_connections = map(self.getDao('vt_connection').fromBin, vt_connections)
+        prov_usages = map(self.getDao('prov_usage').fromBin, prov_usages)
+        prov_generations = map(self.getDao('prov_generation').fromBin, prov_generations)
+        prov_associations = map(self.getDao('prov_association').fromBin, prov_associations)
+        obj = DBProvDocument(prov_entitys=prov_entitys, prov_activitys=prov_activitys, prov_agents=prov_agents, vt_connections=vt_connections, prov_usages=prov_usages, prov_generations=prov_generations, prov_associations=prov_associations)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_document):
+        return (DBProvDocument.vtType, (
+            map(self.getDao('prov_entity').toBin, prov_document.db_prov_entitys),
+            map(self.getDao('prov_activity').toBin, prov_document.db_prov_activitys),
+            map(self.getDao('prov_agent').toBin, prov_document.db_prov_agents),
+            map(self.getDao('vt_connection').toBin, prov_document.db_vt_connections),
+            map(self.getDao('prov_usage').toBin, prov_document.db_prov_usages),
+            map(self.getDao('prov_generation').toBin, prov_document.db_prov_generations),
+            map(self.getDao('prov_association').toBin, prov_document.db_prov_associations),
+            ))
+
+class DBOpmProcessesBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (processs,) = self.checkRecord(record, DBOpmProcesses.vtType, 1)
+        processs = map(self.getDao('opm_process').fromBin, processs)
+        obj = DBOpmProcesses(processs=processs)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_processes):
+        return (DBOpmProcesses.vtType, (
+            map(self.getDao('opm_process').toBin, opm_processes.db_processs),
+            ))
+
+class DBOpmAccountIdBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id,) = self.checkRecord(record, DBOpmAccountId.vtType, 1)
+        obj = DBOpmAccountId(id=id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_account_id):
+        return (DBOpmAccountId.vtType, (
+            self.convertToBin(opm_account_id.db_id, 'str'),
+            ))
+
+class DBPortSpecItemBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, pos, module, package, namespace, label, default, values, entry_type) = self.checkRecord(record, DBPortSpecItem.vtType, 9)
+        obj = DBPortSpecItem(id=id, pos=pos, module=module, package=package, namespace=namespace, label=label, default=default, values=values, entry_type=entry_type)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, portSpecItem):
+        return (DBPortSpecItem.vtType, (
+            portSpecItem.db_id,
+            portSpecItem.db_pos,
+            self.convertToBin(portSpecItem.db_module, 'str'),
+            self.convertToBin(portSpecItem.db_package, 'str'),
+            self.convertToBin(portSpecItem.db_namespace, 'str'),
+            self.convertToBin(portSpecItem.db_label, 'str'),
+            self.convertToBin(portSpecItem.db_default, 'str'),
+            self.convertToBin(portSpecItem.db_values, 'str'),
+            self.convertToBin(portSpecItem.db_entry_type, 'str'),
+            ))
+
+class DBMashupComponentBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, vtid, vttype, vtparent_type, vtparent_id, vtpos, vtmid, pos, type, val, minVal, maxVal, stepSize, strvaluelist, widget, seq, parent) = self.checkRecord(record, DBMashupComponent.vtType, 17)
+        obj = DBMashupComponent(id=id, vtid=vtid, vttype=vttype, vtparent_type=vtparent_type, vtparent_id=vtparent_id, vtpos=vtpos, vtmid=vtmid, pos=pos, type=type, val=val, minVal=minVal, maxVal=maxVal, stepSize=stepSize, strvaluelist=strvaluelist, widget=widget, seq=seq, parent=parent)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, mashup_component):
+        return (DBMashupComponent.vtType, (
+            mashup_component.db_id,
+            mashup_component.db_vtid,
+            self.convertToBin(mashup_component.db_vttype, 'str'),
+            self.convertToBin(mashup_component.db_vtparent_type, 'str'),
+            mashup_component.db_vtparent_id,
+            mashup_component.db_vtpos,
+            mashup_component.db_vtmid,
+            mashup_component.db_pos,
+            self.convertToBin(mashup_component.db_type, 'str'),
+            self.convertToBin(mashup_component.db_val, 'str'),
+            self.convertToBin(mashup_component.db_minVal, 'str'),
+            self.convertToBin(mashup_component.db_maxVal, 'str'),
+            self.convertToBin(mashup_component.db_stepSize, 'str'),
+            self.convertToBin(mashup_component.db_strvaluelist, 'str'),
+            self.convertToBin(mashup_component.db_widget, 'str'),
+            mashup_component.db_seq,
+            self.convertToBin(mashup_component.db_parent, 'str'),
+            ))
+
+class DBMashupBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, name, version, type, vtid, has_seq, aliases, layout, geometry) = self.checkRecord(record, DBMashup.vtType, 9)
+        aliases = map(self.getDao('mashup_alias').fromBin, aliases)
+        obj = DBMashup(id=id, name=name, version=version, aliases=aliases, type=type, vtid=vtid, layout=layout, geometry=geometry, has_seq=has_seq)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, mashup):
+        return (DBMashup.vtType, (
+            mashup.db_id,
+            self.convertToBin(mashup.db_name, 'str'),
+            mashup.db_version,
+            self.convertToBin(mashup.db_type, 'str'),
+            mashup.db_vtid,
+            mashup.db_has_seq,
+            map(self.getDao('mashup_alias').toBin, mashup.db_aliases),
+            self.convertToBin(mashup.db_layout, 'str'),
+            self.convertToBin(mashup.db_geometry, 'str'),
+            ))
+
+class DBMachineBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, name, os, architecture, processor, ram) = self.checkRecord(record, DBMachine.vtType, 6)
+        obj = DBMachine(id=id, name=name, os=os, architecture=architecture, processor=processor, ram=ram)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, machine):
+        return (DBMachine.vtType, (
+            machine.db_id,
+            self.convertToBin(machine.db_name, 'str'),
+            self.convertToBin(machine.db_os, 'str'),
+            self.convertToBin(machine.db_architecture, 'str'),
+            self.convertToBin(machine.db_processor, 'str'),
+            machine.db_ram,
+            ))
+
+class DBConfigFloatBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (value,) = self.checkRecord(record, DBConfigFloat.vtType, 1)
+        obj = DBConfigFloat(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, config_float):
+        return (DBConfigFloat.vtType, (
+            config_float.db_value,
+            ))
+
+class DBOtherBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, key, value) = self.checkRecord(record, DBOther.vtType, 3)
+        obj = DBOther(id=id, key=key, value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, other):
+        return (DBOther.vtType, (
+            other.db_id,
+            self.convertToBin(other.db_key, 'str'),
+            self.convertToBin(other.db_value, 'str'),
+            ))
+
+class DBRefProvActivityBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (prov_ref,) = self.checkRecord(record, DBRefProvActivity.vtType, 1)
+        obj = DBRefProvActivity(prov_ref=prov_ref)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, ref_prov_activity):
+        return (DBRefProvActivity.vtType, (
+            self.convertToBin(ref_prov_activity.db_prov_ref, 'str'),
+            ))
+
+class DBAbstractionBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, cache, name, namespace, package, version, internal_version, location, functions, annotations, controlParameters) = self.checkRecord(record, DBAbstraction.vtType, 11)
+        if location is not None:
+            location = self.getDao('location').fromBin(location)
+        functions = map(self.getDao('function').fromBin, functions)
+        annotations = map(self.getDao('annotation').fromBin, annotations)
+        controlParameters = map(self.getDao('controlParameter').fromBin, controlParameters)
+        obj = DBAbstraction(id=id, cache=cache, name=name, namespace=namespace, package=package, version=version, internal_version=internal_version, location=location, functions=functions, annotations=annotations, controlParameters=controlParameters)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, abstraction):
+        return (DBAbstraction.vtType, (
+            abstraction.db_id,
+            abstraction.db_cache,
+            self.convertToBin(abstraction.db_name, 'str'),
+            self.convertToBin(abstraction.db_namespace, 'str'),
+            self.convertToBin(abstraction.db_package, 'str'),
+            self.convertToBin(abstraction.db_version, 'str'),
+            self.convertToBin(abstraction.db_internal_version, 'str'),
+            self.getDao('location').toBin(abstraction.db_location) if abstraction.db_location is not None else None,
+            map(self.getDao('function').toBin, abstraction.db_functions),
+            map(self.getDao('annotation').toBin, abstraction.db_annotations),
+            map(self.getDao('controlParameter').toBin, abstraction.db_controlParameters),
+            ))
+
+class DBProvAgentBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, vt_id, prov_type, prov_label, vt_machine_os, vt_machine_architecture, vt_machine_processor, vt_machine_ram) = self.checkRecord(record, DBProvAgent.vtType, 8)
+        obj = DBProvAgent(id=id, vt_id=vt_id, prov_type=prov_type, prov_label=prov_label, vt_machine_os=vt_machine_os, vt_machine_architecture=vt_machine_architecture, vt_machine_processor=vt_machine_processor, vt_machine_ram=vt_machine_ram)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_agent):
+        return (DBProvAgent.vtType, (
+            self.convertToBin(prov_agent.db_id, 'str'),
+            self.convertToBin(prov_agent.db_vt_id, 'str'),
+            self.convertToBin(prov_agent.db_prov_type, 'str'),
+            self.convertToBin(prov_agent.db_prov_label, 'str'),
+            self.convertToBin(prov_agent.db_vt_machine_os, 'str'),
+            self.convertToBin(prov_agent.db_vt_machine_architecture, 'str'),
+            self.convertToBin(prov_agent.db_vt_machine_processor, 'str'),
+            self.convertToBin(prov_agent.db_vt_machine_ram, 'str'),
+            ))
+
+class DBMashuptrailBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (name, version, vtVersion, actions, annotations, actionAnnotations) = self.checkRecord(record, DBMashuptrail.vtType, 6)
+        actions = map(self.getDao('mashup_action').fromBin, actions)
+        annotations = map(self.getDao('annotation').fromBin, annotations)
+        actionAnnotations = map(self.getDao('mashup_actionAnnotation').fromBin, actionAnnotations)
+        obj = DBMashuptrail(name=name, version=version, vtVersion=vtVersion, actions=actions, annotations=annotations, actionAnnotations=actionAnnotations)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, mashuptrail):
+        return (DBMashuptrail.vtType, (
+            self.convertToBin(mashuptrail.db_name, 'str'),
+            self.convertToBin(mashuptrail.db_version, 'str'),
+            mashuptrail.db_vtVersion,
+            map(self.getDao('mashup_action').toBin, mashuptrail.db_actions),
+            map(self.getDao('annotation').toBin, mashuptrail.db_annotations),
+            map(self.getDao('mashup_actionAnnotation').toBin, mashuptrail.db_actionAnnotations),
+            ))
+
+class DBRegistryBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, version, root_descriptor_id, packages) = self.checkRecord(record, DBRegistry.vtType, 4)
+        packages = map(self.getDao('package').fromBin, packages)
+        obj = DBRegistry(id=id, version=version, root_descriptor_id=root_descriptor_id, packages=packages)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, registry):
+        return (DBRegistry.vtType, (
+            registry.db_id,
+            self.convertToBin(registry.db_version, 'str'),
+            registry.db_root_descriptor_id,
+            map(self.getDao('package').toBin, registry.db_packages),
+            ))
+
+class DBOpmAgentBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, value, accounts) = self.checkRecord(record, DBOpmAgent.vtType, 3)
+        accounts = map(self.getDao('opm_account_id').fromBin, accounts)
+        obj = DBOpmAgent(id=id, value=value, accounts=accounts)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_agent):
+        return (DBOpmAgent.vtType, (
+            self.convertToBin(opm_agent.db_id, 'str'),
+            self.convertToBin(opm_agent.db_value, 'str'),
+            map(self.getDao('opm_account_id').toBin, opm_agent.db_accounts),
+            ))
+
+class DBProvEntityBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, prov_type, prov_label, prov_value, vt_id, vt_type, vt_desc, vt_package, vt_version, vt_cache, vt_location_x, vt_location_y, is_part_of) = self.checkRecord(record, DBProvEntity.vtType, 13)
+        if is_part_of is not None:
+            is_part_of = self.getDao('is_part_of').fromBin(is_part_of)
+        obj = DBProvEntity(id=id, prov_type=prov_type, prov_label=prov_label, prov_value=prov_value, vt_id=vt_id, vt_type=vt_type, vt_desc=vt_desc, vt_package=vt_package, vt_version=vt_version, vt_cache=vt_cache, vt_location_x=vt_location_x, vt_location_y=vt_location_y, is_part_of=is_part_of)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_entity):
+        return (DBProvEntity.vtType, (
+            self.convertToBin(prov_entity.db_id, 'str'),
+            self.convertToBin(prov_entity.db_prov_type, 'str'),
+            self.convertToBin(prov_entity.db_prov_label, 'str'),
+            self.convertToBin(prov_entity.db_prov_value, 'str'),
+            self.convertToBin(prov_entity.db_vt_id, 'str'),
+            self.convertToBin(prov_entity.db_vt_type, 'str'),
+            self.convertToBin(prov_entity.db_vt_desc, 'str'),
+            self.convertToBin(prov_entity.db_vt_package, 'str'),
+            self.convertToBin(prov_entity.db_vt_version, 'str'),
+            self.convertToBin(prov_entity.db_vt_cache, 'str'),
+            self.convertToBin(prov_entity.db_vt_location_x, 'str'),
+            self.convertToBin(prov_entity.db_vt_location_y, 'str'),
+            self.getDao('is_part_of').toBin(prov_entity.db_is_part_of) if prov_entity.db_is_part_of is not None else None,
+            ))
+
+class DBAnnotationBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, key, value) = self.checkRecord(record, DBAnnotation.vtType, 3)
+        obj = DBAnnotation(id=id, key=key, value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, annotation):
+        return (DBAnnotation.vtType, (
+            annotation.db_id,
+            self.convertToBin(annotation.db_key, 'str'),
+            self.convertToBin(annotation.db_value, 'str'),
+            ))
+
+class DBOpmTimeBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (no_later_than, no_earlier_than, clock_id) = self.checkRecord(record, DBOpmTime.vtType, 3)
+        no_later_than = self.convertFromBin(no_later_than, 'datetime')
+        no_earlier_than = self.convertFromBin(no_earlier_than, 'datetime')
+        obj = DBOpmTime(no_later_than=no_later_than, no_earlier_than=no_earlier_than, clock_id=clock_id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_time):
+        return (DBOpmTime.vtType, (
+            self.convertToBin(opm_time.db_no_later_than, 'datetime'),
+            self.convertToBin(opm_time.db_no_earlier_than, 'datetime'),
+            self.convertToBin(opm_time.db_clock_id, 'str'),
+            ))
+
+class DBParameterExplorationBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, action_id, name, date, user, dims, layout, functions) = self.checkRecord(record, DBParameterExploration.vtType, 8)
+        date = self.convertFromBin(date, 'datetime')
+        functions = map(self.getDao('pe_function').fromBin, functions)
+        obj = DBParameterExploration(id=id, action_id=action_id, name=name, date=date, user=user, dims=dims, layout=layout, functions=functions)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, parameter_exploration):
+        return (DBParameterExploration.vtType, (
+            parameter_exploration.db_id,
+            parameter_exploration.db_action_id,
+            self.convertToBin(parameter_exploration.db_name, 'str'),
+            self.convertToBin(parameter_exploration.db_date, 'datetime'),
+            self.convertToBin(parameter_exploration.db_user, 'str'),
+            self.convertToBin(parameter_exploration.db_dims, 'str'),
+            self.convertToBin(parameter_exploration.db_layout, 'str'),
+            map(self.getDao('pe_function').toBin, parameter_exploration.db_functions),
+            ))
+
+class DBMashupActionAnnotationBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, key, value, action_id, date, user) = self.checkRecord(record, DBMashupActionAnnotation.vtType, 6)
+        date = self.convertFromBin(date, 'datetime')
+        obj = DBMashupActionAnnotation(id=id, key=key, value=value, action_id=action_id, date=date, user=user)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, mashup_actionAnnotation):
+        return (DBMashupActionAnnotation.vtType, (
+            mashup_actionAnnotation.db_id,
+            self.convertToBin(mashup_actionAnnotation.db_key, 'str'),
+            self.convertToBin(mashup_actionAnnotation.db_value, 'str'),
+            mashup_actionAnnotation.db_action_id,
+            self.convertToBin(mashup_actionAnnotation.db_date, 'datetime'),
+            self.convertToBin(mashup_actionAnnotation.db_user, 'str'),
+            ))
+
+class DBOpmProcessBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, value, accounts) = self.checkRecord(record, DBOpmProcess.vtType, 3)
+        if value is not None:
+            value = self.getDao('opm_process_value').fromBin(value)
+        accounts = map(self.getDao('opm_account_id').fromBin, accounts)
+        obj = DBOpmProcess(id=id, value=value, accounts=accounts)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_process):
+        return (DBOpmProcess.vtType, (
+            self.convertToBin(opm_process.db_id, 'str'),
+            self.getDao('opm_process_value').toBin(opm_process.db_value) if opm_process.db_value is not None else None,
+            map(self.getDao('opm_account_id').toBin, opm_process.db_accounts),
+            ))
+
+class DBDisabledPackagesBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (packages,) = self.checkRecord(record, DBDisabledPackages.vtType, 1)
+        packages = map(self.getDao('startup_package').fromBin, packages)
+        obj = DBDisabledPackages(packages=packages)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, disabled_packages):
+        return (DBDisabledPackages.vtType, (
+            map(self.getDao('startup_package').toBin, disabled_packages.db_packages),
+            ))
+
+class DBModuleExecBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (id, ts_start, ts_end, cached, module_id, module_name, completed, error, machine_id, annotations, loop_execs) = self.checkRecord(record, DBModuleExec.vtType, 11)
+        ts_start = self.convertFromBin(ts_start, 'datetime')
+        ts_end = self.convertFromBin(ts_end, 'datetime')
+        annotations = map(self.getDao('annotation').fromBin, annotations)
+        loop_execs = map(self.getDao('loop_exec').fromBin, loop_execs)
+        obj = DBModuleExec(id=id, ts_start=ts_start, ts_end=ts_end, cached=cached, module_id=module_id, module_name=module_name, completed=completed, error=error, machine_id=machine_id, annotations=annotations, loop_execs=loop_execs)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, module_exec):
+        return (DBModuleExec.vtType, (
+            module_exec.db_id,
+            self.convertToBin(module_exec.db_ts_start, 'datetime'),
+            self.convertToBin(module_exec.db_ts_end, 'datetime'),
+            module_exec.db_cached,
+            module_exec.db_module_id,
+            self.convertToBin(module_exec.db_module_name, 'str'),
+            module_exec.db_completed,
+            self.convertToBin(module_exec.db_error, 'str'),
+            module_exec.db_machine_id,
+            map(self.getDao('annotation').toBin, module_exec.db_annotations),
+            map(self.getDao('loop_exec').toBin, module_exec.db_loop_execs),
+            ))
+
+class DBProvAssociationBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (prov_activity, prov_agent, prov_plan, prov_role) = self.checkRecord(record, DBProvAssociation.vtType, 4)
+        if prov_activity is not None:
+            prov_activity = self.getDao('ref_prov_activity').fromBin(prov_activity)
+        if prov_agent is not None:
+            prov_agent = self.getDao('ref_prov_agent').fromBin(prov_agent)
+        if prov_plan is not None:
+            prov_plan = self.getDao('ref_prov_plan').fromBin(prov_plan)
+        obj = DBProvAssociation(prov_activity=prov_activity, prov_agent=prov_agent, prov_plan=prov_plan, prov_role=prov_role)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_association):
+        return (DBProvAssociation.vtType, (
+            self.getDao('ref_prov_activity').toBin(prov_association.db_prov_activity) if prov_association.db_prov_activity is not None else None,
+            self.getDao('ref_prov_agent').toBin(prov_association.db_prov_agent) if prov_association.db_prov_agent is not None else None,
+            self.getDao('ref_prov_plan').toBin(prov_association.db_prov_plan) if prov_association.db_prov_plan is not None else None,
+            self.convertToBin(prov_association.db_prov_role, 'str'),
+            ))
+
+class DBOpmProcessValueBinDAOBase(BinDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, record):
+        (value,) = self.checkRecord(record, DBOpmProcessValue.vtType, 1)
+        _value = None
+        if value is not None:
+            _data = value
+            _tag = _data[0]
+            if _tag == 'module_exec':
+                _data = self.getDao('module_exec').fromBin(_data)
+            elif _tag == 'group_exec':
+                _data = self.getDao('group_exec').fromBin(_data)
+            elif _tag == 'loop_exec':
+                _data = self.getDao('loop_exec').fromBin(_data)
+            else:
+                self.unexpectedRecord(_data, 'opm_process_value.value')
+            _value = _data
+        value = _value
+        obj = DBOpmProcessValue(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_process_value):
+        value = None
+        _obj = opm_process_value.db_value
+        if _obj is not None:
+            if _obj.vtType == 'module_exec':
+                _data = self.getDao('module_exec').toBin(_obj)
+            elif _obj.vtType == 'group_exec':
+                _data = self.getDao('group_exec').toBin(_obj)
+            elif _obj.vtType == 'loop_exec':
+                _data = self.getDao('loop_exec').toBin(_obj)
+            else:
+                _data = None
+            value = _data
+        return (DBOpmProcessValue.vtType, (
+            value,
+            ))
+
+"""generated automatically by auto_dao.py"""
+
+class BinDAOListBase(dict):
+
+    def __init__(self, daos=None):
+        if daos is not None:
+            dict.update(self, daos)
+
+        if 'opm_was_generated_by' not in self:
+            self['opm_was_generated_by'] = DBOpmWasGeneratedByBinDAOBase(self)
+        if 'config_key' not in self:
+            self['config_key'] = DBConfigKeyBinDAOBase(self)
+        if 'mashup_alias' not in self:
+            self['mashup_alias'] = DBMashupAliasBinDAOBase(self)
+        if 'group' not in self:
+            self['group'] = DBGroupBinDAOBase(self)
+        if 'opm_was_controlled_by' not in self:
+            self['opm_was_controlled_by'] = DBOpmWasControlledByBinDAOBase(self)
+        if 'add' not in self:
+            self['add'] = DBAddBinDAOBase(self)
+        if 'prov_generation' not in self:
+            self['prov_generation'] = DBProvGenerationBinDAOBase(self)
+        if 'opm_used' not in self:
+            self['opm_used'] = DBOpmUsedBinDAOBase(self)
+        if 'opm_artifact_id_cause' not in self:
+            self['opm_artifact_id_cause'] = DBOpmArtifactIdCauseBinDAOBase(self)
+        if 'ref_prov_entity' not in self:
+            self['ref_prov_entity'] = DBRefProvEntityBinDAOBase(self)
+        if 'vt_connection' not in self:
+            self['vt_connection'] = DBVtConnectionBinDAOBase(self)
+        if 'opm_account' not in self:
+            self['opm_account'] = DBOpmAccountBinDAOBase(self)
+        if 'group_exec' not in self:
+            self['group_exec'] = DBGroupExecBinDAOBase(self)
+        if 'opm_agent_id' not in self:
+            self['opm_agent_id'] = DBOpmAgentIdBinDAOBase(self)
+        if 'parameter' not in self:
+            self['parameter'] = DBParameterBinDAOBase(self)
+        if 'vistrail' not in self:
+            self['vistrail'] = DBVistrailBinDAOBase(self)
+        if 'opm_artifact_value' not in self:
+            self['opm_artifact_value'] = DBOpmArtifactValueBinDAOBase(self)
+        if 'config_str' not in self:
+            self['config_str'] = DBConfigStrBinDAOBase(self)
+        if 'startup' not in self:
+            self['startup'] = DBStartupBinDAOBase(self)
+        if 'module' not in self:
+            self['module'] = DBModuleBinDAOBase(self)
+        if 'port' not in self:
+            self['port'] = DBPortBinDAOBase(self)
+        if 'opm_agents' not in self:
+            self['opm_agents'] = DBOpmAgentsBinDAOBase(self)
+        if 'opm_dependencies' not in self:
+            self['opm_dependencies'] = DBOpmDependenciesBinDAOBase(self)
+        if 'pe_function' not in self:
+            self['pe_function'] = DBPEFunctionBinDAOBase(self)
+        if 'workflow' not in self:
+            self['workflow'] = DBWorkflowBinDAOBase(self)
+        if 'mashup_action' not in self:
+            self['mashup_action'] = DBMashupActionBinDAOBase(self)
+        if 'configuration' not in self:
+            self['configuration'] = DBConfigurationBinDAOBase(self)
+        if 'change' not in self:
+            self['change'] = DBChangeBinDAOBase(self)
+        if 'package' not in self:
+            self['package'] = DBPackageBinDAOBase(self)
+        if 'loop_exec' not in self:
+            self['loop_exec'] = DBLoopExecBinDAOBase(self)
+        if 'connection' not in self:
+            self['connection'] = DBConnectionBinDAOBase(self)
+        if 'config_bool' not in self:
+            self['config_bool'] = DBConfigBoolBinDAOBase(self)
+        if 'action' not in self:
+            self['action'] = DBActionBinDAOBase(self)
+        if 'startup_package' not in self:
+            self['startup_package'] = DBStartupPackageBinDAOBase(self)
+        if 'config_int' not in self:
+            self['config_int'] = DBConfigIntBinDAOBase(self)
+        if 'opm_process_id_effect' not in self:
+            self['opm_process_id_effect'] = DBOpmProcessIdEffectBinDAOBase(self)
+        if 'ref_prov_plan' not in self:
+            self['ref_prov_plan'] = DBRefProvPlanBinDAOBase(self)
+        if 'opm_accounts' not in self:
+            self['opm_accounts'] = DBOpmAccountsBinDAOBase(self)
+        if 'ref_prov_agent' not in self:
+            self['ref_prov_agent'] = DBRefProvAgentBinDAOBase(self)
+        if 'portSpec' not in self:
+            self['portSpec'] = DBPortSpecBinDAOBase(self)
+        if 'enabled_packages' not in self:
+            self['enabled_packages'] = DBEnabledPackagesBinDAOBase(self)
+        if 'opm_artifact' not in self:
+            self['opm_artifact'] = DBOpmArtifactBinDAOBase(self)
+        if 'log' not in self:
+            self['log'] = DBLogBinDAOBase(self)
+        if 'loop_iteration' not in self:
+            self['loop_iteration'] = DBLoopIterationBinDAOBase(self)
+        if 'opm_process_id_cause' not in self:
+            self['opm_process_id_cause'] = DBOpmProcessIdCauseBinDAOBase(self)
+        if 'opm_artifacts' not in self:
+            self['opm_artifacts'] = DBOpmArtifactsBinDAOBase(self)
+        if 'pe_parameter' not in self:
+            self['pe_parameter'] = DBPEParameterBinDAOBase(self)
+        if 'workflow_exec' not in self:
+            self['workflow_exec'] = DBWorkflowExecBinDAOBase(self)
+        if 'location' not in self:
+            self['location'] = DBLocationBinDAOBase(self)
+        if 'function' not in self:
+            self['function'] = DBFunctionBinDAOBase(self)
+        if 'actionAnnotation' not in self:
+            self['actionAnnotation'] = DBActionAnnotationBinDAOBase(self)
+        if 'prov_activity' not in self:
+            self['prov_activity'] = DBProvActivityBinDAOBase(self)
+        if 'prov_usage' not in self:
+            self['prov_usage'] = DBProvUsageBinDAOBase(self)
+        if 'opm_artifact_id_effect' not in self:
+            self['opm_artifact_id_effect'] = DBOpmArtifactIdEffectBinDAOBase(self)
+        if 'opm_graph' not in self:
+            self['opm_graph'] = DBOpmGraphBinDAOBase(self)
+        if 'is_part_of' not in self:
+            self['is_part_of'] = DBIsPartOfBinDAOBase(self)
+        if 'opm_was_derived_from' not in self:
+            self['opm_was_derived_from'] = DBOpmWasDerivedFromBinDAOBase(self)
+        if 'controlParameter' not in self:
+            self['controlParameter'] = DBControlParameterBinDAOBase(self)
+        if 'plugin_data' not in self:
+            self['plugin_data'] = DBPluginDataBinDAOBase(self)
+        if 'delete' not in self:
+            self['delete'] = DBDeleteBinDAOBase(self)
+        if 'vistrailVariable' not in self:
+            self['vistrailVariable'] = DBVistrailVariableBinDAOBase(self)
+        if 'opm_overlaps' not in self:
+            self['opm_overlaps'] = DBOpmOverlapsBinDAOBase(self)
+        if 'opm_was_triggered_by' not in self:
+            self['opm_was_triggered_by'] = DBOpmWasTriggeredByBinDAOBase(self)
+        if 'module_descriptor' not in self:
+            self['module_descriptor'] = DBModuleDescriptorBinDAOBase(self)
+        if 'tag' not in self:
+            self['tag'] = DBTagBinDAOBase(self)
+        if 'opm_role' not in self:
+            self['opm_role'] = DBOpmRoleBinDAOBase(self)
+        if 'prov_document' not in self:
+            self['prov_document'] = DBProvDocumentBinDAOBase(self)
+        if 'opm_processes' not in self:
+            self['opm_processes'] = DBOpmProcessesBinDAOBase(self)
+        if 'opm_account_id' not in self:
+            self['opm_account_id'] = DBOpmAccountIdBinDAOBase(self)
+        if 'portSpecItem' not in self:
+            self['portSpecItem'] = DBPortSpecItemBinDAOBase(self)
+        if 'mashup_component' not in self:
+            self['mashup_component'] = DBMashupComponentBinDAOBase(self)
+        if 'mashup' not in self:
+            self['mashup'] = DBMashupBinDAOBase(self)
+        if 'machine' not in self:
+            self['machine'] = DBMachineBinDAOBase(self)
+        if 'config_float' not in self:
+            self['config_float'] = DBConfigFloatBinDAOBase(self)
+        if 'other' not in self:
+            self['other'] = DBOtherBinDAOBase(self)
+        if 'ref_prov_activity' not in self:
+            self['ref_prov_activity'] = DBRefProvActivityBinDAOBase(self)
+        if 'abstraction' not in self:
+            self['abstraction'] = DBAbstractionBinDAOBase(self)
+        if 'prov_agent' not in self:
+            self['prov_agent'] = DBProvAgentBinDAOBase(self)
+        if 'mashuptrail' not in self:
+            self['mashuptrail'] = DBMashuptrailBinDAOBase(self)
+        if 'registry' not in self:
+            self['registry'] = DBRegistryBinDAOBase(self)
+        if 'opm_agent' not in self:
+            self['opm_agent'] = DBOpmAgentBinDAOBase(self)
+        if 'prov_entity' not in self:
+            self['prov_entity'] = DBProvEntityBinDAOBase(self)
+        if 'annotation' not in self:
+            self['annotation'] = DBAnnotationBinDAOBase(self)
+        if 'opm_time' not in self:
+            self['opm_time'] = DBOpmTimeBinDAOBase(self)
+        if 'parameter_exploration' not in self:
+            self['parameter_exploration'] = DBParameterExplorationBinDAOBase(self)
+        if 'mashup_actionAnnotation' not in self:
+            self['mashup_actionAnnotation'] = DBMashupActionAnnotationBinDAOBase(self)
+        if 'opm_process' not in self:
+            self['opm_process'] = DBOpmProcessBinDAOBase(self)
+        if 'disabled_packages' not in self:
+            self['disabled_packages'] = DBDisabledPackagesBinDAOBase(self)
+        if 'module_exec' not in self:
+            self['module_exec'] = DBModuleExecBinDAOBase(self)
+        if 'prov_association' not in self:
+            self['prov_association'] = DBProvAssociationBinDAOBase(self)
+        if 'opm_process_value' not in self:
+            self['opm_process_value'] = DBOpmProcessValueBinDAOBase(self)
@@ -0,0 +1,295 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+
+from datetime import date, datetime, timedelta
+import struct
+
+from vistrails.db import VistrailsDBException
+
+# Encoding of the records
+#
+# A record is a (vtType, fields) tuple, the fields being None, booleans,
+# numbers, strings, lists, or other records. They are written as a tag
+# byte followed by little-endian, struct-packed data:
+#   'N'                               None
+#   'T', 'F'                          True, False
+#   'i' <int32>, 'q' <int64>          integers
+#   'L' <uint32 length> <digits>      larger integers
+#   'd' <float64>                     floats
+#   's' <uint32 index>                strings, from the string table
+#   'l' <uint32 count> <items>        lists
+#   'r' <uint32 vtType index> <uint16 count> <fields>
+#                                     records
+# The encoded data starts with the string table, in which each distinct
+# string is only written once: the number of strings, then for each of
+# them 's' (bytes) or 'u' (UTF-8 encoded unicode), its length and its
+# bytes. The root record follows.
+
+_uint32 = struct.Struct('<I')
+_tagged_uint32 = struct.Struct('<cI')
+_int32 = struct.Struct('<ci')
+_int64 = struct.Struct('<cq')
+_float = struct.Struct('<cd')
+_record = struct.Struct('<cIH')
+
+_INT32_MIN, _INT32_MAX = -2**31, 2**31 - 1
+_INT64_MIN, _INT64_MAX = -2**63, 2**63 - 1
+
+def encode_record(record):
+    """encode_record(record: tuple) -> str
+    Encodes a record and everything it contains.
+
+    """
+    table = []
+    indexes = {str: {}, unicode: {}}
+    str_indexes = indexes[str]
+    out = []
+    append = out.append
+
+    def string_index(value, kind):
+        index = indexes[kind].get(value)
+        if index is None:
+            index = indexes[kind][value] = len(table)
+            table.append(value)
+        return index
+
+    def write(value):
+        t = type(value)
+        if t is str or t is unicode:
+            append(_tagged_uint32.pack('s', string_index(value, t)))
+        elif t is tuple:
+            vtType, fields = value
+            append(_record.pack('r', string_index(vtType, str),
+                                len(fields)))
+            for field in fields:
+                # same as write(field), for the most common fields
+                if type(field) is str:
+                    index = str_indexes.get(field)
+                    if index is None:
+                        index = str_indexes[field] = len(table)
+                        table.append(field)
+                    append(_tagged_uint32.pack('s', index))
+                elif field is None:
+                    append('N')
+                else:
+                    write(field)
+        elif value is None:
+            append('N')
+        elif t is bool:
+            append('T' if value else 'F')
+        elif t is int or t is long:
+            if _INT32_MIN <= value <= _INT32_MAX:
+                append(_int32.pack('i', value))
+            elif _INT64_MIN <= value <= _INT64_MAX:
+                append(_int64.pack('q', value))
+            else:
+                digits = str(value)
+                append('L' + _uint32.pack(len(digits)) + digits)
+        elif t is float:
+            append(_float.pack('d', value))
+        elif t is list:
+            append(_tagged_uint32.pack('l', len(value)))
+            for item in value:
+                write(item)
+        else:
+            raise VistrailsDBException("Cannot write value of type %s to "
+                                       "a binary file" % t.__name__)
+
+    write(record)
+    header = [_uint32.pack(len(table))]
+    for value in table:
+        if isinstance(value, unicode):
+            value = value.encode('utf-8')
+            header.append(_tagged_uint32.pack('u', len(value)))
+        else:
+            header.append(_tagged_uint32.pack('s', len(value)))
+        header.append(value)
+    return ''.join(header + out)
+
+def decode_record(data):
+    """decode_record(data: str) -> tuple
+    Decodes the records written by encode_record().
+
+    Raises VistrailsDBException if the data is not valid.
+
+    """
+    unpack_uint32 = _uint32.unpack_from
+    unpack_tagged_uint32 = _tagged_uint32.unpack_from
+    unpack_record = _record.unpack_from
+    unpack_int32 = _int32.unpack_from
+
+    def read(pos):
+        tag = data[pos]
+        if tag == 's':
+            return strings[unpack_uint32(data, pos + 1)[0]], pos + 5
+        elif tag == 'i':
+            return unpack_int32(data, pos)[1], pos + 5
+        elif tag == 'N':
+            return None, pos + 1
+        elif tag == 'r':
+            tag, vtType, count = unpack_record(data, pos)
+            pos += 7
+            fields = []
+            for i in xrange(count):
+                # most fields are strings, ids or None, read them here
+                # rather than through another call
+                tag = data[pos]
+                if tag == 's':
+                    fields.append(strings[unpack_uint32(data, pos + 1)[0]])
+                    pos += 5
+                elif tag == 'i':
+                    fields.append(unpack_int32(data, pos)[1])
+                    pos += 5
+                elif tag == 'N':
+                    fields.append(None)
+                    pos += 1
+                else:
+                    value, pos = read(pos)
+                    fields.append(value)
+            return (strings[vtType], tuple(fields)), pos
+        elif tag == 'l':
+            count = unpack_uint32(data, pos + 1)[0]
+            pos += 5
+            items = []
+            for i in xrange(count):
+                value, pos = read(pos)
+                items.append(value)
+            return items, pos
+        elif tag == 'T':
+            return True, pos + 1
+        elif tag == 'F':
+            return False, pos + 1
+        elif tag == 'q':
+            return _int64.unpack_from(data, pos)[1], pos + 9
+        elif tag == 'd':
+            return _float.unpack_from(data, pos)[1], pos + 9
+        elif tag == 'L':
+            length = unpack_uint32(data, pos + 1)[0]
+            pos += 5
+            if pos + length > len(data):
+                raise IndexError
+            return long(data[pos:pos + length]), pos + length
+        else:
+            raise VistrailsDBException("Invalid tag %r at offset %d" %
+                                       (tag, pos))
+
+    try:
+        strings = []
+        count = unpack_uint32(data, 0)[0]
+        pos = 4
+        for i in xrange(count):
+            kind, length = unpack_tagged_uint32(data, pos)
+            pos += 5
+            value = data[pos:pos + length]
+            if len(value) != length:
+                raise IndexError
+            if kind == 'u':
+                value = value.decode('utf-8')
+            elif kind != 's':
+                raise VistrailsDBException("Invalid string kind %r" % kind)
+            strings.append(value)
+            pos += length
+        record, pos = read(pos)
+    except (IndexError, struct.error, UnicodeDecodeError):
+        raise VistrailsDBException("Truncated or corrupted binary data")
+    if pos != len(data):
+        raise VistrailsDBException("Unexpected data after the records")
+    if type(record) is not tuple:
+        raise VistrailsDBException("The binary data is not a record")
+    return record
+
+class BinDAO:
+    """Base class of the binary DAOs.
+
+    Objects are converted to records, (vtType, fields) tuples where the
+    fields are in the order of the XML attributes and elements, with
+    lists of records for their children; see encode_record(). Dates are
+    stored as integers.
+
+    """
+
+    def __init__(self):
+        pass
+
+    def checkRecord(self, record, vtType, count):
+        """checkRecord(record: tuple, vtType: str, count: int) -> tuple
+        Returns the fields of a record read from a file, after checking
+        that it is a record of the expected type and number of fields.
+
+        """
+        if (type(record) is not tuple or record[0] != vtType or
+                len(record[1]) != count):
+            if type(record) is tuple:
+                found = "%s record with %d fields" % (record[0],
+                                                      len(record[1]))
+            else:
+                found = "value of type %s" % type(record).__name__
+            raise VistrailsDBException("Expected %s record with %d "
+                                       "fields, found %s" %
+                                       (vtType, count, found))
+        return record[1]
+
+    def unexpectedRecord(self, record, field):
+        """unexpectedRecord(record: tuple, field: str) -> None
+        Raises VistrailsDBException for a record that a field of choice
+        can't contain.
+
+        """
+        raise VistrailsDBException("Unexpected record in %s: %r" %
+                                   (field, record[0] if type(record) is tuple
+                                    else record))
+
+    def convertFromBin(self, value, type):
+        if value is not None:
+            if type == 'date':
+                return date.fromordinal(value)
+            elif type == 'datetime':
+                days, seconds = divmod(value, 86400)
+                return datetime.fromordinal(days) + timedelta(seconds=seconds)
+        return value
+
+    def convertToBin(self, value, type):
+        if value is not None:
+            if type == 'str':
+                if isinstance(value, unicode):
+                    return value
+                return str(value)
+            elif type == 'date':
+                return value.toordinal()
+            elif type == 'datetime':
+                # same precision as the XML files
+                return (value.toordinal() * 86400 + value.hour * 3600 +
+                        value.minute * 60 + value.second)
+        return value
@@ -33,12 +33,16 @@
 ##
 ###############################################################################
 
+from collections import OrderedDict
 from datetime import date, datetime
+import re
 
 from vistrails.core import debug
 from vistrails.core.system import strftime, time_strptime
 from vistrails.db import VistrailsDBException
-from vistrails.db.services.io import get_db_lib
+from vistrails.db.services.io import get_db_lib, is_sqlite_connection
+
+_insert_columns = re.compile(r'^INSERT INTO \w+\(([^)]*)\)')
 
 class SQLDAO:
     def __init__(self):
@@ -55,12 +59,13 @@ class SQLDAO:
             elif type == 'int':
                 return int(value)
             elif type == 'date':
-                if db_type == 'date':
+                # SQLite returns dates as strings
+                if db_type == 'date' and isinstance(value, date):
                     return value
                 else:
                     return date(*time_strptime(str(value), '%Y-%m-%d')[0:3])
             elif type == 'datetime':
-                if db_type == 'datetime':
+                if db_type == 'datetime' and isinstance(value, datetime):
                     return value
                 else:
                     return datetime(*time_strptime(str(value),
@@ -196,8 +201,21 @@ class SQLDAO:
             (table, whereStr)
         return (dbCommand, tuple(values))
 
+    def formatSQL(self, db, dbCommand):
+        """Adapts a statement to the library used by the connection.
+
+        Statements use the 'format' paramstyle of MySQLdb; SQLite uses
+        'qmark' and doesn't support row locks.
+        """
+        if is_sqlite_connection(db):
+            dbCommand = dbCommand.replace('%s', '?')
+            if dbCommand.endswith(" FOR UPDATE;"):
+                dbCommand = dbCommand[:-len(" FOR UPDATE;")] + ";"
+        return dbCommand
+
     def executeSQL(self, db, cmd_tuple, isFetch):
         dbCommand, values = cmd_tuple
+        dbCommand = self.formatSQL(db, dbCommand)
         # print 'db: %s' % dbCommand
         # print 'values:', values
         data = None
@@ -219,6 +237,71 @@ class SQLDAO:
         """ Executes a command consisting of multiple SELECT statements
             It returns a list of results from the SELECT statements
         """
+        if isFetch:
+            if is_sqlite_connection(db):
+                # no round-trips to save with SQLite
+                return [self.executeSQL(db, cmd, True)
+                        for cmd in dbCommandList]
+            return self.executeSQLBundles(db, dbCommandList, True)
+
+        # INSERTs that are identical except for their values (i.e. that
+        # write the same columns of the same table) are run together with
+        # executemany(), which MySQLdb turns into a single multi-row INSERT.
+        # This can't be done if they don't set the id, since we need the id
+        # the database generates for each of them. With SQLite, UPDATEs are
+        # batched as well
+        # This runs the statements out of order, which is fine since each of
+        # them writes the row of a different object, with values computed
+        # beforehand. If one fails, the transaction is rolled back so that
+        # the group isn't left half-written
+        try:
+            return self._executeSQLWrites(db, dbCommandList)
+        except Exception:
+            self.rollback_transaction(db)
+            raise
+
+    def _executeSQLWrites(self, db, dbCommandList):
+        sqlite = is_sqlite_connection(db)
+        data = [None] * len(dbCommandList)
+        batches = OrderedDict()
+        others = []
+        for i, (prepared, values) in enumerate(dbCommandList):
+            m = _insert_columns.match(prepared)
+            if m is not None:
+                batch = 'id' in m.group(1).split(', ')
+            else:
+                batch = sqlite
+            if batch:
+                batches.setdefault(prepared, []).append(i)
+            else:
+                others.append(i)
+
+        if others:
+            if sqlite:
+                for i in others:
+                    data[i] = self.executeSQL(db, dbCommandList[i], False)
+            else:
+                results = self.executeSQLBundles(
+                        db, [dbCommandList[i] for i in others], False)
+                for i, r in zip(others, results):
+                    data[i] = r
+        for prepared, indexes in batches.iteritems():
+            dbCommand = self.formatSQL(db, prepared)
+            values = [dbCommandList[i][1] for i in indexes]
+            cur = db.cursor()
+            try:
+                cur.executemany(dbCommand, values)
+            except Exception, e:
+                raise VistrailsDBException('Command "%s" failed on %d rows: '
+                                           '%s' % (dbCommand, len(values), e))
+            finally:
+                cur.close()
+        return data
+
+    def executeSQLBundles(self, db, dbCommandList, isFetch):
+        """ Executes statements as multi-statement strings (MySQL only)
+            It returns a list of results from the statements
+        """
         data = []
         # break up into bundles
         BUNDLE_SIZE = 10000
@@ -45,7 +45,8 @@ from vistrails.db.versions.v1_0_4.domain import DBVistrail, DBVistrailVariable,
                                       DBConfigInt, DBConfigFloat, \
                                       DBConfiguration, DBStartupPackage, \
                                       DBLoopIteration, DBLoopExec, \
-                                      DBModuleExec, DBGroupExec
+                                      DBModuleExec, DBGroupExec, \
+                                      DBMashuptrail
 
 from vistrails.db.services.vistrail import materializeWorkflow
 from xml.dom.minidom import parseString
@@ -183,6 +184,12 @@ def translateRegistry(_registry):
     registry.db_version = '1.0.4'
     return registry
 
+def translateMashuptrail(_mashuptrail):
+    translate_dict = {}
+    mashuptrail = DBMashuptrail.update_version(_mashuptrail, translate_dict)
+    mashuptrail.db_version = '1.0.4'
+    return mashuptrail
+
 def translateStartup(_startup):
     # format is {<old_name>: <new_name>} or
     # {<old_name>: (<new_name> | None, [conversion_f | None, inner_d | None])
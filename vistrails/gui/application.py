@@ -555,7 +555,8 @@ class VistrailsApplicationSingleton(VistrailsApplicationInterface,
             if self.temp_configuration.check('parameterExploration'):
                 errs.extend(
                     vistrails.core.console_mode.run_parameter_explorations(
-                        w_list, extra_info=extra_info))
+                        w_list, extra_info=extra_info,
+                        jobs=self.temp_configuration.check('jobs')))
             else:
                 errs.extend(vistrails.core.console_mode.run(
                         w_list,
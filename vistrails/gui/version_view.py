@@ -783,6 +783,9 @@ class QVersionTreeScene(QInteractiveGraphicsScene):
         self.edges = {}     # (sourceVersion, targetVersion) -> edge gui object
         self.controller = None
         self.fullGraph = None
+        # layout the scene was last set up from, only the versions it
+        # changed since then need to be set up again
+        self._scene_layout = None
         self.timer = QtCore.QBasicTimer()
         self.animation_step = 1
         self.num_animation_steps = 1
@@ -837,6 +840,7 @@ class QVersionTreeScene(QInteractiveGraphicsScene):
         
         """
         self.versions = {}
+        self._scene_layout = None
         self.clearItems()
 
     def adjust_version_colors(self, controller):
@@ -973,36 +977,59 @@ class QVersionTreeScene(QInteractiveGraphicsScene):
 
         tClearRefine = time.clock() - tClearRefine
 
+        # if the scene shows this layout already, only apply the
+        # changes since then
+        changes = layout.take_changes()
+        if layout is not self._scene_layout or len(self.versions) == 0:
+            changes = None
+        self._scene_layout = layout
+
         # compute nodes that should be removed
         # O(n  * (hashmap query key time)) on 
         # where n is the number of current 
         # nodes in the scene
-        removeNodeSet = set(i for i in self.versions
-                            if not i in tree.vertices)
+        if changes is None:
+            removeNodeSet = set(i for i in self.versions
+                                if not i in tree.vertices)
+        else:
+            removeNodeSet = set(i for i in changes
+                                if i in self.versions and
+                                not i in tree.vertices)
 
         # compute edges to be removed
         # O(n * (hashmap query key time)) 
         # where n is the number of current 
         # edges in the scene
         removeEdgeSet = set((s, t) for (s, t) in self.edges
-                            if (s in removeNodeSet or
-                                t in removeNodeSet or
-                                not tree.has_edge(s, t)))
+                            if ((changes is None or
+                                 s in changes or t in changes) and
+                                (s in removeNodeSet or
+                                 t in removeNodeSet or
+                                 not tree.has_edge(s, t))))
 
         # loop on the nodes of the tree
         vistrail = controller.vistrail
-        tm = vistrail.get_tagMap()
         am = vistrail.actionMap
         last_n = vistrail.getLastActions(controller.num_versions_always_shown)
 
         self.emit_selection = False
-        for node in layout.nodes.itervalues():
+        if changes is None:
+            nodes = layout.nodes.itervalues()
+        else:
+            nodes = [layout.nodes[v] for v in changes if v in layout.nodes]
+            if select_node:
+                for item in self.selectedItems():
+                    if (isinstance(item, QGraphicsVersionItem) and
+                            item.id != controller.current_version):
+                        item.setSelected(False)
+
+        for node in nodes:
 
             # version id
             v = node.id
 
             # version tag
-            tag = tm.get(v, None)
+            tag = vistrail.get_tag(v)
             action = am.get(v, None)
             description = vistrail.get_description(v)
 
@@ -1014,6 +1041,9 @@ class QVersionTreeScene(QInteractiveGraphicsScene):
                 self.addVersion(node, action, tag, description)
             if select_node:
                 self.versions[v].setSelected(v == controller.current_version)
+        if (select_node and changes is not None and
+                controller.current_version in self.versions):
+            self.versions[controller.current_version].setSelected(True)
 
         self.emit_selection = True
         self.selectionChanged()
@@ -1032,8 +1062,15 @@ class QVersionTreeScene(QInteractiveGraphicsScene):
         # adjust the colors
         self.adjust_version_colors(controller)
 
-        # Add or update links
-        for source in tree.vertices.iterkeys():
+        # Add or update links, that depend on the position and state
+        # of both their versions
+        if changes is None:
+            sources = tree.vertices.iterkeys()
+        else:
+            sources = set(v for v in changes if v in tree.vertices)
+            sources.update([s for v in sources
+                            for (s, _) in tree.edges_to(v)])
+        for source in sources:
             eFrom = tree.edges_from(source)
             for (target, aux) in eFrom:
                 guiSource = self.versions[source]
@@ -1048,9 +1085,9 @@ class QVersionTreeScene(QInteractiveGraphicsScene):
                 collapse = (self.fullGraph.parent(target)==source and # No in betweens
                             len(targetChildren) == 1 and # target is not a leaf or branch
                             target != controller.current_version and # target is not selected
-                            target not in tm and # target has no tag
+                            not vistrail.has_tag(target) and # target has no tag
                             target not in last_n and # not one of the last n modules
-                            (source in tm or # source has a tag
+                            (vistrail.has_tag(source) or # source has a tag
                              source == 0 or # source is root node
                              len(sourceChildren) > 1 or # source is branching node 
                              source == controller.current_version)) # source is selected
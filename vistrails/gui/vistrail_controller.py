@@ -327,7 +327,7 @@ class VistrailController(QtCore.QObject, BaseController):
         if action is not None:
             BaseController.add_new_action(self, action, description)
             self.emit(QtCore.SIGNAL("new_action"), action)
-            self.recompute_terse_graph()
+            self.recompute_terse_graph([action.db_id])
 
     ##########################################################################
 
@@ -599,7 +599,7 @@ class VistrailController(QtCore.QObject, BaseController):
             if self.refine:
                 # need to recompute the graph because the refined items might
                 # have changed since last time
-                self.recompute_terse_graph()
+                self.recompute_terse_graph(())
                 self.invalidate_version_tree(True)
             else:
                 self.invalidate_version_tree(False)
@@ -615,7 +615,7 @@ class VistrailController(QtCore.QObject, BaseController):
             self.refine = refine
             # need to recompute the graph because the refined items might
             # have changed since last time
-            self.recompute_terse_graph()
+            self.recompute_terse_graph(())
             self.invalidate_version_tree(True)
 
     def set_full_tree(self, full):
@@ -628,11 +628,27 @@ class VistrailController(QtCore.QObject, BaseController):
             self.full_tree = full
             self.invalidate_version_tree(True)
 
-    def recompute_terse_graph(self):
-        BaseController.recompute_terse_graph(self)
-        self._previous_graph_layout = copy.deepcopy(self._current_graph_layout)
-        self._current_graph_layout.layout_from(self.vistrail,
-                                               self._current_terse_graph)
+    def recompute_terse_graph(self, versions=None):
+        BaseController.recompute_terse_graph(self, versions)
+        # the layout replaces the nodes that move, so a shallow copy
+        # keeps the previous positions
+        self._previous_graph_layout = copy.copy(self._current_graph_layout)
+        self.update_graph_layout()
+
+    def update_graph_layout(self):
+        """ update_graph_layout() -> None
+        Lays out the terse graph again, only moving the versions
+        affected by its last update if it was updated incrementally
+
+        """
+        changes = self._terse_graph_changes
+        if changes is None:
+            self._current_graph_layout.layout_from(self.vistrail,
+                                                   self._current_terse_graph)
+        else:
+            self._current_graph_layout.update_from(self.vistrail,
+                                                   self._current_terse_graph,
+                                                   changes)
 
     def refine_graph(self, step=1.0):
         """ refine_graph(step: float in [0,1]) -> (Graph, Graph)        
@@ -758,7 +774,9 @@ class VistrailController(QtCore.QObject, BaseController):
                     not current_node_will_be_visible and not current == 0:
                 # we're going from one boring node to another,
                 # so just rename the node on the terse graph
-                self._current_terse_graph.rename_vertex(current, new_version)
+                BaseController.recompute_terse_graph(self,
+                                                     [current, new_version])
+                self.update_graph_layout()
                 self.replace_unnamed_node_in_version_tree(current, new_version)
             else:
                 # bail, for now
@@ -807,6 +825,7 @@ class VistrailController(QtCore.QObject, BaseController):
             full = self._current_full_graph
         changed = False
         new_current_version = None
+        pruned = []
         for v in versions:
             if v!=0: # not root
                 highest = v
@@ -822,11 +841,12 @@ class VistrailController(QtCore.QObject, BaseController):
                     if highest == self.current_version:
                         new_current_version = full.parent(highest)
                 self.vistrail.pruneVersion(highest)
+                pruned.append(highest)
         if changed:
             self.set_changed(True)
         if new_current_version is not None:
             self.change_selected_version(new_current_version)
-        self.recompute_terse_graph()
+        self.recompute_terse_graph(pruned)
         self.invalidate_version_tree(False)
 
     def hide_versions_below(self, v=None):
@@ -842,6 +862,7 @@ class VistrailController(QtCore.QObject, BaseController):
         am = self.vistrail.actionMap
 
         changed = False
+        hidden = []
 
         while 1:
             try:
@@ -853,6 +874,7 @@ class VistrailController(QtCore.QObject, BaseController):
                         if (to in am) and \
                             not self.vistrail.is_pruned(to)]
             self.vistrail.hideVersion(current)
+            hidden.append(current)
             changed = True
 
             for child in children:
@@ -860,7 +882,7 @@ class VistrailController(QtCore.QObject, BaseController):
 
         if changed:
             self.set_changed(True)
-        self.recompute_terse_graph()
+        self.recompute_terse_graph(hidden)
         self.invalidate_version_tree(False, False) 
 
     def show_all_versions(self):
@@ -882,10 +904,12 @@ class VistrailController(QtCore.QObject, BaseController):
         """
         full = self.vistrail.getVersionGraph()
         p = full.parent(v2)
+        expanded = []
         while p>v1:
             self.vistrail.expandVersion(p)
+            expanded.append(p)
             p = full.parent(p)
-        self.recompute_terse_graph()
+        self.recompute_terse_graph(expanded)
         self.invalidate_version_tree(False, True)
 
     def collapse_versions(self, v):
@@ -898,6 +922,7 @@ class VistrailController(QtCore.QObject, BaseController):
 
         am = self.vistrail.actionMap
         tm = self.vistrail.get_tagMap()
+        collapsed = []
 
         while 1:
             try:
@@ -910,13 +935,14 @@ class VistrailController(QtCore.QObject, BaseController):
             if len(children) > 1:
                 break
             self.vistrail.collapseVersion(current)
+            collapsed.append(current)
 
             for child in children:
                 if (not child in tm and  # has no Tag
                     child != self.current_version): # not selected
                     x.append(child)
 
-        self.recompute_terse_graph()
+        self.recompute_terse_graph(collapsed)
         self.invalidate_version_tree(False, True) 
 
     def expand_or_collapse_all_versions_below(self, v=None, expand=True):
@@ -931,6 +957,7 @@ class VistrailController(QtCore.QObject, BaseController):
         x = [v]
         
         am = self.vistrail.actionMap
+        changed = []
 
         while 1:
             try:
@@ -944,10 +971,11 @@ class VistrailController(QtCore.QObject, BaseController):
                 self.vistrail.expandVersion(current)
             else:
                 self.vistrail.collapseVersion(current)
+            changed.append(current)
 
             for child in children:
                 x.append(child)
-        self.recompute_terse_graph()
+        self.recompute_terse_graph(changed)
         self.invalidate_version_tree(False, True) 
 
     def expand_all_versions_below(self, v=None):
@@ -992,7 +1020,7 @@ class VistrailController(QtCore.QObject, BaseController):
                          "Please enter a different one." % tag)
             return False
         self.set_changed(True)
-        self.recompute_terse_graph()
+        self.recompute_terse_graph([self.current_version])
         self.invalidate_version_tree(False)
         return True
 
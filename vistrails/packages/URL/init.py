@@ -599,7 +599,7 @@ def initialize(*args, **keywords):
     reg = vistrails.core.modules.module_registry.get_module_registry()
     basic = vistrails.core.modules.basic_modules
 
-    reg.add_module(DownloadFile)
+    reg.add_module(DownloadFile, thread_safe=True)
     reg.add_input_port(DownloadFile, "url", (basic.String, 'URL'))
     reg.add_input_port(DownloadFile, 'insecure',
                        (basic.Boolean, "Allow invalid SSL certificates"),
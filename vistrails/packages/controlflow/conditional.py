@@ -124,7 +124,8 @@ class Default(Module):
 import unittest
 import urllib2
 
-from vistrails.tests.utils import intercept_result, execute
+from vistrails.tests.utils import intercept_result, execute, \
+    execution_threads
 
 class TestIf(unittest.TestCase):
     def do_if(self, val):
@@ -160,6 +161,13 @@ class TestIf(unittest.TestCase):
     def test_if_false(self):
         self.do_if(False)
 
+    def test_if_threads(self):
+        """Only the selected branch runs when updating modules in parallel.
+        """
+        with execution_threads(2):
+            self.do_if(True)
+            self.do_if(False)
+
 
 class TestDefault(unittest.TestCase):
     def do_default(self, val):
@@ -66,7 +66,8 @@ class ExecuteInOrder(Module):
 
 import unittest
 
-from vistrails.tests.utils import capture_stdout, execute
+from vistrails.tests.utils import capture_stdout, execute, \
+    execution_threads
 
 
 class TestOrder(unittest.TestCase):
@@ -103,3 +104,10 @@ class TestOrder(unittest.TestCase):
                     (0, 'self', 2, 'module2'),
                 ]))
         self.assertEqual(output, ['one', 'two'])
+
+    def test_threads(self):
+        """The order is kept when updating modules in parallel.
+        """
+        with execution_threads(2):
+            self.test_1()
+            self.test_2()
@@ -121,7 +121,8 @@ class Or(Fold):
 import unittest
 import urllib2
 
-from vistrails.tests.utils import intercept_result, execute
+from vistrails.tests.utils import intercept_result, execute, \
+    execution_threads
 
 
 class TestMap(unittest.TestCase):
@@ -201,6 +202,14 @@ class TestMap(unittest.TestCase):
                 ]))
         self.assertEqual(results, [[3, 11, 1]])
 
+    def test_threads(self):
+        """The function is only run by Map when updating modules in
+        parallel.
+        """
+        with execution_threads(2):
+            self.test_simple()
+            self.test_multiple()
+
 
 class TestUtils(unittest.TestCase):
     def test_filter(self):
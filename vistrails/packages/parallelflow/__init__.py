@@ -1,3 +1,10 @@
 identifier="edu.poly.vistrails.parallel_flow"
 name="Parallel Flow"
 version="0.1.1"
+
+from vistrails.core.configuration import ConfigurationObject
+
+# backend is 'ipython', 'local' (a pool of processes on this machine) or
+# 'auto' (IPython if it is installed); processes=0 means one per CPU, and
+# chunksize=0 lets the local pool choose
+configuration = ConfigurationObject(backend='auto', processes=0, chunksize=0)
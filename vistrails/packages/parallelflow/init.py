@@ -2,8 +2,11 @@ from vistrails.core.modules.vistrails_module import Module
 from vistrails.core.modules.module_registry import get_module_registry
 from vistrails.core.modules.basic_modules import List, String
 
-from engine_manager import EngineManager
-from map import Map
+from map import Map, ipython_available
+from process_pool import ProcessPool
+
+if ipython_available:
+    from engine_manager import EngineManager
 
 
 def initialize(*args,**keywords):
@@ -18,10 +21,14 @@ def initialize(*args,**keywords):
 
 
 def finalize():
-    EngineManager.cleanup()
+    ProcessPool.cleanup()
+    if ipython_available:
+        EngineManager.cleanup()
 
 
 def menu_items():
+    if not ipython_available:
+        return ()
     return (
             ("Start new engine processes",
              lambda: EngineManager.start_engines()),
@@ -34,3 +41,82 @@ def menu_items():
             ("Request cluster shutdown",
              lambda: EngineManager.shutdown_cluster()),
     )
+
+
+###############################################################################
+
+import unittest
+
+
+def _worker_execute_depth(i):
+    from vistrails.core.interpreter.default import get_default_interpreter
+    return get_default_interpreter()._execute_depth
+
+
+class TestMap(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from vistrails.core.packagemanager import get_package_manager
+        from vistrails.core.modules.module_registry import MissingPackage
+        pm = get_package_manager()
+        try:
+            pm.get_package('edu.poly.vistrails.parallel_flow')
+        except MissingPackage:
+            pm.late_enable_package('parallelflow')
+
+    def setUp(self):
+        from . import configuration
+        self.configuration = configuration
+        self.old_config = (configuration.backend, configuration.processes)
+        configuration.backend = 'local'
+        configuration.processes = 2
+
+    def tearDown(self):
+        (self.configuration.backend,
+         self.configuration.processes) = self.old_config
+
+    def test_local_backend(self):
+        """Runs PythonCalc on a list through the local process pool."""
+        from vistrails.tests.utils import execute, intercept_result
+        with intercept_result(Map, 'Result') as results:
+            self.assertFalse(execute([
+                    ('PythonCalc', 'org.vistrails.vistrails.pythoncalc', [
+                        ('value2', [('Float', '2.0')]),
+                        ('op', [('String', '*')]),
+                    ]),
+                    ('Map', 'edu.poly.vistrails.parallel_flow', [
+                        ('InputList', [('List', '[1, 2, 3, 4, 5]')]),
+                        ('InputPort', [('List', "['value1']")]),
+                        ('OutputPort', [('String', 'value')]),
+                    ]),
+                ],
+                [
+                    (0, 'self', 1, 'FunctionPort'),
+                ]))
+        self.assertEqual(results, [[2.0, 4.0, 6.0, 8.0, 10.0]])
+
+    def test_worker_state(self):
+        """Workers forked during an execution start from a clean state."""
+        from vistrails.core.interpreter.default import \
+            get_default_interpreter
+        from .process_pool import ProcessPool
+        ProcessPool.cleanup()
+        interpreter = get_default_interpreter()
+        interpreter._execute_depth += 1
+        try:
+            pool = ProcessPool.get_pool(2)
+        finally:
+            interpreter._execute_depth -= 1
+        self.assertEqual(pool.map(_worker_execute_depth, range(4),
+                                  chunksize=1),
+                         [0] * 4)
+
+    def test_chunks(self):
+        from .process_pool import split_chunks
+        elements = range(10)
+        self.assertEqual(split_chunks(elements, 2, 3),
+                         [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]])
+        chunks = split_chunks(elements, 2)
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(sum(chunks, []), elements)
+        self.assertEqual(split_chunks([], 4), [])
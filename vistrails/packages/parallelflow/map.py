@@ -16,6 +16,7 @@ from vistrails.core.vistrail.controller import VistrailController
 from vistrails.core.interpreter.default import get_default_interpreter
 from vistrails.core.db.io import serialize, unserialize
 from vistrails.core.log.module_exec import ModuleExec
+from vistrails.core.log.controller import LogController
 from vistrails.core.log.group_exec import GroupExec
 from vistrails.core.log.machine import Machine
 from vistrails.core.utils import xor, long2bytes
@@ -30,9 +31,18 @@ import re
 import sys
 import tempfile
 
-from IPython.parallel.error import CompositeError
+try:
+    from IPython.parallel.error import CompositeError
+except ImportError:
+    ipython_available = False
+
+    class CompositeError(Exception):
+        """Placeholder so that except clauses work without IPython."""
+else:
+    ipython_available = True
 
 from .api import get_client
+from .process_pool import ProcessPool
 
 try:
     import hashlib
@@ -146,11 +156,45 @@ _ansi_code = re.compile(r'%s(?:(?:\[[^A-Za-z]*[A-Za-z])|[^\[])' % '\x1B')
 def strip_ansi_codes(s):
     return _ansi_code.sub('', s)
 
+def add_element_functions(module, element, input_ports):
+    """
+    Sets the values of an element as functions on the module's input ports.
+    """
+    # getting highest id between functions to guarantee unique ids
+    # TODO: can get current IdScope here?
+    if module.functions:
+        high_id = max(function.db_id for function in module.functions)
+    else:
+        high_id = 0
+
+    # adding function and parameter to module in pipeline
+    # TODO: 'pos' should not be always 0 here
+    id_scope = IdScope(beginId=long(high_id+1))
+    for elementValue, inputPort in izip(element, input_ports):
+        p_spec = module.get_port_spec(inputPort, 'input')
+        type = p_spec.sigstring[1:-1]
+        if not isinstance(elementValue, basestring):
+            descr, = p_spec.descriptors()
+            elementValue = descr.module.translate_to_string(elementValue)
+
+        mod_function = ModuleFunction(id=id_scope.getNewId(ModuleFunction.vtType),
+                                      pos=0,
+                                      name=inputPort)
+        mod_param = ModuleParam(id=0L,
+                                pos=0,
+                                type=type,
+                                val=elementValue)
+
+        mod_function.add_parameter(mod_param)
+        module.add_function(mod_function)
+
 ###############################################################################
 # Map Operator
 #
 class Map(Module):
-    """The Map Module executes a map operator in parallel on IPython engines.
+    """The Map Module executes a map operator in parallel on IPython engines,
+    or on a pool of local processes if IPython is not available (see the
+    'backend' setting of the package configuration).
 
     The FunctionPort should be connected to the 'self' output of the module you
     want to execute.
@@ -214,7 +258,6 @@ class Map(Module):
             element_is_iter = True
             inputList = rawInputList
 
-        workflows = []
         module = None
         vtType = None
 
@@ -229,151 +272,37 @@ class Map(Module):
             module_id = connector.obj.moduleInfo['moduleId']
             vtType = original_pipeline.modules[module_id].vtType
 
-            # serialize the module for each value in the list
+            # checking type and setting input in the module
+            # typeChecking() goes over the whole list, call it only once
+            self.typeChecking(connector.obj, nameInput, inputList)
             for i, element in enumerate(inputList):
                 if element_is_iter:
                     self.element = element
                 else:
                     self.element = element[0]
 
-                # checking type and setting input in the module
-                self.typeChecking(connector.obj, nameInput, inputList)
                 self.setInputValues(connector.obj, nameInput, element, i)
 
-                pipeline_db_module = original_pipeline.modules[module_id].do_copy()
-
-                # transforming a subworkflow in a group
-                # TODO: should we also transform inner subworkflows?
-                if pipeline_db_module.is_abstraction():
-                    group = Group(id=pipeline_db_module.id,
-                                  cache=pipeline_db_module.cache,
-                                  location=pipeline_db_module.location,
-                                  functions=pipeline_db_module.functions,
-                                  annotations=pipeline_db_module.annotations)
-
-                    source_port_specs = pipeline_db_module.sourcePorts()
-                    dest_port_specs = pipeline_db_module.destinationPorts()
-                    for source_port_spec in source_port_specs:
-                        group.add_port_spec(source_port_spec)
-                    for dest_port_spec in dest_port_specs:
-                        group.add_port_spec(dest_port_spec)
-
-                    group.pipeline = pipeline_db_module.pipeline
-                    pipeline_db_module = group
-
-                # getting highest id between functions to guarantee unique ids
-                # TODO: can get current IdScope here?
-                if pipeline_db_module.functions:
-                    high_id = max(function.db_id
-                                  for function in pipeline_db_module.functions)
-                else:
-                    high_id = 0
-
-                # adding function and parameter to module in pipeline
-                # TODO: 'pos' should not be always 0 here
-                id_scope = IdScope(beginId=long(high_id+1))
-                for elementValue, inputPort in izip(element, nameInput):
-
-                    p_spec = pipeline_db_module.get_port_spec(inputPort, 'input')
-                    descrs = p_spec.descriptors()
-                    if len(descrs) != 1:
-                        raise ModuleError(
-                                self,
-                                "Tuple input ports are not supported")
-                    if not issubclass(descrs[0].module, Constant):
-                        raise ModuleError(
-                                self,
-                                "Module inputs should be Constant types")
-                    type = p_spec.sigstring[1:-1]
-
-                    mod_function = ModuleFunction(id=id_scope.getNewId(ModuleFunction.vtType),
-                                                  pos=0,
-                                                  name=inputPort)
-                    mod_param = ModuleParam(id=0L,
-                                            pos=0,
-                                            type=type,
-                                            val=elementValue)
-
-                    mod_function.add_parameter(mod_param)
-                    pipeline_db_module.add_function(mod_function)
-
-                # serializing module
-                wf = self.serialize_module(pipeline_db_module)
-                workflows.append(wf)
+            pipeline_db_module = self.prepare_module(
+                    original_pipeline.modules[module_id])
+            self.check_input_ports(pipeline_db_module, nameInput)
 
             # getting first connector, ignoring the rest
             break
 
-        # IPython stuff
-        try:
-            rc = get_client()
-        except Exception, error:
-            raise ModuleError(self, "Exception while loading IPython: "
-                              "%s" % error)
-        if rc is None:
-            raise ModuleError(self, "Couldn't get an IPython connection")
-        engines = rc.ids
-        if not engines:
-            raise ModuleError(
-                    self,
-                    "Exception while loading IPython: No IPython engines "
-                    "detected!")
-
-        # initializes each engine
-        # importing modules and initializing the VisTrails application
-        # in the engines *only* in the first execution on this engine
-        uninitialized = []
-        for eng in engines:
-            try:
-                rc[eng]['init']
-            except Exception:
-                uninitialized.append(eng)
-        if uninitialized:
-            init_view = rc[uninitialized]
-            with init_view.sync_imports():
-                import tempfile
-                import inspect
-
-                # VisTrails API
-                import vistrails
-                import vistrails.core
-                import vistrails.core.db.action
-                import vistrails.core.application
-                import vistrails.core.modules.module_registry
-                from vistrails.core.db.io import serialize
-                from vistrails.core.vistrail.vistrail import Vistrail
-                from vistrails.core.vistrail.pipeline import Pipeline
-                from vistrails.core.db.locator import XMLFileLocator
-                from vistrails.core.vistrail.controller import VistrailController
-                from vistrails.core.interpreter.default import get_default_interpreter
-
-            # initializing a VisTrails application
-            try:
-                init_view.execute(
-                        'app = vistrails.core.application.init('
-                        '        {"spawned": True},'
-                        '        args=[])',
-                        block=True)
-            except CompositeError, e:
-                self.print_compositeerror(e)
-                raise ModuleError(self, "Error initializing application on "
-                                  "IPython engines:\n"
-                                  "%s" % self.list_exceptions(e))
-
-            init_view['init'] = True
+        backend = self.get_backend()
 
         # setting computing color
         module.logging.set_computing(module)
 
-        # executing function in engines
+        # executing function, either in IPython engines or in local processes
         # each map returns a dictionary
-        try:
-            ldview = rc.load_balanced_view()
-            map_result = ldview.map_sync(execute_wf, workflows, [nameOutput]*len(workflows))
-        except CompositeError, e:
-            self.print_compositeerror(e)
-            raise ModuleError(self, "Error from IPython engines:\n"
-                              "%s" % self.list_exceptions(e))
+        if backend == 'local':
+            map_result = self.execute_local(pipeline_db_module, nameInput,
+                                            nameOutput, inputList)
+        else:
+            map_result = self.execute_ipython(pipeline_db_module, nameInput,
+                                              nameOutput, inputList)
 
         # verifying errors
         errors = []
@@ -405,7 +334,10 @@ class Map(Module):
                 output = module_klass().deserialize(map_execution['output'])
             self.result.append(output)
 
-        # including execution logs
+        # including execution logs, unless execution is not being logged
+        # (the interpreter then uses a DummyLogController)
+        if not isinstance(getattr(self.logging, 'log', None), LogController):
+            return
         for engine in range(len(map_result)):
             log = map_result[engine]['xml_log']
             exec_ = None
@@ -446,6 +378,176 @@ class Map(Module):
             self.logging.add_exec(exec_)
 
 
+    def prepare_module(self, pipeline_db_module):
+        """
+        Copies the module to be executed, transforming a subworkflow in a
+        group.
+        """
+        pipeline_db_module = pipeline_db_module.do_copy()
+
+        # TODO: should we also transform inner subworkflows?
+        if pipeline_db_module.is_abstraction():
+            group = Group(id=pipeline_db_module.id,
+                          cache=pipeline_db_module.cache,
+                          location=pipeline_db_module.location,
+                          functions=pipeline_db_module.functions,
+                          annotations=pipeline_db_module.annotations)
+
+            source_port_specs = pipeline_db_module.sourcePorts()
+            dest_port_specs = pipeline_db_module.destinationPorts()
+            for source_port_spec in source_port_specs:
+                group.add_port_spec(source_port_spec)
+            for dest_port_spec in dest_port_specs:
+                group.add_port_spec(dest_port_spec)
+
+            group.pipeline = pipeline_db_module.pipeline
+            pipeline_db_module = group
+
+        return pipeline_db_module
+
+    def check_input_ports(self, pipeline_db_module, nameInput):
+        """
+        Checks that the elements can be set as functions on the input ports.
+        """
+        for inputPort in nameInput:
+            p_spec = pipeline_db_module.get_port_spec(inputPort, 'input')
+            descrs = p_spec.descriptors()
+            if len(descrs) != 1:
+                raise ModuleError(
+                        self,
+                        "Tuple input ports are not supported")
+            if not issubclass(descrs[0].module, Constant):
+                raise ModuleError(
+                        self,
+                        "Module inputs should be Constant types")
+
+    def get_backend(self):
+        """
+        Returns the backend to use, 'ipython' or 'local', according to the
+        package configuration.
+        """
+        from . import configuration
+
+        backend = 'auto'
+        if configuration.check('backend'):
+            backend = configuration.backend
+        if backend not in ('auto', 'ipython', 'local'):
+            raise ModuleError(self, "Unknown Parallel Flow backend: %r" %
+                              backend)
+        if backend == 'auto':
+            if ipython_available:
+                backend = 'ipython'
+            else:
+                backend = 'local'
+        elif backend == 'ipython' and not ipython_available:
+            raise ModuleError(self, "IPython is not available")
+        return backend
+
+    def execute_local(self, pipeline_db_module, nameInput, nameOutput,
+                      inputList):
+        """
+        Executes the module for each element in a pool of local processes.
+
+        The module is serialized once; the workers receive the elements in
+        chunks.
+        """
+        from . import configuration
+
+        processes = chunksize = None
+        if configuration.check('processes'):
+            processes = configuration.processes
+        if configuration.check('chunksize'):
+            chunksize = configuration.chunksize
+
+        wf = self.serialize_module(pipeline_db_module)
+        try:
+            return ProcessPool.map(wf, nameInput, nameOutput, list(inputList),
+                                   processes, chunksize)
+        except Exception, e:
+            raise ModuleError(self, "Error from local worker processes: "
+                              "%s" % e)
+
+    def execute_ipython(self, pipeline_db_module, nameInput, nameOutput,
+                        inputList):
+        """
+        Executes the module for each element on IPython engines.
+        """
+        workflows = []
+        for element in inputList:
+            element_module = pipeline_db_module.do_copy()
+            add_element_functions(element_module, element, nameInput)
+
+            # serializing module
+            wf = self.serialize_module(element_module)
+            workflows.append(wf)
+
+        # IPython stuff
+        try:
+            rc = get_client()
+        except Exception, error:
+            raise ModuleError(self, "Exception while loading IPython: "
+                              "%s" % error)
+        if rc is None:
+            raise ModuleError(self, "Couldn't get an IPython connection")
+        engines = rc.ids
+        if not engines:
+            raise ModuleError(
+                    self,
+                    "Exception while loading IPython: No IPython engines "
+                    "detected!")
+
+        # initializes each engine
+        # importing modules and initializing the VisTrails application
+        # in the engines *only* in the first execution on this engine
+        uninitialized = []
+        for eng in engines:
+            try:
+                rc[eng]['init']
+            except Exception:
+                uninitialized.append(eng)
+        if uninitialized:
+            init_view = rc[uninitialized]
+            with init_view.sync_imports():
+                import tempfile
+                import inspect
+
+                # VisTrails API
+                import vistrails
+                import vistrails.core
+                import vistrails.core.db.action
+                import vistrails.core.application
+                import vistrails.core.modules.module_registry
+                from vistrails.core.db.io import serialize
+                from vistrails.core.vistrail.vistrail import Vistrail
+                from vistrails.core.vistrail.pipeline import Pipeline
+                from vistrails.core.db.locator import XMLFileLocator
+                from vistrails.core.vistrail.controller import VistrailController
+                from vistrails.core.interpreter.default import get_default_interpreter
+
+            # initializing a VisTrails application
+            try:
+                init_view.execute(
+                        'app = vistrails.core.application.init('
+                        '        {"spawned": True},'
+                        '        args=[])',
+                        block=True)
+            except CompositeError, e:
+                self.print_compositeerror(e)
+                raise ModuleError(self, "Error initializing application on "
+                                  "IPython engines:\n"
+                                  "%s" % self.list_exceptions(e))
+
+            init_view['init'] = True
+
+        try:
+            ldview = rc.load_balanced_view()
+            return ldview.map_sync(execute_wf, workflows,
+                                   [nameOutput]*len(workflows))
+        except CompositeError, e:
+            self.print_compositeerror(e)
+            raise ModuleError(self, "Error from IPython engines:\n"
+                              "%s" % self.list_exceptions(e))
+
     def serialize_module(self, module):
         """
         Serializes a module to be executed in parallel.
@@ -0,0 +1,218 @@
+"""Local multiprocessing backend for the Map module.
+
+This is used when IPython is not available, or when the package is
+configured with backend='local'. A pool of worker processes is started the
+first time it is needed and kept alive afterwards: each worker has the
+VisTrails application and its packages already loaded, and keeps its
+interpreter cache from one element to the next.
+
+The serialized module is written once to a temporary file; workers only
+receive its path and the input elements, in chunks, and parse the module a
+single time per Map execution.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import tempfile
+
+from vistrails.core import debug
+
+
+def split_chunks(elements, nb_workers, chunksize=None):
+    """Splits a list of elements into chunks for the workers.
+
+    If chunksize is not given, a few chunks per worker are made so that the
+    load stays balanced while amortizing the cost of each task.
+    """
+    if not chunksize:
+        chunksize, extra = divmod(len(elements), nb_workers * 4)
+        if extra:
+            chunksize += 1
+        chunksize = max(chunksize, 1)
+    return [elements[i:i + chunksize]
+            for i in xrange(0, len(elements), chunksize)]
+
+
+class ProcessPool(object):
+    def __init__(self):
+        self._pool = None
+        self._processes = None
+
+    def get_pool(self, processes=None):
+        """Returns the pool, starting the worker processes if needed.
+
+        If processes is 0 or None, one process per CPU is used.
+        """
+        if not processes:
+            processes = multiprocessing.cpu_count()
+        if self._pool is not None and self._processes != processes:
+            self.cleanup()
+        if self._pool is None:
+            debug.log("Starting %d local worker processes" % processes)
+            self._pool = multiprocessing.Pool(processes, _init_worker)
+            self._processes = processes
+        return self._pool
+
+    def map(self, module_xml, input_ports, output_port, elements,
+            processes=None, chunksize=None):
+        """Executes a serialized module once for each element.
+
+        Returns a list of dictionaries, in the same order as elements, with
+        the same keys as the results of map.execute_wf().
+        """
+        pool = self.get_pool(processes)
+        key = hashlib.sha1(module_xml).hexdigest()
+        fd, filename = tempfile.mkstemp(prefix='vt_map_', suffix='.xml')
+        try:
+            f = os.fdopen(fd, 'w')
+            try:
+                f.write(module_xml)
+            finally:
+                f.close()
+            tasks = [(key, filename, input_ports, output_port, chunk)
+                     for chunk in split_chunks(elements, self._processes,
+                                               chunksize)]
+            results = []
+            for chunk_results in pool.imap(_execute_chunk, tasks):
+                results.extend(chunk_results)
+            return results
+        finally:
+            os.unlink(filename)
+
+    def cleanup(self):
+        """Stops the worker processes."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+            self._processes = None
+
+ProcessPool = ProcessPool()
+
+
+###############################################################################
+# Code running in the worker processes
+#
+
+# The hash of the serialized module being executed and the Module loaded
+# from it; only the last one is kept, since the chunks of a Map execution
+# all use the same module
+_worker_module = (None, None)
+
+
+def _init_worker():
+    """Initializes a worker process.
+
+    On platforms where the pool forks, the VisTrails application of the
+    parent is already there; otherwise a new one is created.
+
+    The pool is started by the first Map to run, so a forked worker gets
+    the state of the parent's interpreter in the middle of an execution: it
+    is reset, without clearing it, which would remove the parent's
+    temporary files.
+    """
+    import vistrails.core.application
+    from vistrails.core.interpreter.default import get_default_interpreter
+    if vistrails.core.application.get_vistrails_application() is None:
+        global _worker_app
+        _worker_app = vistrails.core.application.init({'spawned': True},
+                                                      args=[])
+    else:
+        get_default_interpreter().create()
+
+
+def _load_module(key, filename):
+    from vistrails.core.db.locator import XMLFileLocator
+    from vistrails.core.vistrail.pipeline import Pipeline
+
+    global _worker_module
+    if _worker_module[0] == key:
+        return _worker_module[1]
+    pipeline = XMLFileLocator(filename).load(Pipeline)
+    pipeline.validate()
+    module, = pipeline.module_list
+    _worker_module = (key, module)
+    return module
+
+
+def _execute_chunk(task):
+    import traceback
+
+    key, filename, input_ports, output_port, elements = task
+    try:
+        module = _load_module(key, filename)
+    except Exception:
+        error = ["Couldn't load the module: %s" % traceback.format_exc()]
+        return [dict(errors=error)] * len(elements)
+
+    results = []
+    for element in elements:
+        try:
+            results.append(_execute_element(module, input_ports, output_port,
+                                            element))
+        except Exception:
+            results.append(dict(errors=[traceback.format_exc()]))
+    return results
+
+
+def _execute_element(base_module, input_ports, output_port, element):
+    import inspect
+
+    from vistrails.core.db.io import serialize
+    from vistrails.core.interpreter.default import get_default_interpreter
+    from vistrails.core.log.controller import LogController
+    from vistrails.core.log.log import Log
+    from vistrails.core.modules.module_registry import get_module_registry
+    from vistrails.core.modules.vistrails_module import Module, ModuleError
+    from vistrails.core.utils import DummyView
+    from vistrails.core.vistrail.pipeline import Pipeline
+
+    from .map import add_element_functions
+
+    module = base_module.do_copy()
+    add_element_functions(module, element, input_ports)
+    pipeline = Pipeline()
+    pipeline.add_module(module)
+
+    # The interpreter is not flushed: its cache is kept from one element to
+    # the next
+    log = Log()
+    interpreter = get_default_interpreter()
+    result = interpreter.execute(pipeline,
+                                 view=DummyView(),
+                                 logger=LogController(log),
+                                 reason='Parallel Flow Map (local)')
+
+    errors = []
+    for key, error in result.errors.iteritems():
+        errors.append('%s: %s' % (pipeline.modules[key].name, error))
+
+    try:
+        module_log = log.workflow_execs[0].item_execs[0]
+    except IndexError:
+        errors.append("Module log not found")
+        return dict(errors=errors)
+    machine = log.workflow_execs[0].machines[module_log.machine_id]
+    xml_log = serialize(module_log)
+    machine_log = serialize(machine)
+
+    output = None
+    serializable = None
+    if not result.errors:
+        executed_module = result.objects[module.id]
+        try:
+            output = executed_module.get_output(output_port)
+        except ModuleError:
+            errors.append("Output port not found: %s" % output_port)
+            return dict(errors=errors)
+        if Module in inspect.getmro(type(output)):
+            reg = get_module_registry()
+            serializable = reg.get_descriptor(type(output)).sigstring
+            output = output.serialize()
+
+    return dict(errors=errors,
+                output=output,
+                serializable=serializable,
+                xml_log=xml_log,
+                machine_log=machine_log)
@@ -44,6 +44,15 @@ class TableObject(object):
         else:
             return self._columns[i]
 
+    def get_columns(self, indexes, numeric=False):
+        """Gets several columns from the table.
+
+        This returns the same thing as calling get_column() for each index;
+        tables that read their data lazily override it to read all the
+        columns at once.
+        """
+        return [self.get_column(i, numeric) for i in indexes]
+
     def get_column_by_name(self, name, numeric=False):
         """Gets a column from its name.
 
@@ -195,9 +204,14 @@ class ExtractColumn(Module):
         except ValueError, e:
             raise ModuleError(self, e.message)
 
-        self.set_output('value', table.get_column(
-                column_idx,
-                self.get_input('numeric', allow_default=True)))
+        try:
+            column = table.get_column(
+                    column_idx,
+                    self.get_input('numeric', allow_default=True))
+        except InternalModuleError, e:
+            e.raise_module_error(self)
+
+        self.set_output('value', column)
 
 
 class BuildTable(Module):
@@ -239,8 +253,7 @@ class BuildTable(Module):
                                 item.rows, nb_rows))
                 else:
                     nb_rows = item.rows
-                cols.extend(item.get_column(c)
-                            for c in xrange(item.columns))
+                cols.extend(item.get_columns(xrange(item.columns)))
                 if item.names is not None:
                     names.extend(item.names)
                 else:
@@ -295,7 +308,7 @@ class TableToFileMode(FileMode):
         document.append('<tr>\n')
         document.extend('  <th>%s</th>\n' % name for name in names)
         document.append('</tr>\n')
-        columns = [table.get_column(col) for col in xrange(table.columns)]
+        columns = table.get_columns(xrange(table.columns))
         for row in xrange(table.rows):
             document.append('<tr>\n')
             for col in xrange(table.columns):
@@ -2,6 +2,9 @@ try:
     import numpy
 except ImportError: # pragma: no cover
     numpy = None
+    numpy_ndarray = ()
+else:
+    numpy_ndarray = numpy.ndarray
 import re
 
 from vistrails.core.modules.vistrails_module import ModuleError
@@ -33,7 +36,7 @@ class JoinedTables(TableObject):
         self.build_column_names()
         self.compute_row_map()
         self.column_cache = {}
-        self.rows = len(self.row_map)
+        self.rows = len(self.left_rows)
 
     def build_column_names(self):
         left_name = self.left_t.name
@@ -67,46 +70,50 @@ class JoinedTables(TableObject):
         if (index, numeric) in self.column_cache:
             return self.column_cache[(index, numeric)]
 
-        result = []
         if index < self.left_t.columns:
             column = self.left_t.get_column(index, numeric)
-            for i in xrange(self.left_t.rows):
-                if i in self.row_map:
-                    result.append(column[i])
+            rows = self.left_rows
         else:
             column = self.right_t.get_column(index - self.left_t.columns,
                                              numeric)
-            for i in xrange(self.left_t.rows):
-                if i in self.row_map:
-                    j = self.row_map[i]
-                    result.append(column[j])
+            rows = self.right_rows
 
         if numeric and numpy is not None:
-            result = numpy.array(result, dtype=numpy.float32)
+            result = numpy.asarray(column, dtype=numpy.float32)[rows]
+        else:
+            result = [column[i] for i in rows]
         self.column_cache[(index, numeric)] = result
         return result
 
-    def compute_row_map(self):
-        def build_key_dict(table, key_col):
-            column = table.get_column(key_col)
-            if self.case_sensitive:
-                key_dict = dict((utf8(val).strip(), i)
-                                for i, val in enumerate(column))
-            else:
-                key_dict = dict((utf8(val).strip().upper(), i)
-                                for i, val in enumerate(column))
-            return key_dict
+    def normalize_keys(self, table, key_col):
+        if self.case_sensitive:
+            return [utf8(val).strip()
+                    for val in table.get_column(key_col)]
+        else:
+            return [utf8(val).strip().upper()
+                    for val in table.get_column(key_col)]
 
-        right_keys = build_key_dict(self.right_t, self.right_key_col)
+    def compute_row_map(self):
+        """Matches the rows of the two tables.
 
-        self.row_map = {}
-        for left_row_idx, key in enumerate(
-                self.left_t.get_column(self.left_key_col)):
-            key = utf8(key).strip()
-            if not self.case_sensitive:
-                key = key.upper()
-            if key in right_keys:
-                self.row_map[left_row_idx] = right_keys[key]
+        This sets left_rows and right_rows, the indexes of the matching rows
+        in each table, in the order of the left table. If a key appears
+        several times in the right table, the last row is used.
+        """
+        left_keys = self.normalize_keys(self.left_t, self.left_key_col)
+        right_keys = self.normalize_keys(self.right_t, self.right_key_col)
+
+        right_dict = dict((key, i) for i, key in enumerate(right_keys))
+        self.left_rows = []
+        self.right_rows = []
+        for i, key in enumerate(left_keys):
+            if key in right_dict:
+                self.left_rows.append(i)
+                self.right_rows.append(right_dict[key])
+        if numpy is not None:
+            # Index arrays, to select the rows of numeric columns at once
+            self.left_rows = numpy.array(self.left_rows, dtype=int)
+            self.right_rows = numpy.array(self.right_rows, dtype=int)
 
 
 class JoinTables(Table):
@@ -169,6 +176,10 @@ class ProjectedTable(TableObject):
         mapped_idx = self.col_map[index]
         return self.table.get_column(mapped_idx, numeric)
 
+    def get_columns(self, indexes, numeric=False):
+        return self.table.get_columns([self.col_map[i] for i in indexes],
+                                      numeric)
+
     @property
     def rows(self):
         return self.table.rows
@@ -282,19 +293,46 @@ class SelectFromTable(Table):
                                   "No column %d, table only has %d columns" % (
                                   idx, table.columns))
 
-        condition = self.make_condition(comparand, comparer)
         numeric = isinstance(comparand, float)
         column = table.get_column(idx, numeric)
-        matched_rows = [i
-                        for i, col_val in enumerate(column)
-                        if condition(col_val)]
+        if numeric and numpy is not None and comparer != '=~':
+            # compare as float64, like float() does
+            matched_rows = numpy.nonzero(self.make_mask(
+                    numpy.asarray(column, dtype=numpy.float64),
+                    comparand, comparer))[0]
+        else:
+            condition = self.make_condition(comparand, comparer)
+            matched_rows = [i
+                            for i, col_val in enumerate(column)
+                            if condition(col_val)]
         columns = []
-        for col in xrange(table.columns):
-            column = table.get_column(col)
-            columns.append([column[row] for row in matched_rows])
+        for column in table.get_columns(xrange(table.columns)):
+            if isinstance(column, numpy_ndarray):
+                columns.append(column[matched_rows])
+            else:
+                columns.append([column[row] for row in matched_rows])
         selected_table = TableObject(columns, len(matched_rows), table.names)
         self.set_output('value', selected_table)
 
+    @staticmethod
+    def make_mask(column, comparand, comparer):
+        """Compares a numpy array with a value, returning a boolean array.
+        """
+        if comparer == '==':
+            return column == comparand
+        elif comparer == '!=':
+            return column != comparand
+        elif comparer == '<':
+            return column < comparand
+        elif comparer == '>':
+            return column > comparand
+        elif comparer == '<=':
+            return column <= comparand
+        elif comparer == '>=':
+            return column >= comparand
+        else:
+            raise ValueError("Invalid comparison operator %r" % comparer)
+
 
 class AggregatedTable(TableObject):
     def __init__(self, table, op, col, group_col):
@@ -306,21 +344,52 @@ class AggregatedTable(TableObject):
         self.build_map()
 
     def build_map(self):
-        agg_map = {}
-        for i, val in enumerate(self.table.get_column(self.group_col)):
-            if val in agg_map:
-                agg_map[val].append(i)
-            else:
-                agg_map[val] = [i]
-        self.agg_rows = [(min(rows), rows) for rows in agg_map.itervalues()]
-        self.agg_rows.sort()
-        self.rows = len(self.agg_rows)
+        """Groups the rows by value of the group column.
+
+        Groups are numbered in the order in which their first row appears;
+        group_codes gives the group of each row and group_first the first
+        row of each group.
+        """
+        group_ids = {}
+        self.group_codes = [group_ids.setdefault(val, len(group_ids))
+                            for val in self.table.get_column(self.group_col)]
+        self.rows = len(group_ids)
+        if numpy is not None:
+            self.group_codes = numpy.array(self.group_codes, dtype=int)
+            # stable sort, so that rows stay in order inside each group
+            self.group_order = numpy.argsort(self.group_codes,
+                                             kind='mergesort')
+            self.group_counts = numpy.bincount(self.group_codes,
+                                               minlength=self.rows)
+            self.group_starts = numpy.zeros(self.rows, dtype=int)
+            numpy.cumsum(self.group_counts[:-1], out=self.group_starts[1:])
+            self.group_first = self.group_order[self.group_starts]
+        else:
+            self.group_rows = [[] for i in xrange(self.rows)]
+            for i, code in enumerate(self.group_codes):
+                self.group_rows[code].append(i)
+            self.group_first = [rows[0] for rows in self.group_rows]
         self.columns = 2
         if self.table.names is not None:
             self.names = [self.table.names[self.group_col],
                           self.table.names[self.col]]
 
     def get_column(self, index, numeric=False):
+        if index == 0:
+            col = self.table.get_column(self.group_col, numeric)
+            return [col[i] for i in self.group_first]
+        elif self.op == 'count':
+            if numpy is not None:
+                return self.group_counts.tolist()
+            else:
+                return [len(rows) for rows in self.group_rows]
+        elif self.op not in ('sum', 'average', 'min', 'max'):
+            raise ValueError('Unknown operation: "%s"' % self.op)
+
+        col = self.table.get_column(self.col, True)
+        if numpy is not None:
+            return self.aggregate(numpy.asarray(col)).tolist()
+
         def average(value_iter):
             # value_iter can only be used once
             sum = 0
@@ -332,18 +401,27 @@ class AggregatedTable(TableObject):
                   'average': average,
                   'min': min,
                   'max': max}
-        if index == 0:
-            col = self.table.get_column(self.group_col, numeric)
-            return [col[x[0]] for x in self.agg_rows]
-        else:
-            if self.op == 'count':
-                return [len(x[1]) for x in self.agg_rows]
-            elif self.op in op_map:
-                col = self.table.get_column(self.col, True)
-                return [op_map[self.op](col[idx] for idx in x[1])
-                        for x in self.agg_rows]
-            else:
-                raise ValueError('Unknown operation: "%s"' % self.op)
+        return [op_map[self.op](col[idx] for idx in rows)
+                for rows in self.group_rows]
+
+    def aggregate(self, col):
+        """Computes the aggregate of each group using numpy.
+        """
+        if not self.rows:
+            return numpy.zeros(0)
+        if self.op == 'sum':
+            return numpy.bincount(self.group_codes, weights=col,
+                                  minlength=self.rows)
+        elif self.op == 'average':
+            return (numpy.bincount(self.group_codes, weights=col,
+                                   minlength=self.rows) /
+                    self.group_counts)
+        elif self.op == 'min':
+            return numpy.minimum.reduceat(col[self.group_order],
+                                          self.group_starts)
+        else: # self.op == 'max'
+            return numpy.maximum.reduceat(col[self.group_order],
+                                          self.group_starts)
 
 
 class AggregateColumn(Table):
@@ -695,3 +773,99 @@ class TestAggregate(unittest.TestCase):
                                    ('group_by_index', [('Integer', '2')])])
         self.assertEqual(table.get_column(0, False), ['T', 'F'])
         self.assertEqual(table.get_column(1, True), [-7, 21])
+
+
+class TestWithoutNumpy(unittest.TestCase):
+    """Checks that the pure-Python code gives the same results as numpy.
+    """
+    left = TableObject([[1, 2, 4, 5, 7],
+                        ['one', 'two', 'four', 'five', 'seven'],
+                        [1.5, -2.0, 4.25, 8.0, 0.5]],
+                       5, ['id', 'name', 'value'])
+    right = TableObject([[' 5', '2', 3, 1, 2],
+                         [10.0, 20.0, 30.0, 40.0, 50.0]],
+                        5, ['id', 'weight'])
+    groups = TableObject([['a', 'b', 'a', 'c', 'b', 'a'],
+                          [3.0, -1.5, 2.0, 7.0, 4.5, 1.0]],
+                         6, ['group', 'value'])
+
+    def setUp(self):
+        if numpy is None: # pragma: no cover
+            self.skipTest("numpy is not available")
+
+    def without_numpy(self, func):
+        from . import common, operations
+        saved = common.numpy, operations.numpy, operations.numpy_ndarray
+        common.numpy = operations.numpy = None
+        operations.numpy_ndarray = ()
+        try:
+            return func()
+        finally:
+            common.numpy, operations.numpy, operations.numpy_ndarray = saved
+
+    def compare(self, get_columns, numeric_columns):
+        """Gets the columns with and without numpy and compares them.
+        """
+        expected = get_columns()
+        result = self.without_numpy(get_columns)
+        self.assertEqual(len(result), len(expected))
+        for i, (col, expected_col) in enumerate(zip(result, expected)):
+            self.assertNotIsInstance(col, numpy.ndarray)
+            self.assertEqual(len(col), len(expected_col))
+            if i in numeric_columns:
+                for value, expected_value in zip(col, expected_col):
+                    self.assertAlmostEqual(value, expected_value)
+            else:
+                self.assertEqual(list(col), list(expected_col))
+        return result
+
+    def test_join(self):
+        def get_columns():
+            table = JoinedTables(self.left, self.right, 0, 0)
+            return [table.get_column(0), table.get_column(1),
+                    table.get_column(2, True), table.get_column(3),
+                    table.get_column(4, True)]
+        result = self.compare(get_columns, [2, 4])
+        self.assertEqual(result[0], [1, 2, 5])
+        self.assertEqual(result[3], [1, 2, ' 5'])
+        self.assertEqual(result[4], [40.0, 50.0, 10.0])
+
+    def do_select(self, comparer, comparand):
+        with intercept_result(SelectFromTable, 'value') as results:
+            self.assertFalse(execute([
+                    ('BuildTable', identifier, [
+                        ('name', [('List', repr(self.left.get_column(1)))]),
+                        ('value', [('List', repr(self.left.get_column(2)))]),
+                    ]),
+                    ('SelectFromTable', identifier, [
+                        ('float_expr', [('String', 'value'),
+                                        ('String', comparer),
+                                        ('Float', comparand)]),
+                    ]),
+                ],
+                [
+                    (0, 'value', 1, 'table'),
+                ],
+                add_port_specs=[
+                    (0, 'input', 'name',
+                     'org.vistrails.vistrails.basic:List'),
+                    (0, 'input', 'value',
+                     'org.vistrails.vistrails.basic:List'),
+                ]))
+        table, = results
+        return [table.get_column(0), table.get_column(1, True)]
+
+    def test_select(self):
+        for comparer in ['==', '!=', '<', '>', '<=', '>=']:
+            self.compare(lambda: self.do_select(comparer, '4.25'), [1])
+        result = self.compare(lambda: self.do_select('<', '1.5'), [1])
+        self.assertEqual(result[0], ['two', 'seven'])
+
+    def test_aggregate(self):
+        for op in ['sum', 'count', 'average', 'min', 'max']:
+            def get_columns():
+                table = AggregatedTable(self.groups, op, 1, 0)
+                return [table.get_column(0), table.get_column(1, True)]
+            result = self.compare(get_columns, [1])
+            self.assertEqual(result[0], ['a', 'b', 'c'])
+        self.assertEqual(result[1], [3.0, 4.5, 7.0])
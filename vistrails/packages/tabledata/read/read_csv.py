@@ -1,9 +1,17 @@
+import array
 import csv
+import hashlib
+from itertools import ifilter, izip
+import os
+import tempfile
 try:
     import numpy
 except ImportError: # pragma: no cover
     numpy = None
 
+from vistrails.core import debug
+from vistrails.core.system import current_dot_vistrails
+
 from ..common import TableObject, Table, InternalModuleError
 
 
@@ -16,6 +24,10 @@ def count_lines(fp):
 
 # FIXME : test coverage for CSVTable
 class CSVTable(TableObject):
+    # numeric columns of files at least this big are saved to .npy files in
+    # the user's directory, and memory-mapped when they are requested again
+    sidecar_min_size = 16 * 1024 * 1024
+
     def __init__(self, csv_file, header_present, delimiter,
                  skip_lines=0, dialect=None, use_sniffer=True):
         self._rows = None
@@ -88,43 +100,176 @@ class CSVTable(TableObject):
         return column_count, column_names, delimiter, header_present, dialect
 
     def get_column(self, index, numeric=False):
-        if (index, numeric) in self.column_cache:
-            return self.column_cache[(index, numeric)]
-
-        if numeric and numpy is not None:
-            result = numpy.loadtxt(
-                    self.filename,
-                    dtype=numpy.float32,
-                    delimiter=self.delimiter,
-                    skiprows=self.skip_lines,
-                    usecols=[index])
+        return self.get_columns([index], numeric)[0]
+
+    def get_columns(self, indexes, numeric=False):
+        """Gets several columns, reading the file only once.
+
+        Columns that were already read are kept in column_cache. The ones
+        that are missing are all read in a single pass over the file, unless
+        a sidecar file has them (see read_sidecar()).
+        """
+        indexes = list(indexes)
+        missing = []
+        for index in indexes:
+            if (index, numeric) in self.column_cache:
+                continue
+            column = None
+            if numeric:
+                column = self.read_sidecar(index)
+            if column is not None:
+                self.column_cache[(index, numeric)] = column
+            elif index not in missing:
+                missing.append(index)
+
+        if missing:
+            columns = self.read_columns(missing, numeric)
+            for index, column in izip(missing, columns):
+                self.column_cache[(index, numeric)] = column
+                if numeric:
+                    self.write_sidecar(index, column)
+
+        return [self.column_cache[(index, numeric)] for index in indexes]
+
+    def read_columns(self, indexes, numeric=False):
+        """Reads the given columns from the file, in a single pass.
+
+        If numeric is True, the values are converted to float as they are
+        read, and the columns are returned as numpy arrays (or lists of
+        floats if numpy is not available). The number of rows is recorded
+        at the same time.
+        """
+        if numeric:
+            columns = [array.array('d') for index in indexes]
         else:
-            with open(self.filename, 'rb') as fp:
-                for i in xrange(self.skip_lines):
-                    line = fp.readline()
-                    if not line:
-                        raise InternalModuleError("skip_lines greater than "
-                                                  "the number of lines in the "
-                                                  "file")
-                if self.dialect is not None:
-                    reader = csv.reader(fp, dialect=self.dialect)
+            columns = [[] for index in indexes]
+        appends = [column.append for column in columns]
+        pairs = zip(indexes, appends)
+        rows = 0
+        with open(self.filename, 'rb') as fp:
+            reader = self.read_rows(fp)
+            try:
+                if numeric:
+                    for row in reader:
+                        for index, append in pairs:
+                            append(float(row[index]))
+                        rows += 1
                 else:
-                    reader = csv.reader(fp, delimiter=self.delimiter)
+                    for row in reader:
+                        for index, append in pairs:
+                            append(row[index])
+                        rows += 1
+            except IndexError:
+                raise InternalModuleError("Row %d of the file only has %d "
+                                          "columns" % (rows + 1, len(row)))
+            except ValueError, e:
+                raise InternalModuleError("Invalid numeric value on row "
+                                          "%d: %s" % (rows + 1, e))
+        self._rows = rows
+
+        if numeric:
+            if numpy is not None:
+                columns = [numpy.frombuffer(column, dtype=numpy.float64)
+                                .astype(numpy.float32)
+                           for column in columns]
+            else:
+                columns = [column.tolist() for column in columns]
+        return columns
+
+    def read_rows(self, fp):
+        """Skips the header and the lines to skip, and returns an iterator
+        over the rows of the file, as lists of strings.
+
+        Blank lines are not rows, for both read_columns() and rows.
+        """
+        for i in xrange(self.skip_lines):
+            line = fp.readline()
+            if not line:
+                raise InternalModuleError("skip_lines greater than "
+                                          "the number of lines in the "
+                                          "file")
+        if self.dialect is not None:
+            reader = csv.reader(fp, dialect=self.dialect)
+        else:
+            reader = csv.reader(fp, delimiter=self.delimiter)
+        return ifilter(None, reader)
 
-                result = [row[index] for row in reader]
-            if numeric:
-                result = [float(e) for e in result]
+    def _sidecar_path(self, index):
+        """Returns the directory, name prefix and filename of the sidecar
+        file for a column, or None if sidecars are not used for this file.
 
-        self.column_cache[(index, numeric)] = result
-        return result
+        The prefix identifies the column, the rest of the filename the
+        version of the CSV file.
+        """
+        if numpy is None:
+            return None
+        try:
+            stat = os.stat(self.filename)
+            if stat.st_size < self.sidecar_min_size:
+                return None
+            directory = os.path.join(current_dot_vistrails(),
+                                     'tabledata_columns')
+        except Exception:
+            return None
+        if isinstance(self.dialect, basestring):
+            dialect = self.dialect
+        else:
+            dialect = None
+        prefix = hashlib.sha1(repr((os.path.abspath(self.filename),
+                                    self.delimiter, dialect,
+                                    self.skip_lines, index))).hexdigest()
+        filename = '%s_%d_%d.npy' % (prefix, int(stat.st_mtime),
+                                     stat.st_size)
+        return directory, prefix, filename
+
+    def read_sidecar(self, index):
+        """Loads a numeric column from its sidecar file, memory-mapped.
+
+        Returns None if there is no up-to-date sidecar for this column.
+        """
+        path = self._sidecar_path(index)
+        if path is None:
+            return None
+        directory, prefix, filename = path
+        try:
+            return numpy.load(os.path.join(directory, filename),
+                              mmap_mode='r')
+        except (IOError, OSError, ValueError):
+            return None
+
+    def write_sidecar(self, index, column):
+        """Saves a numeric column to a sidecar file, replacing the ones
+        written for previous versions of the CSV file.
+        """
+        path = self._sidecar_path(index)
+        if path is None:
+            return
+        directory, prefix, filename = path
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            fd, temp = tempfile.mkstemp(prefix=prefix, suffix='.tmp',
+                                        dir=directory)
+            try:
+                with os.fdopen(fd, 'wb') as fp:
+                    numpy.save(fp, column)
+                os.rename(temp, os.path.join(directory, filename))
+            except Exception:
+                os.unlink(temp)
+                raise
+            for other in os.listdir(directory):
+                if (other.startswith(prefix + '_') and other != filename and
+                        other.endswith('.npy')):
+                    os.unlink(os.path.join(directory, other))
+        except (IOError, OSError), e:
+            debug.warning("Couldn't write column cache file", e)
 
     @property
     def rows(self):
         if self._rows is not None:
             return self._rows
         with open(self.filename, 'rb') as fp:
-            self._rows = count_lines(fp)
-        self._rows -= self.skip_lines
+            self._rows = sum(1 for row in self.read_rows(fp))
         return self._rows
 
 
@@ -277,6 +422,75 @@ class CSVTestCase(unittest.TestCase):
         self.assertEqual(results[0],
                          ['col moutarde', '4', 'not a number', '7'])
 
+    def test_single_pass(self):
+        """Reads several columns at once, numeric and not.
+        """
+        table = CSVTable(self._test_dir + '/test.csv', True, ';')
+        self.assertEqual(table.get_columns([2, 0]),
+                         [['4', 'not a number', '7'], ['-1', '2', '6']])
+        self.assertEqual(table.rows, 3)
+        self.assertEqual(list(table.get_column(1, True)), [2.0, 3.0, 14.5])
+        self.assertEqual(sorted(table.column_cache),
+                         [(0, False), (1, True), (2, False)])
+        self.assertRaises(InternalModuleError, table.read_columns, [5])
+        # cached columns are not read again
+        table.filename = None
+        self.assertEqual(table.get_column(0), ['-1', '2', '6'])
+
+    def test_blank_lines(self):
+        """Blank lines are not counted as rows, nor read.
+        """
+        filename = self._test_dir + '/blank_lines.csv'
+        table = CSVTable(filename, True, ';')
+        self.assertEqual(table.rows, 3)
+        table = CSVTable(filename, True, ';')
+        self.assertEqual(list(table.get_column(1, True)), [2.0, 3.0, 14.5])
+        self.assertEqual(table.get_column(2), ['4', 'not a number', '7'])
+        self.assertEqual(table.rows, 3)
+
+    def test_sidecar(self):
+        """Numeric columns of big files are memory-mapped from .npy files.
+        """
+        if numpy is None: # pragma: no cover
+            self.skipTest("numpy is not available")
+        import shutil
+        import vistrails.core.system
+
+        dot_vistrails = tempfile.mkdtemp(prefix='vt_tabledata_')
+        old_dot_vistrails = vistrails.core.system.current_dot_vistrails
+        globals()['current_dot_vistrails'] = lambda: dot_vistrails
+        try:
+            filename = os.path.join(dot_vistrails, 'test.csv')
+            shutil.copyfile(self._test_dir + '/test.csv', filename)
+            directory = os.path.join(dot_vistrails, 'tabledata_columns')
+
+            table = CSVTable(filename, True, ';')
+            table.sidecar_min_size = 0
+            self.assertEqual(list(table.get_column(1, True)),
+                             [2.0, 3.0, 14.5])
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+            table = CSVTable(filename, True, ';')
+            table.sidecar_min_size = 0
+            column = table.get_column(1, True)
+            self.assertIsInstance(column, numpy.memmap)
+            self.assertEqual(list(column), [2.0, 3.0, 14.5])
+            del column
+            table.column_cache.clear()
+
+            # changing the file invalidates the sidecar
+            with open(filename, 'ab') as fp:
+                fp.write('1;2;3\n')
+            os.utime(filename, (0, 0))
+            table = CSVTable(filename, True, ';')
+            table.sidecar_min_size = 0
+            self.assertEqual(list(table.get_column(1, True)),
+                             [2.0, 3.0, 14.5, 2.0])
+            self.assertEqual(len(os.listdir(directory)), 1)
+        finally:
+            globals()['current_dot_vistrails'] = old_dot_vistrails
+            shutil.rmtree(dot_vistrails)
+
 
 class TestCountlines(unittest.TestCase):
     def test_countlines(self):
@@ -52,8 +52,8 @@ class TableCellWidget(QCellWidget):
         self.table.setColumnCount(table.columns + 1)
         self.table.setRowCount(table.rows)
 
-        for col in xrange(table.columns):
-            column = table.get_column(col)
+        columns = table.get_columns(xrange(table.columns))
+        for col, column in enumerate(columns):
             for row in xrange(table.rows):
                 elem = column[row]
                 if isinstance(elem, bytes):
@@ -98,7 +98,7 @@ class TableCellWidget(QCellWidget):
         document.append('<tr>\n')
         document.extend('  <th>%s</th>\n' % name for name in names)
         document.append('</tr>\n')
-        columns = [table.get_column(col) for col in xrange(table.columns)]
+        columns = table.get_columns(xrange(table.columns))
         for row in xrange(table.rows):
             document.append('<tr>\n')
             for col in xrange(table.columns):
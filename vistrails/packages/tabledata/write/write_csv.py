@@ -39,7 +39,8 @@ class WriteCSV(Module):
                 else:
                     fp.write(delimiter.join(table.names) + '\n')
 
-            cols = [iter(table.get_column(i)) for i in xrange(table.columns)]
+            cols = [iter(col)
+                    for col in table.get_columns(xrange(table.columns))]
 
             if not cols:
                 raise ModuleError(
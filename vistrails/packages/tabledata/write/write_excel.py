@@ -36,8 +36,8 @@ class WriteExcelSpreadsheet(Module):
         fileobj = self.interpreter.filePool.create_file(suffix='.xls')
         fname = fileobj.name
 
-        for c in xrange(table.columns):
-            column = table.get_column(c)
+        columns = table.get_columns(xrange(table.columns))
+        for c, column in enumerate(columns):
             for r, e in enumerate(column):
                 sheet.write(r, c, e)
             if r+1 != rows: # pragma: no cover
@@ -48,6 +48,11 @@ def package_dependencies():
     else:
         return []
 
+def registry_snapshot_key():
+    # the generated modules and ports depend on the VTK build
+    import vtk
+    return vtk.vtkVersion.GetVTKSourceVersion()
+
 def package_requirements():
     from vistrails.core.requirements import require_python_module, \
         python_module_exists
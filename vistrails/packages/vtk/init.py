@@ -62,6 +62,7 @@ import fix_classes
 import inspectors
 import offscreen
 import tf_widget
+from port_cache import PortRecorder, create_port_cache_from_configuration
 from vtk_parser import VTKMethodParser
 
 
@@ -126,6 +127,9 @@ set_file_name_pattern = re.compile('Set.*FileName$')
 
 _upgrade_self_to_instance_modules = set()
 
+# PortCache of the current initialize() call, or None
+_port_cache = None
+
 def resolve_overloaded_name(name, ix, signatures):
     # VTK supports static overloading, VisTrails does not. The
     # solution is to check whether the current function has
@@ -393,7 +397,7 @@ def is_class_allowed(module):
     except AttributeError:
         return True
 
-def addAlgorithmPorts(module):
+def addAlgorithmPorts(module, registry=None):
     """ addAlgorithmPorts(module: Module) -> None
     If module is a subclass of vtkAlgorithm, this function will add all
     SetInputConnection([id],[port]) and GetOutputPort([id]) as
@@ -409,7 +413,9 @@ def addAlgorithmPorts(module):
             except TypeError:
                 pass
             else:
-                reg = get_module_registry()
+                if registry is None:
+                    registry = get_module_registry()
+                reg = registry
                 des = reg.get_descriptor_by_name(vtk_pkg_identifier,
                                                       'vtkAlgorithmOutput')
                 for i in xrange(0,instance.GetNumberOfInputPorts()):
@@ -430,7 +436,7 @@ disallowed_set_get_ports = set(['ReferenceCount',
                                 'ProgressText',
                                 'InputArrayToProcess',
                                 ])
-def addSetGetPorts(module, get_set_dict, delayed):
+def addSetGetPorts(module, get_set_dict, delayed, registry=None):
     """ addSetGetPorts(module: Module, get_set_dict: dict) -> None
     Convert all Setxxx methods of module into input ports and all Getxxx
     methods of module into output ports
@@ -442,7 +448,8 @@ def addSetGetPorts(module, get_set_dict, delayed):
     """
 
     klass = get_description_class(module.vtkClass)
-    registry = get_module_registry()
+    if registry is None:
+        registry = get_module_registry()
     for name in get_set_dict.iterkeys():
         if name in disallowed_set_get_ports: continue
         getterMethod = getattr(klass, 'Get%s'%name)
@@ -531,7 +538,7 @@ def addSetGetPorts(module, get_set_dict, delayed):
 disallowed_toggle_ports = set(['GlobalWarningDisplay',
                                'Debug',
                                ])
-def addTogglePorts(module, toggle_dict):
+def addTogglePorts(module, toggle_dict, registry=None):
     """ addTogglePorts(module: Module, toggle_dict: dict) -> None
     Convert all xxxOn/Off methods of module into input ports
 
@@ -540,7 +547,8 @@ def addTogglePorts(module, toggle_dict):
     toggle_dict --- the Toggle method signatures returned by vtk_parser
 
     """
-    registry = get_module_registry()
+    if registry is None:
+        registry = get_module_registry()
     for name in toggle_dict.iterkeys():
         if name in disallowed_toggle_ports:
             continue
@@ -552,7 +560,7 @@ def addTogglePorts(module, toggle_dict):
                                 docstring=module.get_doc(port_name))
 
 disallowed_state_ports = set(['SetInputArrayToProcess'])
-def addStatePorts(module, state_dict):
+def addStatePorts(module, state_dict, registry=None):
     """ addStatePorts(module: Module, state_dict: dict) -> None
     Convert all SetxxxToyyy methods of module into input ports
 
@@ -562,7 +570,8 @@ def addStatePorts(module, state_dict):
 
     """
     klass = get_description_class(module.vtkClass)
-    registry = get_module_registry()
+    if registry is None:
+        registry = get_module_registry()
     for name in state_dict.iterkeys():
         for mode in state_dict[name]:
             # Creates the port Set foo to bar
@@ -645,7 +654,7 @@ force_not_optional_port = set(
      ])
 
 
-def addOtherPorts(module, other_list):
+def addOtherPorts(module, other_list, registry=None):
     """ addOtherPorts(module: Module, other_list: list) -> None
     Convert all other ports such as Insert/Add.... into input/output
 
@@ -656,7 +665,8 @@ def addOtherPorts(module, other_list):
 
     """
     klass = get_description_class(module.vtkClass)
-    registry = get_module_registry()
+    if registry is None:
+        registry = get_module_registry()
     for name in other_list:
         if name=='CopyImportVoidPointer':
             # FIXME add documentation
@@ -742,9 +752,10 @@ disallowed_get_ports = set([
     'GetTotalNumberOfInputConnections',
     ])
 
-def addGetPorts(module, get_list):
+def addGetPorts(module, get_list, registry=None):
     klass = get_description_class(module.vtkClass)
-    registry = get_module_registry()
+    if registry is None:
+        registry = get_module_registry()
     for name in get_list:
         if name in disallowed_get_ports:
             continue
@@ -764,6 +775,22 @@ def addGetPorts(module, get_list):
                 registry.add_output_port(module, n, class_, True,
                                          docstring=module.get_doc(n))
     
+def addParsedPorts(module, delayed, registry):
+    """ addParsedPorts(module: VTK module inherited from Module,
+                       delayed: object with add_input_port slot,
+                       registry: ModuleRegistry or PortRecorder) -> None
+    Parses the methods of the VTK class of module and adds the ports
+    they map to.
+
+    """
+    parser.parse(get_description_class(module.vtkClass))
+    addAlgorithmPorts(module, registry)
+    addGetPorts(module, parser.get_get_methods(), registry)
+    addSetGetPorts(module, parser.get_get_set_methods(), delayed, registry)
+    addTogglePorts(module, parser.get_toggle_methods(), registry)
+    addStatePorts(module, parser.get_state_methods(), registry)
+    addOtherPorts(module, parser.get_other_methods(), registry)
+
 def addPorts(module, delayed):
     """ addPorts(module: VTK module inherited from Module,
                  delayed: object with add_input_port slot
@@ -779,13 +806,15 @@ def addPorts(module, delayed):
     registry = get_module_registry()
     registry.add_output_port(module, 'Instance', module)
     _upgrade_self_to_instance_modules.add(module)
-    parser.parse(klass)
-    addAlgorithmPorts(module)
-    addGetPorts(module, parser.get_get_methods())
-    addSetGetPorts(module, parser.get_get_set_methods(), delayed) 
-    addTogglePorts(module, parser.get_toggle_methods())
-    addStatePorts(module, parser.get_state_methods())
-    addOtherPorts(module, parser.get_other_methods())             
+    if _port_cache is None:
+        addParsedPorts(module, delayed, registry)
+    elif not _port_cache.add_ports(registry, module, delayed):
+        # Parse the class and record what gets added for the next time
+        recorder = PortRecorder(registry)
+        first_delayed = len(delayed.add_input_port)
+        addParsedPorts(module, delayed, recorder)
+        _port_cache.set_ports(module, recorder,
+                              delayed.add_input_port[first_delayed:])
     # CVS version of VTK doesn't support AddInputConnect(vtkAlgorithmOutput)
     # FIXME Add documentation
     basic_pkg = '%s.basic' % get_vistrails_default_pkg_prefix()
@@ -1101,7 +1130,11 @@ def createModule(baseModule, node):
     else:
         module.vtkClass = node.klass
     registry = get_module_registry()
-    registry.add_module(module, abstract=is_abstract(), 
+    if _port_cache is not None:
+        abstract = _port_cache.is_abstract(node.name, is_abstract)
+    else:
+        abstract = is_abstract()
+    registry.add_module(module, abstract=abstract,
                         signatureCallable=vtk_hasher)
     for child in node.children:
         if child.name in disallowed_classes:
@@ -1146,6 +1179,7 @@ def initialize():
     Package-entry to initialize the package
     
     """
+    global _port_cache
     # Check VTK version
     v = vtk.vtkVersion()
     version = [v.GetVTKMajorVersion(),
@@ -1163,17 +1197,27 @@ def initialize():
     delayed = InstanceObject(add_input_port=[])
     # Add VTK modules
     registry = get_module_registry()
-    registry.add_module(vtkBaseModule)
-    registry.add_module(vtkRendererOutput)
-    createAllModules(inheritanceGraph)
-    setAllPorts(registry.get_descriptor_by_name(identifier,
-                                                'vtkObjectBase'),
-                delayed)
+    has_spreadsheet = registry.has_module('%s.spreadsheet' % \
+                                          get_vistrails_default_pkg_prefix(),
+                                          'SpreadsheetCell')
+    # The ports generated in a previous session are reused if the
+    # registry cache is enabled
+    _port_cache = create_port_cache_from_configuration(
+            v.GetVTKSourceVersion(), (has_spreadsheet,))
+    try:
+        registry.add_module(vtkBaseModule)
+        registry.add_module(vtkRendererOutput)
+        createAllModules(inheritanceGraph)
+        setAllPorts(registry.get_descriptor_by_name(identifier,
+                                                    'vtkObjectBase'),
+                    delayed)
+        if _port_cache is not None:
+            _port_cache.save()
+    finally:
+        _port_cache = None
 
     # Register the VTKCell and VTKHandler type if the spreadsheet is up
-    if registry.has_module('%s.spreadsheet' % \
-                           get_vistrails_default_pkg_prefix(),
-                           'SpreadsheetCell'):
+    if has_spreadsheet:
         import vtkhandler
         import vtkcell
         import vtkviewcell
@@ -0,0 +1,422 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""Cache of the ports generated for the VTK classes.
+
+Generating the ports of the VTK modules parses the methods and the
+docstrings of every wrapped class, and instantiates them to find the
+abstract ones. The ports generated for each class are recorded the first
+time and written to a pickle file keyed by the VTK version, the
+VisTrails version and the files of this package, so that later sessions
+can register them without looking at the VTK wrappers again.
+
+"""
+
+import cPickle as pickle
+import hashlib
+import os
+import sys
+import tempfile
+
+from vistrails.core import debug
+from vistrails.core.system import vistrails_version
+
+##############################################################################
+
+def encode_signature(registry, signature):
+    """encode_signature(registry, signature) -> picklable object
+    Replaces the module classes in a port signature, as passed to
+    add_input_port, by the names of their descriptors, or by their
+    import path for classes that aren't registered yet (such as the
+    delayed VTKCell ports).
+
+    """
+    if isinstance(signature, list):
+        return [encode_signature(registry, s) for s in signature]
+    elif isinstance(signature, tuple):
+        return tuple(encode_signature(registry, s) for s in signature)
+    elif isinstance(signature, basestring):
+        return signature
+    try:
+        descriptor = registry.get_descriptor(signature)
+    except KeyError:
+        pass
+    else:
+        return {'module': (descriptor.identifier, descriptor.name,
+                           descriptor.namespace)}
+    module = sys.modules.get(signature.__module__)
+    if getattr(module, signature.__name__, None) is not signature:
+        raise ValueError("Can't encode %r" % (signature,))
+    return {'class': (signature.__module__, signature.__name__)}
+
+def decode_signature(registry, signature):
+    """decode_signature(registry, signature) -> port signature
+    Inverse of encode_signature.
+
+    """
+    if isinstance(signature, list):
+        return [decode_signature(registry, s) for s in signature]
+    elif isinstance(signature, tuple):
+        return tuple(decode_signature(registry, s) for s in signature)
+    elif isinstance(signature, dict):
+        if 'module' in signature:
+            return registry.get_descriptor_by_name(
+                    *signature['module']).module
+        module_name, name = signature['class']
+        __import__(module_name)
+        return getattr(sys.modules[module_name], name)
+    return signature
+
+class PortRecorder(object):
+    """PortRecorder stands for the module registry while the ports of a
+    VTK class are generated, and records the ports that get added.
+
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.ports = []
+        self.complete = True
+
+    def __getattr__(self, name):
+        return getattr(self.registry, name)
+
+    def _record(self, port_type, module, name, signature, optional,
+                docstring):
+        try:
+            encoded = encode_signature(self.registry, signature)
+        except Exception:
+            # a port on something that isn't registered; this class
+            # won't be cached
+            self.complete = False
+        else:
+            self.ports.append((port_type, name, encoded, optional,
+                               docstring is not None))
+
+    def add_input_port(self, module, portName, portSignature, optional=False,
+                       docstring=None):
+        self.registry.add_input_port(module, portName, portSignature,
+                                     optional, docstring=docstring)
+        self._record('input', module, portName, portSignature, optional,
+                     docstring)
+
+    def add_output_port(self, module, portName, portSignature,
+                        optional=False, docstring=None):
+        self.registry.add_output_port(module, portName, portSignature,
+                                      optional, docstring=docstring)
+        self._record('output', module, portName, portSignature, optional,
+                     docstring)
+
+class PortCache(object):
+    """PortCache holds, for each VTK class, whether it is abstract and the
+    ports that were generated for it.
+
+    """
+
+    prefix = 'vtk-'
+    suffix = '.pickle'
+
+    def __init__(self, directory, key):
+        self.directory = directory
+        self.key = key
+        self.abstract = {}
+        self.ports = {}
+        self.changed = False
+        self.hits = 0
+        self.misses = 0
+
+    def get_filename(self):
+        return os.path.join(self.directory,
+                            '%s%s%s' % (self.prefix, self.key, self.suffix))
+
+    def load(self):
+        fname = self.get_filename()
+        if not os.path.exists(fname):
+            return False
+        try:
+            f = open(fname, 'rb')
+            try:
+                self.abstract, self.ports = pickle.load(f)
+            finally:
+                f.close()
+        except Exception, e:
+            debug.warning("Could not read VTK port cache %s" % fname, e)
+            self.abstract = {}
+            self.ports = {}
+            return False
+        return True
+
+    def save(self):
+        """save() -> None
+        Writes the cache if classes were added to it, and removes the
+        files left by other versions.
+
+        """
+        if not self.changed:
+            return
+        fname = self.get_filename()
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+        for f in os.listdir(self.directory):
+            if (f.startswith(self.prefix) and f.endswith(self.suffix) and
+                    f != os.path.basename(fname)):
+                try:
+                    os.unlink(os.path.join(self.directory, f))
+                except OSError, e:
+                    debug.warning("Could not remove VTK port cache %s" % f, e)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            f = os.fdopen(fd, 'wb')
+            try:
+                pickle.dump((self.abstract, self.ports), f,
+                            pickle.HIGHEST_PROTOCOL)
+            finally:
+                f.close()
+            if os.path.exists(fname):
+                os.unlink(fname)
+            os.rename(tmp_name, fname)
+        except (IOError, OSError), e:
+            debug.warning("Could not write VTK port cache %s" % fname, e)
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            return
+        self.changed = False
+
+    def is_abstract(self, name, compute):
+        """is_abstract(name: str, compute: callable) -> bool
+        Returns whether the class is abstract, calling compute() if it
+        isn't cached.
+
+        """
+        try:
+            return self.abstract[name]
+        except KeyError:
+            abstract = self.abstract[name] = compute()
+            self.changed = True
+            return abstract
+
+    def add_ports(self, registry, module, delayed):
+        """add_ports(registry, module, delayed) -> bool
+        Adds the cached ports of a module to the registry, and the
+        delayed ones to the delayed object. Returns False if the module
+        isn't cached, in which case nothing is added.
+
+        """
+        try:
+            ports, delayed_ports = self.ports[module.__name__]
+        except KeyError:
+            self.misses += 1
+            return False
+        try:
+            ports = [(port_type, name,
+                      decode_signature(registry, signature),
+                      optional, has_doc)
+                     for port_type, name, signature, optional, has_doc
+                     in ports]
+            delayed_ports = [(name, decode_signature(registry, signature),
+                              optional)
+                             for name, signature, optional in delayed_ports]
+        except Exception:
+            del self.ports[module.__name__]
+            self.changed = True
+            self.misses += 1
+            return False
+        for port_type, name, signature, optional, has_doc in ports:
+            if has_doc:
+                docstring = module.get_doc(name)
+            else:
+                docstring = None
+            if port_type == 'input':
+                registry.add_input_port(module, name, signature, optional,
+                                        docstring=docstring)
+            else:
+                registry.add_output_port(module, name, signature, optional,
+                                         docstring=docstring)
+        for name, signature, optional in delayed_ports:
+            delayed.add_input_port.append((module, name, signature,
+                                           optional))
+        self.hits += 1
+        return True
+
+    def set_ports(self, module, recorder, delayed_args):
+        """set_ports(module, recorder: PortRecorder, delayed_args) -> None
+        Caches the ports recorded for a module and the delayed ones
+        (a list of add_input_port arguments).
+
+        """
+        if not recorder.complete:
+            return
+        try:
+            delayed_ports = [(name, encode_signature(recorder.registry,
+                                                     signature), optional)
+                             for (_, name, signature, optional)
+                             in delayed_args]
+        except Exception:
+            return
+        self.ports[module.__name__] = (recorder.ports, delayed_ports)
+        self.changed = True
+
+def port_cache_key(vtk_version, extra=()):
+    """port_cache_key(vtk_version: str, extra: tuple) -> str
+    Computes the key of the cache from the versions and the files of
+    this package, plus anything else the generated ports depend on.
+
+    """
+    key = hashlib.sha1()
+    for value in (vistrails_version(), sys.version, vtk_version) + \
+            tuple(extra):
+        key.update(repr(value))
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for filename in sorted(os.listdir(package_dir)):
+        if filename.endswith('.py'):
+            statinfo = os.stat(os.path.join(package_dir, filename))
+            key.update(repr((filename, statinfo.st_mtime, statinfo.st_size)))
+    return key.hexdigest()
+
+def create_port_cache_from_configuration(vtk_version, extra=(),
+                                         configuration=None):
+    """create_port_cache_from_configuration(vtk_version: str, extra: tuple,
+                                            configuration)
+      -> PortCache or None
+    Loads the cache from the registryCacheDir directory. Returns None if
+    the registryCache setting is disabled.
+
+    """
+    from vistrails.core.system import get_vistrails_directory
+    if configuration is None:
+        from vistrails.core.configuration import get_vistrails_configuration
+        configuration = get_vistrails_configuration()
+    if configuration is None or not configuration.check('registryCache'):
+        return None
+    directory = get_vistrails_directory('registryCacheDir', configuration)
+    if directory is None:
+        return None
+    cache = PortCache(directory, port_cache_key(vtk_version, extra))
+    cache.load()
+    return cache
+
+##############################################################################
+
+import unittest
+
+class FakeModule(object):
+    @classmethod
+    def get_doc(cls, port_name):
+        return 'doc of %s' % port_name
+
+class FakeDescriptor(object):
+    def __init__(self, name, module):
+        self.identifier = 'org.example.fake'
+        self.name = name
+        self.namespace = ''
+        self.module = module
+
+class FakeRegistry(object):
+    def __init__(self, modules):
+        self.descriptors = dict((m.__name__, FakeDescriptor(m.__name__, m))
+                                for m in modules)
+        self.calls = []
+
+    def get_descriptor(self, module):
+        return self.descriptors[module.__name__]
+
+    def get_descriptor_by_name(self, identifier, name, namespace=''):
+        return self.descriptors[name]
+
+    def add_input_port(self, *args, **kwargs):
+        self.calls.append(('input', args, kwargs))
+
+    def add_output_port(self, *args, **kwargs):
+        self.calls.append(('output', args, kwargs))
+
+class TestPortCache(unittest.TestCase):
+    def test_signature(self):
+        class Float(object):
+            pass
+        registry = FakeRegistry([Float])
+        signature = [(Float, 'x'), Float, [], FakeModule]
+        encoded = encode_signature(registry, signature)
+        pickle.dumps(encoded)
+        self.assertEqual(decode_signature(registry, encoded), signature)
+
+    def test_unknown_class(self):
+        class Float(object):
+            pass
+        self.assertRaises(ValueError,
+                          encode_signature, FakeRegistry([]), Float)
+
+    def test_roundtrip(self):
+        import shutil
+        class Float(object):
+            pass
+        class vtkThing(FakeModule):
+            pass
+        directory = tempfile.mkdtemp()
+        try:
+            registry = FakeRegistry([Float, vtkThing])
+            recorder = PortRecorder(registry)
+            recorder.add_input_port(vtkThing, 'SetValue', Float, True,
+                                    docstring='doc of SetValue')
+            recorder.add_output_port(vtkThing, 'GetValue', [Float, Float])
+            cache = PortCache(directory, 'a' * 40)
+            self.assertTrue(cache.is_abstract('vtkThing', lambda: True))
+            cache.set_ports(vtkThing, recorder,
+                            [(vtkThing, 'SetCell', Float, False)])
+            cache.save()
+
+            cache = PortCache(directory, 'a' * 40)
+            self.assertTrue(cache.load())
+            self.assertTrue(cache.is_abstract('vtkThing', lambda: False))
+            registry = FakeRegistry([Float, vtkThing])
+            delayed = FakeModule()
+            delayed.add_input_port = []
+            self.assertTrue(cache.add_ports(registry, vtkThing, delayed))
+            self.assertEqual(registry.calls,
+                             [('input', (vtkThing, 'SetValue', Float, True),
+                               {'docstring': 'doc of SetValue'}),
+                              ('output', (vtkThing, 'GetValue',
+                                          [Float, Float], False),
+                               {'docstring': None})])
+            self.assertEqual(delayed.add_input_port,
+                             [(vtkThing, 'SetCell', Float, False)])
+
+            # another key replaces the file
+            cache = PortCache(directory, 'b' * 40)
+            self.assertFalse(cache.load())
+            cache.is_abstract('vtkThing', lambda: False)
+            cache.save()
+            self.assertEqual(os.listdir(directory),
+                             ['vtk-%s.pickle' % ('b' * 40)])
+        finally:
+            shutil.rmtree(directory)
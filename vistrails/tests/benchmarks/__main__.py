@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# pragma: no testimport
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+
+"""Runs the benchmarks of suite.py from the command-line.
+
+  python -m vistrails.tests.benchmarks [options] [benchmark1 ...]
+
+The times are written to a JSON file with -o; --compare checks them
+against such a file and exits with a non-zero status if a benchmark got
+slower than the tolerance.
+
+"""
+
+import json
+from optparse import OptionParser
+import os
+import shutil
+import sys
+import tempfile
+
+if 'vistrails' not in sys.modules:
+    # Makes sure we can import modules as if we were running VisTrails
+    # from the root directory
+    _this_dir = os.path.dirname(os.path.realpath(__file__))
+    _root_directory = os.path.realpath(os.path.join(_this_dir, '..', '..'))
+    sys.path.insert(0, os.path.realpath(os.path.join(_root_directory, '..')))
+
+
+def main(args):
+    from vistrails.tests.benchmarks.suite import BENCHMARKS, \
+        DEFAULT_PARAMETERS
+
+    usage = "Usage: %prog [options] [benchmark1 benchmark2 ...]"
+    parser = OptionParser(usage=usage)
+    for name, default in DEFAULT_PARAMETERS.iteritems():
+        parser.add_option('--%s' % name.replace('_', '-'), action='store',
+                          type=type(default).__name__, default=default,
+                          dest=name,
+                          help="generated data: %s (default=%s)" % (
+                               name, default))
+    parser.add_option('-r', '--repeat', action='store', type='int',
+                      default=5, dest='repeat',
+                      help="number of times each benchmark is run, the "
+                      "best time is kept (default=5)")
+    parser.add_option('-o', '--output', action='store', type='str',
+                      default=None, dest='output',
+                      help="write the results to this JSON file")
+    parser.add_option('-c', '--compare', action='store', type='str',
+                      default=None, dest='baseline',
+                      help="compare the results to this JSON file")
+    parser.add_option('-t', '--tolerance', action='store', type='float',
+                      default=0.1, dest='tolerance',
+                      help="slowdown reported as a regression when "
+                      "comparing (default=0.1, i.e. 10%)")
+    parser.add_option('-l', '--list', action='store_true', default=False,
+                      help="list the benchmarks and exit")
+    (options, names) = parser.parse_args(args)
+
+    if options.list:
+        for name in BENCHMARKS:
+            print name
+        return 0
+    for name in names:
+        if name not in BENCHMARKS:
+            parser.error("unknown benchmark %r" % name)
+
+    # Use a different temporary directory, and don't touch the user's
+    # configuration
+    tempfile.tempdir = tempfile.mkdtemp(prefix='vt_benchmarks_')
+    import vistrails.core.application
+    app = vistrails.core.application.init({'batch': True,
+                                          'spawned': True,
+                                          'executionLog': False,
+                                          'singleInstance': False,
+                                          'enablePackagesSilently': True,
+                                          'handlerDontAsk': True},
+                                         args=[])
+    from vistrails.tests.benchmarks.suite import compare, run_benchmarks
+
+    try:
+        parameters = dict((name, getattr(options, name))
+                          for name in DEFAULT_PARAMETERS)
+        results = run_benchmarks(names or None, options.repeat,
+                                 out=sys.stdout, **parameters)
+    finally:
+        app.finishSession()
+        shutil.rmtree(tempfile.tempdir, ignore_errors=True)
+
+    if options.output is not None:
+        with open(options.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    if options.baseline is not None:
+        with open(options.baseline) as f:
+            baseline = json.load(f)
+        report, regressions = compare(results, baseline, options.tolerance)
+        sys.stdout.write(report)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
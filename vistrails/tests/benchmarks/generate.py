@@ -0,0 +1,182 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+
+"""Generation of synthetic vistrails for the benchmarks.
+
+The pipelines are made of Integer modules arranged in layers: the modules
+of the first layer have a value set, and each module of the next layers
+is connected to 'fanout' modules of the previous layer. The version tree
+starts with an action adding the whole pipeline, followed by actions
+changing the value of a module of the first layer; each of them either
+continues the current branch or branches off an earlier version.
+
+"""
+
+import csv
+import random
+
+from vistrails.core.db.action import create_action, create_paste_action
+from vistrails.core.modules.basic_modules import identifier as basic_pkg
+from vistrails.core.modules.module_registry import get_module_registry
+from vistrails.core.vistrail.connection import Connection
+from vistrails.core.vistrail.module import Module
+from vistrails.core.vistrail.module_function import ModuleFunction
+from vistrails.core.vistrail.module_param import ModuleParam
+from vistrails.core.vistrail.pipeline import Pipeline
+from vistrails.core.vistrail.port import Port
+from vistrails.core.vistrail.vistrail import Vistrail
+
+
+INTEGER_SIG = '(%s:Integer)' % basic_pkg
+
+
+def make_pipeline(modules=100, depth=10, fanout=2, seed=0):
+    """make_pipeline(modules: int, depth: int, fanout: int, seed: int)
+         -> Pipeline
+    Generates a layered pipeline of 'modules' Integer modules, 'depth'
+    layers deep.
+
+    """
+    rng = random.Random(seed)
+    depth = max(1, min(depth, modules))
+    desc = get_module_registry().get_descriptor_by_name(basic_pkg, 'Integer')
+
+    # Spread the modules evenly over the layers
+    layers = []
+    next_id = 0
+    for layer in xrange(depth):
+        size = (modules * (layer + 1)) // depth - (modules * layer) // depth
+        layers.append(range(next_id, next_id + size))
+        next_id += size
+
+    pipeline = Pipeline()
+    for i in layers[0]:
+        function = ModuleFunction(id=i, pos=0, name='value',
+                                  parameters=[ModuleParam(id=i, pos=0,
+                                                          type='Integer',
+                                                          val=str(i))])
+        pipeline.add_module(Module(id=i, name='Integer', package=basic_pkg,
+                                   version=desc.package_version,
+                                   functions=[function]))
+    conn_id = 0
+    for previous, layer in zip(layers, layers[1:]):
+        for i in layer:
+            pipeline.add_module(Module(id=i, name='Integer',
+                                       package=basic_pkg,
+                                       version=desc.package_version))
+            for source in rng.sample(previous, min(fanout, len(previous))):
+                pipeline.add_connection(Connection(
+                        id=conn_id,
+                        ports=[Port(id=conn_id * 2, type='source',
+                                    moduleId=source, name='value',
+                                    signature=INTEGER_SIG),
+                               Port(id=conn_id * 2 + 1, type='destination',
+                                    moduleId=i, name='value',
+                                    signature=INTEGER_SIG)]))
+                conn_id += 1
+    return pipeline
+
+
+def make_vistrail(versions=100, modules=100, depth=10, fanout=2,
+                  branch_rate=0.1, tag_every=25, seed=0):
+    """make_vistrail(versions: int, modules: int, depth: int, fanout: int,
+                     branch_rate: float, tag_every: int, seed: int)
+         -> Vistrail
+    Generates a vistrail of 'versions' versions over a pipeline built by
+    make_pipeline(). A new version branches off a random earlier version
+    with probability branch_rate, and one version out of tag_every gets
+    tagged. The first version is tagged 'base'.
+
+    """
+    rng = random.Random(seed)
+    vistrail = Vistrail()
+    id_scope = vistrail.idScope
+    pipeline = make_pipeline(modules, depth, fanout, seed)
+
+    action = create_paste_action(pipeline, id_scope)
+    vistrail.add_action(action, 0)
+    base = action.id
+    vistrail.set_tag(base, 'base')
+
+    # The current parameter of each module of the first layer, by version,
+    # to make changes against it
+    function_modules = {}
+    function_params = {}
+    for op in action.operations:
+        if op.what == ModuleFunction.vtType:
+            function_modules[op.objectId] = op.parentObjId
+        elif op.what == ModuleParam.vtType:
+            function_params[op.parentObjId] = op.data
+    params = dict((function_modules[function_id], (function_id, param))
+                  for function_id, param in function_params.iteritems())
+    version_params = {base: params}
+    all_versions = [base]
+
+    sources = sorted(params)
+    current = base
+    for i in xrange(1, versions):
+        if rng.random() < branch_rate:
+            parent = rng.choice(all_versions)
+        else:
+            parent = current
+        params = dict(version_params[parent])
+        module_id = rng.choice(sources)
+        function_id, old_param = params[module_id]
+        new_param = ModuleParam(id=id_scope.getNewId(ModuleParam.vtType),
+                                pos=0, type='Integer',
+                                val=str(rng.randint(0, 1000)))
+        action = create_action([('change', old_param, new_param,
+                                 ModuleFunction.vtType, function_id)])
+        vistrail.add_action(action, parent)
+        current = action.id
+        params[module_id] = (function_id, new_param)
+        version_params[current] = params
+        all_versions.append(current)
+        if tag_every and i % tag_every == 0:
+            vistrail.set_tag(current, 'v%d' % i)
+    return vistrail
+
+
+def make_csv(filename, rows=10000, columns=10, seed=0):
+    """make_csv(filename: str, rows: int, columns: int, seed: int) -> None
+    Writes a CSV file of random numbers, with a header line.
+
+    """
+    rng = random.Random(seed)
+    with open(filename, 'wb') as fp:
+        writer = csv.writer(fp)
+        writer.writerow(['col%d' % c for c in xrange(columns)])
+        for r in xrange(rows):
+            writer.writerow(['%.6f' % rng.random() for c in xrange(columns)])
@@ -0,0 +1,644 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+
+"""Benchmarks of the hot paths of VisTrails.
+
+Each benchmark is a function registered with @benchmark, that gets a
+BenchmarkData holding the synthetic data (see generate.py) and returns
+the list of times measured by time_calls(), optionally with a dictionary
+of other measures such as peak_memory() or retained_memory(). run_benchmarks() runs them and
+returns a dictionary that can be dumped to JSON; compare() checks such
+results against a baseline.
+
+The command-line interface is in __main__.py:
+  python -m vistrails.tests.benchmarks -o results.json
+  python -m vistrails.tests.benchmarks --compare results.json
+
+"""
+
+from collections import OrderedDict
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+from vistrails.tests.benchmarks.generate import make_vistrail, make_csv
+
+
+# Parameters of the generated data, and their default values
+DEFAULT_PARAMETERS = OrderedDict([
+        ('versions', 500),
+        ('modules', 200),
+        ('depth', 10),
+        ('fanout', 2),
+        ('branch_rate', 0.1),
+        ('rows', 20000),
+        ('columns', 10),
+        ('seed', 0),
+    ])
+
+BENCHMARKS = OrderedDict()
+
+def benchmark(name):
+    """Registers a benchmark function under the given name."""
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def time_calls(func, repeat, setup=None):
+    """time_calls(func: callable, repeat: int, setup: callable) -> list
+    Calls func() 'repeat' times and returns the times it took, in seconds.
+    setup() is called before each call, and is not timed.
+
+    """
+    timer = timeit.default_timer
+    times = []
+    for i in xrange(repeat):
+        if setup is not None:
+            setup()
+        start = timer()
+        func()
+        times.append(timer() - start)
+    return times
+
+
+_MEMORY_SCRIPT = """\
+import gc
+import sys
+sys.path.insert(0, %(root)r)
+
+def status(field):
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) * 1024
+    except IOError:
+        pass
+    return None
+
+def peak():
+    # ru_maxrss is kept across exec() on Linux, so it would include the
+    # parent process; VmHWM is not
+    value = status('VmHWM')
+    if value is not None:
+        return value
+    import resource
+    # in bytes on Mac OS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+%(setup)s
+gc.collect()
+before_peak, before_rss = peak(), status('VmRSS')
+%(statement)s
+gc.collect()
+rss = status('VmRSS')
+print peak() - before_peak, (rss - before_rss if rss is not None else -1)
+"""
+
+def _memory_usage(statement, setup):
+    if sys.platform == 'win32':
+        return None, None
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.dirname(os.path.abspath(__file__)))))
+    script = _MEMORY_SCRIPT % dict(root=root, setup=setup,
+                                   statement=statement)
+    output = subprocess.check_output([sys.executable, '-c', script])
+    peak, retained = map(int, output.strip().splitlines()[-1].split())
+    return peak, (retained if retained >= 0 else None)
+
+def peak_memory(statement, setup=''):
+    """peak_memory(statement: str, setup: str) -> int
+    Runs the statement in a new Python process, after the setup, and
+    returns by how many bytes it increased the peak memory usage of the
+    process. Returns None if that can't be measured on this platform.
+
+    """
+    return _memory_usage(statement, setup)[0]
+
+def retained_memory(statement, setup=''):
+    """retained_memory(statement: str, setup: str) -> int
+    Same as peak_memory(), but returns by how many bytes the statement
+    increased the resident memory of the process once it is done, i.e.
+    the size of what the statement keeps around (assign it to a name).
+    Returns None if that can't be measured on this platform (it needs
+    /proc).
+
+    """
+    return _memory_usage(statement, setup)[1]
+
+
+class BenchmarkData(object):
+    """The synthetic data shared by the benchmarks.
+
+    The files and objects are only created when a benchmark needs them.
+
+    """
+
+    def __init__(self, parameters):
+        self.parameters = parameters
+        self.directory = tempfile.mkdtemp(prefix='vt_bench_')
+        self._vistrail = None
+        self._pipeline = None
+
+    def close(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    @property
+    def vistrail(self):
+        if self._vistrail is None:
+            p = self.parameters
+            self._vistrail = make_vistrail(p['versions'], p['modules'],
+                                           p['depth'], p['fanout'],
+                                           p['branch_rate'], seed=p['seed'])
+        return self._vistrail
+
+    @property
+    def base_version(self):
+        return self.vistrail.get_version_number('base')
+
+    @property
+    def last_version(self):
+        return max(self.vistrail.actionMap)
+
+    @property
+    def pipeline(self):
+        """The pipeline of the last version, validated."""
+        if self._pipeline is None:
+            from vistrails.core.db.io import get_workflow
+            self._pipeline = get_workflow(self.vistrail, self.last_version)
+            self._pipeline.validate()
+        return self._pipeline
+
+    @property
+    def xml_file(self):
+        filename = self.path('vistrail.xml')
+        if not os.path.exists(filename):
+            from vistrails.db.services.io import save_vistrail_to_xml
+            save_vistrail_to_xml(self.vistrail, filename)
+        return filename
+
+    @property
+    def vt_file(self):
+        filename = self.path('vistrail.vt')
+        if not os.path.exists(filename):
+            save_vt(self.vistrail, filename)
+        return filename
+
+    @property
+    def csv_file(self):
+        filename = self.path('table.csv')
+        if not os.path.exists(filename):
+            make_csv(filename, self.parameters['rows'],
+                     self.parameters['columns'], self.parameters['seed'])
+        return filename
+
+
+def save_vt(vistrail, filename):
+    from vistrails.db.domain import DBVistrail
+    from vistrails.db.services.io import SaveBundle, \
+        save_vistrail_bundle_to_zip_xml
+
+    bundle = SaveBundle(DBVistrail.vtType, vistrail=vistrail)
+    save_dir = save_vistrail_bundle_to_zip_xml(bundle, filename)[1]
+    shutil.rmtree(save_dir, ignore_errors=True)
+
+
+###############################################################################
+# Benchmarks
+
+@benchmark('xml_save')
+def bench_xml_save(data, repeat):
+    from vistrails.db.services.io import save_vistrail_to_xml
+    filename = data.path('saved.xml')
+    return time_calls(lambda: save_vistrail_to_xml(data.vistrail, filename),
+                      repeat)
+
+@benchmark('xml_load')
+def bench_xml_load(data, repeat):
+    from vistrails.db.services.io import open_vistrail_from_xml
+    filename = data.xml_file
+    times = time_calls(lambda: open_vistrail_from_xml(filename), repeat)
+    memory = peak_memory(
+            'open_vistrail_from_xml(%r)' % filename,
+            'from vistrails.db.services.io import open_vistrail_from_xml')
+    return times, {'peak_memory': memory}
+
+@benchmark('xml_load_dom')
+def bench_xml_load_dom(data, repeat):
+    """Same as xml_load, but reading the whole document before creating
+    the objects, which is how vistrails from older versions are loaded.
+
+    """
+    from vistrails.db.domain import DBVistrail
+    from vistrails.db.services.vistrail import update_id_scope
+    from vistrails.db.versions import getVersionDAO
+    daoList = getVersionDAO()
+    filename = data.xml_file
+    def load():
+        update_id_scope(daoList.open_from_xml(filename, DBVistrail.vtType))
+    times = time_calls(load, repeat)
+    memory = peak_memory(
+            'update_id_scope(daoList.open_from_xml(%r, %r))' % (
+                    filename, DBVistrail.vtType),
+            'from vistrails.db.services.vistrail import update_id_scope\n'
+            'from vistrails.db.versions import getVersionDAO\n'
+            'daoList = getVersionDAO()')
+    return times, {'peak_memory': memory}
+
+@benchmark('xml_load_lazy')
+def bench_xml_load_lazy(data, repeat):
+    """Same as xml_load, but only reading the operations of the actions
+    needed to materialize the last version.
+
+    """
+    from vistrails.db.services.io import open_vistrail_from_xml
+    from vistrails.db.services.vistrail import materializeWorkflow
+    filename, version = data.xml_file, data.last_version
+    def load():
+        vistrail = open_vistrail_from_xml(filename, lazy=True)
+        materializeWorkflow(vistrail, version)
+    times = time_calls(load, repeat)
+    memory = peak_memory(
+            'materializeWorkflow(open_vistrail_from_xml(%r, lazy=True), %r)' % (
+                    filename, version),
+            'from vistrails.db.services.io import open_vistrail_from_xml\n'
+            'from vistrails.db.services.vistrail import materializeWorkflow')
+    return times, {'peak_memory': memory}
+
+@benchmark('vt_save')
+def bench_vt_save(data, repeat):
+    filename = data.path('saved.vt')
+    return time_calls(lambda: save_vt(data.vistrail, filename), repeat)
+
+@benchmark('vt_load')
+def bench_vt_load(data, repeat):
+    from vistrails.db.services.io import open_vistrail_bundle_from_zip_xml
+    filename = data.vt_file
+    def load():
+        save_dir = open_vistrail_bundle_from_zip_xml(filename)[1]
+        shutil.rmtree(save_dir, ignore_errors=True)
+    return time_calls(load, repeat)
+
+@benchmark('vistrail_memory')
+def bench_vistrail_memory(data, repeat):
+    """Memory held by the domain objects of a loaded vistrail; the times
+    are those of getCurrentOperationDict() over the longest action chain,
+    which reads the fields of every operation.
+
+    """
+    from vistrails.db.services.action_chain import getActionChain, \
+        getCurrentOperationDict
+    vistrail = data.vistrail
+    actions = max((getActionChain(vistrail, version)
+                   for version in vistrail.actionMap), key=len)
+    times = time_calls(lambda: getCurrentOperationDict(actions), repeat)
+    memory = retained_memory(
+            'vistrail = open_vistrail_from_xml(%r)' % data.xml_file,
+            'from vistrails.db.services.io import open_vistrail_from_xml')
+    return times, {'retained_memory': memory}
+
+@benchmark('materialize')
+def bench_materialize(data, repeat):
+    from vistrails.db.services.vistrail import materializeWorkflow
+    vistrail, version = data.vistrail, data.last_version
+    return time_calls(lambda: materializeWorkflow(vistrail, version), repeat)
+
+@benchmark('signatures')
+def bench_signatures(data, repeat):
+    return time_calls(data.pipeline.refresh_signatures, repeat)
+
+@benchmark('pipeline_copy')
+def bench_pipeline_copy(data, repeat):
+    pipeline = data.pipeline
+    module_id = max(pipeline.modules)
+    def copy_and_change():
+        # what a parameter exploration does for each of its pipelines
+        for i in xrange(10):
+            pipeline.cow_copy().unshare_module(module_id)
+    return time_calls(copy_and_change, repeat)
+
+@benchmark('port_typecheck')
+def bench_port_typecheck(data, repeat):
+    from vistrails.core.modules.module_registry import get_module_registry
+    registry = get_module_registry()
+    ports = [(c.source.spec, c.destination.spec)
+             for c in data.pipeline.connections.itervalues()]
+    def typecheck():
+        # what make_connection and the pipeline view do for each edge
+        for i in xrange(10):
+            for source, destination in ports:
+                registry.ports_can_connect(source, destination)
+    return time_calls(typecheck, repeat)
+
+@benchmark('setup_pipeline')
+def bench_setup_pipeline(data, repeat):
+    from vistrails.core.interpreter.cached import CachedInterpreter
+    interpreter = CachedInterpreter()
+    try:
+        return time_calls(lambda: interpreter.setup_pipeline(data.pipeline),
+                          repeat, interpreter.clear)
+    finally:
+        interpreter.clear()
+
+@benchmark('cached_execute')
+def bench_cached_execute(data, repeat):
+    from vistrails.core.interpreter.cached import CachedInterpreter
+    from vistrails.core.utils import DummyView
+    interpreter = CachedInterpreter()
+    def execute():
+        result = interpreter.execute(data.pipeline, view=DummyView(),
+                                     current_version=data.last_version)
+        if result.errors:
+            raise RuntimeError("Execution failed: %r" % result.errors)
+    try:
+        # the first execution fills the cache
+        execute()
+        return time_calls(execute, repeat)
+    finally:
+        interpreter.clear()
+
+@benchmark('workflow_diff')
+def bench_workflow_diff(data, repeat):
+    from vistrails.db.services.vistrail import getWorkflowDiff
+    vistrail = data.vistrail
+    v1, v2 = data.base_version, data.last_version
+    return time_calls(lambda: getWorkflowDiff((vistrail, v1), (vistrail, v2),
+                                              True),
+                      repeat)
+
+@benchmark('terse_graph')
+def bench_terse_graph(data, repeat):
+    from vistrails.core.vistrail.controller import VistrailController
+    controller = VistrailController(data.vistrail, auto_save=False)
+    return time_calls(controller.recompute_terse_graph, repeat)
+
+@benchmark('terse_graph_update')
+def bench_terse_graph_update(data, repeat):
+    from vistrails.core.vistrail.controller import VistrailController
+    vistrail = data.vistrail
+    controller = VistrailController(vistrail, auto_save=False)
+    controller.current_version = data.last_version
+    controller.recompute_terse_graph()
+    versions = sorted(vistrail.actionMap)[::max(1, len(vistrail.actionMap) //
+                                                 10)]
+    def update():
+        # what expanding and collapsing versions in the version view does
+        for version in versions:
+            vistrail.expandVersion(version)
+            controller.recompute_terse_graph([version])
+            vistrail.collapseVersion(version)
+            controller.recompute_terse_graph([version])
+    return time_calls(update, repeat)
+
+def _version_tree_layout(vistrail, controller):
+    from vistrails.core.layout.version_tree_layout import \
+        VistrailsTreeLayoutLW
+    # fixed-width font, the GUI measures the labels with Qt
+    layout = VistrailsTreeLayoutLW(lambda text: 7 * len(text), 14, 20, 4)
+    layout.layout_from(vistrail, controller._current_terse_graph)
+    return layout
+
+@benchmark('version_tree_layout')
+def bench_version_tree_layout(data, repeat):
+    from vistrails.core.vistrail.controller import VistrailController
+    vistrail = data.vistrail
+    controller = VistrailController(vistrail, auto_save=False)
+    controller.current_version = data.last_version
+    controller.recompute_terse_graph()
+    return time_calls(lambda: _version_tree_layout(vistrail, controller),
+                      repeat)
+
+@benchmark('version_tree_layout_update')
+def bench_version_tree_layout_update(data, repeat):
+    from vistrails.core.vistrail.controller import VistrailController
+    vistrail = data.vistrail
+    controller = VistrailController(vistrail, auto_save=False)
+    controller.current_version = data.last_version
+    controller.recompute_terse_graph()
+    layout = _version_tree_layout(vistrail, controller)
+    versions = sorted(vistrail.actionMap)[::max(1, len(vistrail.actionMap) //
+                                                 10)]
+    def recompute(version):
+        controller.recompute_terse_graph([version])
+        layout.update_from(vistrail, controller._current_terse_graph,
+                           controller._terse_graph_changes)
+    def update():
+        # same as terse_graph_update, also laying out the changes
+        for version in versions:
+            vistrail.expandVersion(version)
+            recompute(version)
+            vistrail.collapseVersion(version)
+            recompute(version)
+    return time_calls(update, repeat)
+
+@benchmark('tabledata_read')
+def bench_tabledata_read(data, repeat):
+    from vistrails.packages.tabledata.read.read_csv import CSVTable
+    filename = data.csv_file
+    columns = range(data.parameters['columns'])
+    def read():
+        table = CSVTable(filename, True, ',', use_sniffer=False)
+        # measure parsing, not the memory-mapped .npy cache
+        table.sidecar_min_size = float('inf')
+        table.get_columns(columns, numeric=True)
+    return time_calls(read, repeat)
+
+@benchmark('tabledata_operations')
+def bench_tabledata_operations(data, repeat):
+    import random
+    from vistrails.packages.tabledata.common import TableObject
+    from vistrails.packages.tabledata.operations import JoinedTables, \
+        SelectFromTable, AggregatedTable
+    rows = data.parameters['rows']
+    rng = random.Random(data.parameters['seed'])
+    keys = range(rows)
+    rng.shuffle(keys)
+    left = TableObject([range(rows),
+                        [rng.random() for i in xrange(rows)],
+                        [i % 100 for i in xrange(rows)]],
+                       rows, ['key', 'value', 'group'])
+    right = TableObject([keys, [rng.random() for i in xrange(rows)]],
+                        rows, ['key', 'weight'])
+    def operations():
+        # join on the key, keep the rows below a value, sum by group
+        joined = JoinedTables(left, right, 0, 0)
+        joined.get_columns(xrange(joined.columns), numeric=True)
+        select = SelectFromTable()
+        inputs = {'table': left, 'float_expr': ('value', '<', 0.5)}
+        select.has_input = inputs.__contains__
+        select.get_input = inputs.__getitem__
+        select.compute()
+        AggregatedTable(left, 'sum', 1, 2).get_column(1, True)
+    return time_calls(operations, repeat)
+
+
+###############################################################################
+# Running and comparing
+
+def run_benchmarks(names=None, repeat=5, out=None, **parameters):
+    """run_benchmarks(names: list, repeat: int, out: file, **parameters)
+         -> dict
+    Runs the named benchmarks (all of them if names is None) on data
+    generated with the given parameters (see DEFAULT_PARAMETERS).
+
+    Returns a dictionary with the parameters, the environment and the
+    times of each benchmark, suitable for JSON. Progress is written to out
+    if given.
+
+    """
+    if names is None:
+        names = list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError("Unknown benchmark %r" % name)
+    for name in parameters:
+        if name not in DEFAULT_PARAMETERS:
+            raise ValueError("Unknown parameter %r" % name)
+    params = OrderedDict(DEFAULT_PARAMETERS)
+    params.update(parameters)
+
+    results = OrderedDict()
+    data = BenchmarkData(params)
+    try:
+        for name in names:
+            times = BENCHMARKS[name](data, repeat)
+            if isinstance(times, tuple):
+                times, measures = times
+            else:
+                measures = {}
+            results[name] = OrderedDict([
+                    ('min', min(times)),
+                    ('median', sorted(times)[len(times) // 2]),
+                    ('times', times),
+                ])
+            results[name].update(sorted(measures.iteritems()))
+            if out is not None:
+                out.write("%-20s %10.2f ms" % (name, min(times) * 1e3))
+                if measures.get('peak_memory') is not None:
+                    out.write("  %10.1f MB peak" % (
+                              measures['peak_memory'] / 1048576.0))
+                if measures.get('retained_memory') is not None:
+                    out.write("  %10.1f MB retained" % (
+                              measures['retained_memory'] / 1048576.0))
+                out.write("\n")
+    finally:
+        data.close()
+    return OrderedDict([
+            ('parameters', params),
+            ('repeat', repeat),
+            ('python', sys.version.split()[0]),
+            ('platform', platform.platform()),
+            ('results', results),
+        ])
+
+
+def compare(results, baseline, tolerance=0.1):
+    """compare(results: dict, baseline: dict, tolerance: float)
+         -> (str, list)
+    Compares the best times of two runs of run_benchmarks().
+
+    Returns a report and the names of the benchmarks that got slower by
+    more than the given fraction.
+
+    """
+    lines = ['%-20s %14s %14s %8s' % ('benchmark', 'baseline (ms)',
+                                      'current (ms)', 'ratio')]
+    if results['parameters'] != baseline['parameters']:
+        lines.append("Warning: the baseline was run with different "
+                     "parameters")
+    regressions = []
+    for name, result in results['results'].iteritems():
+        if name not in baseline['results']:
+            lines.append('%-20s %14s %14.2f %8s' % (name, '-',
+                                                    result['min'] * 1e3, '-'))
+            continue
+        old = baseline['results'][name]['min']
+        new = result['min']
+        ratio = new / old if old > 0 else float('inf')
+        status = ''
+        if ratio > 1.0 + tolerance:
+            status = 'SLOWER'
+            regressions.append(name)
+        elif ratio < 1.0 - tolerance:
+            status = 'faster'
+        lines.append('%-20s %14.2f %14.2f %8.2f %s' % (
+                     name, old * 1e3, new * 1e3, ratio, status))
+    return '\n'.join(lines) + '\n', regressions
+
+
+###############################################################################
+
+import unittest
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_generate(self):
+        from vistrails.core.db.io import get_workflow
+        vistrail = make_vistrail(versions=20, modules=12, depth=3, fanout=2,
+                                 branch_rate=0.3, tag_every=5)
+        self.assertEqual(len(vistrail.actionMap), 20)
+        pipeline = get_workflow(vistrail, max(vistrail.actionMap))
+        self.assertEqual(len(pipeline.modules), 12)
+        # 4 modules per layer, each connected to 2 in the previous one
+        self.assertEqual(len(pipeline.connections), 16)
+        self.assertEqual(len(pipeline.graph.sinks()), 4)
+        pipeline.validate()
+
+    def test_run(self):
+        results = run_benchmarks(repeat=1, versions=10, modules=12, depth=3,
+                                 rows=50, columns=3)
+        self.assertEqual(list(results['results']), list(BENCHMARKS))
+        for result in results['results'].itervalues():
+            self.assertEqual(len(result['times']), 1)
+        import json
+        json.dumps(results)
+
+    def test_compare(self):
+        def make(**times):
+            return {'parameters': {}, 'results': dict(
+                    (name, {'min': t}) for name, t in times.iteritems())}
+        report, regressions = compare(make(a=1.0, b=2.0, c=1.0),
+                                      make(a=1.0, b=1.0, d=1.0))
+        self.assertEqual(regressions, ['b'])
+        self.assertEqual(len(report.splitlines()), 4)
@@ -228,6 +228,59 @@ def intercept_results(*args):
     return contextlib.nested(*ctx)
 
 
+@contextlib.contextmanager
+def execution_threads(threads):
+    """Temporarily sets the number of threads pipelines are executed with.
+    """
+    from vistrails.core.configuration import get_vistrails_configuration
+    conf = get_vistrails_configuration()
+    old = conf.executionThreads
+    conf.executionThreads = threads
+    try:
+        yield
+    finally:
+        conf.executionThreads = old
+
+
+@contextlib.contextmanager
+def dummy_vistrail():
+    """Loads tests/resources/dummy.xml in a controller, with StandardOutput
+    printing nothing until the block ends.
+
+    It is used as a context manager, for instance:
+    with dummy_vistrail() as controller:
+        version, pipeline = select_tag(controller, 'int chain')
+        ...
+    """
+    import os
+    from vistrails.core.db.io import load_vistrail
+    from vistrails.core.db.locator import XMLFileLocator
+    from vistrails.core.modules.basic_modules import StandardOutput
+    from vistrails.core.system import vistrails_root_directory
+    from vistrails.core.vistrail.controller import VistrailController
+
+    old_compute = StandardOutput.compute
+    StandardOutput.compute = lambda s: None
+    try:
+        locator = XMLFileLocator(os.path.join(vistrails_root_directory(),
+                                              'tests/resources/dummy.xml'))
+        (v, abstractions, thumbnails, mashups) = load_vistrail(locator)
+        yield VistrailController(v, locator, abstractions, thumbnails,
+                                 mashups)
+    finally:
+        StandardOutput.compute = old_compute
+
+
+def select_tag(controller, tag):
+    """Selects the tagged version in a controller, returning it and its
+    pipeline.
+    """
+    version = controller.vistrail.get_version_number(tag)
+    controller.change_selected_version(version)
+    controller.flush_delayed_actions()
+    return version, controller.current_pipeline
+
+
 @contextlib.contextmanager
 def capture_stream(stream):
     lines = []